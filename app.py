@@ -1,18 +1,142 @@
+import os
+import time
+
 import gradio as gr
-from langchain_ollama import ChatOllama
 
-from src.graph import create_graph
-from src.schemas.state import GraphState
+from src.agents.director import ReviewTextEvent
+from src.agents.request_parser import configure_request_cache
+from src.agents.story_writer import StoryTextEvent
+from src.agents.tools.search_lorebook import set_eager_warmup, start_retriever_warmup
+from src.graph import configure_story_cache, stream_story_generation
+from src.schemas.state import EvalReport, RefinedRequest, StoryOutput
+from src.utils.llm_cache import configure_llm_cache
 from src.utils.prompt_loader import load_system_prompts
+from src.utils.retry_policy import ConvergencePolicy, configure_retry_policy
+
+# 동시에 실행할 생성 요청 수 (Ollama 서버가 병렬로 처리하는 요청 수 OLLAMA_NUM_PARALLEL에 맞춤)
+GENERATE_CONCURRENCY = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "1")))
+# 대기열 최대 길이 (가득 차면 새 요청은 대기하지 않고 바로 거절됨)
+QUEUE_MAX_SIZE = int(
+    os.environ.get("STORY_QUEUE_MAX_SIZE", str(GENERATE_CONCURRENCY * 8))
+)
+RENDER_INTERVAL = 0.05  # 토큰 스트리밍 중 화면을 다시 그리는 최소 간격 (초)
+# 샘플링 seed (지정하면 같은 입력에 같은 응답이 나오므로 요청 분석/작성/검수 응답을 LLM 캐시에 재사용)
+LLM_SEED = os.environ.get("STORY_LLM_SEED")
+LLM_OPTIONS = {"seed": int(LLM_SEED)} if LLM_SEED else {}
+
+
+class StoryTranscript:
+    """
+    생성 결과 마크다운 버퍼
+
+    완료된 섹션은 한 문자열로 한 번만 이어 붙이고, 스트리밍 중인 섹션만
+    필드별 조각 리스트로 유지합니다. 토큰이 도착할 때마다 전체 출력을
+    다시 합치지 않고 진행 중인 섹션만 렌더링합니다.
+    """
+
+    def __init__(self):
+        self._done = ""
+        self._live_key: tuple | None = None
+        self._live_header = ""
+        self._live_fields: dict[str, list[str]] = {}
+
+    def commit(self, section: str) -> None:
+        """완료된 섹션 추가 (진행 중인 섹션은 이 섹션으로 대체)"""
+        self._done += section
+        self._live_key = None
+        self._live_header = ""
+        self._live_fields = {}
+
+    def stream(self, event: StoryTextEvent | ReviewTextEvent) -> None:
+        """스트리밍 이벤트를 진행 중인 섹션에 반영"""
+        key = (type(event), event.attempt)
+        if key != self._live_key:
+            self._live_key = key
+            self._live_header = _live_header(event)
+            self._live_fields = {}
+        parts = self._live_fields.setdefault(event.field, [])
+        if getattr(event, "replace", False):
+            parts.clear()
+        parts.append(event.text)
+
+    def render(self) -> str:
+        """현재까지의 출력 (완료된 섹션 + 진행 중인 섹션)"""
+        if self._live_key is None:
+            return self._done
+        live = [self._live_header]
+        for field, parts in self._live_fields.items():
+            text = "".join(parts)
+            if field == "title":
+                live.append(f"### {text}\n\n")
+            elif field == "feedback":
+                live.append(f"**피드백**: {text}\n\n")
+            else:
+                live.append(f"{text}\n\n")
+        return self._done + "".join(live)
+
+
+def _live_header(event: StoryTextEvent | ReviewTextEvent) -> str:
+    """진행 중인 섹션의 제목"""
+    if isinstance(event, ReviewTextEvent):
+        return f"## 🔍 검수 중 (시도 {event.attempt})\n\n"
+    if event.attempt > 1:
+        return f"## ✍️ 스토리 수정 중 (시도 {event.attempt})\n\n"
+    return "## ✍️ 스토리 작성 중\n\n"
+
+
+def _format_request(req: RefinedRequest) -> str:
+    """요청 분석 섹션"""
+    return (
+        "## 📝 요청 분석\n"
+        f"- **프롬프트**: {req.summarized_prompt}\n"
+        f"- **장르**: {req.genre}\n"
+        f"- **스타일**: {req.style}\n"
+        f"- **분량**: {req.length}\n\n"
+        "---\n\n"
+    )
+
+
+def _format_story(story_out: StoryOutput, retry_count: int) -> str:
+    """스토리 작성 결과 섹션"""
+    parts = []
+    if retry_count > 0:
+        parts.append(f"## ✍️ 스토리 수정 (시도 {retry_count + 1})\n\n")
+    else:
+        parts.append("## ✍️ 스토리 초안\n\n")
+
+    if story_out.title:
+        parts.append(f"### {story_out.title}\n\n")
+    if story_out.story:
+        parts.append(f"{story_out.story}\n\n")
+    if story_out.notes:
+        parts.append(f"*📌 참고: {story_out.notes}*\n\n")
+
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
+def _format_review(report: EvalReport) -> str:
+    """검수 결과 섹션"""
+    parts = ["## ✅ 검수 통과\n\n" if report.is_approved else "## 🔄 검수 피드백\n\n"]
+    parts.append(f"**점수**: {report.score}/10\n\n")
+    parts.append(f"**피드백**: {report.feedback}\n\n")
+    if not report.is_approved and report.issues:
+        parts.append("**개선 필요 사항**:\n")
+        parts.extend(f"- {issue}\n" for issue in report.issues)
+        parts.append("\n")
+
+    parts.append("---\n\n")
+    return "".join(parts)
 
 
 def generate_story(
     user_input: str,
     model_name: str,
     max_retries: int,
+    use_cache: bool = True,
     progress=gr.Progress(),
 ):
-    """스토리 생성 (스트리밍)"""
+    """스토리 생성 (토큰 단위 스트리밍)"""
 
     if not user_input.strip():
         yield "스토리 아이디어를 입력해주세요."
@@ -21,90 +145,73 @@ def generate_story(
     # 시스템 프롬프트 로드 (캐싱됨)
     prompts = load_system_prompts()
 
-    # LLM 설정
-    llm = ChatOllama(model=model_name)
-
-    # 그래프 생성
-    graph = create_graph(
-        llm=llm,
+    # 출력 버퍼
+    transcript = StoryTranscript()
+    last_render = 0.0
+    # 노드는 바뀐 필드만 반환하므로 재시도 횟수는 review 결과에서 따로 추적
+    retry_count = 0
+
+    # 스트리밍 실행 (custom: 스토리/피드백 토큰, updates: 노드 완료 결과)
+    # 같은 요청의 결과가 캐시에 있으면 저장된 노드 결과를 바로 재생
+    events = stream_story_generation(
+        user_input,
+        model_name=model_name,
+        max_retries=int(max_retries),
         story_writer_system_prompt=prompts.story_writer,
         director_system_prompt=prompts.director,
+        stream_mode=["custom", "updates"],
+        use_cache=use_cache,
+        stream_story=True,
+        stream_review=True,
+        **LLM_OPTIONS,
     )
-    app = graph.compile()
-
-    # 초기 상태
-    initial_state = GraphState(user_input=user_input, max_retries=max_retries)
-
-    # 출력 버퍼
-    output_parts = []
-
-    # 스트리밍 실행
-    for event in app.stream(initial_state, stream_mode="updates"):
-        for node_name, node_output in event.items():
+    for mode, chunk in events:
+        if mode == "custom":
+            if isinstance(chunk, (StoryTextEvent, ReviewTextEvent)):
+                transcript.stream(chunk)
+                # 토큰마다 화면을 갱신하지 않고 일정 간격으로 모아서 갱신
+                now = time.monotonic()
+                if now - last_render >= RENDER_INTERVAL:
+                    last_render = now
+                    yield transcript.render()
+            continue
+
+        for node_name, node_output in chunk.items():
 
             if node_name == "init":
                 # 요청 파싱 결과
-                if "request" in node_output and node_output["request"]:
-                    req = node_output["request"]
-                    output_parts.append("## 📝 요청 분석\n")
-                    output_parts.append(f"- **프롬프트**: {req.summarized_prompt}\n")
-                    output_parts.append(f"- **장르**: {req.genre}\n")
-                    output_parts.append(f"- **스타일**: {req.style}\n")
-                    output_parts.append(f"- **분량**: {req.length}\n\n")
-                    output_parts.append("---\n\n")
-                    yield "".join(output_parts)
+                if node_output.get("request"):
+                    transcript.commit(_format_request(node_output["request"]))
+                    yield transcript.render()
 
             elif node_name == "write":
-                # 스토리 작성 결과
-                if "story_output" in node_output and node_output["story_output"]:
-                    story_out = node_output["story_output"]
-                    retry_count = node_output.get("retry_count", 0)
-
-                    if retry_count > 0:
-                        output_parts.append(
-                            f"## ✍️ 스토리 수정 (시도 {retry_count + 1})\n\n"
-                        )
-                    else:
-                        output_parts.append("## ✍️ 스토리 초안\n\n")
-
-                    if hasattr(story_out, "title") and story_out.title:
-                        output_parts.append(f"### {story_out.title}\n\n")
-
-                    if hasattr(story_out, "story") and story_out.story:
-                        output_parts.append(f"{story_out.story}\n\n")
-
-                    if hasattr(story_out, "notes") and story_out.notes:
-                        output_parts.append(f"*📌 참고: {story_out.notes}*\n\n")
+                # 스토리 작성 결과 (스트리밍으로 보여준 섹션을 최종 결과로 대체)
+                if node_output.get("story_output"):
+                    transcript.commit(
+                        _format_story(node_output["story_output"], retry_count)
+                    )
+                    yield transcript.render()
 
-                    output_parts.append("---\n\n")
-                    yield "".join(output_parts)
+            elif node_name == "skip_review":
+                # 재작성 정책에 따라 마지막 작성본은 검수하지 않고 종료
+                transcript.commit(
+                    "## ⏭️ 마지막 작성본은 검수하지 않았습니다\n\n"
+                    "이전 검수 점수는 이 작성본에 적용되지 않습니다.\n"
+                )
+                transcript.commit("## 🎉 스토리 생성 완료!\n")
+                yield transcript.render()
 
             elif node_name == "review":
                 # 검수 결과
-                if "eval_report" in node_output and node_output["eval_report"]:
-                    report = node_output["eval_report"]
-
-                    if report.is_approved:
-                        output_parts.append("## ✅ 검수 통과\n\n")
-                        output_parts.append(f"**점수**: {report.score}/10\n\n")
-                        output_parts.append(f"**피드백**: {report.feedback}\n\n")
-                    else:
-                        output_parts.append("## 🔄 검수 피드백\n\n")
-                        output_parts.append(f"**점수**: {report.score}/10\n\n")
-                        output_parts.append(f"**피드백**: {report.feedback}\n\n")
-                        if report.issues:
-                            output_parts.append("**개선 필요 사항**:\n")
-                            for issue in report.issues:
-                                output_parts.append(f"- {issue}\n")
-                            output_parts.append("\n")
-
-                    output_parts.append("---\n\n")
-                    yield "".join(output_parts)
+                retry_count = node_output.get("retry_count", retry_count)
+                if node_output.get("eval_report"):
+                    transcript.commit(_format_review(node_output["eval_report"]))
+                    yield transcript.render()
 
                 # 완료 여부 확인
                 if node_output.get("is_complete"):
-                    output_parts.append("## 🎉 스토리 생성 완료!\n")
-                    yield "".join(output_parts)
+                    transcript.commit("## 🎉 스토리 생성 완료!\n")
+                    yield transcript.render()
 
 
 def create_demo():
@@ -146,6 +253,11 @@ def create_demo():
                         step=1,
                         info="Director 피드백 반영 최대 횟수",
                     )
+                    use_cache = gr.Checkbox(
+                        label="결과 캐시 사용",
+                        value=True,
+                        info="같은 요청의 이전 생성 결과가 있으면 바로 표시",
+                    )
 
                 generate_btn = gr.Button("✨ 스토리 생성", variant="primary")
 
@@ -166,23 +278,45 @@ def create_demo():
             inputs=user_input,
         )
 
-        # 이벤트 연결
+        # 이벤트 연결 (버튼과 Enter 입력이 같은 동시 실행 한도를 공유)
         generate_btn.click(
             fn=generate_story,
-            inputs=[user_input, model_name, max_retries],
+            inputs=[user_input, model_name, max_retries, use_cache],
             outputs=output,
+            concurrency_limit=GENERATE_CONCURRENCY,
+            concurrency_id="generate_story",
         )
 
         user_input.submit(
             fn=generate_story,
-            inputs=[user_input, model_name, max_retries],
+            inputs=[user_input, model_name, max_retries, use_cache],
             outputs=output,
+            concurrency_limit=GENERATE_CONCURRENCY,
+            concurrency_id="generate_story",
         )
 
+    # 한도를 넘는 요청은 대기열에서 기다리고, 대기열이 가득 차면 거절하여 Ollama 과부하 방지
+    demo.queue(
+        max_size=QUEUE_MAX_SIZE,
+        default_concurrency_limit=GENERATE_CONCURRENCY,
+    )
     return demo
 
 
 if __name__ == "__main__":
+    # 임베딩 모델을 백그라운드에서 미리 로드 (첫 요청의 대기 시간 감소)
+    set_eager_warmup(True)
+    start_retriever_warmup()
+
+    # 같은 요청(예시 버튼 등)은 저장된 결과를 바로 반환
+    configure_story_cache()
+    # temperature=0이거나 STORY_LLM_SEED로 seed를 고정한 경우에만 LLM 응답 재사용
+    configure_llm_cache()
+    # 비슷한 요청은 임베딩 유사도로 이전 요청 분석을 재사용 (init 단계의 LLM 호출 생략)
+    configure_request_cache()
+    # 점수가 충분하거나 더 오르지 않으면 재작성을 멈추고, 마지막 작성본의 검수는 생략
+    configure_retry_policy(ConvergencePolicy())
+
     demo = create_demo()
     demo.launch(
         server_name="0.0.0.0",
@@ -1,5 +1,6 @@
 import asyncio
 
+from src.agents.tools.search_lorebook import set_eager_warmup
 from src.graph import (
     run_story_generation,
     run_story_generation_stream,
@@ -39,6 +40,9 @@ async def main_stream_tokens():
 
 
 if __name__ == "__main__":
+    # 그래프 생성 시 임베딩 모델을 백그라운드에서 로드 (request 파싱과 병렬 진행)
+    set_eager_warmup(True)
+
     # 일반 실행
     # main()
 
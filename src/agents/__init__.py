@@ -2,12 +2,14 @@
 
 from src.agents.base import BaseAgent
 from src.agents.director import Director
+from src.agents.lore_prefetcher import LorePrefetcher
 from src.agents.request_parser import UserRequestParser
 from src.agents.story_writer import StoryWriter
 
 __all__ = [
     "BaseAgent",
     "Director",
+    "LorePrefetcher",
     "StoryWriter",
     "UserRequestParser",
 ]
@@ -1,30 +1,90 @@
 """에이전트 베이스 클래스"""
 
+import asyncio
 import json
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
-from langchain_ollama import ChatOllama
+from langchain_core.documents import Document
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    message_chunk_to_message,
+)
 from pydantic import BaseModel
 
-from src.agents.tools.search_lorebook import search_lorebook
-from src.schemas.state import GraphState
+from src.agents.tools.search_lorebook import search_lorebook, search_lorebook_batch
+from src.schemas.state import GraphState, RetrievalMemo
+from src.utils.context_packer import DEFAULT_TOKEN_BUDGET, ContextPacker
+from src.utils.json_stream import FieldDelta, StreamingJSONParser
+from src.utils.llm_cache import LLMResponseCache, cache_allowed, get_llm_cache
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+# 한 AI 메시지의 여러 tool call을 병렬 실행할 스레드 풀 (임베딩이 CPU를 쓰므로 상한을 둠)
+MAX_TOOL_WORKERS = 4
+_tool_executor = ThreadPoolExecutor(
+    max_workers=MAX_TOOL_WORKERS, thread_name_prefix="tool-call"
+)
 
 
 class BaseAgent(ABC):
     """모든 에이전트의 베이스 클래스"""
 
-    def __init__(self, llm: ChatOllama, system_prompt: str = ""):
+    # 한 번의 실행에서 tool 결과(Lorebook 자료)에 쓸 최대 토큰 수 (에이전트별로 오버라이드)
+    LORE_TOKEN_BUDGET = DEFAULT_TOKEN_BUDGET
+    # LLM 응답 캐시 정책 (src.utils.llm_cache 참고, 에이전트별로 오버라이드)
+    LLM_CACHE_POLICY = "deterministic"
+
+    def __init__(
+        self,
+        llm: "ChatOllama",
+        system_prompt: str = "",
+        lore_token_budget: int | None = None,
+    ):
         self.llm = llm
-        self.llm_with_tools = llm.bind_tools([search_lorebook])
+        self.llm_with_tools = llm.bind_tools([search_lorebook, search_lorebook_batch])
         self.system_prompt = system_prompt
+        self.lore_token_budget = lore_token_budget or self.LORE_TOKEN_BUDGET
+        # None이면 configure_llm_cache로 설정한 공유 캐시 사용
+        self.llm_cache: LLMResponseCache | None = None
 
     @abstractmethod
-    def __call__(self, state: GraphState, runtime: Any) -> GraphState:
-        """에이전트 실행 (하위 클래스에서 구현)"""
+    def __call__(self, state: GraphState, runtime: Any) -> dict[str, Any]:
+        """
+        에이전트 실행 (하위 클래스에서 구현)
+
+        전달받은 state는 수정하지 않고, 바뀐 필드만 담은 상태 업데이트를 반환합니다.
+        (히스토리 필드는 reducer가 이어 붙이므로 새 항목만 반환)
+        """
         pass
 
+    async def acall(self, state: GraphState, runtime: Any) -> dict[str, Any]:
+        """
+        에이전트 비동기 실행
+
+        기본 구현은 동기 __call__을 스레드에서 실행합니다.
+        하위 클래스는 _ahandle_tool_calls를 사용하여 오버라이드할 수 있습니다.
+        """
+        return await asyncio.to_thread(self, state, runtime)
+
+    @staticmethod
+    def _with_own_memo(state: GraphState) -> GraphState:
+        """
+        검색 메모만 깊은 복사한 상태
+
+        recall/record는 메모를 직접 갱신하므로, 입력 상태(체크포인트나 이전 스냅샷과
+        공유될 수 있음) 대신 이 노드 전용 메모를 갱신하고 업데이트로 반환합니다.
+        """
+        return state.model_copy(
+            update={"retrieval_memo": state.retrieval_memo.model_copy(deep=True)}
+        )
+
     @abstractmethod
     def _build_user_message(self, state: GraphState) -> str:
         """유저 메시지 구성 (하위 클래스에서 구현)"""
@@ -46,6 +106,9 @@ class BaseAgent(ABC):
         self,
         messages: list,
         max_iterations: int = 3,
+        memo: RetrievalMemo | None = None,
+        stream_fields: Iterable[str] | None = None,
+        on_delta: Callable[[FieldDelta], None] | None = None,
     ) -> str:
         """
         Tool call을 처리하고 최종 응답 텍스트를 반환
@@ -53,68 +116,484 @@ class BaseAgent(ABC):
         Args:
             messages: 현재 메시지 리스트
             max_iterations: 최대 tool call 반복 횟수
+            memo: 실행 단위 검색 메모 (있으면 같은 검색어는 다시 검색하지 않음)
+            stream_fields: 지정하면 응답을 스트리밍하며 JSON의 이 필드들을 on_delta로 전달하고,
+                JSON 객체가 닫히는 즉시 생성을 중단 (None이면 스트리밍하지 않음)
+            on_delta: 스트리밍 중 도착한 필드 조각을 받을 콜백
 
         Returns:
             최종 응답 텍스트
         """
         response_text: str = ""
+        packer = self._create_context_packer(messages)
 
         for iteration in range(max_iterations):
-            ai_message = self.llm_with_tools.invoke(messages)
-            messages.append(ai_message)
+            ai_message = self._call_llm(messages, stream_fields, on_delta)
+            if self._accept_ai_message(messages, iteration, ai_message):
+                # tool call이 있으면 실행 후 계속 반복
+                messages.extend(
+                    self._run_tool_calls(ai_message.tool_calls, packer, memo)
+                )
+                continue
+            response_text = self._content_to_text(ai_message.content)
+            break
 
-            # 로그 출력
-            content = ai_message.content
-            if isinstance(content, str):
-                content_preview = content[:100]
-            else:
-                content_preview = str(content)[:100] if content else ""
-            print(
-                f"🔍 {self.__class__.__name__} {iteration+1}차 응답: '{content_preview}'..."
-            )
+        # max_iterations 도달 후에도 응답이 없으면 tool 없이 마지막으로 한 번 더 시도
+        if not response_text.strip():
+            self._log_final_request()
+            final_message = self._call_llm(messages, use_tools=False)
+            response_text = self._final_response_text(final_message)
+
+        return response_text
+
+    async def _ahandle_tool_calls(
+        self,
+        messages: list,
+        max_iterations: int = 3,
+        memo: RetrievalMemo | None = None,
+        stream_fields: Iterable[str] | None = None,
+        on_delta: Callable[[FieldDelta], None] | None = None,
+    ) -> str:
+        """
+        _handle_tool_calls의 비동기 버전
+
+        LLM 호출은 ainvoke, Lorebook 검색은 search_lorebook.ainvoke를 사용하므로
+        이벤트 루프 스레드를 점유하지 않습니다.
+
+        Args:
+            messages: 현재 메시지 리스트
+            max_iterations: 최대 tool call 반복 횟수
+            memo: 실행 단위 검색 메모 (있으면 같은 검색어는 다시 검색하지 않음)
+            stream_fields: 지정하면 응답을 스트리밍하며 JSON의 이 필드들을 on_delta로 전달하고,
+                JSON 객체가 닫히는 즉시 생성을 중단 (None이면 스트리밍하지 않음)
+            on_delta: 스트리밍 중 도착한 필드 조각을 받을 콜백
 
-            if ai_message.tool_calls:
-                print(f"🔧 Tool calls: {ai_message.tool_calls}")
-
-                for tool_call in ai_message.tool_calls:
-                    if tool_call["name"] == "search_lorebook":
-                        tool_result = search_lorebook.invoke(tool_call)
-                        # 검색 결과 크기 제한 (최대 1000자)
-                        tool_result_str = str(tool_result)[:1000]
-                        print(f"📚 Lorebook 검색 결과: {tool_result_str[:200]}...")
-
-                        messages.append(
-                            ToolMessage(
-                                content=tool_result_str,
-                                tool_call_id=tool_call["id"],
-                            )
-                        )
-                # tool call이 있으면 계속 반복
+        Returns:
+            최종 응답 텍스트
+        """
+        response_text: str = ""
+        packer = self._create_context_packer(messages)
+
+        for iteration in range(max_iterations):
+            ai_message = await self._acall_llm(messages, stream_fields, on_delta)
+            if self._accept_ai_message(messages, iteration, ai_message):
+                messages.extend(
+                    await self._arun_tool_calls(ai_message.tool_calls, packer, memo)
+                )
                 continue
-            else:
-                # tool call이 없으면 응답 텍스트 사용
-                if isinstance(content, str):
-                    response_text = content
-                else:
-                    response_text = str(content) if content else ""
-                break
-
-        # max_iterations 도달 후에도 응답이 없으면 마지막으로 한 번 더 시도
+            response_text = self._content_to_text(ai_message.content)
+            break
+
         if not response_text.strip():
-            print(
-                f"⚠️ {self.__class__.__name__} max_iterations 도달, 최종 응답 요청 중..."
+            self._log_final_request()
+            final_message = await self._acall_llm(messages, use_tools=False)
+            response_text = self._final_response_text(final_message)
+
+        return response_text
+
+    def _accept_ai_message(
+        self, messages: list, iteration: int, ai_message: AIMessage
+    ) -> bool:
+        """응답을 메시지에 추가하고 로그 출력 (실행할 tool call이 있으면 True)"""
+        messages.append(ai_message)
+        self._log_ai_message(iteration, ai_message)
+        if not ai_message.tool_calls:
+            return False
+        print(f"🔧 Tool calls: {ai_message.tool_calls}")
+        return True
+
+    def _log_final_request(self) -> None:
+        """max_iterations 도달 로그 출력"""
+        print(f"⚠️ {self.__class__.__name__} max_iterations 도달, 최종 응답 요청 중...")
+
+    def _final_response_text(self, final_message: AIMessage) -> str:
+        """tool 없이 요청한 마지막 응답의 텍스트"""
+        response_text = self._content_to_text(final_message.content)
+        print(f"🔍 {self.__class__.__name__} 최종 응답: '{response_text[:100]}'...")
+        return response_text
+
+    def _call_llm(
+        self,
+        messages: list,
+        stream_fields: Iterable[str] | None = None,
+        on_delta: Callable[[FieldDelta], None] | None = None,
+        use_tools: bool = True,
+    ) -> AIMessage:
+        """
+        LLM 호출 (캐시 정책이 허용하면 같은 메시지의 이전 응답 재사용)
+
+        Args:
+            messages: 보낼 메시지 리스트
+            stream_fields: 지정하면 스트리밍 호출 (_stream_llm 참고)
+            on_delta: 스트리밍 중 도착한 필드 조각을 받을 콜백
+            use_tools: False이면 tool을 바인딩하지 않은 LLM으로 호출
+        """
+        cache, key, cached = self._llm_cache_lookup(messages, use_tools)
+        if cached is not None:
+            return self._replay_cached(cached, stream_fields, on_delta)
+
+        if not use_tools:
+            ai_message = self.llm.invoke(messages)
+        elif stream_fields is None:
+            ai_message = self.llm_with_tools.invoke(messages)
+        else:
+            ai_message = self._stream_llm(messages, stream_fields, on_delta)
+        self._llm_cache_store(cache, key, ai_message)
+        return ai_message
+
+    async def _acall_llm(
+        self,
+        messages: list,
+        stream_fields: Iterable[str] | None = None,
+        on_delta: Callable[[FieldDelta], None] | None = None,
+        use_tools: bool = True,
+    ) -> AIMessage:
+        """_call_llm의 비동기 버전"""
+        cache, key, cached = self._llm_cache_lookup(messages, use_tools)
+        if cached is not None:
+            return self._replay_cached(cached, stream_fields, on_delta)
+
+        if not use_tools:
+            ai_message = await self.llm.ainvoke(messages)
+        elif stream_fields is None:
+            ai_message = await self.llm_with_tools.ainvoke(messages)
+        else:
+            ai_message = await self._astream_llm(messages, stream_fields, on_delta)
+        self._llm_cache_store(cache, key, ai_message)
+        return ai_message
+
+    def _llm_cache_lookup(
+        self, messages: list, use_tools: bool
+    ) -> tuple[LLMResponseCache | None, str, AIMessage | None]:
+        """
+        이번 호출에 쓸 (캐시, 키, 캐시된 응답)
+
+        정책상 캐시하지 않으면 (None, "", None)을 반환합니다.
+        """
+        cache = self.llm_cache if self.llm_cache is not None else get_llm_cache()
+        if cache is None or not cache_allowed(self.LLM_CACHE_POLICY, self.llm):
+            return None, "", None
+        tools = getattr(self.llm_with_tools, "kwargs", {}).get("tools")
+        if not use_tools or not isinstance(tools, list):
+            tools = None
+        key = cache.make_key(self.llm, messages, tools)
+        if key is None:
+            return None, "", None
+        return cache, key, cache.get(key)
+
+    def _llm_cache_store(
+        self, cache: LLMResponseCache | None, key: str, ai_message: AIMessage
+    ) -> None:
+        """응답 저장 (내용과 tool call이 모두 없는 빈 응답은 저장하지 않음)"""
+        if cache is None:
+            return
+        if ai_message.tool_calls or self._content_to_text(ai_message.content).strip():
+            cache.set(key, ai_message)
+
+    def _replay_cached(
+        self,
+        ai_message: AIMessage,
+        stream_fields: Iterable[str] | None,
+        on_delta: Callable[[FieldDelta], None] | None,
+    ) -> AIMessage:
+        """캐시된 응답 반환 (스트리밍 호출이면 필드 조각을 한 번에 전달)"""
+        print(f"💾 {self.__class__.__name__} LLM 응답 캐시 적중")
+        if stream_fields is not None and on_delta is not None:
+            text = self._content_to_text(ai_message.content)
+            for delta in StreamingJSONParser(stream_fields).feed(text):
+                on_delta(delta)
+        return ai_message
+
+    def _stream_llm(
+        self,
+        messages: list,
+        fields: Iterable[str],
+        on_delta: Callable[[FieldDelta], None] | None,
+    ) -> AIMessage:
+        """
+        LLM 응답을 스트리밍하며 JSON 필드 조각을 전달하고, 객체가 닫히면 생성을 중단
+
+        tool call 응답도 청크를 합쳐 그대로 반환합니다.
+        """
+        parser = StreamingJSONParser(fields)
+        accumulated = None
+        stream = self.llm_with_tools.stream(messages)
+        try:
+            for chunk in stream:
+                accumulated = chunk if accumulated is None else accumulated + chunk
+                if self._feed_stream_parser(parser, chunk, on_delta):
+                    break
+        finally:
+            # 스트림을 닫아야 모델 서버가 남은 토큰 생성을 멈춤
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        return self._finish_stream(accumulated)
+
+    async def _astream_llm(
+        self,
+        messages: list,
+        fields: Iterable[str],
+        on_delta: Callable[[FieldDelta], None] | None,
+    ) -> AIMessage:
+        """_stream_llm의 비동기 버전"""
+        parser = StreamingJSONParser(fields)
+        accumulated = None
+        stream = self.llm_with_tools.astream(messages)
+        try:
+            async for chunk in stream:
+                accumulated = chunk if accumulated is None else accumulated + chunk
+                if self._feed_stream_parser(parser, chunk, on_delta):
+                    break
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return self._finish_stream(accumulated)
+
+    @staticmethod
+    def _stream_writer_options(
+        runtime: Any,
+        fields: Iterable[str],
+        make_event: Callable[[FieldDelta], Any],
+    ) -> dict[str, Any]:
+        """필드 조각을 이벤트로 바꿔 그래프의 custom 스트림에 쓰는 _handle_tool_calls 인자"""
+        write = getattr(runtime, "stream_writer", None)
+
+        def on_delta(delta: FieldDelta) -> None:
+            if write is not None:
+                write(make_event(delta))
+
+        return {"stream_fields": fields, "on_delta": on_delta}
+
+    def _feed_stream_parser(
+        self,
+        parser: StreamingJSONParser,
+        chunk: Any,
+        on_delta: Callable[[FieldDelta], None] | None,
+    ) -> bool:
+        """청크를 파서에 넣고 필드 조각을 전달 (JSON 객체가 닫혔으면 True)"""
+        if not isinstance(chunk.content, str) or not chunk.content:
+            return False
+        for delta in parser.feed(chunk.content):
+            if on_delta is not None:
+                on_delta(delta)
+        if parser.done:
+            print(f"⏹️ {self.__class__.__name__} JSON 응답 완료, 생성 중단")
+        return parser.done
+
+    @staticmethod
+    def _finish_stream(accumulated: Any) -> AIMessage:
+        """합친 청크를 일반 AIMessage로 변환"""
+        if accumulated is None:
+            return AIMessage(content="")
+        return message_chunk_to_message(accumulated)
+
+    def _create_context_packer(self, messages: list) -> ContextPacker:
+        """메시지에 이미 있는 자료를 제외하고 에이전트 예산으로 채우는 패커 생성"""
+        return ContextPacker.from_messages(messages, budget_tokens=self.lore_token_budget)
+
+    def _run_tool_calls(
+        self,
+        tool_calls: list[dict],
+        packer: ContextPacker | None = None,
+        memo: RetrievalMemo | None = None,
+    ) -> list[ToolMessage]:
+        """
+        한 AI 메시지의 tool call들을 실행하고 ToolMessage 리스트를 반환
+
+        여러 개의 Lorebook 검색 호출은 스레드 풀에서 병렬로 실행하며,
+        결과 ToolMessage는 원래 tool call 순서를 유지합니다.
+        메모에 있는 검색어는 실행하지 않고 메모의 결과를 사용합니다.
+        """
+        tools = self._lorebook_tools()
+        search_calls, planned = self._plan_tool_calls(tool_calls, memo)
+
+        def run(plan: tuple[dict, dict | None]) -> Any:
+            _, pending = plan
+            return tools[pending["name"]].invoke(pending) if pending else None
+
+        if sum(pending is not None for _, pending in planned) > 1:
+            results = list(_tool_executor.map(run, planned))
+        else:
+            results = [run(plan) for plan in planned]
+
+        return self._tool_messages(search_calls, planned, results, packer, memo)
+
+    async def _arun_tool_calls(
+        self,
+        tool_calls: list[dict],
+        packer: ContextPacker | None = None,
+        memo: RetrievalMemo | None = None,
+    ) -> list[ToolMessage]:
+        """_run_tool_calls의 비동기 버전 (asyncio.gather로 동시 실행, 순서 유지)"""
+        tools = self._lorebook_tools()
+        search_calls, planned = self._plan_tool_calls(tool_calls, memo)
+
+        async def run(plan: tuple[dict, dict | None]) -> Any:
+            _, pending = plan
+            return await tools[pending["name"]].ainvoke(pending) if pending else None
+
+        results = await asyncio.gather(*(run(plan) for plan in planned))
+
+        return self._tool_messages(search_calls, planned, results, packer, memo)
+
+    def _plan_tool_calls(
+        self, tool_calls: list[dict], memo: RetrievalMemo | None
+    ) -> tuple[list[dict], list[tuple[dict[str, list[Document]], dict | None]]]:
+        """
+        실행할 Lorebook 검색 tool call 목록과 tool call별 (메모 결과, 실행할 tool call)
+
+        Lorebook 검색이 아닌 tool call은 제외합니다.
+        """
+        tools = self._lorebook_tools()
+        search_calls = [tc for tc in tool_calls if tc["name"] in tools]
+        return search_calls, [self._recall_memoized(tc, memo) for tc in search_calls]
+
+    def _tool_messages(
+        self,
+        search_calls: list[dict],
+        planned: list[tuple[dict[str, list[Document]], dict | None]],
+        results: list[Any],
+        packer: ContextPacker | None,
+        memo: RetrievalMemo | None,
+    ) -> list[ToolMessage]:
+        """실행 결과를 메모와 합쳐 원래 tool call 순서의 ToolMessage로 변환"""
+        packer = packer or self._create_context_packer([])
+        return [
+            self._to_tool_message(
+                tool_call,
+                self._merge_memoized(tool_call, recalled, tool_result, memo),
+                packer,
             )
-            # tool 없이 일반 LLM으로 마지막 응답 요청
-            final_message = self.llm.invoke(messages)
-            if isinstance(final_message.content, str):
-                response_text = final_message.content
+            for tool_call, (recalled, _), tool_result in zip(
+                search_calls, planned, results
+            )
+        ]
+
+    @staticmethod
+    def _search_queries(tool_call: dict) -> list[str]:
+        """검색 tool call의 검색어 목록"""
+        args = tool_call.get("args", {})
+        if tool_call["name"] == "search_lorebook_batch":
+            return list(args.get("queries", []))
+        return [args.get("query", "")]
+
+    def _recall_memoized(
+        self, tool_call: dict, memo: RetrievalMemo | None
+    ) -> tuple[dict[str, list[Document]], dict | None]:
+        """
+        메모에 있는 검색어 결과와 나머지 검색어로 실행할 tool call을 분리
+
+        Returns:
+            (메모에서 찾은 검색어 → 문서, 실행할 tool call 또는 모두 메모에 있으면 None)
+        """
+        if memo is None:
+            return {}, tool_call
+
+        recalled: dict[str, list[Document]] = {}
+        missing: list[str] = []
+        for query in self._search_queries(tool_call):
+            contents = memo.recall(query, agent=self.__class__.__name__)
+            if contents is None:
+                missing.append(query)
             else:
-                response_text = (
-                    str(final_message.content) if final_message.content else ""
+                recalled[query] = [Document(page_content=c) for c in contents]
+
+        if recalled:
+            print(f"♻️ 검색 메모 재사용: {list(recalled)}")
+        if not missing:
+            return recalled, None
+        if not recalled:
+            return {}, tool_call
+        # 배치 검색의 일부만 메모에 있으면 나머지 검색어만 실행
+        return recalled, {**tool_call, "args": {**tool_call["args"], "queries": missing}}
+
+    def _merge_memoized(
+        self,
+        tool_call: dict,
+        recalled: dict[str, list[Document]],
+        tool_result: Any,
+        memo: RetrievalMemo | None,
+    ) -> Any:
+        """새 검색 결과를 메모에 기록하고 메모 결과와 합쳐 원래 검색어 순서로 반환"""
+        if tool_result is None:
+            return ToolMessage(content="", artifact=recalled, tool_call_id=tool_call["id"])
+        if not isinstance(tool_result, ToolMessage) or not isinstance(
+            tool_result.artifact, dict
+        ):
+            return tool_result
+
+        if memo is not None:
+            for query, docs in tool_result.artifact.items():
+                memo.record(
+                    query,
+                    [doc.page_content for doc in docs],
+                    agent=self.__class__.__name__,
                 )
-            print(f"🔍 {self.__class__.__name__} 최종 응답: '{response_text[:100]}'...")
+        merged = {
+            query: recalled.get(query) or tool_result.artifact.get(query, [])
+            for query in self._search_queries(tool_call)
+        }
+        return ToolMessage(
+            content=tool_result.content, artifact=merged, tool_call_id=tool_call["id"]
+        )
 
-        return response_text
+    @staticmethod
+    def _lorebook_tools() -> dict[str, Any]:
+        """이름 → 실행할 Lorebook tool"""
+        return {
+            "search_lorebook": search_lorebook,
+            "search_lorebook_batch": search_lorebook_batch,
+        }
+
+    def _log_ai_message(self, iteration: int, ai_message: Any) -> None:
+        """LLM 응답 로그 출력"""
+        content = ai_message.content
+        if isinstance(content, str):
+            content_preview = content[:100]
+        else:
+            content_preview = str(content)[:100] if content else ""
+        print(
+            f"🔍 {self.__class__.__name__} {iteration+1}차 응답: '{content_preview}'..."
+        )
+
+    def _to_tool_message(
+        self,
+        tool_call: dict,
+        tool_result: Any,
+        packer: ContextPacker,
+    ) -> ToolMessage:
+        """
+        Tool 실행 결과를 ToolMessage로 변환
+
+        검색 tool은 ToolMessage.artifact에 검색어 → 원본 문서를 담아 반환하므로,
+        패커가 이미 제공한 문서를 빼고 관련도 순으로 토큰 예산 안에서 다시 묶습니다.
+        """
+        if isinstance(tool_result, ToolMessage):
+            artifact = tool_result.artifact
+            content = self._content_to_text(tool_result.content)
+        else:
+            artifact = None
+            content = str(tool_result)
+
+        if isinstance(artifact, dict):
+            packed = packer.pack(artifact)
+        else:
+            packed = packer.pack_text(content)
+
+        print(
+            f"📚 Lorebook 검색 결과 ({packer.used_tokens}/{packer.budget_tokens} 토큰): "
+            f"{packed[:200]}..."
+        )
+        return ToolMessage(content=packed, tool_call_id=tool_call["id"])
+
+    @staticmethod
+    def _content_to_text(content: Any) -> str:
+        """메시지 content를 문자열로 변환"""
+        if isinstance(content, str):
+            return content
+        return str(content) if content else ""
 
     def _extract_json(self, response: str) -> dict:
         """
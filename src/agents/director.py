@@ -1,21 +1,164 @@
 """스토리 검수 에이전트"""
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.documents import Document
+
 from src.agents.base import BaseAgent
 from src.schemas.state import EvalReport, GraphState
+from src.utils.context_packer import ContextPacker
+from src.utils.retry_policy import RetryPolicy, get_retry_policy, record_run
+from src.utils.story_diff import paragraph_hash, split_paragraphs
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+# Director 프롬프트에 보여줄 "작성자가 참고한 자료"를 받은 에이전트
+WRITER_AGENTS = {"LorePrefetcher", "StoryWriter"}
+
+# 검수 방식: incremental (바뀐 문단만 전체 본문으로 검수), full (항상 전체 검수)
+REVIEW_MODES = ("incremental", "full")
+SUMMARY_CHARS = 80  # 바뀌지 않은 문단을 요약으로 보여줄 때의 앞부분 길이
+PARSE_FAILED_ISSUE = "Evaluation parsing failed"
+STREAM_FIELDS = ("feedback",)  # 스트리밍으로 내보낼 응답 JSON 필드
+
+
+@dataclass(frozen=True)
+class ReviewTextEvent:
+    """
+    검수 피드백 스트리밍 이벤트 (LangGraph custom 스트림으로 전달)
+
+    Attributes:
+        field: "feedback"
+        text: 새로 도착한 텍스트 조각
+        attempt: 검수 중인 작성 차수 (1부터)
+    """
+
+    field: str
+    text: str
+    attempt: int
 
 
 class Director(BaseAgent):
-    """스토리 검수 에이전트 (Director)"""
+    """
+    스토리 검수 에이전트 (Director)
+
+    스토리를 문단 단위로 검수하고 문단 해시별 결과를 state.paragraph_reviews에 보관합니다.
+    incremental 모드의 재검수에서는 바뀐 문단만 전체 본문으로 보내고,
+    나머지는 이전 검수 결과와 앞부분 요약으로 대체합니다. 최종 판정은 항상 스토리 전체 기준입니다.
+
+    stream_output이 True이면 응답을 스트리밍하면서 feedback 필드를
+    ReviewTextEvent로 그래프의 custom 스트림에 내보내고, JSON이 닫히면 생성을 중단합니다.
+    """
 
-    def __call__(self, state: GraphState, runtime) -> GraphState:
+    # 검수는 스토리 본문이 이미 프롬프트를 차지하므로 설정 확인용 자료만 작게 둠
+    LORE_TOKEN_BUDGET = 2000
+    # StoryWriter가 이미 참고한 자료에 쓸 최대 토큰 수
+    WRITER_LORE_TOKEN_BUDGET = 1500
+
+    def __init__(
+        self,
+        llm: "ChatOllama",
+        system_prompt: str = "",
+        lore_token_budget: int | None = None,
+        review_mode: str = "incremental",
+        stream_output: bool = False,
+    ):
+        if review_mode not in REVIEW_MODES:
+            raise ValueError(
+                f"review_mode는 {REVIEW_MODES} 중 하나여야 합니다: {review_mode}"
+            )
+        super().__init__(llm, system_prompt, lore_token_budget)
+        self.review_mode = review_mode
+        self.stream_output = stream_output
+        # None이면 configure_retry_policy로 설정한 공유 정책 사용
+        self.retry_policy: RetryPolicy | None = None
+
+    def __call__(self, state: GraphState, runtime) -> dict[str, Any]:
         """스토리 검수 실행"""
+        state = self._with_own_memo(state)
+        user_message = self._build_user_message(state)
+        messages = self._create_messages(user_message)
+
+        # Tool call 처리 (Director는 tool 검색 후 최종 응답까지 받아야 함)
+        response_text = self._handle_tool_calls(
+            messages,
+            max_iterations=4,
+            memo=state.retrieval_memo,
+            **self._stream_options(state, runtime),
+        )
+        return self._apply_response(state, response_text)
+
+    async def acall(self, state: GraphState, runtime) -> dict[str, Any]:
+        """스토리 검수 비동기 실행"""
+        state = self._with_own_memo(state)
         user_message = self._build_user_message(state)
         messages = self._create_messages(user_message)
 
         # Tool call 처리 (Director는 tool 검색 후 최종 응답까지 받아야 함)
-        response_text = self._handle_tool_calls(messages, max_iterations=4)
+        response_text = await self._ahandle_tool_calls(
+            messages,
+            max_iterations=4,
+            memo=state.retrieval_memo,
+            **self._stream_options(state, runtime),
+        )
+        return self._apply_response(state, response_text)
+
+    def stopping_policy(self) -> RetryPolicy:
+        """이 Director가 사용할 재작성 정책"""
+        if self.retry_policy is not None:
+            return self.retry_policy
+        return get_retry_policy()
+
+    def should_skip_review(self, state: GraphState) -> bool:
+        """
+        방금 작성한 스토리의 검수를 생략할지 여부
 
-        # 응답 파싱
+        검수 결과와 관계없이 max_retries에 도달해 재작성이 일어날 수 없는 마지막 작성본이고,
+        정책의 skip_final_review가 켜져 있으며, 이전 작성본을 한 번 이상 검수했을 때만 생략합니다.
+
+        Args:
+            state: 작성 직후의 상태
+        """
+        return (
+            self.stopping_policy().skip_final_review
+            and state.retry_count > 0
+            and state.retry_count + 1 >= state.max_retries
+        )
+
+    def skip_review(self, state: GraphState) -> dict[str, Any]:
+        """
+        검수 없이 종료하는 상태 업데이트
+
+        마지막 작성본은 검수하지 않았으므로 이전 작성본의 eval_report를 지우고
+        review_skipped로 표시합니다 (score_history는 검수한 작성본까지만 포함).
+        """
+        print("⏭️ 마지막 작성본이므로 검수를 생략하고 종료합니다.")
+        stats = record_run(
+            state.score_history,
+            writes=state.retry_count + 1,
+            max_writes=state.max_retries,
+            review_skipped=True,
+        )
+        print(f"📊 재작성 정책: {stats.summary()}")
+        return {"eval_report": None, "review_skipped": True, "is_complete": True}
+
+    def _stream_options(self, state: GraphState, runtime: Any) -> dict[str, Any]:
+        """스트리밍 모드일 때 _handle_tool_calls에 넘길 인자"""
+        if not self.stream_output:
+            return {}
+        attempt = state.retry_count + 1
+        return self._stream_writer_options(
+            runtime,
+            STREAM_FIELDS,
+            lambda delta: ReviewTextEvent(delta.field, delta.text, attempt),
+        )
+
+    def _apply_response(self, state: GraphState, response_text: str) -> dict[str, Any]:
+        """응답을 파싱하여 상태 업데이트 생성 (feedback_history에는 새 피드백만 추가)"""
+        # 응답 파싱 (문단별 결과는 정상 파싱된 응답만 캐시)
+        parsed = False
         if not response_text or (
             isinstance(response_text, str) and not response_text.strip()
         ):
@@ -37,21 +180,49 @@ class Director(BaseAgent):
         else:
             print(f"🔍 Director 응답 파싱 중: {response_text[:200]}...")
             eval_report = self._parse_response(response_text)
+            parsed = PARSE_FAILED_ISSUE not in eval_report.issues
+
+        paragraph_reviews = self._merge_paragraph_reviews(state, eval_report, parsed)
 
         # 결과 반환
-        state.eval_report = eval_report
+        update: dict[str, Any] = {
+            "eval_report": eval_report,
+            "paragraph_reviews": paragraph_reviews,
+            "retrieval_memo": state.retrieval_memo,
+        }
+        scores = list(state.score_history)
+        if parsed:
+            scores.append(eval_report.score)
+            update["score_history"] = [eval_report.score]
+
+        retry_count = state.retry_count
         if not eval_report.is_approved:
-            state.feedback_history.append(eval_report.feedback)
-            state.retry_count += 1
+            retry_count += 1
+            update["feedback_history"] = [eval_report.feedback]
+            update["retry_count"] = retry_count
 
+        early_stop = False
         if eval_report.is_approved:
-            state.is_complete = True
+            update["is_complete"] = True
             print("✅ 스토리가 승인되었습니다.")
-        elif state.retry_count >= state.max_retries:
-            state.is_complete = True
+        elif retry_count >= state.max_retries:
+            update["is_complete"] = True
             print("⚠️ 최대 재시도 횟수에 도달하여 종료합니다.")
+        elif parsed and (reason := self.stopping_policy().stop_reason(scores)):
+            update["is_complete"] = early_stop = True
+            print(f"⏹️ 재작성을 조기 종료합니다: {reason}")
 
-        return state
+        if update.get("is_complete"):
+            print(f"📊 Lorebook 검색량: {state.retrieval_memo.summary()}")
+            stats = record_run(
+                scores,
+                writes=state.retry_count + 1,
+                max_writes=state.max_retries,
+                early_stop=early_stop,
+            )
+            print(f"📊 재작성 정책: {stats.summary()}")
+
+        return update
 
     def _build_user_message(self, state: GraphState) -> str:
         """유저 메시지 구성"""
@@ -70,19 +241,99 @@ class Director(BaseAgent):
                 parts.append(f"Length: {state.request.length}")
             parts.append("")
 
-        # 검수할 스토리
-        parts.append("## Story to Review")
-        if state.story_output and state.story_output.story:
-            parts.append(state.story_output.story)
-        else:
+        # 검수할 스토리 (문단 번호를 붙여 paragraph_issues로 문단별 결과를 받음)
+        paragraphs, changed = self._review_plan(state)
+        if not paragraphs:
+            parts.append("## Story to Review")
             parts.append("(스토리 없음)")
+        elif len(changed) == len(paragraphs):
+            parts.append("## Story to Review")
+            parts.extend(f"[P{n}] {p}" for n, p in enumerate(paragraphs, start=1))
+        else:
+            parts.extend(self._incremental_story_section(state, paragraphs, changed))
         parts.append("")
 
+        # StoryWriter가 참고한 자료 (같은 설정을 다시 검색하지 않도록 함께 제공)
+        writer_lore = state.retrieval_memo.used_by(WRITER_AGENTS)
+        if writer_lore:
+            parts.append("## Story Writer가 참고한 설정 자료")
+            results = {
+                record.query: [Document(page_content=c) for c in record.contents]
+                for record in writer_lore
+            }
+            parts.append(ContextPacker(self.WRITER_LORE_TOKEN_BUDGET).pack(results))
+            parts.append(
+                "위 자료로 확인할 수 있는 설정은 search_lorebook으로 다시 검색하지 마세요."
+            )
+            parts.append("")
+
         # 재시도 정보
         parts.append("## Review Info")
         parts.append(f"Attempt: {state.retry_count} / {state.max_retries}")
         return "\n".join(parts)
 
+    def _review_plan(self, state: GraphState) -> tuple[list[str], set[int]]:
+        """현재 스토리 문단과 전체 본문으로 검수할 문단 번호 (이전 검수 결과가 없는 문단)"""
+        story = state.story_output.story if state.story_output else ""
+        paragraphs = split_paragraphs(story)
+        numbers = set(range(1, len(paragraphs) + 1))
+        if self.review_mode == "full" or not state.paragraph_reviews:
+            return paragraphs, numbers
+        return paragraphs, {
+            n
+            for n in numbers
+            if paragraph_hash(paragraphs[n - 1]) not in state.paragraph_reviews
+        }
+
+    def _incremental_story_section(
+        self, state: GraphState, paragraphs: list[str], changed: set[int]
+    ) -> list[str]:
+        """바뀐 문단만 전체 본문으로, 나머지는 이전 검수 결과와 요약으로 표시"""
+        parts = [
+            "## Story to Review (변경된 문단만 전체 표시)",
+            f"이전 검수 이후 {len(changed)}개 문단이 바뀌었습니다. "
+            "바뀌지 않은 문단은 이전 검수 결과와 앞부분만 표시합니다.",
+        ]
+        for number, paragraph in enumerate(paragraphs, start=1):
+            if number in changed:
+                parts.append(f"[P{number}] {paragraph}")
+                continue
+            issues = state.paragraph_reviews[paragraph_hash(paragraph)]
+            verdict = f"이전 지적: {'; '.join(issues)}" if issues else "이전 검수 통과"
+            summary = paragraph[:SUMMARY_CHARS] + ("…" if len(paragraph) > SUMMARY_CHARS else "")
+            parts.append(f"[P{number}] (변경 없음, {verdict}) {summary}")
+        parts.append(
+            "paragraph_issues에는 전체 본문이 표시된 문단만 평가하세요. "
+            "is_approved, score, feedback은 이전 지적을 포함한 스토리 전체 기준으로 판단하세요."
+        )
+        return parts
+
+    def _merge_paragraph_reviews(
+        self, state: GraphState, eval_report: EvalReport, parsed: bool
+    ) -> dict[str, list[str]]:
+        """
+        이번 검수 결과를 문단 해시별로 기록하고, 바뀌지 않은 문단의 이전 지적을 보고서에 합침
+
+        반환하는 캐시는 현재 버전의 문단만 포함하므로 재시도가 늘어도 크기가 일정합니다.
+        응답 파싱에 실패하면 이번에 검수한 문단은 기록하지 않습니다.
+        """
+        paragraphs, changed = self._review_plan(state)
+        reviews: dict[str, list[str]] = {}
+        for number, paragraph in enumerate(paragraphs, start=1):
+            key = paragraph_hash(paragraph)
+            if number in changed:
+                if parsed:
+                    reviews[key] = eval_report.paragraph_issues.get(number, [])
+                continue
+
+            reviews[key] = cached = state.paragraph_reviews[key]
+            if cached:
+                eval_report.paragraph_issues.setdefault(number, cached)
+                eval_report.issues.extend(
+                    issue for issue in cached if issue not in eval_report.issues
+                )
+        return reviews
+
     def _parse_response(self, response: str) -> EvalReport:
         """LLM 응답을 EvalReport로 파싱"""
         try:
@@ -92,6 +343,9 @@ class Director(BaseAgent):
                 score=float(data.get("score", 0.0)),
                 feedback=data.get("feedback", ""),
                 issues=data.get("issues", []),
+                paragraph_issues=self._parse_paragraph_issues(
+                    data.get("paragraph_issues")
+                ),
             )
         except Exception as e:
             # 파싱 실패 시 기본값 반환 (불합격 처리)
@@ -99,5 +353,22 @@ class Director(BaseAgent):
                 is_approved=False,
                 score=0.0,
                 feedback=f"Failed to parse evaluation response: {str(e)}. Raw: {response[:500]}",
-                issues=["Evaluation parsing failed"],
+                issues=[PARSE_FAILED_ISSUE],
             )
+
+    @staticmethod
+    def _parse_paragraph_issues(raw: Any) -> dict[int, list[str]]:
+        """paragraph_issues 파싱 (형식이 잘못된 항목은 무시)"""
+        if not isinstance(raw, dict):
+            return {}
+        result: dict[int, list[str]] = {}
+        for number, issues in raw.items():
+            try:
+                key = int(number)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(issues, str):
+                issues = [issues]
+            if isinstance(issues, list) and issues:
+                result[key] = [str(issue) for issue in issues]
+        return result
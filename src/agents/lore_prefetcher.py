@@ -0,0 +1,99 @@
+"""Lorebook 사전 검색 에이전트"""
+
+import asyncio
+from typing import Any
+
+from src.agents.tools.search_lorebook import get_gazetteer, retrieve_documents_batch
+from src.schemas.state import GraphState, LoreSnippet, RefinedRequest
+
+MAX_PREFETCH_QUERIES = 4  # 한 번에 검색할 최대 검색어 수
+MAX_PREFETCH_DOCS = 4  # 프롬프트에 넣을 최대 자료 수
+
+
+class LorePrefetcher:
+    """
+    파싱된 요청에서 개체와 주제를 뽑아 Lorebook 자료를 미리 검색하는 에이전트
+
+    LLM을 호출하지 않고 개체명 사전과 배치 검색만 사용합니다.
+    검색 결과는 state.prefetched_lore에 담겨 StoryWriter의 첫 프롬프트에 들어가므로,
+    StoryWriter가 search_lorebook tool call에 LLM 호출을 쓰지 않아도 됩니다.
+    """
+
+    def __init__(
+        self,
+        max_queries: int = MAX_PREFETCH_QUERIES,
+        max_docs: int = MAX_PREFETCH_DOCS,
+    ):
+        self.max_queries = max_queries
+        self.max_docs = max_docs
+
+    def __call__(self, state: GraphState, runtime) -> dict[str, Any]:
+        """사전 검색 실행 (검색 실패 시 빈 자료로 계속 진행)"""
+        queries = self.extract_queries(state.request)
+        if not queries:
+            return {}
+
+        print(f"🔎 Lorebook 사전 검색: {queries}")
+        try:
+            results = retrieve_documents_batch(queries)
+        except Exception as e:
+            print(f"⚠️ Lorebook 사전 검색 실패, tool call로 대체합니다: {e}")
+            return {}
+
+        # 실행 단위 검색 메모에 기록하여 StoryWriter/Director가 다시 검색하지 않게 함
+        # (입력 상태의 메모는 바꾸지 않고 복사본에 기록하여 업데이트로 반환)
+        memo = state.retrieval_memo.model_copy(deep=True)
+        for query, docs in zip(queries, results):
+            memo.record(
+                query, [doc.page_content for doc in docs], agent=self.__class__.__name__
+            )
+        return {
+            "prefetched_lore": self._collect_snippets(queries, results),
+            "retrieval_memo": memo,
+        }
+
+    async def acall(self, state: GraphState, runtime) -> dict[str, Any]:
+        """사전 검색 비동기 실행 (검색은 스레드에서 실행)"""
+        return await asyncio.to_thread(self, state, runtime)
+
+    def extract_queries(self, request: RefinedRequest) -> list[str]:
+        """
+        요청에서 검색어 추출
+
+        요청 문장에 등장하는 lorebook 개체 이름을 먼저 넣고,
+        마지막으로 요청 문장 자체를 주제 검색어로 사용합니다.
+        개체명 사전을 불러오지 못하면 요청 문장만 검색어로 사용합니다.
+        """
+        prompt = request.summarized_prompt.strip()
+        if not prompt:
+            return []
+
+        try:
+            mentions = get_gazetteer().mentions(prompt)
+        except Exception as e:
+            print(f"⚠️ 개체명 사전을 불러오지 못해 요청 문장만 검색합니다: {e}")
+            return [prompt]
+
+        queries: list[str] = []
+        for entity in mentions:
+            if entity.korean not in queries:
+                queries.append(entity.korean)
+            if len(queries) >= self.max_queries - 1:
+                break
+
+        queries.append(prompt)
+        return queries
+
+    def _collect_snippets(self, queries, results) -> list[LoreSnippet]:
+        """검색어별 결과를 합치고 같은 문서는 한 번만 포함"""
+        snippets: list[LoreSnippet] = []
+        seen: set[str] = set()
+        for query, docs in zip(queries, results):
+            for doc in docs:
+                if doc.page_content in seen:
+                    continue
+                seen.add(doc.page_content)
+                snippets.append(LoreSnippet(query=query, content=doc.page_content))
+                if len(snippets) >= self.max_docs:
+                    return snippets
+        return snippets
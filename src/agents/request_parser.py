@@ -1,15 +1,76 @@
+import asyncio
 import json
 import logging
 import re
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_ollama import ChatOllama
 
+from src.agents.tools.search_lorebook import embed_text_if_ready
 from src.schemas.state import GraphState, RefinedRequest
+from src.utils.llm_cache import LLMResponseCache, cache_allowed, get_llm_cache
+from src.utils.request_rules import FastPathStats, extract_request
+from src.utils.semantic_cache import SemanticCache
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
 
 logger = logging.getLogger(__name__)
 
+# 의미 기반 요청 캐시 (configure_request_cache로 켜기 전까지는 사용하지 않음)
+_request_cache: SemanticCache[RefinedRequest] | None = None
+
+# 규칙 기반 분석(fast path)과 LLM 분석의 횟수/소요 시간 (모든 파서 공유)
+_fast_path_stats = FastPathStats()
+_fast_path_stats_lock = threading.Lock()
+
+
+def configure_request_cache(
+    threshold: float = 0.95, maxsize: int = 256, enabled: bool = True
+) -> SemanticCache[RefinedRequest] | None:
+    """
+    요청 분석 결과의 의미 기반 캐시를 설정합니다.
+
+    입력이 이전 요청과 같으면(정규화 후 완전 일치) 이전 RefinedRequest를 그대로 사용하고,
+    임베딩 유사도가 threshold 이상이면 이전 분석의 장르/스타일/분량만 재사용하여
+    LLM을 호출하지 않습니다. 임베딩은 Lorebook 검색용 임베딩 모델이 이미 로드되어
+    있을 때만 계산하며, 그 전에는 완전 일치만 확인합니다.
+
+    Args:
+        threshold: 적중으로 볼 최소 코사인 유사도
+        maxsize: 보관할 최대 요청 수 (넘으면 오래 사용되지 않은 요청부터 제거)
+        enabled: False이면 캐시 끄기
+
+    Returns:
+        SemanticCache | None: 새로 설정된 캐시 (끈 경우 None)
+    """
+    global _request_cache
+    _request_cache = (
+        SemanticCache(threshold=threshold, maxsize=maxsize) if enabled else None
+    )
+    return _request_cache
+
+
+def get_request_cache() -> SemanticCache[RefinedRequest] | None:
+    """요청 분석 캐시 반환 (설정하지 않았으면 None)"""
+    return _request_cache
+
+
+def get_fast_path_stats() -> FastPathStats:
+    """규칙 기반 분석 통계의 복사본 반환"""
+    with _fast_path_stats_lock:
+        return FastPathStats(**vars(_fast_path_stats))
+
+
+def reset_fast_path_stats() -> None:
+    """규칙 기반 분석 통계 초기화"""
+    global _fast_path_stats
+    with _fast_path_stats_lock:
+        _fast_path_stats = FastPathStats()
+
 
 class RequestParserError(Exception):
     """Request parsing 중 발생하는 에러"""
@@ -21,45 +82,254 @@ class UserRequestParser:
     """사용자 요청을 구조화된 RefinedRequest로 변환하는 파서"""
 
     MAX_RETRIES = 2  # JSON 파싱 실패 시 재시도 횟수
+    # LLM 응답 캐시 정책 (src.utils.llm_cache 참고) - 샘플링하는 모델의 분석은 고정하지 않음
+    LLM_CACHE_POLICY = "deterministic"
+    # 규칙 기반 분석 신뢰도가 이 값 이상이면 LLM을 호출하지 않음
+    FAST_PATH_MIN_CONFIDENCE = 0.75
 
-    def __init__(self, llm: ChatOllama):
+    def __init__(self, llm: "ChatOllama"):
         self.llm = llm
         self.system_prompt = self._system_prompt()
+        # None이면 configure_llm_cache로 설정한 공유 캐시 사용
+        self.llm_cache: LLMResponseCache | None = None
+        # None이면 configure_request_cache로 설정한 공유 캐시 사용
+        self.request_cache: SemanticCache[RefinedRequest] | None = None
+        # None이면 규칙 기반 분석을 사용하지 않고 항상 LLM 호출
+        self.fast_path_min_confidence: float | None = self.FAST_PATH_MIN_CONFIDENCE
+
+    def __call__(self, state: GraphState, runtime) -> dict[str, Any]:
+        request = self._parse_without_embedding(state.user_input)
+        if request is not None:
+            return {"request": request}
+        embedding = self._embed(state.user_input)
+        request, cache, key = self._parse_from_cache(state.user_input, embedding)
+        if request is not None:
+            return {"request": request}
+
+        chain = self._build_chain()
+        last_error: Exception | None = None
+        started = time.perf_counter()
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            result = chain.invoke({"input": state.user_input})
+            request, last_error = self._try_parse(result, attempt)
+            if request is not None:
+                self._cache_store(cache, key, result)
+                break
+
+        return {
+            "request": self._finish_llm(
+                state.user_input, request, embedding, started, last_error
+            )
+        }
+
+    async def acall(self, state: GraphState, runtime) -> dict[str, Any]:
+        """__call__의 비동기 버전 (chain.ainvoke 사용)"""
+        request = self._parse_without_embedding(state.user_input)
+        if request is not None:
+            return {"request": request}
+        embedding = await asyncio.to_thread(self._embed, state.user_input)
+        request, cache, key = self._parse_from_cache(state.user_input, embedding)
+        if request is not None:
+            return {"request": request}
+
+        chain = self._build_chain()
+        last_error: Exception | None = None
+        started = time.perf_counter()
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            result = await chain.ainvoke({"input": state.user_input})
+            request, last_error = self._try_parse(result, attempt)
+            if request is not None:
+                self._cache_store(cache, key, result)
+                break
+
+        return {
+            "request": self._finish_llm(
+                state.user_input, request, embedding, started, last_error
+            )
+        }
+
+    def _parse_without_embedding(self, user_input: str) -> RefinedRequest | None:
+        """임베딩 없이 끝나는 분석 (요청 캐시 완전 일치 또는 규칙 기반 분석)"""
+        request = self._request_cache_exact(user_input)
+        if request is not None:
+            return request
+        return self._fast_path(user_input)
+
+    def _parse_from_cache(
+        self, user_input: str, embedding: list[float] | None
+    ) -> tuple[RefinedRequest | None, LLMResponseCache | None, str]:
+        """
+        의미 기반 요청 캐시와 LLM 응답 캐시로 분석
+
+        Returns:
+            (분석 결과 또는 None, LLM 호출 후 응답을 저장할 캐시, 키)
+        """
+        request = self._request_cache_lookup(user_input, embedding)
+        if request is not None:
+            return request, None, ""
 
-    def __call__(self, state: GraphState, runtime) -> GraphState:
+        cache, key, cached = self._cache_lookup(user_input)
+        if cached is None:
+            return None, cache, key
+        request = self._parse_result(cached.content)
+        self._request_cache_store(user_input, request, embedding)
+        return request, None, ""
+
+    def _try_parse(
+        self, result: Any, attempt: int
+    ) -> tuple[RefinedRequest | None, Exception | None]:
+        """LLM 응답 파싱 시도 - (결과, None) 또는 실패 시 (None, 에러)"""
+        try:
+            return self._parse_result(result.content), None
+        except (json.JSONDecodeError, RequestParserError, KeyError) as e:
+            logger.warning(
+                f"Parsing 시도 {attempt + 1}/{self.MAX_RETRIES + 1} 실패: {e}"
+            )
+            return None, e
+
+    def _finish_llm(
+        self,
+        user_input: str,
+        request: RefinedRequest | None,
+        embedding: list[float] | None,
+        started: float,
+        last_error: Exception | None,
+    ) -> RefinedRequest:
+        """LLM 분석 시간 기록 후 결과를 요청 캐시에 저장 (모든 재시도 실패 시 기본값)"""
+        self._record_llm(time.perf_counter() - started)
+        if request is None:
+            logger.error(f"모든 parsing 시도 실패, 기본값 사용: {last_error}")
+            return self._create_fallback_request(user_input)
+        self._request_cache_store(user_input, request, embedding)
+        return request
+
+    def _fast_path(self, user_input: str) -> RefinedRequest | None:
+        """키워드 규칙으로 분석 (신뢰도가 기준 미만이면 None을 반환하고 LLM 사용)"""
+        if self.fast_path_min_confidence is None:
+            return None
+        started = time.perf_counter()
+        extraction = extract_request(user_input)
+        if extraction.confidence < self.fast_path_min_confidence:
+            logger.info(
+                f"규칙 기반 분석 신뢰도 부족 ({extraction.confidence:.2f}), LLM 사용"
+            )
+            return None
+
+        with _fast_path_stats_lock:
+            _fast_path_stats.fast_path += 1
+            _fast_path_stats.fast_path_seconds += time.perf_counter() - started
+            stats = FastPathStats(**vars(_fast_path_stats))
+        logger.info(
+            f"규칙 기반 분석 사용 (신뢰도 {extraction.confidence:.2f}) - "
+            f"fast path {stats.fast_path_rate:.0%}, "
+            f"절약 추정 {stats.estimated_seconds_saved:.1f}초"
+        )
+        self._request_cache_store(user_input, extraction.request, None)
+        return extraction.request
+
+    @staticmethod
+    def _record_llm(elapsed: float) -> None:
+        """LLM 분석(재시도 포함) 소요 시간 기록 - fast path 절약 시간 추정에 사용"""
+        with _fast_path_stats_lock:
+            _fast_path_stats.llm += 1
+            _fast_path_stats.llm_seconds += elapsed
+
+    def _get_request_cache(self) -> SemanticCache[RefinedRequest] | None:
+        if self.request_cache is not None:
+            return self.request_cache
+        return get_request_cache()
+
+    def _request_cache_exact(self, user_input: str) -> RefinedRequest | None:
+        """같은 입력의 이전 분석 결과 (임베딩 없이 확인)"""
+        cache = self._get_request_cache()
+        request = cache.get_exact(user_input) if cache is not None else None
+        if request is None:
+            return None
+        logger.info("요청 분석 캐시 적중 (완전 일치)")
+        return request.model_copy()
+
+    def _embed(self, user_input: str) -> list[float] | None:
+        """의미 기반 조회용 입력 임베딩 (캐시를 쓰지 않거나 임베딩할 수 없으면 None)"""
+        if self._get_request_cache() is None:
+            return None
+        try:
+            return embed_text_if_ready(user_input)
+        except Exception as e:
+            logger.warning(f"요청 임베딩 실패, 의미 기반 캐시를 건너뜁니다: {e}")
+            return None
+
+    def _request_cache_lookup(
+        self, user_input: str, embedding: list[float] | None
+    ) -> RefinedRequest | None:
+        """
+        임베딩이 가장 가까운 이전 요청의 분석 결과 (threshold 미만이면 None)
+
+        비슷한 문장이라도 지명이나 인물처럼 주제가 다를 수 있으므로 장르/스타일/분량만
+        재사용하고, summarized_prompt는 이번 입력(공백 정리)을 사용합니다.
+        """
+        cache = self._get_request_cache()
+        if cache is None or embedding is None:
+            return None
+        hit = cache.get(user_input, embedding)
+        if hit is None:
+            return None
+        request, similarity = hit
+        logger.info(f"요청 분석 캐시 적중 (유사도 {similarity:.3f})")
+        return request.model_copy(
+            update={"summarized_prompt": " ".join(user_input.split())}
+        )
+
+    def _request_cache_store(
+        self, user_input: str, request: RefinedRequest, embedding: list[float] | None
+    ) -> None:
+        cache = self._get_request_cache()
+        if cache is not None:
+            cache.add(user_input, request.model_copy(), embedding)
+
+    def _cache_lookup(
+        self, user_input: str
+    ) -> tuple[LLMResponseCache | None, str, AIMessage | None]:
+        """(캐시, 키, 캐시된 응답) 조회 - 정책상 캐시하지 않으면 캐시가 None"""
+        cache = self.llm_cache if self.llm_cache is not None else get_llm_cache()
+        if cache is None or not cache_allowed(self.LLM_CACHE_POLICY, self.llm):
+            return None, "", None
+        messages = [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=user_input),
+        ]
+        key = cache.make_key(self.llm, messages)
+        if key is None:
+            return None, "", None
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Request parsing LLM 응답 캐시 적중")
+        return cache, key, cached
+
+    @staticmethod
+    def _cache_store(cache: LLMResponseCache | None, key: str, result: Any) -> None:
+        """파싱에 성공한 응답만 저장 (실패한 응답은 재시도 시 다시 생성)"""
+        if cache is not None and isinstance(result, AIMessage):
+            cache.set(key, result)
+
+    def _build_chain(self):
+        """프롬프트 | LLM 체인 생성"""
         prompt = ChatPromptTemplate.from_messages(
             [("system", self.system_prompt), ("human", "{input}")]
         )
-        chain = prompt | self.llm
+        return prompt | self.llm
 
-        last_error: Exception | None = None
+    def _parse_result(self, content: str) -> RefinedRequest:
+        """LLM 응답 텍스트를 RefinedRequest로 변환 (실패 시 예외 발생)"""
+        result_json = self._extract_json(content)
 
-        for attempt in range(self.MAX_RETRIES + 1):
-            try:
-                result = chain.invoke({"input": state.user_input})
-                result_json = self._extract_json(result.content)
-
-                if result_json is None:
-                    raise RequestParserError("JSON 추출 실패")
-
-                request = self._create_refined_request(result_json)
-                state.request = request
-                logger.info(
-                    f"Request parsing 성공: {request.summarized_prompt[:50]}..."
-                )
-                return state
-
-            except (json.JSONDecodeError, RequestParserError, KeyError) as e:
-                last_error = e
-                logger.warning(
-                    f"Parsing 시도 {attempt + 1}/{self.MAX_RETRIES + 1} 실패: {e}"
-                )
-                continue
-
-        # 모든 재시도 실패 시 기본값으로 폴백
-        logger.error(f"모든 parsing 시도 실패, 기본값 사용: {last_error}")
-        state.request = self._create_fallback_request(state.user_input)
-        return state
+        if result_json is None:
+            raise RequestParserError("JSON 추출 실패")
+
+        request = self._create_refined_request(result_json)
+        logger.info(f"Request parsing 성공: {request.summarized_prompt[:50]}...")
+        return request
 
     def _extract_json(self, content: str) -> dict[str, Any] | None:
         """LLM 응답에서 JSON을 추출"""
@@ -1,20 +1,158 @@
 """스토리 작성 에이전트"""
 
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.documents import Document
+
 from src.agents.base import BaseAgent
 from src.schemas.state import GraphState, StoryOutput
+from src.utils.context_packer import ContextPacker
+from src.utils.story_diff import (
+    apply_edits,
+    join_paragraphs,
+    number_paragraphs,
+    parse_edits,
+    split_paragraphs,
+)
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+# 재시도 시 수정 방식: auto (긴 스토리만 부분 수정), diff (항상 부분 수정), full (항상 전체 재작성)
+REVISION_MODES = ("auto", "diff", "full")
+REVISION_MIN_CHARS = 1000  # auto 모드에서 부분 수정을 사용할 최소 스토리 길이
+STREAM_FIELDS = ("title", "story")  # 스트리밍으로 내보낼 응답 JSON 필드
+
+
+@dataclass(frozen=True)
+class StoryTextEvent:
+    """
+    스토리 텍스트 스트리밍 이벤트 (LangGraph custom 스트림으로 전달)
+
+    Attributes:
+        field: "title" 또는 "story"
+        text: 새로 도착한 텍스트 조각
+        attempt: 몇 번째 작성인지 (1부터)
+        replace: True면 같은 작성의 해당 필드 텍스트 전체를 text로 대체 (부분 수정 결과)
+    """
+
+    field: str
+    text: str
+    attempt: int
+    replace: bool = False
 
 
 class StoryWriter(BaseAgent):
-    """스토리 작성 에이전트"""
+    """
+    스토리 작성 에이전트
+
+    재시도 시 revision_mode에 따라 전체 스토리를 다시 생성하는 대신
+    이전 버전에 대한 문단 단위 수정안만 받아 로컬에서 적용합니다.
+    수정안을 적용할 수 없으면 전체 재작성으로 대체합니다.
+
+    stream_output이 True이면 응답을 스트리밍하면서 title/story 필드를
+    StoryTextEvent로 그래프의 custom 스트림에 내보내고, JSON이 닫히면 생성을 중단합니다.
+    """
 
-    def __call__(self, state: GraphState, runtime) -> GraphState:
+    # 미리 검색한 Lorebook 자료에 쓸 최대 토큰 수 (tool 결과 예산과 별도)
+    PREFETCH_TOKEN_BUDGET = 2000
+
+    def __init__(
+        self,
+        llm: "ChatOllama",
+        system_prompt: str = "",
+        lore_token_budget: int | None = None,
+        revision_mode: str = "auto",
+        stream_output: bool = False,
+    ):
+        if revision_mode not in REVISION_MODES:
+            raise ValueError(
+                f"revision_mode는 {REVISION_MODES} 중 하나여야 합니다: {revision_mode}"
+            )
+        super().__init__(llm, system_prompt, lore_token_budget)
+        self.revision_mode = revision_mode
+        self.stream_output = stream_output
+
+    def __call__(self, state: GraphState, runtime) -> dict[str, Any]:
         """스토리 작성 실행"""
+        state = self._with_own_memo(state)
+        if self._use_revision(state):
+            messages = self._create_messages(self._build_revision_message(state))
+            # 수정안은 스토리 본문이 아니므로 필드 스트리밍 없이 조기 중단만 사용
+            response_text = self._handle_tool_calls(
+                messages,
+                max_iterations=3,
+                memo=state.retrieval_memo,
+                **self._stream_options(state, runtime, fields=()),
+            )
+            update = self._revision_update(state, runtime, response_text)
+            if update is not None:
+                return update
+
         user_message = self._build_user_message(state)
         messages = self._create_messages(user_message)
 
         # Tool call 처리
-        response_text = self._handle_tool_calls(messages, max_iterations=3)
+        response_text = self._handle_tool_calls(
+            messages,
+            max_iterations=3,
+            memo=state.retrieval_memo,
+            **self._stream_options(state, runtime),
+        )
+        return self._apply_response(state, response_text)
 
+    async def acall(self, state: GraphState, runtime) -> dict[str, Any]:
+        """스토리 작성 비동기 실행"""
+        state = self._with_own_memo(state)
+        if self._use_revision(state):
+            messages = self._create_messages(self._build_revision_message(state))
+            response_text = await self._ahandle_tool_calls(
+                messages,
+                max_iterations=3,
+                memo=state.retrieval_memo,
+                **self._stream_options(state, runtime, fields=()),
+            )
+            update = self._revision_update(state, runtime, response_text)
+            if update is not None:
+                return update
+
+        user_message = self._build_user_message(state)
+        messages = self._create_messages(user_message)
+
+        # Tool call 처리
+        response_text = await self._ahandle_tool_calls(
+            messages,
+            max_iterations=3,
+            memo=state.retrieval_memo,
+            **self._stream_options(state, runtime),
+        )
+        return self._apply_response(state, response_text)
+
+    def _stream_options(
+        self, state: GraphState, runtime: Any, fields: tuple[str, ...] = STREAM_FIELDS
+    ) -> dict[str, Any]:
+        """스트리밍 모드일 때 _handle_tool_calls에 넘길 인자"""
+        if not self.stream_output:
+            return {}
+        attempt = state.retry_count + 1
+        return self._stream_writer_options(
+            runtime, fields, lambda delta: StoryTextEvent(delta.field, delta.text, attempt)
+        )
+
+    def _emit_revised(
+        self, state: GraphState, runtime: Any, story_output: StoryOutput
+    ) -> None:
+        """부분 수정으로 만든 새 버전을 스트림에 한 번에 내보냄"""
+        write = getattr(runtime, "stream_writer", None)
+        if not self.stream_output or write is None:
+            return
+        attempt = state.retry_count + 1
+        write(StoryTextEvent("title", story_output.title, attempt, replace=True))
+        write(StoryTextEvent("story", story_output.story, attempt, replace=True))
+
+    def _apply_response(self, state: GraphState, response_text: str) -> dict[str, Any]:
+        """응답을 파싱하여 상태 업데이트 생성 (story_history에는 새 버전만 추가)"""
         # 응답 파싱
         if isinstance(response_text, str) and response_text.strip():
             print("📝 Story Writer 응답 파싱 중...")
@@ -28,9 +166,95 @@ class StoryWriter(BaseAgent):
                 notes="응답 형식 오류",
             )
 
-        state.story_output = story_output
-        state.story_history.append(story_output.story)
-        return state
+        return self._story_update(state, story_output)
+
+    def _revision_update(
+        self, state: GraphState, runtime: Any, response_text: str
+    ) -> dict[str, Any] | None:
+        """수정안을 적용한 상태 업데이트 (적용할 수 없으면 None을 반환하고 전체 재작성)"""
+        story_output = self._apply_revision(state, response_text)
+        if story_output is None:
+            return None
+        self._emit_revised(state, runtime, story_output)
+        return self._story_update(state, story_output)
+
+    @staticmethod
+    def _story_update(state: GraphState, story_output: StoryOutput) -> dict[str, Any]:
+        """새 스토리 버전의 상태 업데이트"""
+        return {
+            "story_output": story_output,
+            "story_history": [story_output.story],
+            "retrieval_memo": state.retrieval_memo,
+        }
+
+    def _previous_story(self, state: GraphState) -> str:
+        """수정 대상인 이전 스토리 본문"""
+        if state.story_output and state.story_output.story:
+            return state.story_output.story
+        return state.story_history[-1] if state.story_history else ""
+
+    def _use_revision(self, state: GraphState) -> bool:
+        """이번 작성을 부분 수정으로 처리할지 여부"""
+        if self.revision_mode == "full" or not state.feedback_history:
+            return False
+        previous = self._previous_story(state)
+        if len(split_paragraphs(previous)) < 2:
+            return False
+        return self.revision_mode == "diff" or len(previous) >= REVISION_MIN_CHARS
+
+    def _build_revision_message(self, state: GraphState) -> str:
+        """부분 수정 모드의 유저 메시지 구성 (번호 붙인 이전 버전 + 피드백)"""
+        parts = [
+            "## 수정 모드",
+            "이전 버전의 문단 단위 수정안만 JSON으로 출력하세요. 스토리 전체를 다시 쓰지 마세요.",
+            "## 마지막 리뷰 피드백",
+            state.feedback_history[-1],
+            "## 이전 스토리 버전 (문단 번호)",
+        ]
+        if state.story_output and state.story_output.title:
+            parts.append(f"Title: {state.story_output.title}")
+        parts.append(number_paragraphs(split_paragraphs(self._previous_story(state))))
+        parts.append("## 출력 형식")
+        parts.append(
+            '{"title": "바꿀 때만 입력", "edits": ['
+            '{"op": "replace", "paragraph": 2, "text": "..."}, '
+            '{"op": "insert_after", "paragraph": 3, "text": "..."}, '
+            '{"op": "delete", "paragraph": 5}], "notes": "수정한 내용"}'
+        )
+        parts.append(
+            "paragraph는 이전 버전의 문단 번호입니다. (insert_after는 0이면 맨 앞에 삽입)"
+        )
+        return "\n".join(parts)
+
+    def _apply_revision(self, state: GraphState, response_text: str) -> StoryOutput | None:
+        """
+        수정안 응답을 이전 버전에 적용 (적용할 수 없으면 None)
+
+        모델이 수정안 대신 전체 스토리를 출력했으면 그대로 사용합니다.
+        """
+        previous = state.story_output or StoryOutput()
+        try:
+            data = self._extract_json(response_text)
+            if "edits" not in data and data.get("story"):
+                print("📝 Story Writer가 전체 스토리를 출력하여 그대로 사용합니다.")
+                return self._parse_response(response_text)
+            edits = parse_edits(data.get("edits"))
+            paragraphs = apply_edits(
+                split_paragraphs(self._previous_story(state)), edits
+            )
+        except (ValueError, AttributeError, IndexError) as e:
+            # json.JSONDecodeError와 EditApplyError도 ValueError
+            print(f"⚠️ 수정안을 적용할 수 없어 전체 재작성합니다: {e}")
+            return None
+
+        story = join_paragraphs(paragraphs)
+        print(f"✂️ 수정안 {len(edits)}개 적용")
+        return StoryOutput(
+            title=data.get("title") or previous.title,
+            story=story,
+            word_count=len(story),
+            notes=data.get("notes", ""),
+        )
 
     def _build_user_message(self, state: GraphState) -> str:
         """유저 메시지 구성"""
@@ -49,6 +273,19 @@ class StoryWriter(BaseAgent):
             parts.append(latest_story)
             parts.append("이전 버전을 참고하여 스토리를 수정해 주세요.")
 
+        # 요청 분석 후 미리 검색한 Lorebook 자료
+        if state.prefetched_lore:
+            parts.append("## 참고 설정 자료 (Lorebook 사전 검색 결과)")
+            results: dict[str, list[Document]] = {}
+            for snippet in state.prefetched_lore:
+                results.setdefault(snippet.query, []).append(
+                    Document(page_content=snippet.content)
+                )
+            parts.append(ContextPacker(self.PREFETCH_TOKEN_BUDGET).pack(results))
+            parts.append(
+                "위 자료로 충분하면 search_lorebook을 호출하지 말고 바로 스토리를 작성하세요."
+            )
+
         # 스토리 요청
         if state.request:
             parts.append("## Story Request")
@@ -1,36 +1,219 @@
 # tools.py
-import pickle
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from langchain_core.documents import Document
+from langchain_core.tools import StructuredTool
+
+from src.utils.docstore import SQLiteDocStore, migrate_local_file_store
+from src.utils.gazetteer import Gazetteer, build_gazetteer
+from src.utils.lexical_index import BM25Index, build_lexical_index, reciprocal_rank_fusion
+from src.utils.lorebook_cache import LorebookQueryCache
+from src.utils.vectorstore_adapter import similarity_search_by_vectors
+
+if TYPE_CHECKING:
+    # torch/transformers/chromadb를 끌어오는 무거운 의존성은 첫 검색 시점에 import
+    from langchain_classic.retrievers import ParentDocumentRetriever
+
+# Retriever 기본 설정 (검색 캐시 키에도 사용)
+EMBEDDING_MODEL = "Qwen/Qwen3-Embedding-0.6B"
+COLLECTION_NAME = "split_parents"
+PERSIST_DIRECTORY = "./chroma_db"
+DOCSTORE_PATH = "./parent_docs.sqlite3"
+LEGACY_DOCSTORE_DIR = "./parent_docs_store"  # pickle 파일 기반 이전 저장소
+CHILD_CHUNK_SIZE = 400
+PARENT_CHUNK_SIZE = 2000
+LEXICAL_INDEX_PATH = f"{PERSIST_DIRECTORY}/{COLLECTION_NAME}_bm25.json"  # 적재 시 생성
+GAZETTEER_PATH = f"{PERSIST_DIRECTORY}/{COLLECTION_NAME}_entities.json"  # 적재 시 생성
+RETRIEVAL_K = 4
+
+
+@dataclass(frozen=True)
+class RetrieverStatus:
+    """Retriever 로딩 상태"""
+
+    state: str = "idle"  # idle | loading | ready | failed
+    load_seconds: float | None = None
+    error: str | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state == "ready"
 
-from langchain_chroma import Chroma
-from langchain_classic.retrievers import ParentDocumentRetriever
-from langchain_classic.storage import EncoderBackedStore, LocalFileStore
-from langchain_core.tools import tool
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 # 전역 캐싱: Embedding 모델을 한 번만 로드
 _cached_retriever = None
+_retriever_lock = threading.Lock()
+_retriever_status = RetrieverStatus()
 
+# 백그라운드 워밍업 (eager 모드에서는 그래프 생성 시 자동 시작)
+_eager_warmup = False
+_warmup_future: Future | None = None
+_warmup_lock = threading.Lock()
 
-def pickle_dumps(obj: object) -> bytes:
-    return pickle.dumps(obj)
+# 비동기 검색 시 임베딩/Chroma 조회를 실행할 전용 스레드 풀
+RETRIEVAL_WORKERS = 4
+_retrieval_executor = ThreadPoolExecutor(
+    max_workers=RETRIEVAL_WORKERS, thread_name_prefix="lorebook"
+)
 
+# 검색 결과 캐시 (configure_query_cache로 교체 가능)
+_query_cache: LorebookQueryCache | None = None
+_query_cache_settings: dict = {}
+_query_cache_lock = threading.Lock()
 
-def pickle_loads(data: bytes) -> object:
-    return pickle.loads(data)
+# 하이브리드 검색 설정 (configure_hybrid_search로 변경 가능)
+# auto: BM25 신뢰도가 낮을 때만 벡터 검색 | fusion: 두 결과를 RRF로 결합
+# lexical: BM25만 사용 | vector: 벡터 검색만 사용 (개체명 사전도 사용하지 않음)
+# vector 외의 모드는 검색어가 개체명과 정확히 일치하면 사전의 섹션을 바로 반환
+HYBRID_MODES = ("auto", "fusion", "lexical", "vector")
+_hybrid_mode = "auto"
+_min_lexical_coverage = 0.8
+_lexical_index_path = LEXICAL_INDEX_PATH
+_lexical_index: BM25Index | None = None
+_gazetteer_path = GAZETTEER_PATH
+_gazetteer: Gazetteer | None = None
+_docstore: SQLiteDocStore | None = None
+_lexical_lock = threading.Lock()
 
 
 def get_retriever(
-    model="Qwen/Qwen3-Embedding-0.6B",
-    collection_name="split_parents",
-    persist_directory="./chroma_db",
-) -> ParentDocumentRetriever:
-    global _cached_retriever
-
+    model=EMBEDDING_MODEL,
+    collection_name=COLLECTION_NAME,
+    persist_directory=PERSIST_DIRECTORY,
+) -> "ParentDocumentRetriever":
     # 이미 로드된 retriever가 있으면 재사용
     if _cached_retriever is not None:
         return _cached_retriever
 
+    # 워밍업이 진행 중이면 두 번째 복사본을 만들지 않고 완료를 기다림
+    # (실패했다면 아래에서 직접 로드를 다시 시도)
+    warmup = _warmup_future
+    if warmup is not None:
+        try:
+            return warmup.result()
+        except Exception:
+            pass
+
+    return _load_retriever(model, collection_name, persist_directory)
+
+
+def _load_retriever(
+    model: str = EMBEDDING_MODEL,
+    collection_name: str = COLLECTION_NAME,
+    persist_directory: str = PERSIST_DIRECTORY,
+) -> "ParentDocumentRetriever":
+    """retriever를 한 번만 로드하고 로딩 상태/시간을 기록"""
+    global _cached_retriever, _retriever_status
+
+    with _retriever_lock:
+        # 다른 스레드가 먼저 로드했으면 재사용
+        if _cached_retriever is not None:
+            return _cached_retriever
+
+        _retriever_status = RetrieverStatus(state="loading")
+        started = time.perf_counter()
+        try:
+            _cached_retriever = _build_retriever(
+                model, collection_name, persist_directory
+            )
+        except Exception as e:
+            _retriever_status = RetrieverStatus(state="failed", error=str(e))
+            raise
+        _retriever_status = RetrieverStatus(
+            state="ready", load_seconds=time.perf_counter() - started
+        )
+        return _cached_retriever
+
+
+def get_retriever_status() -> RetrieverStatus:
+    """Retriever 로딩 상태 반환 (준비 여부, 로딩 시간)"""
+    return _retriever_status
+
+
+def embed_text_if_ready(text: str) -> list[float] | None:
+    """
+    이미 로드된 Lorebook 임베딩 모델로 텍스트를 임베딩 (retriever 로딩 전이면 None)
+
+    요청 파싱처럼 지연에 민감한 단계가 모델 로딩을 기다리지 않도록 로딩을 시작하지 않습니다.
+    """
+    retriever = _cached_retriever
+    if retriever is None:
+        return None
+    return retriever.vectorstore.embeddings.embed_query(text)
+
+
+def set_eager_warmup(enabled: bool = True) -> None:
+    """
+    eager 워밍업 모드를 설정합니다.
+
+    활성화하면 그래프 생성 시 start_retriever_warmup()이 자동으로 호출되어
+    임베딩 모델 로딩이 init 노드의 LLM 호출과 겹쳐서 진행됩니다.
+    """
+    global _eager_warmup
+    _eager_warmup = enabled
+
+
+def is_eager_warmup_enabled() -> bool:
+    """eager 워밍업 모드 여부"""
+    return _eager_warmup
+
+
+def start_retriever_warmup() -> Future:
+    """
+    백그라운드 스레드에서 retriever 로딩을 시작합니다.
+
+    이미 시작되었으면 기존 Future를 반환하므로 여러 번 호출해도 한 번만 로드합니다.
+    워밍업 중에 호출된 get_retriever()는 로딩 완료를 기다린 뒤 같은 인스턴스를 사용합니다.
+
+    Returns:
+        Future: 완료 시 로드된 ParentDocumentRetriever를 결과로 가짐
+    """
+    global _warmup_future
+
+    with _warmup_lock:
+        if _warmup_future is not None:
+            return _warmup_future
+
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+
+        def warm_up() -> None:
+            try:
+                retriever = _load_retriever()
+                # 첫 forward pass의 초기화 비용도 미리 지불
+                retriever.vectorstore.embeddings.embed_query("워밍업")
+            except Exception as e:
+                print(f"⚠️ Lorebook retriever 워밍업 실패: {e}")
+                future.set_exception(e)
+            else:
+                print(
+                    "🔥 Lorebook retriever 준비 완료 "
+                    f"({_retriever_status.load_seconds:.2f}초)"
+                )
+                future.set_result(retriever)
+
+        # 프로세스 종료를 막지 않도록 daemon 스레드로 실행
+        threading.Thread(target=warm_up, name="lorebook-warmup", daemon=True).start()
+        _warmup_future = future
+        return future
+
+
+def _build_retriever(
+    model: str,
+    collection_name: str,
+    persist_directory: str,
+) -> "ParentDocumentRetriever":
+    from langchain_chroma import Chroma
+    from langchain_classic.retrievers import ParentDocumentRetriever
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     # CPU에서 실행하여 GPU 메모리 절약
     embedding_function = HuggingFaceEmbeddings(
         model_name=model,
@@ -41,26 +224,339 @@ def get_retriever(
         persist_directory=persist_directory,
         embedding_function=embedding_function,
     )
-    fs = LocalFileStore("./parent_docs_store")
-    store = EncoderBackedStore(
-        store=fs,
-        key_encoder=lambda x: x,
-        value_serializer=pickle_dumps,
-        value_deserializer=pickle_loads,
-    )
-    child_splitter = RecursiveCharacterTextSplitter(chunk_size=400)
-    parent_splitter = RecursiveCharacterTextSplitter(chunk_size=2000)
-    _cached_retriever = ParentDocumentRetriever(
+    store = get_docstore()
+    child_splitter = RecursiveCharacterTextSplitter(chunk_size=CHILD_CHUNK_SIZE)
+    parent_splitter = RecursiveCharacterTextSplitter(chunk_size=PARENT_CHUNK_SIZE)
+    return ParentDocumentRetriever(
         vectorstore=vectorstore,
         docstore=store,
         child_splitter=child_splitter,
         parent_splitter=parent_splitter,
     )
-    return _cached_retriever
 
 
-@tool
-def search_lorebook(query: str) -> str:
+def open_docstore(path: str = DOCSTORE_PATH) -> SQLiteDocStore:
+    """
+    부모 문서 저장소를 엽니다.
+
+    SQLite 파일이 없고 이전 pickle 저장소(LEGACY_DOCSTORE_DIR)가 있으면 한 번 변환합니다.
+    """
+    legacy_dir = Path(LEGACY_DOCSTORE_DIR)
+    needs_migration = not Path(path).exists() and legacy_dir.is_dir()
+
+    store = SQLiteDocStore(path)
+    if needs_migration:
+        count = migrate_local_file_store(legacy_dir, store)
+        print(f"📦 부모 문서 {count}개를 {path}로 변환했습니다.")
+    return store
+
+
+def get_docstore() -> SQLiteDocStore:
+    """retriever와 어휘 검색이 함께 쓰는 부모 문서 저장소 (처음 호출 시 열기)"""
+    global _docstore
+
+    if _docstore is None:
+        with _lexical_lock:
+            if _docstore is None:
+                _docstore = open_docstore()
+    return _docstore
+
+
+def _retriever_config() -> dict:
+    """검색 캐시 키에 포함할 retriever 설정"""
+    return {
+        "model": EMBEDDING_MODEL,
+        "collection_name": COLLECTION_NAME,
+        "persist_directory": PERSIST_DIRECTORY,
+        "child_chunk_size": CHILD_CHUNK_SIZE,
+        "parent_chunk_size": PARENT_CHUNK_SIZE,
+        "hybrid_mode": _hybrid_mode,
+        "min_lexical_coverage": _min_lexical_coverage,
+    }
+
+
+def configure_query_cache(
+    maxsize: int = 256,
+    ttl: float | None = 3600.0,
+    disk_path: str | None = None,
+    disk_max_entries: int = 10_000,
+) -> LorebookQueryCache:
+    """
+    검색 결과 캐시를 설정합니다.
+
+    Args:
+        maxsize: 메모리 계층 최대 항목 수
+        ttl: 항목 유효 시간(초), None이면 만료 없음
+        disk_path: 디스크 계층 SQLite 파일 경로 (예: ".cache/lorebook_queries.sqlite3")
+        disk_max_entries: 디스크 계층 최대 항목 수
+
+    Returns:
+        LorebookQueryCache: 새로 설정된 캐시
+    """
+    global _query_cache, _query_cache_settings
+
+    with _query_cache_lock:
+        _query_cache_settings = {
+            "maxsize": maxsize,
+            "ttl": ttl,
+            "disk_path": disk_path,
+            "disk_max_entries": disk_max_entries,
+        }
+        _query_cache = LorebookQueryCache(
+            _retriever_config(),
+            maxsize=maxsize,
+            ttl=ttl,
+            disk_path=disk_path,
+            disk_max_entries=disk_max_entries,
+        )
+        return _query_cache
+
+
+def get_query_cache() -> LorebookQueryCache:
+    """검색 결과 캐시 반환 (없으면 메모리 전용 기본 설정으로 생성)"""
+    global _query_cache
+
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                _query_cache = LorebookQueryCache(_retriever_config())
+    return _query_cache
+
+
+def configure_hybrid_search(
+    mode: str = "auto",
+    min_coverage: float = 0.8,
+    index_path: str = LEXICAL_INDEX_PATH,
+    gazetteer_path: str = GAZETTEER_PATH,
+) -> None:
+    """
+    어휘(BM25) + 벡터 하이브리드 검색을 설정합니다.
+
+    Args:
+        mode: "auto" | "fusion" | "lexical" | "vector" (vector는 개체명 사전도 사용하지 않음)
+        min_coverage: auto 모드에서 BM25 결과를 그대로 쓰기 위한 최소 검색어 토큰 일치율
+        index_path: BM25 인덱스 파일 경로 (없으면 docstore로 메모리에서 생성)
+        gazetteer_path: 개체명 사전 파일 경로 (없으면 docstore로 메모리에서 생성)
+    """
+    global _hybrid_mode, _min_lexical_coverage, _lexical_index_path, _lexical_index
+    global _gazetteer_path, _gazetteer
+
+    if mode not in HYBRID_MODES:
+        raise ValueError(f"지원하지 않는 검색 모드입니다: {mode} (가능: {HYBRID_MODES})")
+
+    with _lexical_lock:
+        _hybrid_mode = mode
+        _min_lexical_coverage = min_coverage
+        if index_path != _lexical_index_path:
+            _lexical_index_path = index_path
+            _lexical_index = None
+        if gazetteer_path != _gazetteer_path:
+            _gazetteer_path = gazetteer_path
+            _gazetteer = None
+
+    # 모드에 따라 결과가 달라지므로 같은 캐시 설정으로 키를 새로 만듦
+    configure_query_cache(**_query_cache_settings)
+
+
+def get_lexical_index() -> BM25Index:
+    """BM25 인덱스 반환 (처음 호출 시 파일에서 로드, 파일이 없으면 docstore로 생성)"""
+    global _lexical_index
+
+    if _lexical_index is None:
+        docstore = get_docstore()
+        with _lexical_lock:
+            if _lexical_index is None:
+                if Path(_lexical_index_path).exists():
+                    _lexical_index = BM25Index.load(_lexical_index_path)
+                else:
+                    _lexical_index = build_lexical_index(docstore)
+    return _lexical_index
+
+
+def get_gazetteer() -> Gazetteer:
+    """
+    lorebook 개체명 사전 반환 (처음 호출 시 파일에서 로드, 파일이 없으면 docstore로 생성)
+
+    다른 컴포넌트에서도 이름 → 문서 ID 조회, 별칭 확인 등에 바로 사용할 수 있습니다.
+    """
+    global _gazetteer
+
+    if _gazetteer is None:
+        docstore = get_docstore()
+        with _lexical_lock:
+            if _gazetteer is None:
+                if Path(_gazetteer_path).exists():
+                    _gazetteer = Gazetteer.load(_gazetteer_path)
+                else:
+                    _gazetteer = build_gazetteer(docstore)
+    return _gazetteer
+
+
+def find_entity_documents(name: str) -> list[Document]:
+    """
+    이름(한국어/영어/별칭)과 정확히 일치하는 lorebook 개체의 부모 문서
+
+    해시 조회와 docstore 조회만 하므로 임베딩 모델을 로드하지 않습니다.
+
+    Example:
+        >>> find_entity_documents("Whiterun Hold") == find_entity_documents("화이트런 영지")
+        True
+    """
+    section_ids = get_gazetteer().lookup(name)[:RETRIEVAL_K]
+    if not section_ids:
+        return []
+    return [doc for doc in get_docstore().mget(section_ids) if doc is not None]
+
+
+def _lexical_search(query: str, min_coverage: float) -> list[Document]:
+    """BM25 상위 문서 중 검색어 토큰 일치율이 min_coverage 이상인 부모 문서"""
+    hits = [
+        hit
+        for hit in get_lexical_index().search(query, k=RETRIEVAL_K)
+        if hit.coverage >= min_coverage
+    ]
+    if not hits:
+        return []
+    docs = get_docstore().mget([hit.doc_id for hit in hits])
+    return [doc for doc in docs if doc is not None]
+
+
+def _lexical_first(query: str) -> list[Document] | None:
+    """
+    auto/fusion/lexical 모드의 개체명 사전 또는 어휘 검색 결과 (벡터 검색이 필요하면 None)
+
+    vector 모드는 개체명 사전도 거치지 않고 항상 벡터 검색을 사용합니다.
+    """
+    if _hybrid_mode == "vector":
+        return None
+    entity_docs = find_entity_documents(query)
+    if entity_docs:
+        return entity_docs
+    if _hybrid_mode == "lexical":
+        return _lexical_search(query, min_coverage=0.0)
+    if _hybrid_mode == "auto":
+        return _lexical_search(query, _min_lexical_coverage) or None
+    return None
+
+
+def _combine_with_vector(query: str, vector_docs: list[Document]) -> list[Document]:
+    """fusion 모드면 벡터 결과와 BM25 결과를 RRF로 결합"""
+    if _hybrid_mode != "fusion":
+        return vector_docs
+    lexical_docs = _lexical_search(query, min_coverage=0.0)
+    return reciprocal_rank_fusion([lexical_docs, vector_docs], k=RETRIEVAL_K)
+
+
+def retrieve_documents(query: str) -> list[Document]:
+    """
+    Lorebook에서 query와 관련된 부모 문서를 검색합니다.
+
+    같은 검색어(정규화 기준)는 캐시에서 바로 반환하므로 임베딩/Chroma 조회를 생략합니다.
+    검색어가 개체 이름이나 별칭과 정확히 일치하면 개체명 사전으로 바로 찾고,
+    auto 모드에서는 BM25 검색을 먼저 실행하고, 고유명사처럼 어휘 일치도가 높으면
+    임베딩 모델 없이 바로 반환합니다.
+    """
+    cache = get_query_cache()
+    docs = cache.get(query)
+    if docs is None:
+        docs = _lexical_first(query)
+        if docs is None:
+            docs = _combine_with_vector(query, get_retriever().invoke(query))
+        cache.set(query, docs)
+    return docs
+
+
+def retrieve_documents_batch(queries: list[str]) -> list[list[Document]]:
+    """
+    여러 검색어를 한 번에 검색합니다.
+
+    캐시에 없는 검색어만 모아 한 번의 배치 임베딩으로 벡터를 만들고,
+    벡터 검색도 한 번의 Chroma 쿼리로 실행합니다.
+    여러 검색어가 같은 부모 문서를 가리키면 docstore에서 한 번만 읽습니다.
+
+    Args:
+        queries: 검색어 리스트
+
+    Returns:
+        검색어 순서대로의 부모 문서 리스트
+    """
+    cache = get_query_cache()
+    results: list[list[Document] | None] = [cache.get(q) for q in queries]
+
+    # 캐시 미스 검색어 (중복 제거, 순서 유지)
+    pending: dict[str, list[int]] = {}
+    for index, (query, docs) in enumerate(zip(queries, results)):
+        if docs is None:
+            pending.setdefault(query, []).append(index)
+
+    def store(query: str, docs: list[Document]) -> None:
+        cache.set(query, docs)
+        for index in pending[query]:
+            results[index] = docs
+
+    # 어휘 검색으로 충분한 검색어는 벡터 배치에서 제외
+    vector_queries = []
+    for query in pending:
+        docs = _lexical_first(query)
+        if docs is None:
+            vector_queries.append(query)
+        else:
+            store(query, docs)
+
+    if vector_queries:
+        fetched = _retrieve_uncached_batch(get_retriever(), vector_queries)
+        for query, docs in zip(vector_queries, fetched):
+            store(query, _combine_with_vector(query, docs))
+
+    return [docs or [] for docs in results]
+
+
+def _retrieve_uncached_batch(
+    retriever: "ParentDocumentRetriever", queries: list[str]
+) -> list[list[Document]]:
+    """배치 임베딩 + 배치 벡터 검색 + 부모 문서 일괄 조회"""
+    vectorstore = retriever.vectorstore
+    query_embeddings = _embed_queries(vectorstore.embeddings, queries)
+    k = retriever.search_kwargs.get("k", 4)
+
+    # 검색어별 부모 문서 ID (순서 유지, 중복 제거)
+    ids_per_query: list[list[str]] = []
+    for child_docs in similarity_search_by_vectors(vectorstore, query_embeddings, k):
+        ids: list[str] = []
+        for child in child_docs:
+            parent_id = child.metadata.get(retriever.id_key)
+            if parent_id is not None and parent_id not in ids:
+                ids.append(parent_id)
+        ids_per_query.append(ids)
+
+    # 공유되는 부모 문서는 한 번만 조회
+    unique_ids = list(dict.fromkeys(i for ids in ids_per_query for i in ids))
+    parents = dict(zip(unique_ids, retriever.docstore.mget(unique_ids)))
+
+    return [
+        [parents[i] for i in ids if parents.get(i) is not None]
+        for ids in ids_per_query
+    ]
+
+
+def _embed_queries(embeddings, queries: list[str]) -> list[list[float]]:
+    """검색어들을 임베딩 (가능하면 한 번의 forward pass)"""
+    # HuggingFaceEmbeddings에 검색어 전용 인코딩 옵션이 있으면 embed_documents와 결과가 다르므로
+    # 공개 API인 embed_query로 검색어마다 임베딩
+    query_kwargs = getattr(embeddings, "query_encode_kwargs", None)
+    if query_kwargs and query_kwargs != getattr(embeddings, "encode_kwargs", None):
+        return [embeddings.embed_query(query) for query in queries]
+    return embeddings.embed_documents(queries)
+
+
+def _format_documents(docs: list[Document]) -> str:
+    """검색된 문서들의 내용을 tool 응답 텍스트로 변환"""
+    if not docs:
+        return "관련된 설정을 찾을 수 없습니다."
+    return "\n\n".join([f"[설정 자료]: {doc.page_content}" for doc in docs])
+
+
+def _search_lorebook(query: str) -> tuple[str, dict[str, list[Document]]]:
     """
     게임 설정집(Lorebook)에서 정보를 검색합니다.
     1. 스토리의 내용이 설정과 맞는지 확인할 때 하거나
@@ -69,11 +565,75 @@ def search_lorebook(query: str) -> str:
     Args:
         query: 검색할 키워드나 질문 (예: "화이트 런", "블러드 드래곤")
     """
-    retriever = get_retriever()
-    docs = retriever.invoke(query)
+    docs = retrieve_documents(query)
 
-    if not docs:
-        return "관련된 설정을 찾을 수 없습니다."
+    # 검색된 문서들의 내용을 합쳐서 반환 (원본 문서는 artifact로 전달)
+    return _format_documents(docs), {query: docs}
 
-    # 검색된 문서들의 내용을 합쳐서 반환
-    return "\n\n".join([f"[설정 자료]: {doc.page_content}" for doc in docs])
+
+async def _asearch_lorebook(query: str) -> tuple[str, dict[str, list[Document]]]:
+    """search_lorebook의 비동기 버전 (임베딩/Chroma 조회는 전용 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_retrieval_executor, _search_lorebook, query)
+
+
+# 동기(invoke)와 비동기(ainvoke) 실행을 모두 지원하는 tool
+# tool call로 실행하면 ToolMessage.artifact에 검색어 → 원본 문서가 담김 (컨텍스트 패킹용)
+search_lorebook = StructuredTool.from_function(
+    func=_search_lorebook,
+    coroutine=_asearch_lorebook,
+    name="search_lorebook",
+    response_format="content_and_artifact",
+)
+
+
+def _search_lorebook_batch(
+    queries: list[str],
+) -> tuple[str, dict[str, list[Document]]]:
+    """
+    게임 설정집(Lorebook)에서 여러 키워드를 한 번에 검색합니다.
+    확인할 인물/지역/사건이 여러 개일 때 search_lorebook을 여러 번 부르는 대신 사용하세요.
+
+    Args:
+        queries: 검색할 키워드나 질문 목록 (예: ["화이트런", "드래곤본"])
+    """
+    results = retrieve_documents_batch(queries)
+
+    sections = []
+    seen: dict[str, str] = {}  # 문서 내용 → 처음 등장한 검색어
+    for query, docs in zip(queries, results):
+        new_docs = []
+        shared_with = []
+        for doc in docs:
+            if doc.page_content in seen:
+                shared_with.append(seen[doc.page_content])
+            else:
+                seen[doc.page_content] = query
+                new_docs.append(doc)
+
+        body = _format_documents(new_docs) if new_docs or not shared_with else ""
+        if shared_with:
+            refs = ", ".join(f"'{q}'" for q in dict.fromkeys(shared_with))
+            body = (body + "\n\n" if body else "") + f"({refs} 검색 결과와 같은 자료 포함)"
+        sections.append(f"## {query}\n{body}")
+
+    return "\n\n".join(sections), dict(zip(queries, results))
+
+
+async def _asearch_lorebook_batch(
+    queries: list[str],
+) -> tuple[str, dict[str, list[Document]]]:
+    """search_lorebook_batch의 비동기 버전"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _retrieval_executor, _search_lorebook_batch, queries
+    )
+
+
+# 여러 검색어를 한 번의 배치 임베딩으로 처리하는 tool
+search_lorebook_batch = StructuredTool.from_function(
+    func=_search_lorebook_batch,
+    coroutine=_asearch_lorebook_batch,
+    name="search_lorebook_batch",
+    response_format="content_and_artifact",
+)
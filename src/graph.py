@@ -5,9 +5,12 @@ LangGraph를 사용하여 멀티 에이전트 스토리 생성 파이프라인
 
 워크플로우:
     1. init: 사용자 요청을 파싱하여 구조화된 RefinedRequest 생성
-    2. write: StoryWriter가 스토리 작성
-    3. review: Director가 스토리 검수 및 피드백 제공
-    4. 조건부 분기: 승인되면 종료, 아니면 write로 재시도
+    2. prefetch: 요청에 등장하는 개체/주제의 Lorebook 자료를 미리 배치 검색
+    3. write: StoryWriter가 스토리 작성
+    4. review: Director가 스토리 검수 및 피드백 제공
+    5. 조건부 분기: 승인되면 종료, 아니면 write로 재시도
+       (재작성 정책에 따라 점수가 수렴하면 조기 종료)
+    6. skip_review: 정책에 따라 마지막 작성본은 검수하지 않고 종료 (review_skipped로 표시)
 
 Example:
     >>> from src.graph import run_story_generation
@@ -15,19 +18,51 @@ Example:
     >>> print(result.story_output.story)
 """
 
-from langchain_ollama import ChatOllama
+import hashlib
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.runtime import get_runtime
 
 from src.agents.director import Director
+from src.agents.lore_prefetcher import LorePrefetcher
 from src.agents.request_parser import UserRequestParser
 from src.agents.story_writer import StoryWriter
-from src.schemas.state import GraphState
+from src.agents.tools.search_lorebook import (
+    is_eager_warmup_enabled,
+    start_retriever_warmup,
+)
+from src.schemas.state import GraphState, graph_state_schema
+from src.utils.cache import LRUCache
+from src.utils.llm_cache import llm_identity
+from src.utils.retry_policy import get_retry_policy
+from src.utils.story_cache import DEFAULT_STORY_CACHE_PATH, CachedStory, StoryCache
+
+if TYPE_CHECKING:
+    from langchain_ollama import ChatOllama
+
+DEFAULT_MODEL = "gpt-oss:20b"
+GRAPH_REGISTRY_SIZE = 8  # 동시에 유지할 컴파일된 그래프 수
+
+# 컴파일된 그래프 레지스트리: (모델, LLM 옵션, 프롬프트 해시, 그래프 옵션) → CompiledStateGraph
+_graph_registry: LRUCache[tuple, CompiledStateGraph] = LRUCache(
+    maxsize=GRAPH_REGISTRY_SIZE
+)
+
+# 스토리 생성 결과 캐시 (configure_story_cache로 켜기 전까지는 사용하지 않음)
+_story_cache: StoryCache | None = None
 
 
 def create_graph(
-    llm: ChatOllama,
+    llm: "ChatOllama",
     story_writer_system_prompt: str = "",
     director_system_prompt: str = "",
+    stream_story: bool = False,
+    stream_review: bool = False,
+    history_limit: int | None = None,
 ) -> StateGraph:
     """
     스토리 작성 워크플로우 그래프를 생성합니다.
@@ -36,51 +71,118 @@ def create_graph(
         llm: 사용할 LLM 인스턴스 (ChatOllama)
         story_writer_system_prompt: StoryWriter의 시스템 프롬프트 (빈 문자열이면 기본값 사용)
         director_system_prompt: Director의 시스템 프롬프트 (빈 문자열이면 기본값 사용)
+        stream_story: True이면 StoryWriter가 응답을 스트리밍하며 스토리 텍스트를
+            StoryTextEvent로 custom 스트림에 내보냄 (stream_mode="custom"으로 수신)
+        stream_review: True이면 Director가 검수 피드백을 ReviewTextEvent로 custom 스트림에 내보냄
+        history_limit: story_history/feedback_history를 최근 몇 개만 보관할지
+            (None이면 전체 보관, graph_state_schema 참고)
 
     Returns:
         StateGraph: 컴파일 가능한 LangGraph StateGraph 객체
 
     Note:
         반환된 그래프는 .compile() 호출 후 사용해야 합니다.
+        컴파일된 그래프는 invoke/stream과 ainvoke/astream_events를 모두 지원하며,
+        비동기 실행 시 에이전트의 acall 경로를 사용합니다.
+        eager 워밍업 모드(set_eager_warmup)에서는 Lorebook retriever 로딩을
+        백그라운드에서 시작하여 init 노드의 LLM 호출과 겹치게 합니다.
     """
+    if is_eager_warmup_enabled():
+        start_retriever_warmup()
+
     # 에이전트 초기화
     request_parser = UserRequestParser(llm=llm)
-    story_writer = StoryWriter(llm=llm, system_prompt=story_writer_system_prompt)
-    director = Director(llm=llm, system_prompt=director_system_prompt)
+    lore_prefetcher = LorePrefetcher()
+    story_writer = StoryWriter(
+        llm=llm, system_prompt=story_writer_system_prompt, stream_output=stream_story
+    )
+    director = Director(
+        llm=llm, system_prompt=director_system_prompt, stream_output=stream_review
+    )
 
     # 그래프 정의
-    graph = StateGraph(GraphState)
+    # 노드/엣지 함수의 타입 힌트도 이 스키마를 써야 LangGraph가 GraphState의
+    # 기본 reducer로 같은 채널을 다시 정의하지 않음
+    State = graph_state_schema(history_limit)
+    graph = StateGraph(State)
 
     # ========== 노드 정의 ==========
-    def init_node(state: GraphState, runtime) -> GraphState:
+    # 각 노드는 동기(invoke/stream)와 비동기(ainvoke/astream_events) 구현을 함께 가짐
+    # (RunnableLambda의 afunc, 스트림 writer 등 실행 정보는 get_runtime()으로 조회)
+    def init_node(state: State) -> dict[str, Any]:
         """사용자 요청을 파싱하여 RefinedRequest로 변환"""
-        return request_parser(state, runtime)
+        return request_parser(state, get_runtime())
+
+    async def ainit_node(state: State) -> dict[str, Any]:
+        return await request_parser.acall(state, get_runtime())
 
-    def write_node(state: GraphState, runtime) -> GraphState:
+    def prefetch_node(state: State) -> dict[str, Any]:
+        """요청에서 뽑은 개체/주제의 Lorebook 자료를 미리 검색"""
+        return lore_prefetcher(state, get_runtime())
+
+    async def aprefetch_node(state: State) -> dict[str, Any]:
+        return await lore_prefetcher.acall(state, get_runtime())
+
+    def write_node(state: State) -> dict[str, Any]:
         """StoryWriter가 스토리를 작성하고 StoryOutput 생성"""
-        return story_writer(state, runtime)
+        return story_writer(state, get_runtime())
 
-    def review_node(state: GraphState, runtime) -> GraphState:
+    async def awrite_node(state: State) -> dict[str, Any]:
+        return await story_writer.acall(state, get_runtime())
+
+    def review_node(state: State) -> dict[str, Any]:
         """Director가 스토리를 검수하고 EvalReport 생성"""
-        return director(state, runtime)
+        return director(state, get_runtime())
+
+    async def areview_node(state: State) -> dict[str, Any]:
+        return await director.acall(state, get_runtime())
+
+    def skip_review_node(state: State) -> dict[str, Any]:
+        """재작성 정책에 따라 마지막 작성본을 검수하지 않고 종료"""
+        return director.skip_review(state)
 
     # 노드 추가
-    graph.add_node("init", init_node)
-    graph.add_node("write", write_node)
-    graph.add_node("review", review_node)
+    graph.add_node("init", RunnableLambda(init_node, afunc=ainit_node, name="init"))
+    graph.add_node(
+        "prefetch", RunnableLambda(prefetch_node, afunc=aprefetch_node, name="prefetch")
+    )
+    graph.add_node("write", RunnableLambda(write_node, afunc=awrite_node, name="write"))
+    graph.add_node(
+        "review", RunnableLambda(review_node, afunc=areview_node, name="review")
+    )
+    graph.add_node(
+        "skip_review", RunnableLambda(skip_review_node, name="skip_review")
+    )
 
     # ========== 엣지 정의 ==========
-    # 기본 흐름: START → init → write → review
+    # 기본 흐름: START → init → prefetch → write → review
     graph.add_edge(START, "init")
-    graph.add_edge("init", "write")
-    graph.add_edge("write", "review")
+    graph.add_edge("init", "prefetch")
+    graph.add_edge("prefetch", "write")
 
-    def should_retry(state: GraphState) -> str:
+    def should_review(state: State) -> str:
+        """
+        작성 후 검수 여부를 결정합니다.
+
+        Returns:
+            "skip_review": 재작성 정책에 따라 마지막 작성본의 검수를 생략함
+            "review": 검수 진행
+        """
+        if director.should_skip_review(state):
+            return "skip_review"
+        return "review"
+
+    graph.add_conditional_edges(
+        "write", should_review, {"skip_review": "skip_review", "review": "review"}
+    )
+    graph.add_edge("skip_review", END)
+
+    def should_retry(state: State) -> str:
         """
         검수 결과에 따라 분기를 결정합니다.
 
         Returns:
-            "end": 스토리가 승인되었거나 최대 재시도 횟수 도달
+            "end": 스토리가 승인되었거나, 최대 재시도 횟수 도달 또는 재작성 정책에 따라 조기 종료
             "retry": 스토리 수정이 필요함
         """
         if state.is_complete:
@@ -99,15 +201,288 @@ def create_graph(
     return graph
 
 
+def _hash_prompt(prompt: str) -> str:
+    """시스템 프롬프트의 해시 (레지스트리 키용)"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _graph_key(
+    model_name: str,
+    llm_options: dict[str, Any],
+    story_writer_system_prompt: str,
+    director_system_prompt: str,
+    llm: "ChatOllama | None",
+    stream_story: bool = False,
+    stream_review: bool = False,
+    history_limit: int | None = None,
+) -> tuple:
+    """레지스트리 키 생성 (프롬프트는 원문 대신 해시로 보관)"""
+    options = tuple(sorted((k, repr(v)) for k, v in llm_options.items()))
+    # 외부에서 주입된 LLM은 인스턴스 단위로 구분 (레지스트리가 참조를 유지하므로 id가 고유함)
+    llm_identity = ("instance", id(llm)) if llm is not None else ("model", model_name)
+    return (
+        llm_identity,
+        options,
+        _hash_prompt(story_writer_system_prompt),
+        _hash_prompt(director_system_prompt),
+        stream_story,
+        stream_review,
+        history_limit,
+    )
+
+
+def get_compiled_graph(
+    model_name: str = DEFAULT_MODEL,
+    story_writer_system_prompt: str = "",
+    director_system_prompt: str = "",
+    llm: "ChatOllama | None" = None,
+    stream_story: bool = False,
+    stream_review: bool = False,
+    history_limit: int | None = None,
+    **llm_options: Any,
+) -> CompiledStateGraph:
+    """
+    컴파일된 그래프를 레지스트리에서 가져옵니다.
+
+    (모델 이름, LLM 옵션, 시스템 프롬프트 해시)가 같으면 이미 컴파일된 그래프를
+    재사용하므로 요청마다 에이전트 생성/tool 바인딩/컴파일 비용이 들지 않습니다.
+    여러 스레드에서 동시에 호출해도 안전하며, 오래 사용되지 않은 그래프부터 제거됩니다.
+
+    Args:
+        model_name: Ollama 모델 이름 (llm이 주어지면 무시)
+        story_writer_system_prompt: StoryWriter의 시스템 프롬프트
+        director_system_prompt: Director의 시스템 프롬프트
+        llm: 직접 생성한 LLM 인스턴스 (None이면 model_name으로 ChatOllama 생성)
+        stream_story: StoryWriter 스토리 텍스트 스트리밍 여부 (create_graph 참고)
+        stream_review: Director 검수 피드백 스트리밍 여부 (create_graph 참고)
+        history_limit: 히스토리 보관 개수 (create_graph 참고)
+        **llm_options: ChatOllama에 전달할 추가 옵션 (예: reasoning=True)
+
+    Returns:
+        CompiledStateGraph: 실행 가능한 컴파일된 그래프
+
+    Example:
+        >>> app = get_compiled_graph("gpt-oss:20b", reasoning=True)
+        >>> app is get_compiled_graph("gpt-oss:20b", reasoning=True)
+        True
+    """
+    key = _graph_key(
+        model_name,
+        llm_options,
+        story_writer_system_prompt,
+        director_system_prompt,
+        llm,
+        stream_story,
+        stream_review,
+        history_limit,
+    )
+
+    def build() -> CompiledStateGraph:
+        # Ollama 클라이언트는 실제로 모델을 만들 때만 import (CLI/테스트 시작 시간 단축)
+        from langchain_ollama import ChatOllama
+
+        graph_llm = llm if llm is not None else ChatOllama(
+            model=model_name, **llm_options
+        )
+        graph = create_graph(
+            llm=graph_llm,
+            story_writer_system_prompt=story_writer_system_prompt,
+            director_system_prompt=director_system_prompt,
+            stream_story=stream_story,
+            stream_review=stream_review,
+            history_limit=history_limit,
+        )
+        return graph.compile()
+
+    return _graph_registry.get_or_create(key, build)
+
+
+def clear_graph_registry() -> None:
+    """
+    컴파일된 그래프 레지스트리를 비웁니다.
+
+    시스템 프롬프트 외의 그래프 구성이 바뀌었을 때 호출하세요.
+    """
+    _graph_registry.clear()
+
+
+def configure_story_cache(
+    path: str | None = DEFAULT_STORY_CACHE_PATH,
+    max_entries: int = 200,
+    ttl: float | None = None,
+) -> StoryCache | None:
+    """
+    스토리 생성 결과 캐시를 설정합니다.
+
+    캐시를 켜면 같은 요청(사용자 입력, 모델, LLM 옵션, 시스템 프롬프트, 최대 재시도 횟수)은
+    그래프를 다시 실행하지 않고 저장된 결과를 반환합니다. lorebook이 바뀌면 자동으로 무효화됩니다.
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 끄기)
+        max_entries: 최대 저장 결과 수 (넘으면 오래 조회되지 않은 결과부터 제거)
+        ttl: 결과 유효 시간(초), None이면 만료 없음
+
+    Returns:
+        StoryCache | None: 새로 설정된 캐시 (끈 경우 None)
+    """
+    global _story_cache
+
+    if _story_cache is not None:
+        _story_cache.close()
+    _story_cache = (
+        StoryCache(path, max_entries=max_entries, ttl=ttl) if path is not None else None
+    )
+    return _story_cache
+
+
+def get_story_cache() -> StoryCache | None:
+    """현재 스토리 생성 결과 캐시 반환 (설정하지 않았으면 None)"""
+    return _story_cache
+
+
+def _lookup_story_cache(
+    use_cache: bool,
+    user_input: str,
+    model_name: str,
+    llm: "ChatOllama | None",
+    llm_options: dict[str, Any],
+    story_writer_system_prompt: str = "",
+    director_system_prompt: str = "",
+    max_retries: int = 3,
+) -> tuple[StoryCache | None, str, CachedStory | None]:
+    """
+    결과 캐시 조회
+
+    외부에서 주입한 LLM은 llm_options 대신 인스턴스의 실제 옵션(temperature, seed,
+    num_ctx 등)을 LLM 응답 캐시와 같은 방식(llm_identity)으로 키에 넣으며,
+    model 속성이 문자열이 아니면 캐시하지 않습니다.
+
+    Returns:
+        (캐시, 키, 캐시된 결과) - 캐시를 쓰지 않는 요청이면 캐시가 None
+    """
+    if not use_cache or _story_cache is None:
+        return None, "", None
+    if llm is not None:
+        identity = llm_identity(llm)
+        if identity is None:
+            return None, "", None
+        model_name = identity.pop("model")
+        llm_options = {**identity, **llm_options}
+
+    cache = _story_cache
+    key = StoryCache.make_key(
+        user_input,
+        model_name,
+        llm_options,
+        story_writer_system_prompt,
+        director_system_prompt,
+        max_retries,
+        repr(get_retry_policy()),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        print("💾 캐시된 스토리 생성 결과를 사용합니다.")
+    return cache, key, cached
+
+
+def stream_story_generation(
+    user_input: str = "",
+    model_name: str = DEFAULT_MODEL,
+    max_retries: int = 3,
+    story_writer_system_prompt: str = "",
+    director_system_prompt: str = "",
+    llm: "ChatOllama | None" = None,
+    stream_mode: Iterable[str] = ("updates",),
+    use_cache: bool = True,
+    stream_story: bool = False,
+    stream_review: bool = False,
+    **llm_options: Any,
+) -> Iterator[tuple[str, Any]]:
+    """
+    결과 캐시를 거쳐 스토리 생성 과정을 스트리밍합니다.
+
+    app.stream(stream_mode=[...])과 같이 (모드, 데이터) 튜플을 내보냅니다.
+    캐시에 같은 요청의 결과가 있으면 그래프를 실행하지 않고 저장된 노드 업데이트("updates")와
+    최종 상태("values")를 재생합니다. 토큰 단위 이벤트("custom")는 재생하지 않습니다.
+
+    Args:
+        user_input: 사용자의 스토리 요청 텍스트
+        model_name: Ollama 모델 이름 (llm이 주어지면 무시)
+        max_retries: 최대 재시도 횟수
+        story_writer_system_prompt: StoryWriter의 시스템 프롬프트
+        director_system_prompt: Director의 시스템 프롬프트
+        llm: 직접 생성한 LLM 인스턴스 (model 속성이 없으면 결과 캐시를 사용하지 않음)
+        stream_mode: 받을 스트림 모드 ("updates", "values", "custom")
+        use_cache: False이면 이번 요청은 결과 캐시를 조회/저장하지 않음
+        stream_story: StoryWriter 스토리 텍스트 스트리밍 여부 (create_graph 참고)
+        stream_review: Director 검수 피드백 스트리밍 여부 (create_graph 참고)
+        **llm_options: ChatOllama에 전달할 추가 옵션
+
+    Example:
+        >>> for mode, chunk in stream_story_generation("용사 이야기"):
+        ...     print(mode, list(chunk))
+    """
+    modes = list(stream_mode)
+    cache, key, cached = _lookup_story_cache(
+        use_cache,
+        user_input,
+        model_name,
+        llm,
+        llm_options,
+        story_writer_system_prompt,
+        director_system_prompt,
+        max_retries,
+    )
+    if cached is not None:
+        if "updates" in modes:
+            for update in cached.updates:
+                yield "updates", update
+        if "values" in modes:
+            yield "values", dict(cached.final_state)
+        return
+
+    app = get_compiled_graph(
+        model_name,
+        story_writer_system_prompt=story_writer_system_prompt,
+        director_system_prompt=director_system_prompt,
+        llm=llm,
+        stream_story=stream_story,
+        stream_review=stream_review,
+        **llm_options,
+    )
+    initial_state = GraphState(user_input=user_input, max_retries=max_retries)
+
+    # 캐시에 저장할 노드 업데이트와 최종 상태는 요청하지 않은 모드여도 함께 받음
+    updates: list[dict[str, Any]] = []
+    final_state: dict[str, Any] | None = None
+    run_modes = list(dict.fromkeys([*modes, "updates", "values"]))
+    for mode, chunk in app.stream(initial_state, stream_mode=run_modes):
+        if mode == "updates":
+            updates.append(chunk)
+        elif mode == "values":
+            final_state = chunk
+        if mode in modes:
+            yield mode, chunk
+
+    # 끝까지 실행된 결과만 저장 (중간에 중단된 스트림은 여기까지 오지 않음)
+    if cache is not None and final_state is not None:
+        cache.set(key, GraphState(**final_state), updates)
+
+
 def run_story_generation(
-    user_input: str = "", llm: ChatOllama | None = None
+    user_input: str = "",
+    llm: "ChatOllama | None" = None,
+    use_cache: bool = True,
 ) -> GraphState:
     """
     동기 방식으로 스토리를 생성합니다.
 
+    결과 캐시(configure_story_cache)가 켜져 있으면 같은 요청은 저장된 최종 상태를 바로 반환합니다.
+
     Args:
         user_input: 사용자의 스토리 요청 텍스트
         llm: 사용할 LLM 인스턴스 (None이면 기본 모델 사용)
+        use_cache: False이면 이번 요청은 결과 캐시를 조회/저장하지 않음
 
     Returns:
         GraphState: 최종 상태 (story_output에 생성된 스토리 포함)
@@ -117,24 +492,77 @@ def run_story_generation(
         >>> print(result.story_output.title)
         >>> print(result.story_output.story)
     """
-    # 기본 LLM 설정
-    if llm is None:
-        llm = ChatOllama(model="gpt-oss:20b")
+    final_state: dict[str, Any] = {}
+    for _, chunk in stream_story_generation(
+        user_input, llm=llm, stream_mode=["values"], use_cache=use_cache
+    ):
+        final_state = chunk
+
+    return GraphState(**final_state)
+
+
+async def arun_story_generation(
+    user_input: str = "",
+    llm: "ChatOllama | None" = None,
+    use_cache: bool = True,
+) -> GraphState:
+    """
+    비동기 방식으로 스토리를 생성합니다.
+
+    LLM 호출과 Lorebook 검색이 모두 비동기로 실행되므로, 하나의 이벤트 루프에서
+    여러 스토리 세션을 동시에 처리할 수 있습니다.
+    결과 캐시(configure_story_cache)가 켜져 있으면 같은 요청은 저장된 최종 상태를 바로 반환합니다.
+
+    Args:
+        user_input: 사용자의 스토리 요청 텍스트
+        llm: 사용할 LLM 인스턴스 (None이면 기본 모델 사용)
+        use_cache: False이면 이번 요청은 결과 캐시를 조회/저장하지 않음
 
-    # 그래프 생성 및 컴파일
-    graph = create_graph(llm=llm)
-    app = graph.compile()
+    Returns:
+        GraphState: 최종 상태 (story_output에 생성된 스토리 포함)
 
-    # 그래프 실행
+    Example:
+        >>> import asyncio
+        >>> results = asyncio.run(asyncio.gather(
+        ...     arun_story_generation("용사 이야기"),
+        ...     arun_story_generation("도둑 이야기"),
+        ... ))
+    """
     initial_state = GraphState(user_input=user_input)
-    final_state = app.invoke(initial_state)
+    cache, key, cached = _lookup_story_cache(
+        use_cache,
+        user_input,
+        DEFAULT_MODEL,
+        llm,
+        {},
+        max_retries=initial_state.max_retries,
+    )
+    if cached is not None:
+        return cached.final_state
 
-    return GraphState(**final_state)
+    # 컴파일된 그래프 조회 (llm이 None이면 기본 모델 사용)
+    app = get_compiled_graph(DEFAULT_MODEL, llm=llm)
+
+    # 그래프 실행 (캐시에 저장할 노드 업데이트도 함께 받음)
+    updates: list[dict[str, Any]] = []
+    final_state: dict[str, Any] = {}
+    async for mode, chunk in app.astream(
+        initial_state, stream_mode=["updates", "values"]
+    ):
+        if mode == "updates":
+            updates.append(chunk)
+        else:
+            final_state = chunk
+
+    result = GraphState(**final_state)
+    if cache is not None:
+        cache.set(key, result, updates)
+    return result
 
 
 def run_story_generation_stream(
     user_input: str = "",
-    llm: ChatOllama | None = None,
+    llm: "ChatOllama | None" = None,
     story_writer_system_prompt: str = "",
     director_system_prompt: str = "",
 ) -> None:
@@ -153,17 +581,20 @@ def run_story_generation_stream(
     Note:
         결과를 반환하지 않고 콘솔에 직접 출력합니다.
     """
-    # 기본 LLM 설정
+    # 컴파일된 그래프 조회 (llm이 None이면 기본 모델 사용)
     if llm is None:
-        llm = ChatOllama(model="gpt-oss:20b", reasoning=True)
-
-    # 그래프 생성 및 컴파일
-    graph = create_graph(
-        llm=llm,
-        story_writer_system_prompt=story_writer_system_prompt,
-        director_system_prompt=director_system_prompt,
-    )
-    app = graph.compile()
+        app = get_compiled_graph(
+            DEFAULT_MODEL,
+            story_writer_system_prompt=story_writer_system_prompt,
+            director_system_prompt=director_system_prompt,
+            reasoning=True,
+        )
+    else:
+        app = get_compiled_graph(
+            story_writer_system_prompt=story_writer_system_prompt,
+            director_system_prompt=director_system_prompt,
+            llm=llm,
+        )
 
     # 그래프 스트리밍 실행
     initial_state = GraphState(user_input=user_input)
@@ -184,7 +615,7 @@ def run_story_generation_stream(
 
 async def run_story_generation_stream_tokens(
     user_input: str = "",
-    llm: ChatOllama | None = None,
+    llm: "ChatOllama | None" = None,
     story_writer_system_prompt: str = "",
     director_system_prompt: str = "",
 ) -> None:
@@ -207,17 +638,13 @@ async def run_story_generation_stream_tokens(
         >>> import asyncio
         >>> asyncio.run(run_story_generation_stream_tokens("용사 이야기"))
     """
-    # 기본 LLM 설정
-    if llm is None:
-        llm = ChatOllama(model="gpt-oss:20b")
-
-    # 그래프 생성 및 컴파일
-    graph = create_graph(
-        llm=llm,
+    # 컴파일된 그래프 조회 (llm이 None이면 기본 모델 사용)
+    app = get_compiled_graph(
+        DEFAULT_MODEL,
         story_writer_system_prompt=story_writer_system_prompt,
         director_system_prompt=director_system_prompt,
+        llm=llm,
     )
-    app = graph.compile()
 
     # 그래프 스트리밍 실행
     initial_state = GraphState(user_input=user_input)
@@ -237,11 +664,11 @@ async def run_story_generation_stream_tokens(
 
         # 노드 시작/종료 이벤트
         elif kind == "on_chain_start" and event.get("name"):
-            if event["name"] in ["init", "write", "review"]:
+            if event["name"] in ["init", "prefetch", "write", "review"]:
                 print(f"\n\n📍 노드 시작: {event['name']}")
                 print("-" * 30)
         elif kind == "on_chain_end" and event.get("name"):
-            if event["name"] in ["init", "write", "review"]:
+            if event["name"] in ["init", "prefetch", "write", "review"]:
                 print(f"\n📍 노드 종료: {event['name']}")
 
     print("\n" + "=" * 50)
@@ -1,8 +1,37 @@
-from operator import add
+import operator
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import BaseModel, Field
 
+from src.utils.lorebook_cache import normalize_query
+
+
+def append_history(existing: list[str], new: list[str]) -> list[str]:
+    """
+    히스토리 reducer: 노드가 반환한 새 항목만 이어 붙임
+
+    노드는 전체 히스토리가 아니라 이번에 추가할 항목(delta)만 반환해야 합니다.
+    """
+    return existing + new
+
+
+def bounded_history(limit: int) -> Callable[[list[str], list[str]], list[str]]:
+    """
+    최근 limit개만 남기는 히스토리 reducer 생성 (graph_state_schema 참고)
+
+    Raises:
+        ValueError: limit가 1보다 작을 때
+    """
+    if limit < 1:
+        raise ValueError(f"limit는 1 이상이어야 합니다: {limit}")
+
+    def append_bounded(existing: list[str], new: list[str]) -> list[str]:
+        return append_history(existing, new)[-limit:]
+
+    return append_bounded
+
 
 class RefinedRequest(BaseModel):
     """사용자 요청 스키마"""
@@ -15,6 +44,68 @@ class RefinedRequest(BaseModel):
     length: str | None = Field(default=None, description="스토리 길이")
 
 
+class LoreSnippet(BaseModel):
+    """미리 검색한 Lorebook 자료"""
+
+    query: str = Field(default="", description="검색어")
+    content: str = Field(default="", description="검색된 설정 자료 본문")
+
+
+class RetrievalRecord(BaseModel):
+    """실행 중 한 번 검색한 Lorebook 결과"""
+
+    query: str = Field(default="", description="처음 검색한 검색어 원문")
+    contents: list[str] = Field(default_factory=list, description="검색된 부모 문서 본문")
+    used_by: list[str] = Field(
+        default_factory=list, description="이 결과를 받은 에이전트 (처음 검색한 순서대로)"
+    )
+
+
+class RetrievalMemo(BaseModel):
+    """
+    실행 단위 Lorebook 검색 메모 (검색어 → 결과)
+
+    그래프 상태에 담겨 한 실행 동안 모든 에이전트가 공유하므로,
+    같은 검색어는 재시도 루프를 포함해 한 번만 실제로 검색합니다.
+    recall/record는 메모를 직접 갱신하므로, 노드는 입력 상태의 메모를 복사하여
+    갱신한 뒤 상태 업데이트로 반환해야 합니다.
+    """
+
+    records: dict[str, RetrievalRecord] = Field(
+        default_factory=dict, description="정규화된 검색어 → 검색 결과"
+    )
+    hits: int = Field(default=0, description="메모에서 재사용한 검색 수")
+    misses: int = Field(default=0, description="실제로 검색을 실행한 수")
+
+    def recall(self, query: str, agent: str = "") -> list[str] | None:
+        """메모에 있으면 결과 본문 반환 (없으면 None)"""
+        record = self.records.get(normalize_query(query))
+        if record is None:
+            return None
+        self.hits += 1
+        if agent and agent not in record.used_by:
+            record.used_by.append(agent)
+        return record.contents
+
+    def record(self, query: str, contents: list[str], agent: str = "") -> None:
+        """검색 결과 기록"""
+        self.misses += 1
+        self.records[normalize_query(query)] = RetrievalRecord(
+            query=query, contents=contents, used_by=[agent] if agent else []
+        )
+
+    def used_by(self, agents: set[str]) -> list[RetrievalRecord]:
+        """주어진 에이전트 중 하나라도 받은 결과 (검색 순서대로)"""
+        return [r for r in self.records.values() if agents.intersection(r.used_by)]
+
+    def summary(self) -> str:
+        """실행에 필요했던 검색량 요약"""
+        return (
+            f"고유 검색어 {len(self.records)}개, "
+            f"실제 검색 {self.misses}회, 메모 재사용 {self.hits}회"
+        )
+
+
 class StoryOutput(BaseModel):
     """Story Writer의 스토리 출력 스키마"""
 
@@ -31,6 +122,9 @@ class EvalReport(BaseModel):
     score: float = Field(default=0.0, ge=0.0, le=10.0, description="스토리 점수 (0-10)")
     feedback: str = Field(default="", description="스토리에 대한 피드백")
     issues: list[str] = Field(default_factory=list, description="발견된 문제점 목록")
+    paragraph_issues: dict[int, list[str]] = Field(
+        default_factory=dict, description="문단 번호(1부터) → 해당 문단의 문제점"
+    )
 
 
 class GraphState(BaseModel):
@@ -40,20 +134,72 @@ class GraphState(BaseModel):
     request: RefinedRequest = Field(
         default_factory=RefinedRequest, description="파싱된 사용자 요청"
     )
+    prefetched_lore: list[LoreSnippet] = Field(
+        default_factory=list, description="요청 분석 후 미리 검색한 Lorebook 자료"
+    )
+    retrieval_memo: RetrievalMemo = Field(
+        default_factory=RetrievalMemo, description="이번 실행의 Lorebook 검색 메모"
+    )
     story_output: StoryOutput | None = Field(
         default=None, description="Story Writer의 구조화된 출력"
     )
-    story_history: Annotated[list[str], add] = Field(
+    story_history: Annotated[list[str], append_history] = Field(
         default_factory=list, description="이전 스토리 버전 히스토리"
     )
 
     # Director 출력
     eval_report: EvalReport | None = Field(default=None, description="검수 결과 보고서")
-    feedback_history: Annotated[list[str], add] = Field(
+    feedback_history: Annotated[list[str], append_history] = Field(
         default_factory=list, description="Director 피드백 히스토리"
     )
+    score_history: Annotated[list[float], operator.add] = Field(
+        default_factory=list,
+        description="검수한 작성본의 점수 (오래된 순, 응답 파싱에 실패한 검수는 제외)",
+    )
+    review_skipped: bool = Field(
+        default=False,
+        description="마지막 작성본을 검수하지 않고 종료했는지 여부 (이때 eval_report는 None)",
+    )
+    paragraph_reviews: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="문단 해시 → 검수 때 지적된 문제점 (빈 리스트면 통과, 현재 버전 문단만 보관)",
+    )
 
     # 흐름 제어
     retry_count: int = Field(default=0, description="현재 재시도 횟수")
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
     is_complete: bool = Field(default=False, description="작업 완료 여부")
+
+
+@lru_cache(maxsize=None)
+def graph_state_schema(history_limit: int | None = None) -> type[GraphState]:
+    """
+    히스토리 보관 개수에 맞는 그래프 상태 스키마
+
+    history_limit를 주면 story_history/feedback_history를 최근 history_limit개만 보관하는
+    GraphState 하위 클래스를 반환합니다. 에이전트는 최신 항목만 프롬프트에 사용하므로,
+    재시도가 많은 장기 실행에서 상태 크기와 노드별 직렬화 비용을 일정하게 유지할 때 사용합니다.
+    보관 개수는 이 스키마로 만든 그래프에만 적용됩니다.
+
+    Args:
+        history_limit: 보관할 최대 개수 (None이면 전체 보관하는 GraphState)
+
+    Raises:
+        ValueError: history_limit가 1보다 작을 때
+    """
+    if history_limit is None:
+        return GraphState
+    reducer = bounded_history(history_limit)
+
+    class BoundedGraphState(GraphState):
+        story_history: Annotated[list[str], reducer] = Field(
+            default_factory=list, description="이전 스토리 버전 히스토리 (최근 항목만)"
+        )
+        feedback_history: Annotated[list[str], reducer] = Field(
+            default_factory=list, description="Director 피드백 히스토리 (최근 항목만)"
+        )
+
+    BoundedGraphState.__name__ = BoundedGraphState.__qualname__ = (
+        f"GraphState_history{history_limit}"
+    )
+    return BoundedGraphState
@@ -0,0 +1,286 @@
+"""
+캐시 유틸리티 모듈
+
+여러 스레드에서 공유할 수 있는 메모리 LRU 캐시와 SQLite 기반 디스크 캐시를 제공합니다.
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/미스 통계"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    스레드 안전한 LRU 캐시
+
+    maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    ttl(초)을 지정하면 저장 후 ttl이 지난 항목은 조회 시 만료 처리됩니다.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.get_or_create("a", lambda: 1)
+        1
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._expires_at: dict[K, float] = {}
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """키에 해당하는 값을 반환 (없거나 만료되었으면 default)"""
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._stats.misses += 1
+                return default
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """값 저장 (용량 초과 시 LRU 항목 제거)"""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        캐시된 값을 반환하거나, 없으면 factory로 생성하여 저장합니다.
+
+        factory는 락 밖에서 실행되므로 다른 키의 조회를 막지 않습니다.
+        같은 키를 동시에 생성한 경우 먼저 저장된 값을 모두가 공유합니다.
+        """
+        value = self.get(key, _MISSING)  # type: ignore[arg-type]
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+
+        created = factory()
+        with self._lock:
+            existing = self._lookup(key)
+            if existing is not _MISSING:
+                return existing  # type: ignore[return-value]
+            self._store(key, created)
+            return created
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """항목 제거 후 값 반환"""
+        with self._lock:
+            self._expires_at.pop(key, None)
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._data.clear()
+            self._expires_at.clear()
+
+    def stats(self) -> CacheStats:
+        """현재 통계의 복사본 반환"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+            )
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._lookup(key) is not _MISSING  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _lookup(self, key: K) -> V | object:
+        """만료를 확인하며 조회 (락을 잡은 상태에서 호출)"""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            del self._expires_at[key]
+            self._stats.evictions += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def _store(self, key: K, value: V) -> None:
+        """값 저장 후 용량 초과분 제거 (락을 잡은 상태에서 호출)"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.ttl is not None:
+            self._expires_at[key] = time.monotonic() + self.ttl
+        while len(self._data) > self.maxsize:
+            oldest, _ = self._data.popitem(last=False)
+            self._expires_at.pop(oldest, None)
+            self._stats.evictions += 1
+
+
+class SQLiteCache:
+    """
+    SQLite 파일 하나에 저장하는 디스크 캐시 (문자열 키 → 문자열 값)
+
+    프로세스를 재시작해도 유지되며, max_entries를 넘으면 가장 오래 조회되지 않은
+    항목부터, ttl(초)이 지난 항목은 조회 시 제거합니다.
+    tag로 항목을 묶어 두면 purge_except()로 다른 tag의 항목을 한 번에 지울 수 있습니다.
+
+    Example:
+        >>> cache = SQLiteCache(".cache/example.sqlite3", max_entries=100)
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10_000,
+        ttl: float | None = None,
+    ):
+        if max_entries <= 0:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # 캐시 용도이므로 쓰기 지연을 줄이는 쪽으로 설정
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    tag TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)"
+            )
+
+    def get(self, key: str, tag: str | None = None) -> str | None:
+        """
+        값을 조회합니다.
+
+        Args:
+            key: 캐시 키
+            tag: 지정하면 저장 시의 tag와 같을 때만 적중으로 처리
+
+        Returns:
+            저장된 값 (없거나 만료/태그 불일치면 None)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, tag, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            value, stored_tag, created_at = row
+            expired = self.ttl is not None and now - created_at >= self.ttl
+            if expired or (tag is not None and stored_tag != tag):
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._stats.misses += 1
+                self._stats.evictions += 1
+                return None
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: str, tag: str = "") -> None:
+        """값 저장 (용량 초과 시 가장 오래 조회되지 않은 항목 제거)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, tag, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, tag, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self._stats.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        """항목 제거"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def purge_except(self, tag: str) -> int:
+        """주어진 tag가 아닌 모든 항목을 제거하고 제거된 개수를 반환"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM entries WHERE tag != ?", (tag,))
+            self._stats.evictions += cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> CacheStats:
+        """현재 통계의 복사본 반환"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+            )
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            return count
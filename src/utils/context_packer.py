@@ -0,0 +1,213 @@
+"""
+Lorebook 컨텍스트 패킹 모듈
+
+tool call로 검색된 부모 문서를 토큰 예산 안에서 프롬프트에 넣을 형태로 묶습니다.
+이미 메시지에 들어간 문서는 다시 넣지 않고, 검색어와의 관련도 순으로 예산을 채우므로
+검색 횟수가 늘어나도 프롬프트 크기(= prefill 시간)가 일정 범위를 넘지 않습니다.
+"""
+
+import hashlib
+import math
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+from src.utils.lexical_index import char_ngrams
+
+DEFAULT_TOKEN_BUDGET = 3000
+MIN_SNIPPET_TOKENS = 64  # 잘라서라도 넣을 최소 토큰 수 (이보다 작게 남으면 생략)
+_SEEN_PREFIX_CHARS = 200  # 메시지 본문에 이미 있는지 비교할 문서 앞부분 길이
+_HANGUL_PATTERN = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정
+
+    토크나이저를 불러오지 않고 글자 종류로 근사합니다.
+    (한글은 대략 글자당 1토큰, 그 밖의 문자는 4글자당 1토큰)
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_PATTERN.findall(text))
+    others = len(text) - hangul - text.count(" ")
+    return math.ceil(hangul + max(others, 0) / 4)
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    query: str
+    doc: Document
+    rank: int
+    relevance: float
+
+
+class ContextPacker:
+    """
+    토큰 예산 안에서 Lorebook 검색 결과를 묶는 패커
+
+    한 에이전트 실행(tool call 반복 전체) 동안 같은 인스턴스를 사용하여
+    이미 넣은 문서와 남은 예산을 기억합니다.
+
+    Args:
+        budget_tokens: Lorebook 자료에 쓸 최대 토큰 수
+        token_counter: 토큰 수 계산 함수 (기본값: estimate_tokens)
+        existing_text: 이미 메시지에 들어간 텍스트 (여기 포함된 문서는 다시 넣지 않음)
+
+    Example:
+        >>> packer = ContextPacker(budget_tokens=500)
+        >>> text = packer.pack({"화이트런": [Document(page_content="화이트런은 ...")]})
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = DEFAULT_TOKEN_BUDGET,
+        token_counter: Callable[[str], int] = estimate_tokens,
+        existing_text: str = "",
+    ):
+        self.budget_tokens = budget_tokens
+        self.token_counter = token_counter
+        self.used_tokens = 0
+        self._existing_text = existing_text
+        self._seen: dict[str, str] = {}  # 문서 해시 → 처음 넣은 검색어
+
+    @classmethod
+    def from_messages(
+        cls,
+        messages: Iterable,
+        budget_tokens: int = DEFAULT_TOKEN_BUDGET,
+        token_counter: Callable[[str], int] = estimate_tokens,
+    ) -> "ContextPacker":
+        """메시지 리스트에 이미 있는 문서를 제외하도록 패커 생성"""
+        existing = "\n".join(
+            message.content
+            for message in messages
+            if isinstance(getattr(message, "content", None), str)
+        )
+        return cls(budget_tokens, token_counter=token_counter, existing_text=existing)
+
+    @property
+    def remaining_tokens(self) -> int:
+        return max(self.budget_tokens - self.used_tokens, 0)
+
+    def pack(self, results: dict[str, list[Document]]) -> str:
+        """
+        검색어 → 문서 결과를 예산 안에서 텍스트로 묶습니다.
+
+        관련도(검색어 n-gram이 문서에 나타난 비율, 동률이면 검색 순위) 순으로 넣으며,
+        예산이 조금 남으면 문단 단위로 잘라 넣고, 부족하면 생략한 수만 표시합니다.
+        """
+        candidates, duplicates = self._rank(results)
+
+        sections: dict[str, list[str]] = {query: [] for query in results}
+        omitted = 0
+        for candidate in candidates:
+            content = self._fit(candidate.doc.page_content)
+            if content is None:
+                omitted += 1
+                continue
+            self._seen[_doc_key(candidate.doc)] = candidate.query
+            sections[candidate.query].append(f"[설정 자료]: {content}")
+
+        for query, first_query in duplicates:
+            sections[query].append(f"('{first_query}' 검색 결과와 같은 자료, 이미 제공됨)")
+
+        parts = []
+        for query, entries in sections.items():
+            if entries:
+                body = "\n\n".join(entries)
+            elif results[query]:
+                continue  # 결과는 있었지만 모두 예산 초과로 생략됨
+            else:
+                body = "관련된 설정을 찾을 수 없습니다."
+            parts.append(f"## {query}\n{body}" if len(results) > 1 else body)
+        if omitted:
+            parts.append(f"(컨텍스트 예산 초과로 자료 {omitted}개 생략)")
+        return "\n\n".join(parts)
+
+    def pack_text(self, text: str) -> str:
+        """문서 구조가 없는 tool 결과를 남은 예산에 맞게 문단 단위로 자름"""
+        content = self._fit(text)
+        return content if content is not None else "(컨텍스트 예산 초과로 생략)"
+
+    def _rank(
+        self, results: dict[str, list[Document]]
+    ) -> tuple[list[_Candidate], list[tuple[str, str]]]:
+        """중복을 걸러낸 후보를 관련도 순으로 정렬"""
+        candidates: list[_Candidate] = []
+        duplicates: list[tuple[str, str]] = []
+        queued: dict[str, str] = {}
+        for query, docs in results.items():
+            query_tokens = set(char_ngrams(query))
+            for rank, doc in enumerate(docs):
+                key = _doc_key(doc)
+                first_query = self._seen.get(key) or queued.get(key)
+                if first_query is None and self._in_existing_text(doc):
+                    first_query = "이전 메시지"
+                if first_query is not None:
+                    duplicates.append((query, first_query))
+                    continue
+                queued[key] = query
+                candidates.append(
+                    _Candidate(query, doc, rank, _relevance(query_tokens, doc))
+                )
+
+        candidates.sort(key=lambda c: (-c.relevance, c.rank))
+        return candidates, list(dict.fromkeys(duplicates))
+
+    def _in_existing_text(self, doc: Document) -> bool:
+        prefix = doc.page_content[:_SEEN_PREFIX_CHARS].strip()
+        return bool(prefix) and prefix in self._existing_text
+
+    def _fit(self, text: str) -> str | None:
+        """남은 예산에 맞게 텍스트를 넣고 사용량 반영 (넣을 수 없으면 None)"""
+        tokens = self.token_counter(text)
+        if tokens <= self.remaining_tokens:
+            self.used_tokens += tokens
+            return text
+        if self.remaining_tokens < MIN_SNIPPET_TOKENS:
+            return None
+
+        trimmed = _trim_to_tokens(text, self.remaining_tokens, self.token_counter)
+        if not trimmed:
+            return None
+        self.used_tokens += self.token_counter(trimmed)
+        return trimmed + " …"
+
+
+def _doc_key(doc: Document) -> str:
+    return hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+
+
+def _relevance(query_tokens: set[str], doc: Document) -> float:
+    """검색어 n-gram 중 문서에 나타난 비율"""
+    if not query_tokens:
+        return 0.0
+    doc_tokens = set(char_ngrams(doc.page_content))
+    return len(query_tokens & doc_tokens) / len(query_tokens)
+
+
+def _trim_to_tokens(text: str, max_tokens: int, token_counter: Callable[[str], int]) -> str:
+    """문단(없으면 줄) 경계에서 max_tokens 이내로 자름"""
+    separator = "\n\n" if "\n\n" in text else "\n"
+    units = text.split(separator)
+    kept: list[str] = []
+    for unit in units:
+        if token_counter(separator.join([*kept, unit])) > max_tokens:
+            break
+        kept.append(unit)
+
+    if kept:
+        return separator.join(kept)
+
+    # 첫 문단부터 예산을 넘으면 글자 단위로 자름
+    low, high = 0, len(units[0])
+    while low < high:
+        middle = (low + high + 1) // 2
+        if token_counter(units[0][:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return units[0][:low]
@@ -0,0 +1,151 @@
+"""
+부모 문서 저장소 모듈
+
+ParentDocumentRetriever의 docstore로 사용할 수 있는 SQLite 단일 파일 저장소를 제공합니다.
+문서는 pickle 대신 JSON으로 직렬화하며, 여러 문서를 한 번의 쿼리로 조회합니다.
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+from langchain_core.documents import Document
+from langchain_core.stores import BaseStore
+
+# SQLite의 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+_QUERY_CHUNK_SIZE = 500
+_MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SQLiteDocStore(BaseStore[str, Document]):
+    """
+    SQLite 파일 하나에 부모 문서를 저장하는 docstore
+
+    LocalFileStore + pickle 조합을 대체하는 drop-in 저장소입니다.
+    문서 ID가 기본 키 인덱스이므로 mget은 문서 수와 관계없이 한 번의 쿼리로 처리됩니다.
+
+    Example:
+        >>> store = SQLiteDocStore("./parent_docs.sqlite3")
+        >>> store.mset([("doc-1", Document(page_content="화이트런"))])
+        >>> store.mget(["doc-1"])[0].page_content
+        '화이트런'
+    """
+
+    def __init__(self, path: str | Path, read_only: bool = False):
+        self.path = Path(path)
+        self.read_only = read_only
+        self._lock = threading.Lock()
+
+        if read_only:
+            uri = f"{self.path.resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS documents ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+        # 조회 시 파일을 메모리 매핑하여 read 시스템 콜을 줄임
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+
+    def mget(self, keys: Sequence[str]) -> list[Document | None]:
+        """여러 문서를 조회 (없는 키는 None)"""
+        found: dict[str, Document] = {}
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+                chunk = list(keys[start : start + _QUERY_CHUNK_SIZE])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM documents WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = _loads(value)
+        return [found.get(key) for key in keys]
+
+    def mset(self, key_value_pairs: Sequence[tuple[str, Document]]) -> None:
+        """여러 문서를 저장 (같은 키는 덮어씀)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents (key, value) VALUES (?, ?)",
+                [(key, _dumps(doc)) for key, doc in key_value_pairs],
+            )
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """여러 문서를 삭제"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM documents WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def yield_keys(self, *, prefix: str | None = None) -> Iterator[str]:
+        """저장된 키 순회 (prefix로 필터링 가능)"""
+        with self._lock:
+            if prefix:
+                rows = self._conn.execute(
+                    "SELECT key FROM documents WHERE substr(key, 1, ?) = ? ORDER BY key",
+                    (len(prefix), prefix),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT key FROM documents ORDER BY key"
+                ).fetchall()
+        for (key,) in rows:
+            yield key
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()
+            return count
+
+
+def _dumps(doc: Document) -> str:
+    """Document를 JSON 문자열로 직렬화"""
+    return json.dumps(
+        {"id": doc.id, "page_content": doc.page_content, "metadata": doc.metadata},
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _loads(value: str) -> Document:
+    """JSON 문자열을 Document로 역직렬화"""
+    data = json.loads(value)
+    return Document(
+        id=data.get("id"),
+        page_content=data["page_content"],
+        metadata=data.get("metadata", {}),
+    )
+
+
+def migrate_local_file_store(source_dir: str | Path, target: SQLiteDocStore) -> int:
+    """
+    pickle 파일 기반 LocalFileStore를 SQLiteDocStore로 옮깁니다.
+
+    직접 생성한(신뢰할 수 있는) 기존 저장소를 변환할 때만 사용하세요.
+    pickle 역직렬화는 이 마이그레이션에서 한 번만 수행됩니다.
+
+    Args:
+        source_dir: 기존 LocalFileStore 디렉토리 (예: "./parent_docs_store")
+        target: 옮겨 담을 SQLiteDocStore
+
+    Returns:
+        int: 옮긴 문서 수
+    """
+    pairs = []
+    for path in sorted(Path(source_dir).iterdir()):
+        if path.is_file():
+            doc = pickle.loads(path.read_bytes())
+            pairs.append((path.name, doc))
+    target.mset(pairs)
+    return len(pairs)
@@ -0,0 +1,234 @@
+"""
+Lorebook 개체명 사전(gazetteer) 모듈
+
+lorebook의 제목과 목록 항목에 나오는 "한국어 이름 (English Name)" 쌍을 적재 시점에 추출해,
+모든 이름 변형(한국어, 영어, 띄어쓰기/정관사 생략 등)을 해당 부모 문서 ID에 연결합니다.
+검색어가 이름과 정확히 일치하면 임베딩 없이 해시 조회 한 번으로 문서를 찾을 수 있습니다.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from langchain_core.documents import Document
+from langchain_core.stores import BaseStore
+
+from src.utils.lorebook_cache import normalize_query
+
+GAZETTEER_VERSION = 1
+MAX_NAME_WORDS = 3  # 괄호 앞에서 한국어 이름으로 볼 최대 어절 수
+
+# "한국어 이름 (English Name)" — 괄호 안은 영문자로 시작해야 함
+_PAIR_PATTERN = re.compile(r"([^()]*?)\s*\(([A-Za-z][^()]*)\)")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s+")
+_LIST_PATTERN = re.compile(r"^\s*[-*]\s+")
+_NUMBERING_PATTERN = re.compile(r"^(?:제?\d+(?:\.\d+)*[부장절]?[.:]?\s*)+")
+_SEGMENT_DELIMITERS = re.compile(r"[:\-–—|,.;·'\"*\[\]<>]")
+# 이름 앞에 붙는 칭호 ("야를 발그루프" → "발그루프"도 등록)
+_TITLES = ("야를 ", "jarl ")
+# 앞 괄호 바로 뒤에 붙은 조사 ("(The Great War)과 백금 조약" → "백금 조약")
+_LEADING_PARTICLES = {"과", "와", "및", "의", "은", "는", "이", "가", "을", "를", "로", "으로", "에서"}
+
+
+@dataclass(frozen=True)
+class Entity:
+    """lorebook 개체 (한국어/영어 이름과 해당 부모 문서 ID)"""
+
+    korean: str
+    english: str
+    section_ids: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        """표시용 이름 (예: "화이트런 영지 (Whiterun Hold)")"""
+        return f"{self.korean} ({self.english})"
+
+
+def extract_name_pairs(text: str) -> list[tuple[str, str]]:
+    """
+    제목과 목록 항목에서 (한국어 이름, 영어 이름) 쌍을 추출합니다.
+
+    Example:
+        >>> extract_name_pairs("### 1. 화이트런 영지 (Whiterun Hold) - 스카이림의 심장")
+        [('화이트런 영지', 'Whiterun Hold')]
+    """
+    pairs = []
+    for line in text.splitlines():
+        if _HEADING_PATTERN.match(line):
+            body = _HEADING_PATTERN.sub("", line)
+        elif _LIST_PATTERN.match(line):
+            body = _LIST_PATTERN.sub("", line)
+        else:
+            continue
+
+        for match in _PAIR_PATTERN.finditer(body):
+            korean = _korean_name(match.group(1))
+            english = match.group(2).strip()
+            if korean and english:
+                pairs.append((korean, english))
+    return pairs
+
+
+def _korean_name(prefix: str) -> str:
+    """
+    괄호 앞 텍스트에서 한국어 이름 부분만 추출
+
+    구분 기호 뒤의 구절이 MAX_NAME_WORDS 어절보다 길면 문장 속 설명으로 보고 제외합니다.
+    """
+    segment = _SEGMENT_DELIMITERS.split(prefix)[-1]
+    segment = _NUMBERING_PATTERN.sub("", segment.strip())
+    words = segment.split()
+    if words and words[0] in _LEADING_PARTICLES:
+        words = words[1:]
+    if len(words) > MAX_NAME_WORDS:
+        return ""
+    name = " ".join(words)
+    # 한글이 없는 경우(영문 약어 등)는 개체로 보지 않음
+    if not re.search(r"[가-힣]", name):
+        return ""
+    return name
+
+
+def name_variants(korean: str, english: str) -> set[str]:
+    """
+    이름 쌍의 조회용 변형 (normalize_query 기준)
+
+    Example:
+        >>> sorted(name_variants("리치", "The Reach"))
+        ['reach', 'the reach', '리치', '리치 (the reach)']
+    """
+    variants = {korean, english, f"{korean} ({english})", korean.replace(" ", "")}
+    if english.lower().startswith("the "):
+        variants.add(english[4:])
+    for name in (korean, english):
+        for title in _TITLES:
+            if name.lower().startswith(title):
+                variants.add(name[len(title) :])
+    return {normalize_query(v) for v in variants if v.strip()}
+
+
+class Gazetteer:
+    """
+    이름 변형 → 개체 해시 테이블
+
+    같은 이름이 여러 문서에 나오면 해당 문서 ID를 모두 연결합니다.
+
+    Example:
+        >>> gazetteer = Gazetteer.build([("p1", "### 9. 팔크리스 (Falkreath) - 죽음의 안식처")])
+        >>> gazetteer.lookup("Falkreath")
+        ['p1']
+    """
+
+    def __init__(self):
+        self._entities: dict[tuple[str, str], list[str]] = {}
+        self._aliases: dict[str, list[tuple[str, str]]] = {}
+
+    @classmethod
+    def build(cls, documents: list[tuple[str, str]]) -> "Gazetteer":
+        """(문서 ID, 본문) 리스트로 사전 생성"""
+        gazetteer = cls()
+        for doc_id, text in documents:
+            for korean, english in extract_name_pairs(text):
+                gazetteer.add(korean, english, doc_id)
+        return gazetteer
+
+    def add(self, korean: str, english: str, section_id: str) -> None:
+        """이름 쌍과 문서 ID 연결"""
+        key = (korean, english)
+        sections = self._entities.setdefault(key, [])
+        if section_id not in sections:
+            sections.append(section_id)
+        for variant in name_variants(korean, english):
+            keys = self._aliases.setdefault(variant, [])
+            if key not in keys:
+                keys.append(key)
+
+    def entities(self, name: str) -> list[Entity]:
+        """이름(한국어/영어/변형)과 정확히 일치하는 개체 목록"""
+        keys = self._aliases.get(normalize_query(name), [])
+        return [
+            Entity(korean=k, english=e, section_ids=tuple(self._entities[(k, e)]))
+            for k, e in keys
+        ]
+
+    def lookup(self, name: str) -> list[str]:
+        """이름과 정확히 일치하는 개체들의 문서 ID (등장 순서, 중복 제거)"""
+        ids: dict[str, None] = {}
+        for key in self._aliases.get(normalize_query(name), []):
+            ids.update(dict.fromkeys(self._entities[key]))
+        return list(ids)
+
+    def mentions(self, text: str, min_length: int = 2) -> list[Entity]:
+        """
+        텍스트에 이름(별칭 포함)이 등장하는 개체 목록 (처음 등장한 위치 순)
+
+        조사가 붙은 형태("화이트런의")도 찾을 수 있도록 부분 문자열로 비교하며,
+        min_length보다 짧은 별칭은 오탐을 줄이기 위해 제외합니다.
+        """
+        normalized = normalize_query(text)
+        positions: dict[tuple[str, str], int] = {}
+        for alias, keys in self._aliases.items():
+            if len(alias) < min_length:
+                continue
+            position = normalized.find(alias)
+            if position < 0:
+                continue
+            for key in keys:
+                positions[key] = min(position, positions.get(key, position))
+
+        ordered = sorted(positions, key=lambda key: positions[key])
+        return [
+            Entity(korean=k, english=e, section_ids=tuple(self._entities[(k, e)]))
+            for k, e in ordered
+        ]
+
+    def aliases(self, name: str) -> set[str]:
+        """같은 개체를 가리키는 모든 이름 변형"""
+        variants = set()
+        for key in self._aliases.get(normalize_query(name), []):
+            variants |= name_variants(*key)
+        return variants
+
+    def save(self, path: str | Path) -> None:
+        """사전을 JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": GAZETTEER_VERSION,
+            "entities": [
+                {"korean": k, "english": e, "section_ids": ids}
+                for (k, e), ids in self._entities.items()
+            ],
+        }
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Gazetteer":
+        """JSON 파일에서 사전 로드 (이름 변형은 로드 시 다시 계산)"""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("version") != GAZETTEER_VERSION:
+            raise ValueError(f"지원하지 않는 사전 버전입니다: {payload.get('version')}")
+
+        gazetteer = cls()
+        for entity in payload["entities"]:
+            for section_id in entity["section_ids"]:
+                gazetteer.add(entity["korean"], entity["english"], section_id)
+        return gazetteer
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and normalize_query(name) in self._aliases
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+def build_gazetteer(docstore: BaseStore[str, Document]) -> Gazetteer:
+    """docstore의 부모 문서 전체로 개체명 사전 생성"""
+    keys = list(docstore.yield_keys())
+    documents = [
+        (key, doc.page_content)
+        for key, doc in zip(keys, docstore.mget(keys))
+        if doc is not None
+    ]
+    return Gazetteer.build(documents)
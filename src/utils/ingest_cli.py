@@ -0,0 +1,139 @@
+"""
+Lorebook 일괄 적재 CLI
+
+여러 lorebook을 프로세스 풀에서 병렬로 분할하고, 새 청크를 배치 단위로 임베딩하여
+벡터 DB와 docstore에 한 번에 저장합니다.
+
+Example:
+    python -m src.utils.ingest_cli lorebooks/
+    python -m src.utils.ingest_cli "lorebooks/Elder*.md" --batch-size 128 --workers 8
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import typer
+
+from src.agents.tools.search_lorebook import (
+    CHILD_CHUNK_SIZE,
+    DOCSTORE_PATH,
+    EMBEDDING_MODEL,
+    GAZETTEER_PATH,
+    LEXICAL_INDEX_PATH,
+    PARENT_CHUNK_SIZE,
+    PERSIST_DIRECTORY,
+    open_docstore,
+)
+from src.utils.gazetteer import build_gazetteer
+from src.utils.lexical_index import build_lexical_index
+from src.utils.split_and_store_to_vector_db import (
+    SplitLorebook,
+    apply_plans,
+    create_vectorstore,
+    plan_ingestion,
+    split_lorebook,
+)
+
+app = typer.Typer(help="Lorebook 일괄 적재")
+
+
+def resolve_lorebooks(target: str) -> list[Path]:
+    """
+    디렉토리 또는 glob 패턴을 lorebook 파일 목록으로 변환
+
+    Args:
+        target: 디렉토리 경로(하위의 *.md 전체) 또는 glob 패턴
+
+    Returns:
+        정렬된 lorebook 파일 경로 리스트
+    """
+    path = Path(target)
+    if path.is_dir():
+        return sorted(path.glob("*.md"))
+    return sorted(Path(p) for p in glob.glob(target, recursive=True) if Path(p).is_file())
+
+
+def split_lorebooks(
+    paths: list[Path],
+    workers: int,
+    parent_chunk_size: int = PARENT_CHUNK_SIZE,
+    child_chunk_size: int = CHILD_CHUNK_SIZE,
+) -> list[SplitLorebook]:
+    """lorebook들을 프로세스 풀에서 병렬로 분할 (workers가 1이면 현재 프로세스에서 실행)"""
+    split = partial(
+        split_lorebook,
+        parent_chunk_size=parent_chunk_size,
+        child_chunk_size=child_chunk_size,
+    )
+    if workers <= 1 or len(paths) <= 1:
+        return [split(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(split, paths))
+
+
+@app.command()
+def ingest(
+    target: str = typer.Argument("lorebooks", help="lorebook 디렉토리 또는 glob 패턴"),
+    workers: int = typer.Option(os.cpu_count() or 1, help="분할에 사용할 프로세스 수"),
+    batch_size: int = typer.Option(64, min=1, help="한 번에 임베딩할 청크 수"),
+    parent_chunk_size: int = typer.Option(PARENT_CHUNK_SIZE, help="부모 청크 크기"),
+    child_chunk_size: int = typer.Option(CHILD_CHUNK_SIZE, help="자식 청크 크기"),
+    model: str = typer.Option(EMBEDDING_MODEL, help="임베딩 모델"),
+    persist_directory: str = typer.Option(PERSIST_DIRECTORY, help="Chroma 저장 경로"),
+    docstore_path: str = typer.Option(DOCSTORE_PATH, help="부모 문서 저장소 경로"),
+    lexical_index_path: str = typer.Option(LEXICAL_INDEX_PATH, help="BM25 인덱스 경로"),
+    gazetteer_path: str = typer.Option(GAZETTEER_PATH, help="개체명 사전 경로"),
+):
+    """lorebook들을 증분 적재하고 처리량을 출력합니다."""
+    paths = resolve_lorebooks(target)
+    if not paths:
+        typer.echo(f"❌ lorebook을 찾을 수 없습니다: {target}", err=True)
+        raise typer.Exit(code=1)
+
+    started = time.perf_counter()
+    splits = split_lorebooks(paths, workers, parent_chunk_size, child_chunk_size)
+    split_seconds = time.perf_counter() - started
+    typer.echo(f"✂️ lorebook {len(paths)}개 분할 완료 ({split_seconds:.2f}s)")
+
+    vectorstore = create_vectorstore(model=model, persist_directory=persist_directory)
+    docstore = open_docstore(docstore_path)
+    plans = plan_ingestion(splits, docstore)
+
+    total_chunks = sum(len(plan.children) for plan in plans)
+    embed_times: list[float] = []
+
+    def on_batch(size: int, seconds: float) -> None:
+        embed_times.append(seconds)
+        typer.echo(
+            f"  🧮 배치 {len(embed_times)}: 청크 {size}개, 임베딩 {seconds * 1000:.1f}ms"
+        )
+
+    typer.echo(f"📥 새 청크 {total_chunks}개 임베딩 (배치 크기 {batch_size})")
+    apply_plans(plans, vectorstore, docstore, batch_size=batch_size, on_batch=on_batch)
+
+    lexical_index = build_lexical_index(docstore)
+    lexical_index.save(lexical_index_path)
+    typer.echo(f"🔤 BM25 인덱스 저장: 문서 {len(lexical_index)}개 → {lexical_index_path}")
+    gazetteer = build_gazetteer(docstore)
+    gazetteer.save(gazetteer_path)
+    typer.echo(f"🏷️ 개체명 사전 저장: 개체 {len(gazetteer)}개 → {gazetteer_path}")
+    elapsed = time.perf_counter() - started
+
+    for plan in plans:
+        typer.echo(f"📚 {plan.report()}")
+
+    typer.echo(
+        f"⏱️ 총 {elapsed:.2f}s | {len(paths) / elapsed:.2f} docs/s | "
+        f"{total_chunks / elapsed:.1f} chunks/s"
+    )
+    if embed_times:
+        mean_ms = sum(embed_times) / len(embed_times) * 1000
+        typer.echo(f"   임베딩 평균 {mean_ms:.1f}ms/배치 ({len(embed_times)}개 배치)")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,176 @@
+"""
+스트리밍 JSON 필드 파서 모듈
+
+LLM이 토큰 단위로 출력하는 JSON 객체에서 지정한 최상위 문자열 필드(예: title, story)를
+도착하는 대로 디코딩하여 이벤트로 내보냅니다. 최상위 객체가 닫히면 done이 되므로
+호출자는 그 시점에 생성을 중단하여 뒤따르는 토큰 비용을 아낄 수 있습니다.
+
+Example:
+    >>> parser = StreamingJSONParser(fields=("story",))
+    >>> parser.feed('{"title": "t", "story": "옛날 ')
+    [FieldDelta(field='story', text='옛날 ')]
+    >>> parser.feed('옛적에"}')
+    [FieldDelta(field='story', text='옛적에')]
+    >>> parser.done
+    True
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+@dataclass(frozen=True)
+class FieldDelta:
+    """스트리밍 중 도착한 필드 문자열 조각"""
+
+    field: str
+    text: str
+
+
+class StreamingJSONParser:
+    """
+    토큰 스트림에서 최상위 문자열 필드를 점진적으로 꺼내는 파서
+
+    첫 "{" 이전의 텍스트(```json 코드 블록 표시 등)는 무시하며,
+    지정하지 않은 필드와 중첩된 객체/배열은 구조만 추적합니다.
+
+    Args:
+        fields: 스트리밍할 최상위 문자열 필드 이름
+    """
+
+    def __init__(self, fields: Iterable[str] = ("title", "story")):
+        self.fields = frozenset(fields)
+        self.values: dict[str, str] = {}
+        self.done = False
+        self._raw: list[str] = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._unicode: str | None = None  # \uXXXX 수집 중인 16진수
+        self._high_surrogate: str | None = None
+        self._expect_key = False
+        self._reading_key = False
+        self._key: list[str] = []
+        self._current_key = ""
+        self._active_field: str | None = None
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 원문 (객체가 닫힌 뒤의 텍스트는 제외)"""
+        return "".join(self._raw)
+
+    def feed(self, chunk: str) -> list[FieldDelta]:
+        """
+        토큰 조각을 넣고 새로 디코딩된 필드 조각을 반환
+
+        같은 필드의 연속된 글자는 하나의 FieldDelta로 합칩니다.
+        """
+        deltas: list[FieldDelta] = []
+        for index, char in enumerate(chunk):
+            if self.done:
+                self._raw.append(chunk[:index])
+                return deltas
+            decoded = self._consume(char)
+            if decoded and self._active_field:
+                self._emit(deltas, self._active_field, decoded)
+        self._raw.append(chunk)
+        return deltas
+
+    def _emit(self, deltas: list[FieldDelta], field: str, text: str) -> None:
+        self.values[field] = self.values.get(field, "") + text
+        if deltas and deltas[-1].field == field:
+            deltas[-1] = FieldDelta(field, deltas[-1].text + text)
+        else:
+            deltas.append(FieldDelta(field, text))
+
+    def _consume(self, char: str) -> str:
+        """한 글자를 처리하고, 스트리밍 중인 필드 값이면 디코딩된 글자를 반환"""
+        if not self._started:
+            if char == "{":
+                self._started = True
+                self._depth = 1
+                self._expect_key = True
+            return ""
+
+        if self._in_string:
+            return self._consume_string(char)
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expect_key:
+                self._reading_key = True
+                self._expect_key = False
+                self._key = []
+            elif self._depth == 1 and self._current_key in self.fields:
+                self._active_field = self._current_key
+        elif char == "," and self._depth == 1:
+            self._expect_key = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self.done = True
+        return ""
+
+    def _consume_string(self, char: str) -> str:
+        """문자열 내부 글자 처리 (이스케이프 디코딩)"""
+        if self._unicode is not None:
+            self._unicode += char
+            if len(self._unicode) < 4:
+                return ""
+            decoded = self._decode_unicode(self._unicode)
+            self._unicode = None
+            return self._append_string(decoded)
+
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode = ""
+                return ""
+            return self._append_string(_ESCAPES.get(char, char))
+
+        if char == "\\":
+            self._escape = True
+            return ""
+        if char == '"':
+            self._in_string = False
+            if self._reading_key:
+                self._reading_key = False
+                self._current_key = "".join(self._key)
+            self._active_field = None
+            return ""
+        return self._append_string(char)
+
+    def _decode_unicode(self, hex_digits: str) -> str:
+        """\\uXXXX 디코딩 (서로게이트 쌍은 두 번째 절반이 올 때 합침)"""
+        try:
+            code = int(hex_digits, 16)
+        except ValueError:
+            return ""
+        if 0xD800 <= code <= 0xDBFF:
+            self._high_surrogate = chr(code)
+            return ""
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate:
+            pair = self._high_surrogate + chr(code)
+            self._high_surrogate = None
+            return pair.encode("utf-16", "surrogatepass").decode("utf-16")
+        return chr(code)
+
+    def _append_string(self, text: str) -> str:
+        if self._reading_key:
+            self._key.append(text)
+            return ""
+        return text
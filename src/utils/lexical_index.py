@@ -0,0 +1,208 @@
+"""
+Lorebook 어휘(BM25) 검색 인덱스 모듈
+
+한국어는 조사가 붙고 띄어쓰기가 일정하지 않으므로 형태소 분석 대신 글자 n-gram으로 토큰화합니다.
+("화이트런의" → 화이, 이트, 트런, 런의) 인덱스는 적재 시점에 만들어 JSON 파일로 저장하며,
+검색 시 임베딩 모델 없이 역색인만으로 점수를 계산합니다.
+"""
+
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from langchain_core.documents import Document
+from langchain_core.stores import BaseStore
+
+_WORD_PATTERN = re.compile(r"\w+")
+INDEX_VERSION = 1
+
+
+def char_ngrams(text: str, n: int = 2) -> list[str]:
+    """
+    텍스트를 단어별 글자 n-gram으로 토큰화합니다.
+
+    n보다 짧은 단어는 단어 전체를 토큰으로 사용합니다.
+
+    Example:
+        >>> char_ngrams("블러드 드래곤")
+        ['블러', '러드', '드래', '래곤']
+    """
+    normalized = unicodedata.normalize("NFC", text).casefold()
+    tokens = []
+    for word in _WORD_PATTERN.findall(normalized):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i : i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+@dataclass(frozen=True)
+class LexicalHit:
+    """BM25 검색 결과 한 건"""
+
+    doc_id: str
+    score: float
+    coverage: float  # 검색어 토큰 중 문서에 나타난 비율 (어휘 검색 신뢰도)
+
+
+class BM25Index:
+    """
+    글자 n-gram 기반 BM25 역색인
+
+    Args:
+        k1: 단어 빈도 포화 계수
+        b: 문서 길이 정규화 계수
+        ngram: 토큰화에 사용할 n-gram 길이
+
+    Example:
+        >>> index = BM25Index.build([("whiterun", "화이트런은 스카이림 중앙의 영지다.")])
+        >>> index.search("화이트런")[0].doc_id
+        'whiterun'
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, ngram: int = 2):
+        self.k1 = k1
+        self.b = b
+        self.ngram = ngram
+        self.doc_ids: list[str] = []
+        self.doc_lengths: list[int] = []
+        self.postings: dict[str, dict[int, int]] = {}
+        self._avg_length = 0.0
+
+    @classmethod
+    def build(
+        cls,
+        documents: list[tuple[str, str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        ngram: int = 2,
+    ) -> "BM25Index":
+        """(문서 ID, 본문) 리스트로 인덱스 생성"""
+        index = cls(k1=k1, b=b, ngram=ngram)
+        for doc_id, text in documents:
+            index.add(doc_id, text)
+        return index
+
+    def add(self, doc_id: str, text: str) -> None:
+        """문서 하나를 인덱스에 추가"""
+        tokens = char_ngrams(text, self.ngram)
+        position = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.doc_lengths.append(len(tokens))
+        for token, count in Counter(tokens).items():
+            self.postings.setdefault(token, {})[position] = count
+        self._avg_length = sum(self.doc_lengths) / len(self.doc_lengths)
+
+    def search(self, query: str, k: int = 4) -> list[LexicalHit]:
+        """
+        BM25 점수 상위 k개 문서를 반환합니다.
+
+        Args:
+            query: 검색어
+            k: 반환할 최대 문서 수
+
+        Returns:
+            점수 내림차순의 LexicalHit 리스트 (검색어 토큰이 하나도 없는 문서는 제외)
+        """
+        query_tokens = set(char_ngrams(query, self.ngram))
+        if not query_tokens or not self.doc_ids:
+            return []
+
+        total = len(self.doc_ids)
+        scores: dict[int, float] = {}
+        matched: Counter[int] = Counter()
+        for token in query_tokens:
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for position, tf in posting.items():
+                length_ratio = self.doc_lengths[position] / self._avg_length
+                norm = self.k1 * (1 - self.b + self.b * length_ratio)
+                weight = idf * tf * (self.k1 + 1) / (tf + norm)
+                scores[position] = scores.get(position, 0.0) + weight
+                matched[position] += 1
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [
+            LexicalHit(
+                doc_id=self.doc_ids[position],
+                score=score,
+                coverage=matched[position] / len(query_tokens),
+            )
+            for position, score in ranked
+        ]
+
+    def save(self, path: str | Path) -> None:
+        """인덱스를 JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "ngram": self.ngram,
+            "doc_ids": self.doc_ids,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BM25Index":
+        """JSON 파일에서 인덱스 로드"""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 버전입니다: {payload.get('version')}")
+
+        index = cls(k1=payload["k1"], b=payload["b"], ngram=payload["ngram"])
+        index.doc_ids = payload["doc_ids"]
+        index.doc_lengths = payload["doc_lengths"]
+        # JSON 객체 키는 문자열이므로 문서 위치를 정수로 복원
+        index.postings = {
+            token: {int(position): tf for position, tf in posting.items()}
+            for token, posting in payload["postings"].items()
+        }
+        if index.doc_lengths:
+            index._avg_length = sum(index.doc_lengths) / len(index.doc_lengths)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+
+def build_lexical_index(docstore: BaseStore[str, Document]) -> BM25Index:
+    """docstore의 부모 문서 전체로 BM25 인덱스 생성"""
+    keys = list(docstore.yield_keys())
+    documents = [
+        (key, doc.page_content)
+        for key, doc in zip(keys, docstore.mget(keys))
+        if doc is not None
+    ]
+    return BM25Index.build(documents)
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[Document]],
+    k: int = 4,
+    constant: int = 60,
+) -> list[Document]:
+    """
+    여러 검색 결과 순위를 Reciprocal Rank Fusion으로 합칩니다.
+
+    같은 문서(본문 기준)가 여러 순위에 나타나면 점수를 더하고 하나만 남깁니다.
+    """
+    scores: dict[str, float] = {}
+    documents: dict[str, Document] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking):
+            key = doc.page_content
+            scores[key] = scores.get(key, 0.0) + 1.0 / (constant + rank + 1)
+            documents.setdefault(key, doc)
+    ranked = sorted(scores, key=scores.get, reverse=True)[:k]
+    return [documents[key] for key in ranked]
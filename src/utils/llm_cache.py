@@ -0,0 +1,213 @@
+"""
+LLM 응답 캐시 모듈
+
+모델, LLM 옵션, 바인딩된 tool, 직렬화한 메시지 리스트를 키로 AIMessage를 SQLite 파일에 저장합니다.
+파서 재시도나 중단된 그래프 재실행처럼 같은 메시지로 다시 호출할 때 모델을 거치지 않습니다.
+
+캐시 허용 여부는 에이전트별 정책으로 정합니다.
+    - "deterministic": temperature가 0이거나 seed가 지정된 LLM일 때만 캐시
+    - "always": 샘플링 설정과 무관하게 캐시 (입력이 같으면 결과도 같아야 하는 단계)
+    - "never": 캐시하지 않음
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    message_to_dict,
+    messages_from_dict,
+    messages_to_dict,
+)
+
+from src.utils.cache import CacheStats, SQLiteCache
+
+CACHE_POLICIES = ("deterministic", "always", "never")
+DEFAULT_LLM_CACHE_PATH = ".cache/llm_responses.sqlite3"
+
+# 키에 넣지 않는 LLM 필드 (응답 내용과 무관한 실행/로깅 설정)
+_IGNORED_FIELDS = {
+    "cache",
+    "callbacks",
+    "callback_manager",
+    "custom_get_token_ids",
+    "metadata",
+    "rate_limiter",
+    "tags",
+    "verbose",
+}
+
+_llm_cache: "LLMResponseCache | None" = None
+_llm_cache_lock = threading.Lock()
+
+
+def is_deterministic(llm: Any) -> bool:
+    """temperature가 0이거나 seed가 지정되어 같은 입력에 같은 응답을 기대할 수 있는지 여부"""
+    temperature = getattr(llm, "temperature", None)
+    seed = getattr(llm, "seed", None)
+    return (isinstance(temperature, (int, float)) and temperature == 0) or isinstance(
+        seed, int
+    )
+
+
+def cache_allowed(policy: str, llm: Any) -> bool:
+    """
+    정책에 따라 이 LLM의 응답을 캐시할 수 있는지 여부
+
+    Raises:
+        ValueError: 알 수 없는 정책
+    """
+    if policy not in CACHE_POLICIES:
+        raise ValueError(f"policy는 {CACHE_POLICIES} 중 하나여야 합니다: {policy}")
+    if policy == "never":
+        return False
+    return policy == "always" or is_deterministic(llm)
+
+
+def llm_identity(llm: Any) -> dict[str, Any] | None:
+    """
+    캐시 키용 LLM 식별 정보 (클래스, 모델 이름, JSON으로 표현 가능한 옵션)
+
+    모델 이름(model 속성)을 알 수 없으면 None을 반환하며, 이때는 캐시하지 않습니다.
+    """
+    model = getattr(llm, "model", None)
+    if not isinstance(model, str):
+        return None
+
+    identity: dict[str, Any] = {"class": type(llm).__name__}
+    for name in getattr(type(llm), "model_fields", {}):
+        if name in _IGNORED_FIELDS:
+            continue
+        value = getattr(llm, name, None)
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        identity[name] = value
+    identity["model"] = model
+    return identity
+
+
+class LLMResponseCache:
+    """
+    SQLite 기반 LLM 응답 캐시
+
+    max_entries를 넘으면 가장 오래 조회되지 않은 응답부터 제거합니다.
+    get/set/make_key를 가진 객체라면 에이전트에 대신 주입할 수 있습니다.
+
+    Args:
+        path: SQLite 파일 경로
+        max_entries: 최대 저장 응답 수
+        ttl: 응답 유효 시간(초), None이면 만료 없음
+
+    Example:
+        >>> cache = LLMResponseCache(".cache/llm_responses.sqlite3")
+        >>> key = cache.make_key(llm, messages)
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_LLM_CACHE_PATH,
+        max_entries: int = 5_000,
+        ttl: float | None = None,
+    ):
+        self._disk = SQLiteCache(path, max_entries=max_entries, ttl=ttl)
+
+    @staticmethod
+    def make_key(
+        llm: Any, messages: list[BaseMessage], tools: Any = None
+    ) -> str | None:
+        """
+        캐시 키 생성
+
+        Args:
+            llm: 호출할 LLM (tool을 바인딩하기 전의 모델)
+            messages: 보낼 메시지 리스트
+            tools: 바인딩된 tool 스키마 (없으면 None)
+
+        Returns:
+            캐시 키 (모델 이름을 알 수 없으면 None)
+        """
+        identity = llm_identity(llm)
+        if identity is None:
+            return None
+        payload = json.dumps(
+            {
+                "llm": identity,
+                "tools": tools,
+                "messages": messages_to_dict(messages),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> AIMessage | None:
+        """캐시된 응답 반환 (없으면 None)"""
+        raw = self._disk.get(key)
+        if raw is None:
+            return None
+        (message,) = messages_from_dict([json.loads(raw)])
+        return message
+
+    def set(self, key: str, message: AIMessage) -> None:
+        """응답 저장"""
+        self._disk.set(
+            key, json.dumps(message_to_dict(message), ensure_ascii=False, default=str)
+        )
+
+    def clear(self) -> None:
+        """모든 응답 제거"""
+        self._disk.clear()
+
+    def stats(self) -> CacheStats:
+        """적중/미스 통계"""
+        return self._disk.stats()
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        self._disk.close()
+
+    def __len__(self) -> int:
+        return len(self._disk)
+
+
+def configure_llm_cache(
+    path: str | None = DEFAULT_LLM_CACHE_PATH,
+    max_entries: int = 5_000,
+    ttl: float | None = None,
+) -> LLMResponseCache | None:
+    """
+    모든 에이전트가 공유할 LLM 응답 캐시를 설정합니다.
+
+    Args:
+        path: SQLite 파일 경로 (None이면 캐시 끄기)
+        max_entries: 최대 저장 응답 수
+        ttl: 응답 유효 시간(초), None이면 만료 없음
+
+    Returns:
+        LLMResponseCache | None: 새로 설정된 캐시 (끈 경우 None)
+    """
+    global _llm_cache
+
+    with _llm_cache_lock:
+        if _llm_cache is not None:
+            _llm_cache.close()
+        _llm_cache = (
+            LLMResponseCache(path, max_entries=max_entries, ttl=ttl)
+            if path is not None
+            else None
+        )
+        return _llm_cache
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """공유 LLM 응답 캐시 반환 (설정하지 않았으면 None)"""
+    return _llm_cache
@@ -0,0 +1,255 @@
+"""
+Lorebook 검색 결과 캐시 모듈
+
+정규화된 검색어와 retriever 설정을 키로 search_lorebook 결과 문서를 캐싱합니다.
+메모리 LRU 계층과 선택적인 SQLite 디스크 계층으로 구성되며,
+lorebook 원문이나 chroma_db가 바뀌면 자동으로 무효화됩니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from langchain_core.documents import Document
+
+from src.utils.cache import LRUCache, SQLiteCache
+
+
+@dataclass
+class QueryCacheStats:
+    """Lorebook 검색 캐시 통계"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hits(self) -> int:
+        """전체 적중 수 (메모리 + 디스크)"""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키용 검색어 정규화
+
+    유니코드 NFC 정규화, 대소문자 통일, 공백 정리를 수행합니다.
+
+    Example:
+        >>> normalize_query("  Whiterun   Hold ")
+        'whiterun hold'
+    """
+    normalized = unicodedata.normalize("NFC", query)
+    return " ".join(normalized.casefold().split())
+
+
+class LorebookFingerprint:
+    """
+    lorebook 원문과 벡터 DB의 버전 식별자
+
+    lorebook 파일 내용의 해시와 chroma_db/docstore 파일의 stat 정보를 합쳐 만듭니다.
+    내용 해시는 파일 stat이 바뀌었을 때만 다시 계산하며,
+    check_interval(초) 이내의 반복 조회는 이전 결과를 그대로 반환합니다.
+    """
+
+    def __init__(
+        self,
+        lorebook_dir: str | Path = "./lorebooks",
+        persist_directory: str | Path = "./chroma_db",
+        docstore_path: str | Path | None = "./parent_docs.sqlite3",
+        check_interval: float = 2.0,
+    ):
+        self.lorebook_dir = Path(lorebook_dir)
+        self.persist_directory = Path(persist_directory)
+        self.docstore_path = Path(docstore_path) if docstore_path else None
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._content_hashes: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._value = ""
+        self._checked_at = float("-inf")
+
+    def current(self) -> str:
+        """현재 fingerprint 반환"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at >= self.check_interval:
+                self._value = self._compute()
+                self._checked_at = now
+            return self._value
+
+    def _compute(self) -> str:
+        digest = hashlib.sha256()
+
+        # lorebook 원문 내용 해시 (stat이 같으면 이전 해시 재사용)
+        lorebook_files = (
+            sorted(self.lorebook_dir.glob("*.md")) if self.lorebook_dir.is_dir() else []
+        )
+        for path in lorebook_files:
+            digest.update(path.name.encode("utf-8"))
+            digest.update(self._content_hash(path).encode("ascii"))
+
+        # 벡터 DB / docstore는 파일 stat으로 변경 여부 판단
+        for root in (self.persist_directory, self.docstore_path):
+            if root is None:
+                continue
+            digest.update(repr(_stat_signature(root)).encode("ascii"))
+
+        return digest.hexdigest()[:16]
+
+    def _content_hash(self, path: Path) -> str:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._content_hashes.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._content_hashes[path] = (signature, content_hash)
+        return content_hash
+
+
+def _stat_signature(path: Path) -> tuple:
+    """파일 또는 디렉토리(직속 항목 포함)의 (이름, mtime, 크기) 목록"""
+    if not path.exists():
+        return ()
+    if path.is_file():
+        stat = path.stat()
+        return ((path.name, stat.st_mtime_ns, stat.st_size),)
+    stat = path.stat()
+    entries = [(path.name, stat.st_mtime_ns, 0)]
+    for child in sorted(path.iterdir()):
+        if child.is_file():
+            child_stat = child.stat()
+            entries.append((child.name, child_stat.st_mtime_ns, child_stat.st_size))
+    return tuple(entries)
+
+
+class LorebookQueryCache:
+    """
+    Lorebook 검색 결과 캐시 (메모리 LRU + 선택적 디스크 계층)
+
+    Args:
+        retriever_config: 캐시 키에 포함할 retriever 설정 (모델, 컬렉션, 청크 크기 등)
+        maxsize: 메모리 계층 최대 항목 수
+        ttl: 항목 유효 시간(초), None이면 만료 없음
+        disk_path: 디스크 계층 SQLite 파일 경로 (None이면 메모리만 사용)
+        disk_max_entries: 디스크 계층 최대 항목 수
+        fingerprint: lorebook 버전 식별자 (None이면 기본 경로로 생성)
+
+    Example:
+        >>> cache = LorebookQueryCache({"model": "Qwen/Qwen3-Embedding-0.6B"})
+        >>> cache.get("화이트런") is None
+        True
+    """
+
+    def __init__(
+        self,
+        retriever_config: dict[str, Any],
+        maxsize: int = 256,
+        ttl: float | None = 3600.0,
+        disk_path: str | Path | None = None,
+        disk_max_entries: int = 10_000,
+        fingerprint: LorebookFingerprint | None = None,
+    ):
+        self._config_key = json.dumps(retriever_config, sort_keys=True, default=str)
+        self._memory: LRUCache[str, list[Document]] = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._disk = (
+            SQLiteCache(disk_path, max_entries=disk_max_entries, ttl=ttl)
+            if disk_path
+            else None
+        )
+        self._fingerprint = fingerprint or LorebookFingerprint()
+        self._version: str | None = None
+        self._lock = threading.Lock()
+        self._stats = QueryCacheStats()
+
+    def get(self, query: str) -> list[Document] | None:
+        """캐시된 검색 결과 반환 (없으면 None)"""
+        version = self._check_version()
+        key = self._make_key(query)
+
+        docs = self._memory.get(key)
+        if docs is not None:
+            self._count("memory_hits")
+            return list(docs)
+
+        if self._disk is not None:
+            raw = self._disk.get(key, tag=version)
+            if raw is not None:
+                docs = _deserialize_documents(raw)
+                self._memory.set(key, docs)
+                self._count("disk_hits")
+                return list(docs)
+
+        self._count("misses")
+        return None
+
+    def set(self, query: str, docs: list[Document]) -> None:
+        """검색 결과 저장"""
+        version = self._check_version()
+        key = self._make_key(query)
+        self._memory.set(key, list(docs))
+        if self._disk is not None:
+            self._disk.set(key, _serialize_documents(docs), tag=version)
+
+    def clear(self) -> None:
+        """모든 계층 비우기"""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def stats(self) -> QueryCacheStats:
+        """현재 통계의 복사본 반환"""
+        with self._lock:
+            return QueryCacheStats(**vars(self._stats))
+
+    def _make_key(self, query: str) -> str:
+        payload = f"{self._config_key}\0{normalize_query(query)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _check_version(self) -> str:
+        """lorebook/벡터 DB가 바뀌었으면 캐시를 무효화하고 현재 버전 반환"""
+        version = self._fingerprint.current()
+        with self._lock:
+            if self._version == version:
+                return version
+            if self._version is not None:
+                self._stats.invalidations += 1
+            self._version = version
+
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.purge_except(version)
+        return version
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + 1)
+
+
+def _serialize_documents(docs: list[Document]) -> str:
+    """Document 리스트를 JSON 문자열로 직렬화 (pickle 미사용)"""
+    return json.dumps(
+        [{"page_content": d.page_content, "metadata": d.metadata} for d in docs],
+        ensure_ascii=False,
+        default=str,
+    )
+
+
+def _deserialize_documents(raw: str) -> list[Document]:
+    """JSON 문자열을 Document 리스트로 역직렬화"""
+    return [
+        Document(page_content=item["page_content"], metadata=item.get("metadata", {}))
+        for item in json.loads(raw)
+    ]
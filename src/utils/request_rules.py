@@ -0,0 +1,238 @@
+"""
+규칙 기반 요청 분석 모듈
+
+사용자 입력에 직접 적힌 장르/스타일/분량 키워드로 RefinedRequest를 채우고 신뢰도를 계산합니다.
+신뢰도가 충분히 높으면 UserRequestParser가 LLM 호출을 생략합니다.
+
+신뢰도는 필드별 점수의 가중 평균입니다.
+    - 장르 (가중치 0.5): 명시 1.0, 세계관 용어로 추정 0.8, 여러 장르가 섞임 0.3, 없음 0.0
+    - 스타일/분량 (가중치 각 0.25): 명시 1.0, 여러 값이 섞임 0.3,
+      없음 0.6 (LLM도 같은 기본값을 쓰므로 크게 깎지 않음)
+부정 표현("짧지 않게", "소설 말고")이 있거나 입력이 길면 요약이 필요하므로 신뢰도를 낮춥니다.
+
+키워드는 어절 단위로 찾습니다. 키워드가 어절의 처음에 있고, 뒤에 조사/어미(ENDINGS)나
+다른 키워드("판타지소설", "SF동화")만 붙어야 합니다. 따라서 "길고양이"의 "길고", "시간"의 "시"처럼
+다른 단어의 일부인 키워드는 찾지 않습니다.
+
+Example:
+    >>> result = extract_request("판타지 소설을 짧게 써줘")
+    >>> result.request.genre, result.request.style, result.request.length
+    ('판타지', '소설', 'Short')
+    >>> result.confidence
+    1.0
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from src.schemas.state import RefinedRequest
+
+DEFAULT_GENRE = "판타지"
+DEFAULT_STYLE = "소설"
+DEFAULT_LENGTH = "Medium"
+MAX_FAST_PATH_CHARS = 200  # 이보다 긴 입력은 LLM 요약을 사용
+
+GENRE_WEIGHT = 0.5
+STYLE_WEIGHT = 0.25
+LENGTH_WEIGHT = 0.25
+MISSING_FIELD_SCORE = 0.6
+INFERRED_GENRE_SCORE = 0.8
+AMBIGUOUS_SCORE = 0.3
+
+# 값 → 키워드 (소문자, 여러 어절이면 공백 하나로 구분)
+GENRE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "판타지": ("판타지", "fantasy"),
+    "SF": ("sf", "공상과학", "사이언스 픽션", "우주선"),
+    "로맨스": ("로맨스", "연애", "사랑 이야기"),
+    "미스터리": ("미스터리", "추리", "탐정"),
+    "호러": ("호러", "공포", "괴담"),
+    "스릴러": ("스릴러",),
+    "무협": ("무협",),
+    "코미디": ("코미디", "코믹", "유머"),
+}
+# 장르가 없을 때 판타지로 추정할 세계관 용어 (Lorebook 세계관)
+FANTASY_WORLD_TERMS = (
+    "스카이림",
+    "탐리엘",
+    "드래곤",
+    "용사",
+    "마법",
+    "엘프",
+    "드워프",
+    "던전",
+    "기사단",
+)
+STYLE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "소설": ("소설",),
+    "대본": ("대본", "시나리오", "각본"),
+    "시": ("시", "운문"),
+    "동화": ("동화",),
+    "뉴스 기사": ("뉴스", "신문 기사"),
+    "일기": ("일기",),
+    "편지": ("편지",),
+}
+LENGTH_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Short": ("짧게", "짧은", "짤막", "간단히", "간단하게", "단편"),
+    "Medium": ("적당한 길이", "적당히", "중간 길이", "보통 길이"),
+    "Long": ("길게", "긴", "길고", "장편", "자세하게", "자세히"),
+}
+ALL_KEYWORDS = sorted(
+    {
+        keyword
+        for lexicon in (GENRE_KEYWORDS, STYLE_KEYWORDS, LENGTH_KEYWORDS)
+        for patterns in lexicon.values()
+        for keyword in patterns
+    },
+    key=len,
+    reverse=True,
+)
+# 키워드 뒤에 붙을 수 있는 조사와 파생 접미사 ("동화풍으로" = 동화 + 풍 + 으로)
+PARTICLES = (
+    "이", "가", "을", "를", "은", "는", "의", "에", "에서", "에게", "로", "으로",
+    "와", "과", "도", "만", "나", "이나", "랑", "이랑", "처럼", "같이", "같은", "요",
+)
+DERIVATIONS = ("풍", "물", "체", "한", "하게", "하고", "스러운", "스럽게")
+ENDINGS = frozenset(
+    (*PARTICLES, *DERIVATIONS, *(d + p for d in DERIVATIONS for p in PARTICLES))
+)
+WORD_PATTERN = re.compile(r"[0-9a-z가-힣]+(?: [0-9a-z가-힣]+)*")
+NEGATION_PATTERN = re.compile(r"지\s*않|지\s*말|말고|제외|빼고")
+
+
+@dataclass
+class RuleExtraction:
+    """
+    규칙 기반 분석 결과
+
+    Attributes:
+        request: 규칙으로 채운 요청 (찾지 못한 필드는 기본값)
+        confidence: 신뢰도 (0.0 ~ 1.0)
+        matched: 필드 → 입력에서 찾은 값 목록
+    """
+
+    request: RefinedRequest
+    confidence: float
+    matched: dict[str, list[str]] = field(default_factory=dict)
+
+
+@dataclass
+class FastPathStats:
+    """규칙 기반 분석(fast path)과 LLM 분석의 횟수/소요 시간 통계"""
+
+    fast_path: int = 0
+    llm: int = 0
+    fast_path_seconds: float = 0.0
+    llm_seconds: float = 0.0
+
+    @property
+    def fast_path_rate(self) -> float:
+        """LLM 없이 처리한 요청 비율 (0.0 ~ 1.0)"""
+        total = self.fast_path + self.llm
+        return self.fast_path / total if total else 0.0
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """fast path 요청이 평균 LLM 분석 시간만큼 걸렸다고 가정한 절약 시간(초)"""
+        if not self.llm or not self.fast_path:
+            return 0.0
+        saved = self.fast_path * (self.llm_seconds / self.llm) - self.fast_path_seconds
+        return max(saved, 0.0)
+
+
+def _parse_compound(word: str, start: int) -> list[str] | None:
+    """
+    word[start:]를 키워드 하나 이상과 조사/어미로 나눈 키워드 목록
+
+    나눌 수 없으면 None을 반환합니다. 여러 어절 키워드를 위해 word에는 공백이 있을 수 있으며,
+    키워드 뒤에 공백이 오면 그 어절은 키워드에서 끝난 것으로 봅니다.
+    """
+    for keyword in ALL_KEYWORDS:
+        if not word.startswith(keyword, start):
+            continue
+        end = start + len(keyword)
+        rest = word[end:].split(" ", 1)[0]
+        if not rest or rest in ENDINGS:
+            return [keyword]
+        tail = _parse_compound(word, end)
+        if tail is not None:
+            return [keyword, *tail]
+    return None
+
+
+def _matched_keywords(text: str) -> set[str]:
+    """입력에서 어절 경계에 맞게 등장한 키워드 (소문자 입력 기준)"""
+    found: set[str] = set()
+    for match in WORD_PATTERN.finditer(text):
+        phrase = match.group()
+        # 어절마다 그 어절에서 시작하는 키워드 확인 (여러 어절 키워드 포함)
+        starts = [0] + [i + 1 for i, ch in enumerate(phrase) if ch == " "]
+        for start in starts:
+            keywords = _parse_compound(phrase, start)
+            if keywords is not None:
+                found.update(keywords)
+    return found
+
+
+def _find(found: set[str], lexicon: dict[str, tuple[str, ...]]) -> list[str]:
+    """찾은 키워드에 해당하는 값 목록 (lexicon 순서)"""
+    return [
+        value
+        for value, patterns in lexicon.items()
+        if any(keyword in found for keyword in patterns)
+    ]
+
+
+def _starts_word(text: str, term: str) -> bool:
+    """term이 어떤 어절의 처음에 등장하는지 여부 (뒤에 붙는 말은 제한하지 않음)"""
+    return re.search(rf"(?<![0-9a-z가-힣]){re.escape(term)}", text) is not None
+
+
+def _field_score(found: list[str], default: str) -> tuple[str, float]:
+    """찾은 값 목록으로 (값, 점수) 결정"""
+    if not found:
+        return default, MISSING_FIELD_SCORE
+    if len(found) > 1:
+        return found[0], AMBIGUOUS_SCORE
+    return found[0], 1.0
+
+
+def extract_request(user_input: str) -> RuleExtraction:
+    """
+    키워드 규칙으로 RefinedRequest를 채우고 신뢰도 계산
+
+    summarized_prompt는 입력의 공백만 정리하여 그대로 사용합니다.
+    """
+    summary = " ".join(user_input.split())
+    text = summary.casefold()
+
+    found = _matched_keywords(text)
+    genres = _find(found, GENRE_KEYWORDS)
+    styles = _find(found, STYLE_KEYWORDS)
+    lengths = _find(found, LENGTH_KEYWORDS)
+
+    if genres:
+        genre, genre_score = _field_score(genres, DEFAULT_GENRE)
+    elif any(_starts_word(text, term) for term in FANTASY_WORLD_TERMS):
+        genre, genre_score = DEFAULT_GENRE, INFERRED_GENRE_SCORE
+    else:
+        genre, genre_score = DEFAULT_GENRE, 0.0
+    style, style_score = _field_score(styles, DEFAULT_STYLE)
+    length, length_score = _field_score(lengths, DEFAULT_LENGTH)
+
+    confidence = (
+        GENRE_WEIGHT * genre_score
+        + STYLE_WEIGHT * style_score
+        + LENGTH_WEIGHT * length_score
+    )
+    if NEGATION_PATTERN.search(text):
+        confidence *= 0.5
+    if not summary or len(summary) > MAX_FAST_PATH_CHARS:
+        confidence = 0.0
+
+    return RuleExtraction(
+        request=RefinedRequest(
+            summarized_prompt=summary, genre=genre, style=style, length=length
+        ),
+        confidence=round(confidence, 4),
+        matched={"genre": genres, "style": styles, "length": lengths},
+    )
@@ -0,0 +1,198 @@
+"""
+재작성 루프 종료 정책 모듈
+
+Director가 스토리를 승인하지 않았을 때 다시 작성할지를 점수 히스토리로 판단합니다.
+    - RetryPolicy: 승인되거나 max_retries에 도달할 때까지 재작성 (점수를 보지 않는 기본 정책)
+    - ConvergencePolicy: 점수가 충분히 높거나(good_enough) 더 이상 오르지 않으면(plateau) 조기 종료
+
+skip_final_review가 켜진 정책은 마지막 작성본의 검수를 생략합니다.
+마지막 검수는 결과와 관계없이 재작성을 일으킬 수 없기 때문입니다.
+생략은 그래프의 skip_review 단계에서 처리되며, 최종 상태의 eval_report는 None이 됩니다.
+정책별 효과(절약한 작성/검수 횟수와 점수 변화)는 get_retry_stats()로 확인합니다.
+
+Example:
+    >>> policy = ConvergencePolicy(good_enough=8.0, min_improvement=0.5)
+    >>> policy.stop_reason([6.0, 6.2])
+    '점수 정체 (최근 1회 개선 +0.2 < 0.5)'
+"""
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    기본 재작성 정책: 승인되거나 max_retries에 도달할 때까지 재작성
+
+    Attributes:
+        skip_final_review: True이면 재작성을 일으킬 수 없는 마지막 작성본의 검수를 생략
+    """
+
+    skip_final_review: bool = False
+
+    def stop_reason(self, scores: list[float]) -> str | None:
+        """
+        조기 종료 사유 (계속 재작성하면 None)
+
+        Args:
+            scores: 지금까지 검수한 작성본의 점수 (오래된 순)
+        """
+        return None
+
+
+@dataclass(frozen=True)
+class ConvergencePolicy(RetryPolicy):
+    """
+    점수 수렴을 보고 조기 종료하는 재작성 정책
+
+    Attributes:
+        good_enough: 이 점수 이상이면 승인되지 않아도 종료 (None이면 사용하지 않음)
+        min_improvement: 최근 patience회 동안 최고 점수가 이만큼 오르지 않으면 종료
+        patience: 정체를 판단할 최근 검수 횟수
+        skip_final_review: 마지막 작성본의 검수 생략 여부 (기본 True)
+    """
+
+    good_enough: float | None = 8.0
+    min_improvement: float = 0.5
+    patience: int = 1
+    skip_final_review: bool = True
+
+    def __post_init__(self):
+        if self.patience < 1:
+            raise ValueError(f"patience는 1 이상이어야 합니다: {self.patience}")
+
+    def stop_reason(self, scores: list[float]) -> str | None:
+        if not scores:
+            return None
+        if self.good_enough is not None and scores[-1] >= self.good_enough:
+            return f"충분한 점수 ({scores[-1]:.1f} ≥ {self.good_enough:.1f})"
+        if len(scores) <= self.patience:
+            return None
+        improvement = max(scores[-self.patience :]) - max(scores[: -self.patience])
+        if improvement < self.min_improvement:
+            return (
+                f"점수 정체 (최근 {self.patience}회 개선 "
+                f"{improvement:+.1f} < {self.min_improvement:.1f})"
+            )
+        return None
+
+
+@dataclass
+class RetryStats:
+    """
+    재작성 정책 효과 통계
+
+    Attributes:
+        runs: 완료된 실행 수
+        writes: 실제 작성 횟수 합
+        loops_saved: 조기 종료로 생략한 작성 횟수 합 (max_retries 기준)
+        early_stops: 조기 종료된 실행 수
+        reviews_skipped: 마지막 작성본 검수를 생략한 횟수
+        score_gain: 실행별 (마지막 점수 - 첫 점수)의 합 (검수가 2회 이상인 실행만)
+        scored_runs: score_gain에 포함된 실행 수
+        early_stop_last_gain: 조기 종료 직전 재작성 1회의 점수 변화 합
+    """
+
+    runs: int = 0
+    writes: int = 0
+    loops_saved: int = 0
+    early_stops: int = 0
+    reviews_skipped: int = 0
+    score_gain: float = 0.0
+    scored_runs: int = 0
+    early_stop_last_gain: float = 0.0
+
+    @property
+    def mean_score_gain(self) -> float:
+        """재작성으로 오른 평균 점수"""
+        return self.score_gain / self.scored_runs if self.scored_runs else 0.0
+
+    @property
+    def mean_last_gain(self) -> float:
+        """조기 종료 직전 재작성 1회의 평균 점수 변화 (작을수록 생략한 루프의 기대 이득이 작음)"""
+        return self.early_stop_last_gain / self.early_stops if self.early_stops else 0.0
+
+    def summary(self) -> str:
+        """정책 효과 요약"""
+        return (
+            f"실행 {self.runs}회, 작성 {self.writes}회, "
+            f"절약 {self.loops_saved}회 (조기 종료 {self.early_stops}회), "
+            f"검수 생략 {self.reviews_skipped}회, "
+            f"평균 점수 변화 {self.mean_score_gain:+.2f}, "
+            f"조기 종료 직전 변화 {self.mean_last_gain:+.2f}"
+        )
+
+
+_retry_policy = RetryPolicy()
+_retry_stats = RetryStats()
+_retry_stats_lock = threading.Lock()
+
+
+def configure_retry_policy(policy: RetryPolicy | None = None) -> RetryPolicy:
+    """
+    모든 Director가 공유할 재작성 정책을 설정합니다.
+
+    Args:
+        policy: 사용할 정책 (None이면 기본 RetryPolicy)
+
+    Returns:
+        RetryPolicy: 새로 설정된 정책
+    """
+    global _retry_policy
+    _retry_policy = policy if policy is not None else RetryPolicy()
+    return _retry_policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    """공유 재작성 정책 반환"""
+    return _retry_policy
+
+
+def record_run(
+    scores: list[float],
+    writes: int,
+    max_writes: int,
+    early_stop: bool = False,
+    review_skipped: bool = False,
+) -> RetryStats:
+    """
+    완료된 실행 기록
+
+    Args:
+        scores: 검수한 작성본의 점수 (오래된 순)
+        writes: 실제 작성 횟수
+        max_writes: 정책 없이 가능했던 최대 작성 횟수 (max_retries)
+        early_stop: 정책에 따라 조기 종료했는지 여부
+        review_skipped: 마지막 작성본 검수를 생략했는지 여부
+
+    Returns:
+        RetryStats: 기록 후 통계의 복사본
+    """
+    with _retry_stats_lock:
+        _retry_stats.runs += 1
+        _retry_stats.writes += writes
+        if review_skipped:
+            _retry_stats.reviews_skipped += 1
+        if early_stop:
+            _retry_stats.early_stops += 1
+            _retry_stats.loops_saved += max(max_writes - writes, 0)
+            if len(scores) >= 2:
+                _retry_stats.early_stop_last_gain += scores[-1] - scores[-2]
+        if len(scores) >= 2:
+            _retry_stats.scored_runs += 1
+            _retry_stats.score_gain += scores[-1] - scores[0]
+        return RetryStats(**vars(_retry_stats))
+
+
+def get_retry_stats() -> RetryStats:
+    """재작성 정책 통계의 복사본 반환"""
+    with _retry_stats_lock:
+        return RetryStats(**vars(_retry_stats))
+
+
+def reset_retry_stats() -> None:
+    """재작성 정책 통계 초기화"""
+    global _retry_stats
+    with _retry_stats_lock:
+        _retry_stats = RetryStats()
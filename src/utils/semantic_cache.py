@@ -0,0 +1,150 @@
+"""
+의미 기반(semantic) 캐시 모듈
+
+입력 텍스트의 임베딩이 이전 입력과 충분히 가까우면 이전 결과를 재사용합니다.
+정규화한 텍스트가 완전히 같으면 임베딩 없이 바로 적중하며,
+벡터 인덱스는 maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+
+Example:
+    >>> cache = SemanticCache(threshold=0.9, maxsize=2)
+    >>> cache.add("용사 이야기", "결과", embedding=[1.0, 0.0])
+    >>> cache.get("용사의 이야기", embedding=[0.99, 0.1])
+    ('결과', 0.99...)
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from src.utils.lorebook_cache import normalize_query
+
+V = TypeVar("V")
+
+
+@dataclass
+class SemanticCacheStats:
+    """의미 기반 캐시 통계"""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """전체 적중 수 (완전 일치 + 유사도)"""
+        return self.exact_hits + self.semantic_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    vector: tuple[float, ...] | None  # 단위 벡터 (임베딩이 없으면 완전 일치로만 조회)
+
+
+class SemanticCache(Generic[V]):
+    """
+    스레드 안전한 의미 기반 LRU 캐시
+
+    Args:
+        threshold: 적중으로 볼 최소 코사인 유사도 (0.0 ~ 1.0)
+        maxsize: 최대 항목 수
+    """
+
+    def __init__(self, threshold: float = 0.95, maxsize: int = 256):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold는 0보다 크고 1 이하여야 합니다: {threshold}")
+        if maxsize <= 0:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _Entry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = SemanticCacheStats()
+
+    def get_exact(self, text: str) -> V | None:
+        """정규화한 텍스트가 같은 항목 반환 (임베딩 불필요, 없으면 None)"""
+        key = normalize_query(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._stats.exact_hits += 1
+            return entry.value
+
+    def get(
+        self, text: str, embedding: Sequence[float] | None = None
+    ) -> tuple[V, float] | None:
+        """
+        완전 일치 또는 가장 가까운 항목 조회
+
+        Args:
+            text: 입력 텍스트
+            embedding: 입력 임베딩 (None이면 완전 일치만 확인)
+
+        Returns:
+            (값, 유사도) - 완전 일치는 유사도 1.0, threshold 미만이면 None
+        """
+        value = self.get_exact(text)
+        if value is not None:
+            return value, 1.0
+
+        query = _unit(embedding) if embedding is not None else None
+        with self._lock:
+            best_key, best_score = None, self.threshold
+            if query is not None:
+                for key, entry in self._entries.items():
+                    if entry.vector is None or len(entry.vector) != len(query):
+                        continue
+                    score = sum(a * b for a, b in zip(query, entry.vector))
+                    if score >= best_score:
+                        best_key, best_score = key, score
+            if best_key is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(best_key)
+            self._stats.semantic_hits += 1
+            return self._entries[best_key].value, best_score
+
+    def add(self, text: str, value: V, embedding: Sequence[float] | None = None) -> None:
+        """항목 저장 (용량 초과 시 LRU 항목 제거)"""
+        key = normalize_query(text)
+        vector = _unit(embedding) if embedding is not None else None
+        with self._lock:
+            self._entries[key] = _Entry(value=value, vector=vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> SemanticCacheStats:
+        """현재 통계의 복사본 반환"""
+        with self._lock:
+            return SemanticCacheStats(**vars(self._stats))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _unit(vector: Sequence[float]) -> tuple[float, ...] | None:
+    """단위 벡터로 정규화 (영벡터면 None)"""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return None
+    return tuple(x / norm for x in vector)
@@ -1,68 +1,353 @@
-# from langchain.retrievers import ParentDocumentRetriever
-# from langchain.storage import InMemoryStore
-import pickle
+"""
+Lorebook 적재(ingestion) 모듈
+
+lorebook 문서를 부모 청크(2000자)와 자식 청크(400자)로 나누어
+자식 청크는 벡터 DB(Chroma)에, 부모 청크는 docstore에 저장합니다.
+
+부모 청크마다 내용 해시 기반의 고정 ID를 부여하므로, 다시 실행하면
+바뀐 청크만 임베딩하고 사라진 청크는 두 저장소에서 모두 삭제합니다.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
 
-from langchain_chroma import Chroma
-from langchain_classic.retrievers import ParentDocumentRetriever
-from langchain_classic.storage import EncoderBackedStore, LocalFileStore
 from langchain_core.documents import Document
-from langchain_huggingface import HuggingFaceEmbeddings
+from langchain_core.stores import BaseStore
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from src.agents.tools.search_lorebook import (
+    CHILD_CHUNK_SIZE,
+    COLLECTION_NAME,
+    EMBEDDING_MODEL,
+    GAZETTEER_PATH,
+    LEXICAL_INDEX_PATH,
+    PARENT_CHUNK_SIZE,
+    PERSIST_DIRECTORY,
+    open_docstore,
+)
+from src.utils.gazetteer import build_gazetteer
+from src.utils.lexical_index import build_lexical_index
+from src.utils.vectorstore_adapter import native_collection, upsert_embeddings
 
-def main():
-    with open("lorebooks/ElderScrolls_Skyrim.md", "r", encoding="utf-8") as f:
-        long_text = f.read()
-
-    parent_splitter = RecursiveCharacterTextSplitter(chunk_size=2000)
-    child_splitter = RecursiveCharacterTextSplitter(chunk_size=400)
-    embedding_function = HuggingFaceEmbeddings(model_name="Qwen/Qwen3-Embedding-0.6B")
-
-    # # Vectorstore: 자식 청크를 검색하기 위한 벡터 DB (여기선 Chroma 사용)
-    vectorstore = Chroma(
-        collection_name="split_parents",
-        embedding_function=embedding_function,  # API Key 필요
-        persist_directory="./chroma_db",
-    )
-    fs = LocalFileStore("./parent_docs_store")
+ID_KEY = "doc_id"  # 자식 청크 메타데이터의 부모 ID 키 (ParentDocumentRetriever 기본값)
+SOURCE_KEY = "source"  # 부모 청크 메타데이터의 원본 lorebook 이름
+CHILD_COUNT_KEY = "child_count"  # 부모 청크 메타데이터의 자식 청크 수
 
-    def pickle_dumps(obj: object) -> bytes:
-        return pickle.dumps(obj)
 
-    def pickle_loads(data: bytes) -> object:
-        return pickle.loads(data)
+@dataclass
+class IngestionReport:
+    """lorebook 한 개의 적재 결과"""
 
-    store = EncoderBackedStore(
-        store=fs,
-        key_encoder=lambda x: x,
-        value_serializer=pickle_dumps,
-        value_deserializer=pickle_loads,
-    )
+    source: str
+    added: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    child_chunks: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}: 추가 {self.added}, 유지 {self.unchanged}, "
+            f"삭제 {self.deleted} (자식 청크 {self.child_chunks}개 임베딩)"
+        )
+
+
+def parent_id(source: str, content: str) -> str:
+    """부모 청크의 고정 ID (원본 이름 + 내용 해시)"""
+    digest = hashlib.sha256(f"{source}\0{content}".encode("utf-8")).hexdigest()
+    return digest[:32]
+
+
+def split_into_parents(
+    text: str,
+    source: str,
+    chunk_size: int = PARENT_CHUNK_SIZE,
+) -> list[Document]:
+    """
+    lorebook 원문을 부모 청크로 나누고 내용 해시 ID를 부여합니다.
+
+    Args:
+        text: lorebook 원문
+        source: 원본 lorebook 이름 (예: "ElderScrolls_Skyrim.md")
+        chunk_size: 부모 청크 크기
+
+    Returns:
+        ID(doc.id)와 source 메타데이터가 설정된 부모 청크 리스트
+    """
+    splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size)
+    parents = []
+    for chunk in splitter.split_text(text):
+        parents.append(
+            Document(
+                id=parent_id(source, chunk),
+                page_content=chunk,
+                metadata={SOURCE_KEY: source},
+            )
+        )
+    return parents
+
+
+@dataclass
+class SplitLorebook:
+    """분할된 lorebook 한 개 (프로세스 간 전달 가능)"""
+
+    source: str
+    parents: list[Document]
+    children: list[Document]
+
+
+@dataclass
+class IngestionPlan:
+    """lorebook 한 개의 증분 적재 계획"""
+
+    source: str
+    parents: list[Document] = field(default_factory=list)
+    children: list[Document] = field(default_factory=list)
+    delete_ids: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    def report(self) -> IngestionReport:
+        return IngestionReport(
+            source=self.source,
+            added=len(self.parents),
+            unchanged=self.unchanged,
+            deleted=len(self.delete_ids),
+            child_chunks=len(self.children),
+        )
+
+
+def split_lorebook(
+    path: str | Path,
+    parent_chunk_size: int = PARENT_CHUNK_SIZE,
+    child_chunk_size: int = CHILD_CHUNK_SIZE,
+) -> SplitLorebook:
+    """
+    lorebook 파일을 부모/자식 청크로 나눕니다.
+
+    자식 청크 ID는 "{부모 ID}-{순번}"으로 고정되며, 부모 메타데이터에 자식 수를 기록해
+    나중에 벡터 DB에서 정확히 삭제할 수 있게 합니다.
+    저장소에 접근하지 않으므로 프로세스 풀에서 병렬로 실행할 수 있습니다.
+    """
+    path = Path(path)
+    source = path.name
+    text = path.read_text(encoding="utf-8")
+
+    parents = split_into_parents(text, source, chunk_size=parent_chunk_size)
+    # 같은 내용의 청크가 여러 번 나오면 하나만 저장
+    parents = list({parent.id: parent for parent in parents}.values())
+
+    child_splitter = RecursiveCharacterTextSplitter(chunk_size=child_chunk_size)
+    children: list[Document] = []
+    for parent in parents:
+        parent_children = child_splitter.split_documents([parent])
+        for index, child in enumerate(parent_children):
+            child.id = f"{parent.id}-{index}"
+            child.metadata[ID_KEY] = parent.id
+            children.append(child)
+        parent.metadata[CHILD_COUNT_KEY] = len(parent_children)
+
+    return SplitLorebook(source=source, parents=parents, children=children)
+
+
+def stored_parent_ids(docstore: BaseStore[str, Document]) -> dict[str | None, set[str]]:
+    """
+    docstore에 저장된 부모 청크 ID를 lorebook 이름별로 묶어 반환
+
+    source 메타데이터가 없는 청크(내용 해시 ID 도입 이전에 적재된 청크)는 None 키에 모입니다.
+    """
+    keys = list(docstore.yield_keys())
+    by_source: dict[str | None, set[str]] = {}
+    for key, doc in zip(keys, docstore.mget(keys)):
+        if doc is not None:
+            by_source.setdefault(doc.metadata.get(SOURCE_KEY), set()).add(key)
+    return by_source
 
-    # # 3. ParentDocumentRetriever 초기화
-    retriever = ParentDocumentRetriever(
-        vectorstore=vectorstore,
-        docstore=store,
-        child_splitter=child_splitter,
-        parent_splitter=parent_splitter,
+
+def plan_ingestion(
+    splits: list[SplitLorebook],
+    docstore: BaseStore[str, Document],
+) -> list[IngestionPlan]:
+    """
+    분할된 lorebook과 docstore를 비교해 추가/삭제할 청크를 계산합니다.
+
+    바뀌지 않은 부모 청크는 건너뛰고, 사라진 부모 청크는 삭제 대상이 됩니다.
+    source 메타데이터가 없는 이전 청크는 첫 번째 계획에서 한 번만 삭제합니다.
+    """
+    by_source = stored_parent_ids(docstore)
+    legacy_ids = by_source.pop(None, set())
+
+    plans = []
+    for split in splits:
+        stored_ids = by_source.get(split.source, set()) | legacy_ids
+        legacy_ids = set()
+        current_ids = {parent.id for parent in split.parents}
+
+        plans.append(
+            IngestionPlan(
+                source=split.source,
+                parents=[p for p in split.parents if p.id not in stored_ids],
+                children=[c for c in split.children if c.metadata[ID_KEY] not in stored_ids],
+                delete_ids=sorted(stored_ids - current_ids),
+                unchanged=len(current_ids & stored_ids),
+            )
+        )
+    return plans
+
+
+def write_children(
+    vectorstore: Any,
+    children: list[Document],
+    batch_size: int = 64,
+    on_batch: Callable[[int, float], None] | None = None,
+) -> None:
+    """
+    자식 청크를 batch_size개씩 임베딩하여 벡터 DB에 저장합니다.
+
+    Chroma는 임베딩을 직접 계산한 뒤 컬렉션에 한 번에 upsert하고,
+    그 밖의 벡터 DB는 add_documents로 저장합니다.
+
+    Args:
+        vectorstore: 자식 청크를 저장할 벡터 DB
+        children: ID가 설정된 자식 청크
+        batch_size: 한 번에 임베딩할 청크 수
+        on_batch: 배치마다 (청크 수, 임베딩 소요 초)로 호출되는 콜백
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+
+    native = native_collection(vectorstore) is not None
+    for start in range(0, len(children), batch_size):
+        batch = children[start : start + batch_size]
+        ids = [child.id for child in batch]
+        texts = [child.page_content for child in batch]
+
+        started = time.perf_counter()
+        if not native:
+            vectorstore.add_documents(
+                [Document(page_content=c.page_content, metadata=c.metadata) for c in batch],
+                ids=ids,
+            )
+            elapsed = time.perf_counter() - started
+        else:
+            vectors = vectorstore.embeddings.embed_documents(texts)
+            elapsed = time.perf_counter() - started
+            upsert_embeddings(
+                vectorstore, ids, texts, [child.metadata for child in batch], vectors
+            )
+
+        if on_batch is not None:
+            on_batch(len(batch), elapsed)
+
+
+def delete_parents(
+    vectorstore: Any,
+    docstore: BaseStore[str, Document],
+    ids: list[str],
+) -> None:
+    """부모 청크와 그 자식 청크를 두 저장소에서 삭제합니다."""
+    if not ids:
+        return
+
+    child_ids: list[str] = []
+    legacy_ids: list[str] = []
+    for pid, doc in zip(ids, docstore.mget(ids)):
+        if doc is not None and CHILD_COUNT_KEY in doc.metadata:
+            child_ids.extend(f"{pid}-{i}" for i in range(doc.metadata[CHILD_COUNT_KEY]))
+        else:
+            legacy_ids.append(pid)
+
+    # 자식 수가 기록되지 않은 이전 청크는 메타데이터로 자식 청크를 찾음 (Chroma)
+    if legacy_ids and hasattr(vectorstore, "get"):
+        found = vectorstore.get(where={ID_KEY: {"$in": legacy_ids}})
+        child_ids.extend(found.get("ids", []))
+
+    if child_ids:
+        vectorstore.delete(ids=child_ids)
+    docstore.mdelete(ids)
+
+
+def apply_plans(
+    plans: list[IngestionPlan],
+    vectorstore: Any,
+    docstore: BaseStore[str, Document],
+    batch_size: int = 64,
+    on_batch: Callable[[int, float], None] | None = None,
+) -> None:
+    """
+    적재 계획을 저장소에 반영합니다.
+
+    삭제를 먼저 처리한 뒤, 모든 lorebook의 새 자식 청크를 모아 배치 임베딩하고
+    부모 청크는 docstore에 한 번에 저장합니다.
+    """
+    for plan in plans:
+        delete_parents(vectorstore, docstore, plan.delete_ids)
+
+    children = [child for plan in plans for child in plan.children]
+    write_children(vectorstore, children, batch_size=batch_size, on_batch=on_batch)
+    docstore.mset([(parent.id, parent) for plan in plans for parent in plan.parents])
+
+
+def ingest_lorebook(
+    path: str | Path,
+    vectorstore: Any,
+    docstore: BaseStore[str, Document],
+    parent_chunk_size: int = PARENT_CHUNK_SIZE,
+    child_chunk_size: int = CHILD_CHUNK_SIZE,
+    batch_size: int = 64,
+) -> IngestionReport:
+    """
+    lorebook 파일 하나를 증분 적재합니다.
+
+    바뀌지 않은 부모 청크는 건너뛰고, 새로 생기거나 바뀐 청크만 임베딩하며,
+    사라진 청크는 벡터 DB와 docstore에서 삭제합니다.
+
+    Args:
+        path: lorebook 파일 경로
+        vectorstore: 자식 청크를 저장할 벡터 DB
+        docstore: 부모 청크를 저장할 docstore
+        parent_chunk_size: 부모 청크 크기
+        child_chunk_size: 자식 청크 크기
+        batch_size: 한 번에 임베딩할 자식 청크 수
+
+    Returns:
+        IngestionReport: 추가/유지/삭제된 부모 청크 수
+    """
+    split = split_lorebook(path, parent_chunk_size, child_chunk_size)
+    plans = plan_ingestion([split], docstore)
+    apply_plans(plans, vectorstore, docstore, batch_size=batch_size)
+    return plans[0].report()
+
+
+def create_vectorstore(
+    model: str = EMBEDDING_MODEL,
+    collection_name: str = COLLECTION_NAME,
+    persist_directory: str = PERSIST_DIRECTORY,
+):
+    """적재용 Chroma 벡터 DB 생성"""
+    from langchain_chroma import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    embedding_function = HuggingFaceEmbeddings(model_name=model)
+    return Chroma(
+        collection_name=collection_name,
+        embedding_function=embedding_function,
+        persist_directory=persist_directory,
     )
 
-    # # --- 테스트 데이터 추가 ---
-    docs = [Document(page_content=long_text)]
 
-    # 4. 문서 주입 (add_documents)
-    # 이 과정에서 자동으로 Parent로 자르고 -> 다시 Child로 잘라서 -> 각각 저장소에 넣습니다.
-    retriever.add_documents(docs, ids=None)
+def main():
+    vectorstore = create_vectorstore()
+    # 부모 문서 저장소: SQLite 단일 파일 (JSON 직렬화)
+    docstore = open_docstore()
 
-    # # 5. 검색 실행
-    # # 검색은 '드래곤' 키워드로 자식 청크를 찾지만, 결과는 그 자식이 포함된 '부모 청크' 전체가 나옵니다.
-    # result_docs = retriever.invoke("탐리엘")
+    report = ingest_lorebook("lorebooks/ElderScrolls_Skyrim.md", vectorstore, docstore)
+    print(f"📚 {report}")
 
-    # print(f"검색된 문서 개수: {len(result_docs)}")
-    # print(
-    #     f"내용 길이: {len(result_docs[0].page_content)}"
-    # )  # 400자가 아니라 2000자 단위의 긴 글이 나옴
-    # print(result_docs[0].page_content)
+    # 벡터 DB 옆에 어휘 검색용 BM25 인덱스와 개체명 사전 저장
+    build_lexical_index(docstore).save(LEXICAL_INDEX_PATH)
+    build_gazetteer(docstore).save(GAZETTEER_PATH)
 
 
 if __name__ == "__main__":
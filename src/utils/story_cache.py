@@ -0,0 +1,186 @@
+"""
+스토리 생성 결과 캐시 모듈
+
+같은 요청(사용자 입력, 모델, LLM 옵션, 시스템 프롬프트, 최대 재시도 횟수, 재작성 정책)의
+최종 GraphState와 노드별 상태 업데이트를 SQLite 파일에 저장하여,
+같은 요청이 다시 들어오면 그래프를 실행하지 않고 결과를 돌려줍니다.
+lorebook 원문이나 벡터 DB가 바뀌면 이전 결과는 자동으로 무효화됩니다.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.schemas.state import GraphState
+from src.utils.cache import CacheStats, SQLiteCache
+from src.utils.lorebook_cache import LorebookFingerprint
+
+DEFAULT_STORY_CACHE_PATH = ".cache/stories.sqlite3"
+DEFAULT_MAX_ENTRIES = 200
+
+
+@dataclass
+class CachedStory:
+    """
+    캐시된 스토리 생성 결과
+
+    Attributes:
+        final_state: 그래프 실행이 끝난 최종 상태
+        updates: stream_mode="updates" 이벤트 ({노드 이름: 상태 업데이트}) 순서대로
+    """
+
+    final_state: GraphState
+    updates: list[dict[str, dict[str, Any] | None]]
+
+
+class StoryCache:
+    """
+    스토리 생성 결과 디스크 캐시
+
+    max_entries를 넘으면 가장 오래 조회되지 않은 결과부터 제거합니다.
+
+    Args:
+        path: SQLite 파일 경로
+        max_entries: 최대 저장 결과 수
+        ttl: 결과 유효 시간(초), None이면 만료 없음
+        fingerprint: lorebook 버전 식별자 (None이면 기본 경로로 생성)
+
+    Example:
+        >>> cache = StoryCache(".cache/stories.sqlite3")
+        >>> key = StoryCache.make_key("용사 이야기", "gpt-oss:20b")
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_STORY_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float | None = None,
+        fingerprint: LorebookFingerprint | None = None,
+    ):
+        self._disk = SQLiteCache(path, max_entries=max_entries, ttl=ttl)
+        self._fingerprint = fingerprint or LorebookFingerprint()
+        self._version: str | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        user_input: str,
+        model_name: str,
+        llm_options: dict[str, Any] | None = None,
+        story_writer_system_prompt: str = "",
+        director_system_prompt: str = "",
+        max_retries: int = 3,
+        retry_policy: str = "",
+    ) -> str:
+        """
+        요청과 그래프 구성으로 캐시 키 생성 (lorebook 버전은 저장 시 tag로 구분)
+
+        retry_policy는 재작성 정책의 repr로, 정책이 바뀌면 다른 결과로 취급합니다.
+        """
+        payload = json.dumps(
+            {
+                "user_input": user_input.strip(),
+                "model": model_name,
+                "llm_options": llm_options or {},
+                "story_writer_prompt": story_writer_system_prompt,
+                "director_prompt": director_system_prompt,
+                "max_retries": max_retries,
+                "retry_policy": retry_policy,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedStory | None:
+        """캐시된 결과 반환 (없거나 lorebook이 바뀌었으면 None)"""
+        version = self._check_version()
+        raw = self._disk.get(key, tag=version)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CachedStory(
+            final_state=GraphState.model_validate(data["state"]),
+            updates=[_load_update(update) for update in data["updates"]],
+        )
+
+    def set(
+        self,
+        key: str,
+        final_state: GraphState,
+        updates: list[dict[str, dict[str, Any] | None]],
+    ) -> None:
+        """실행 결과 저장"""
+        version = self._check_version()
+        raw = json.dumps(
+            {
+                "state": final_state.model_dump(mode="json"),
+                "updates": [_dump_update(update) for update in updates],
+            },
+            ensure_ascii=False,
+        )
+        self._disk.set(key, raw, tag=version)
+
+    def delete(self, key: str) -> None:
+        """결과 제거"""
+        self._disk.delete(key)
+
+    def clear(self) -> None:
+        """모든 결과 제거"""
+        self._disk.clear()
+
+    def stats(self) -> CacheStats:
+        """현재 통계의 복사본 반환"""
+        return self._disk.stats()
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        self._disk.close()
+
+    def __len__(self) -> int:
+        return len(self._disk)
+
+    def _check_version(self) -> str:
+        """lorebook/벡터 DB가 바뀌었으면 이전 버전의 결과를 지우고 현재 버전 반환"""
+        version = self._fingerprint.current()
+        with self._lock:
+            if self._version == version:
+                return version
+            self._version = version
+        self._disk.purge_except(version)
+        return version
+
+
+def _dump_update(
+    update: dict[str, dict[str, Any] | None],
+) -> dict[str, dict[str, Any] | None]:
+    """노드별 상태 업데이트를 JSON으로 직렬화 가능한 형태로 변환"""
+    dumped: dict[str, dict[str, Any] | None] = {}
+    for node, output in update.items():
+        if not output:
+            dumped[node] = output
+            continue
+        # 검증 없이 GraphState로 감싸 필드 타입에 맞게 직렬화 (바뀐 필드만)
+        partial = GraphState.model_construct(**output)
+        dumped[node] = partial.model_dump(mode="json", include=set(output))
+    return dumped
+
+
+def _load_update(
+    update: dict[str, dict[str, Any] | None],
+) -> dict[str, dict[str, Any] | None]:
+    """_dump_update의 역변환 (필드 값을 원래 타입으로 복원)"""
+    loaded: dict[str, dict[str, Any] | None] = {}
+    for node, output in update.items():
+        if not output:
+            loaded[node] = output
+            continue
+        state = GraphState.model_validate(output)
+        loaded[node] = {field: getattr(state, field) for field in output}
+    return loaded
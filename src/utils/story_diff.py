@@ -0,0 +1,132 @@
+"""
+스토리 부분 수정(diff) 모듈
+
+재시도 시 StoryWriter가 전체 스토리를 다시 생성하는 대신 문단 단위 수정안만 출력하면,
+이를 이전 버전에 적용하여 새 버전을 만듭니다. 수정안의 문단 번호는 모두
+이전 버전 기준(1부터 시작)이므로 적용 순서와 무관하게 같은 결과가 나옵니다.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+EDIT_OPS = ("replace", "insert_after", "delete")
+
+
+class EditApplyError(ValueError):
+    """수정안을 이전 버전에 적용할 수 없을 때 발생"""
+
+
+@dataclass(frozen=True)
+class ParagraphEdit:
+    """
+    문단 단위 수정 연산
+
+    Attributes:
+        op: "replace" (문단 교체), "insert_after" (문단 뒤에 삽입, 0이면 맨 앞), "delete" (문단 삭제)
+        paragraph: 이전 버전 기준 문단 번호 (1부터 시작)
+        text: 교체/삽입할 본문 (delete는 빈 문자열)
+    """
+
+    op: str
+    paragraph: int
+    text: str = ""
+
+
+def split_paragraphs(story: str) -> list[str]:
+    """빈 줄을 기준으로 문단 분리 (빈 문단 제외)"""
+    return [p.strip() for p in story.replace("\r\n", "\n").split("\n\n") if p.strip()]
+
+
+def join_paragraphs(paragraphs: list[str]) -> str:
+    """문단 리스트를 스토리 본문으로 합침"""
+    return "\n\n".join(paragraphs)
+
+
+def paragraph_hash(paragraph: str) -> str:
+    """공백 차이를 무시한 문단 해시 (검수 결과 캐시 키)"""
+    normalized = " ".join(paragraph.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def number_paragraphs(paragraphs: list[str]) -> str:
+    """프롬프트용 번호 붙인 문단 목록 ([P1] ...)"""
+    return "\n\n".join(f"[P{i}] {p}" for i, p in enumerate(paragraphs, start=1))
+
+
+def parse_edits(raw_edits: Any) -> list[ParagraphEdit]:
+    """
+    LLM 응답의 edits 배열을 ParagraphEdit 리스트로 변환
+
+    Raises:
+        EditApplyError: 형식이 잘못되었을 때
+    """
+    if not isinstance(raw_edits, list):
+        raise EditApplyError(f"edits는 배열이어야 합니다: {type(raw_edits).__name__}")
+
+    edits: list[ParagraphEdit] = []
+    for raw in raw_edits:
+        if not isinstance(raw, dict):
+            raise EditApplyError(f"수정안 항목이 객체가 아닙니다: {raw!r}")
+        op = raw.get("op")
+        if op not in EDIT_OPS:
+            raise EditApplyError(f"알 수 없는 수정 연산: {op!r}")
+        try:
+            paragraph = int(raw.get("paragraph"))
+        except (TypeError, ValueError):
+            raise EditApplyError(f"문단 번호가 올바르지 않습니다: {raw!r}") from None
+        text = str(raw.get("text") or "").strip()
+        if op != "delete" and not text:
+            raise EditApplyError(f"{op} 연산에 text가 없습니다: {raw!r}")
+        edits.append(ParagraphEdit(op=op, paragraph=paragraph, text=text))
+    return edits
+
+
+def apply_edits(paragraphs: list[str], edits: list[ParagraphEdit]) -> list[str]:
+    """
+    이전 버전 문단에 수정안을 적용
+
+    Args:
+        paragraphs: 이전 버전 문단 리스트
+        edits: 이전 버전 문단 번호 기준 수정안
+
+    Returns:
+        수정된 문단 리스트
+
+    Raises:
+        EditApplyError: 문단 번호가 범위를 벗어나거나 같은 문단에 교체/삭제가 겹칠 때
+
+    Example:
+        >>> apply_edits(["a", "b"], [ParagraphEdit("replace", 2, "B")])
+        ['a', 'B']
+    """
+    count = len(paragraphs)
+    replaced: dict[int, str] = {}
+    deleted: set[int] = set()
+    inserted: dict[int, list[str]] = {}
+
+    for edit in edits:
+        low = 0 if edit.op == "insert_after" else 1
+        if not low <= edit.paragraph <= count:
+            raise EditApplyError(
+                f"문단 번호 {edit.paragraph}이(가) 범위({low}~{count})를 벗어났습니다."
+            )
+        if edit.op == "insert_after":
+            inserted.setdefault(edit.paragraph, []).append(edit.text)
+            continue
+        if edit.paragraph in replaced or edit.paragraph in deleted:
+            raise EditApplyError(f"문단 {edit.paragraph}에 수정이 중복되었습니다.")
+        if edit.op == "replace":
+            replaced[edit.paragraph] = edit.text
+        else:
+            deleted.add(edit.paragraph)
+
+    result = list(inserted.get(0, []))
+    for number, paragraph in enumerate(paragraphs, start=1):
+        if number not in deleted:
+            result.append(replaced.get(number, paragraph))
+        result.extend(inserted.get(number, []))
+
+    if not result:
+        raise EditApplyError("수정 결과 스토리가 비어 있습니다.")
+    return result
@@ -0,0 +1,87 @@
+"""
+벡터 DB 배치 접근 어댑터
+
+langchain의 Chroma 래퍼는 여러 쿼리 벡터를 한 번에 검색하거나, 미리 계산한 임베딩을
+upsert하는 공개 API가 없습니다. 이 모듈만 래퍼 내부의 네이티브 컬렉션(_collection)에 접근하며,
+컬렉션을 쓸 수 없으면 공개 API(similarity_search_by_vector / add_documents)로 처리합니다.
+"""
+
+from typing import Any
+
+from langchain_core.documents import Document
+
+# 배치 경로에 필요한 네이티브 컬렉션 메서드
+_COLLECTION_METHODS = ("query", "upsert")
+
+
+def native_collection(vectorstore: Any) -> Any | None:
+    """
+    Chroma 래퍼의 네이티브 컬렉션 반환
+
+    Chroma가 아니거나 래퍼 내부 구조가 바뀌어 필요한 메서드가 없으면 None을 반환하며,
+    이때 호출하는 쪽은 공개 API로 처리해야 합니다.
+    """
+    collection = getattr(vectorstore, "_collection", None)
+    if collection is None:
+        return None
+    if not all(callable(getattr(collection, name, None)) for name in _COLLECTION_METHODS):
+        return None
+    return collection
+
+
+def similarity_search_by_vectors(
+    vectorstore: Any, query_embeddings: list[list[float]], k: int
+) -> list[list[Document]]:
+    """
+    여러 쿼리 벡터의 유사도 검색 (Chroma면 한 번의 쿼리, 아니면 벡터별 공개 API)
+
+    Returns:
+        쿼리 벡터 순서대로 검색된 문서 목록
+    """
+    collection = native_collection(vectorstore)
+    if collection is not None:
+        try:
+            response = collection.query(
+                query_embeddings=query_embeddings,
+                n_results=k,
+                include=["documents", "metadatas"],
+            )
+            return [
+                [
+                    Document(page_content=text or "", metadata=metadata or {})
+                    for text, metadata in zip(texts, metadatas)
+                ]
+                for texts, metadatas in zip(
+                    response["documents"], response["metadatas"]
+                )
+            ]
+        except (AttributeError, KeyError, TypeError) as e:
+            print(f"⚠️ Chroma 배치 검색을 사용할 수 없어 벡터별로 검색합니다: {e}")
+
+    return [
+        vectorstore.similarity_search_by_vector(embedding, k=k)
+        for embedding in query_embeddings
+    ]
+
+
+def upsert_embeddings(
+    vectorstore: Any,
+    ids: list[str],
+    texts: list[str],
+    metadatas: list[dict[str, Any]],
+    embeddings: list[list[float]],
+) -> bool:
+    """
+    미리 계산한 임베딩을 그대로 저장
+
+    Returns:
+        저장했으면 True, 네이티브 컬렉션을 쓸 수 없으면 False
+        (호출하는 쪽은 add_documents로 저장해야 함)
+    """
+    collection = native_collection(vectorstore)
+    if collection is None:
+        return False
+    collection.upsert(
+        ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas
+    )
+    return True
@@ -1,13 +1,25 @@
 """BaseAgent 테스트"""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.documents import Document
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from pydantic import BaseModel
 
 from src.agents.base import BaseAgent
-from src.schemas.state import GraphState
+from src.schemas.state import GraphState, RetrievalMemo
+from src.utils.context_packer import estimate_tokens
+from src.utils.llm_cache import LLMResponseCache
 
 
 class DummyOutput(BaseModel):
@@ -19,13 +31,12 @@ class DummyOutput(BaseModel):
 class ConcreteAgent(BaseAgent):
     """테스트용 구체 에이전트"""
 
-    def __call__(self, state: GraphState, runtime) -> GraphState:
+    def __call__(self, state: GraphState, runtime) -> dict:
         user_message = self._build_user_message(state)
         messages = self._create_messages(user_message)
         response_text = self._handle_tool_calls(messages)
         output = self._parse_response(response_text)
-        state.is_complete = True
-        return state
+        return {"is_complete": True}
 
     def _build_user_message(self, state: GraphState) -> str:
         return f"User input: {state.user_input}"
@@ -186,6 +197,554 @@ class TestBaseAgentToolHandling:
         mock_search.invoke.assert_called_once()
 
 
+    def test_run_tool_calls_parallel_keeps_order(self, agent):
+        """여러 tool call이 병렬 실행되고 순서가 유지되는지 테스트"""
+        tool_calls = [
+            {"id": f"call_{i}", "name": "search_lorebook", "args": {"query": q}}
+            for i, q in enumerate(["화이트런", "드래곤본", "윈드헬름"])
+        ]
+        delays = {"화이트런": 0.05, "드래곤본": 0.0, "윈드헬름": 0.02}
+        threads = set()
+
+        def fake_invoke(tool_call):
+            threads.add(threading.current_thread().name)
+            query = tool_call["args"]["query"]
+            time.sleep(delays[query])
+            return f"결과: {query}"
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.side_effect = fake_invoke
+            tool_messages = agent._run_tool_calls(tool_calls)
+
+        assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2"]
+        assert [m.content for m in tool_messages] == [
+            "결과: 화이트런",
+            "결과: 드래곤본",
+            "결과: 윈드헬름",
+        ]
+        assert all(name.startswith("tool-call") for name in threads)
+
+    def test_run_tool_calls_skips_unknown_tools(self, agent):
+        """search_lorebook 이외의 tool call은 무시되는지 테스트"""
+        tool_calls = [
+            {"id": "a", "name": "unknown", "args": {}},
+            {"id": "b", "name": "search_lorebook", "args": {"query": "q"}},
+        ]
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.return_value = "결과"
+            tool_messages = agent._run_tool_calls(tool_calls)
+
+        assert [m.tool_call_id for m in tool_messages] == ["b"]
+
+    def test_run_tool_calls_dispatches_batch_tool(self, agent):
+        """search_lorebook_batch tool call 처리 테스트"""
+        tool_calls = [
+            {
+                "id": "batch",
+                "name": "search_lorebook_batch",
+                "args": {"queries": ["화이트런", "드래곤본"]},
+            }
+        ]
+
+        with patch("src.agents.base.search_lorebook_batch") as mock_batch:
+            mock_batch.invoke.return_value = "배치 결과"
+            tool_messages = agent._run_tool_calls(tool_calls)
+
+        mock_batch.invoke.assert_called_once_with(tool_calls[0])
+        assert tool_messages[0].content == "배치 결과"
+
+
+class TestBaseAgentContextPacking:
+    """BaseAgent tool 결과 컨텍스트 패킹 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def agent(self, mock_llm):
+        return ConcreteAgent(llm=mock_llm, system_prompt="Test", lore_token_budget=200)
+
+    @staticmethod
+    def _tool_result(tool_call: dict, docs: list[Document]) -> ToolMessage:
+        query = tool_call["args"]["query"]
+        return ToolMessage(
+            content="원본 결과",
+            artifact={query: docs},
+            tool_call_id=tool_call["id"],
+        )
+
+    def test_lore_token_budget_default(self, mock_llm):
+        """예산을 지정하지 않으면 클래스 기본값을 사용하는지 테스트"""
+        agent = ConcreteAgent(llm=mock_llm)
+        assert agent.lore_token_budget == BaseAgent.LORE_TOKEN_BUDGET
+
+    def test_tool_message_uses_artifact_not_repr(self, agent):
+        """ToolMessage 결과가 repr이 아니라 artifact 문서 본문으로 변환되는지 테스트"""
+        tool_call = {"id": "c1", "name": "search_lorebook", "args": {"query": "화이트런"}}
+        docs = [Document(page_content="화이트런은 스카이림의 중심 도시입니다.")]
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.return_value = self._tool_result(tool_call, docs)
+            tool_messages = agent._run_tool_calls([tool_call])
+
+        assert tool_messages[0].content == "[설정 자료]: 화이트런은 스카이림의 중심 도시입니다."
+        assert "tool_call_id" not in tool_messages[0].content
+
+    def test_repeated_search_is_deduplicated(self, agent):
+        """같은 실행에서 이미 제공한 문서는 다시 넣지 않는지 테스트"""
+        doc = Document(page_content="드래곤본은 용의 영혼을 흡수합니다.")
+        first = AIMessage(
+            content="",
+            tool_calls=[{"id": "c1", "name": "search_lorebook", "args": {"query": "드래곤본"}}],
+        )
+        second = AIMessage(
+            content="",
+            tool_calls=[{"id": "c2", "name": "search_lorebook", "args": {"query": "용의 영혼"}}],
+        )
+        final = AIMessage(content="완료")
+        agent.llm_with_tools.invoke.side_effect = [first, second, final]
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.side_effect = lambda tc: self._tool_result(tc, [doc])
+            messages = agent._create_messages("드래곤본 이야기")
+            agent._handle_tool_calls(messages)
+
+        tool_messages = [m for m in messages if isinstance(m, ToolMessage)]
+        assert doc.page_content in tool_messages[0].content
+        assert doc.page_content not in tool_messages[1].content
+        assert "이미 제공됨" in tool_messages[1].content
+
+    def test_tool_results_stay_within_budget(self, agent):
+        """검색을 반복해도 tool 결과 전체가 예산을 넘지 않는지 테스트"""
+        responses = [
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"id": f"c{i}", "name": "search_lorebook", "args": {"query": f"질의{i}"}}
+                ],
+            )
+            for i in range(3)
+        ]
+        # bind_tools가 같은 mock을 반환하므로 마지막 응답도 같은 side_effect에 둠
+        agent.llm_with_tools.invoke.side_effect = [*responses, AIMessage(content="최종")]
+
+        def fake_invoke(tool_call):
+            query = tool_call["args"]["query"]
+            docs = [Document(page_content=f"{query} 설정 " + "가" * 150)]
+            return self._tool_result(tool_call, docs)
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.side_effect = fake_invoke
+            messages = agent._create_messages("긴 검색")
+            agent._handle_tool_calls(messages, max_iterations=3)
+
+        packed = "".join(m.content for m in messages if isinstance(m, ToolMessage))
+        assert estimate_tokens(packed) <= agent.lore_token_budget + 50  # 머리말/생략 안내 여유
+        assert "생략" in packed
+
+
+class TestBaseAgentRetrievalMemo:
+    """실행 단위 검색 메모 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def agent(self, mock_llm):
+        return ConcreteAgent(llm=mock_llm, system_prompt="Test")
+
+    @staticmethod
+    def _batch_result(tool_call: dict) -> ToolMessage:
+        queries = tool_call["args"]["queries"]
+        return ToolMessage(
+            content="검색 결과",
+            artifact={q: [Document(page_content=f"{q} 자료")] for q in queries},
+            tool_call_id=tool_call["id"],
+        )
+
+    def test_new_results_are_recorded(self, agent):
+        """실행한 검색 결과가 메모에 기록되는지 테스트"""
+        memo = RetrievalMemo()
+        tool_call = {
+            "id": "c1",
+            "name": "search_lorebook_batch",
+            "args": {"queries": ["화이트런", "윈드헬름"]},
+        }
+
+        with patch("src.agents.base.search_lorebook_batch") as mock_batch:
+            mock_batch.invoke.side_effect = self._batch_result
+            agent._run_tool_calls([tool_call], memo=memo)
+
+        assert memo.recall("윈드헬름") == ["윈드헬름 자료"]
+        assert memo.records["화이트런"].used_by == ["ConcreteAgent"]
+        assert memo.misses == 2
+
+    def test_memoized_query_skips_search(self, agent):
+        """메모에 있는 검색어는 tool을 실행하지 않는지 테스트"""
+        memo = RetrievalMemo()
+        memo.record("화이트런", ["화이트런 자료"], agent="StoryWriter")
+        tool_call = {"id": "c1", "name": "search_lorebook", "args": {"query": "화이트런"}}
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            tool_messages = agent._run_tool_calls([tool_call], memo=memo)
+
+        mock_search.invoke.assert_not_called()
+        assert tool_messages[0].content == "[설정 자료]: 화이트런 자료"
+        assert memo.hits == 1
+        assert memo.records["화이트런"].used_by == ["StoryWriter", "ConcreteAgent"]
+
+    def test_partial_batch_searches_only_missing(self, agent):
+        """배치 검색의 일부만 메모에 있으면 나머지만 검색하는지 테스트"""
+        memo = RetrievalMemo()
+        memo.record("화이트런", ["화이트런 메모"])
+        tool_call = {
+            "id": "c1",
+            "name": "search_lorebook_batch",
+            "args": {"queries": ["화이트런", "윈드헬름"]},
+        }
+
+        with patch("src.agents.base.search_lorebook_batch") as mock_batch:
+            mock_batch.invoke.side_effect = self._batch_result
+            tool_messages = agent._run_tool_calls([tool_call], memo=memo)
+
+        sent = mock_batch.invoke.call_args.args[0]
+        assert sent["args"]["queries"] == ["윈드헬름"]
+        content = tool_messages[0].content
+        assert content.index("화이트런 메모") < content.index("윈드헬름 자료")
+
+    def test_repeat_lookup_in_async_loop_is_free(self, agent):
+        """비동기 루프에서 반복 검색은 한 번만 실행되는지 테스트"""
+        memo = RetrievalMemo()
+        tool_call = {"name": "search_lorebook", "args": {"query": "드래곤본"}}
+        agent.llm_with_tools.ainvoke = AsyncMock(
+            side_effect=[
+                AIMessage(content="", tool_calls=[{**tool_call, "id": "c1"}]),
+                AIMessage(content="", tool_calls=[{**tool_call, "id": "c2"}]),
+                AIMessage(content="완료"),
+            ]
+        )
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.ainvoke = AsyncMock(
+                return_value=ToolMessage(
+                    content="",
+                    artifact={"드래곤본": [Document(page_content="드래곤본 자료")]},
+                    tool_call_id="c1",
+                )
+            )
+            messages = agent._create_messages("드래곤본")
+            result = asyncio.run(agent._ahandle_tool_calls(messages, memo=memo))
+
+        assert result == "완료"
+        mock_search.ainvoke.assert_awaited_once()
+        assert (memo.hits, memo.misses) == (1, 1)
+
+
+class TestBaseAgentStreaming:
+    """BaseAgent 응답 스트리밍 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def agent(self, mock_llm):
+        return ConcreteAgent(llm=mock_llm, system_prompt="Test")
+
+    @staticmethod
+    def _chunks(*parts: str, closed: list | None = None):
+        def generate():
+            try:
+                for part in parts:
+                    yield AIMessageChunk(content=part)
+            finally:
+                if closed is not None:
+                    closed.append(True)
+
+        return generate()
+
+    def test_stream_emits_deltas_and_stops_early(self, agent):
+        """필드 조각을 전달하고 JSON이 닫히면 남은 토큰을 받지 않는지 테스트"""
+        closed = []
+        agent.llm_with_tools.stream.return_value = self._chunks(
+            '{"title": "t", "sto',
+            'ry": "옛날 ',
+            '옛적에"}',
+            "\n추가 설명",
+            closed=closed,
+        )
+        deltas = []
+
+        result = agent._handle_tool_calls(
+            agent._create_messages("hi"),
+            stream_fields=("story",),
+            on_delta=deltas.append,
+        )
+
+        assert result == '{"title": "t", "story": "옛날 옛적에"}'
+        assert "".join(d.text for d in deltas) == "옛날 옛적에"
+        assert closed == [True]
+        agent.llm_with_tools.invoke.assert_not_called()
+
+    def test_stream_accumulates_tool_calls(self, agent):
+        """스트리밍 중 tool call 청크를 합쳐 실행하는지 테스트"""
+        tool_chunk = AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {
+                    "name": "search_lorebook",
+                    "args": '{"query": "화이트런"}',
+                    "id": "c1",
+                    "index": 0,
+                }
+            ],
+        )
+        agent.llm_with_tools.stream.side_effect = [
+            iter([tool_chunk]),
+            self._chunks('{"story": "끝"}'),
+        ]
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.return_value = "화이트런 자료"
+            result = agent._handle_tool_calls(
+                agent._create_messages("hi"), stream_fields=("story",)
+            )
+
+        assert result == '{"story": "끝"}'
+        sent = mock_search.invoke.call_args.args[0]
+        assert sent["args"] == {"query": "화이트런"}
+
+    def test_astream_stops_early(self, agent):
+        """비동기 스트리밍도 JSON이 닫히면 중단하는지 테스트"""
+        closed = []
+
+        async def generate():
+            try:
+                for part in ['{"story": "a', 'b"}', "뒤"]:
+                    yield AIMessageChunk(content=part)
+            finally:
+                closed.append(True)
+
+        agent.llm_with_tools.astream.return_value = generate()
+        deltas = []
+
+        result = asyncio.run(
+            agent._ahandle_tool_calls(
+                agent._create_messages("hi"),
+                stream_fields=("story",),
+                on_delta=deltas.append,
+            )
+        )
+
+        assert result == '{"story": "ab"}'
+        assert [d.text for d in deltas] == ["a", "b"]
+        assert closed == [True]
+
+
+class TestBaseAgentLLMCache:
+    """BaseAgent LLM 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.model = "test-model"
+        mock.temperature = 0
+        mock.seed = None
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def agent(self, mock_llm, tmp_path):
+        agent = ConcreteAgent(llm=mock_llm)
+        agent.llm_cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+        yield agent
+        agent.llm_cache.close()
+
+    def test_same_messages_call_model_once(self, agent):
+        """같은 메시지 리스트는 두 번째부터 캐시된 응답을 사용하는지 테스트"""
+        agent.llm_with_tools.invoke.return_value = AIMessage(content="응답")
+
+        first = agent._handle_tool_calls(agent._create_messages("질문"))
+        second = agent._handle_tool_calls(agent._create_messages("질문"))
+
+        assert first == second == "응답"
+        assert agent.llm_with_tools.invoke.call_count == 1
+        assert agent.llm_cache.stats().hits == 1
+
+    def test_tool_call_loop_is_replayed(self, agent):
+        """tool call 응답도 캐시하여 재실행 시 모델을 다시 호출하지 않는지 테스트"""
+        agent.llm_with_tools.invoke.side_effect = [
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "unknown_tool", "args": {}, "id": "1"}],
+            ),
+            AIMessage(content="최종"),
+        ]
+
+        agent._handle_tool_calls(agent._create_messages("질문"))
+        result = agent._handle_tool_calls(agent._create_messages("질문"))
+
+        assert result == "최종"
+        assert agent.llm_with_tools.invoke.call_count == 2
+
+    def test_sampling_llm_is_not_cached_by_default(self, agent):
+        """deterministic 정책에서는 temperature>0이고 seed가 없으면 캐시하지 않는지 테스트"""
+        agent.llm.temperature = 0.8
+        agent.llm_with_tools.invoke.return_value = AIMessage(content="응답")
+
+        agent._handle_tool_calls(agent._create_messages("질문"))
+        agent._handle_tool_calls(agent._create_messages("질문"))
+
+        assert agent.llm_with_tools.invoke.call_count == 2
+        assert len(agent.llm_cache) == 0
+
+    def test_empty_response_is_not_cached(self, agent):
+        agent.llm_with_tools.invoke.return_value = AIMessage(content="")
+        agent.llm.invoke.return_value = AIMessage(content="")
+
+        agent._handle_tool_calls(agent._create_messages("질문"), max_iterations=1)
+
+        assert len(agent.llm_cache) == 0
+
+    def test_streaming_hit_replays_fields(self, agent):
+        """스트리밍 호출이 캐시에 적중하면 필드 조각을 한 번에 전달하는지 테스트"""
+        agent.llm_with_tools.stream.return_value = iter(
+            [AIMessageChunk(content='{"story": "옛날 '), AIMessageChunk(content='옛적에"}')]
+        )
+        agent._handle_tool_calls(agent._create_messages("질문"), stream_fields=("story",))
+        deltas = []
+
+        agent._handle_tool_calls(
+            agent._create_messages("질문"),
+            stream_fields=("story",),
+            on_delta=deltas.append,
+        )
+
+        assert agent.llm_with_tools.stream.call_count == 1
+        assert [d.text for d in deltas] == ["옛날 옛적에"]
+
+    def test_async_shares_cache(self, agent):
+        agent.llm_with_tools.invoke.return_value = AIMessage(content="응답")
+        agent.llm_with_tools.ainvoke = AsyncMock()
+        agent._handle_tool_calls(agent._create_messages("질문"))
+
+        result = asyncio.run(agent._ahandle_tool_calls(agent._create_messages("질문")))
+
+        assert result == "응답"
+        agent.llm_with_tools.ainvoke.assert_not_called()
+
+
+class TestBaseAgentAsyncToolHandling:
+    """BaseAgent 비동기 도구 호출 처리 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def agent(self, mock_llm):
+        return ConcreteAgent(llm=mock_llm, system_prompt="Test")
+
+    def test_ahandle_tool_calls_no_tools(self, agent):
+        """비동기: 도구 호출이 없을 때 테스트"""
+        agent.llm_with_tools.ainvoke = AsyncMock(
+            return_value=AIMessage(content="Final response")
+        )
+
+        messages = agent._create_messages("Hello")
+        result = asyncio.run(agent._ahandle_tool_calls(messages))
+
+        assert result == "Final response"
+        agent.llm_with_tools.invoke.assert_not_called()
+
+    def test_ahandle_tool_calls_with_search(self, agent):
+        """비동기: search_lorebook 도구 호출 테스트"""
+        tool_call = {
+            "id": "call_123",
+            "name": "search_lorebook",
+            "args": {"query": "스카이림"},
+        }
+        agent.llm_with_tools.ainvoke = AsyncMock(
+            side_effect=[
+                AIMessage(content="", tool_calls=[tool_call]),
+                AIMessage(content="스카이림에 대한 이야기입니다."),
+            ]
+        )
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.ainvoke = AsyncMock(return_value="스카이림은 노르드의 땅입니다.")
+
+            messages = agent._create_messages("스카이림 이야기")
+            result = asyncio.run(agent._ahandle_tool_calls(messages))
+
+        assert result == "스카이림에 대한 이야기입니다."
+        mock_search.ainvoke.assert_awaited_once()
+        mock_search.invoke.assert_not_called()
+        assert isinstance(messages[3], ToolMessage)
+        assert messages[3].tool_call_id == "call_123"
+
+    def test_ahandle_tool_calls_final_fallback(self, agent):
+        """비동기: max_iterations 도달 시 tool 없는 LLM으로 최종 응답 요청 테스트"""
+        tool_call = {"id": "c", "name": "search_lorebook", "args": {"query": "q"}}
+        agent.llm_with_tools.ainvoke = AsyncMock(
+            return_value=AIMessage(content="", tool_calls=[tool_call])
+        )
+        agent.llm = MagicMock()  # tool 바인딩 LLM과 분리
+        agent.llm.ainvoke = AsyncMock(return_value=AIMessage(content="최종"))
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.ainvoke = AsyncMock(return_value="결과")
+            result = asyncio.run(
+                agent._ahandle_tool_calls(agent._create_messages("q"), max_iterations=2)
+            )
+
+        assert result == "최종"
+        assert mock_search.ainvoke.await_count == 2
+
+    def test_arun_tool_calls_concurrent_keeps_order(self, agent):
+        """비동기: 여러 tool call이 동시에 실행되고 순서가 유지되는지 테스트"""
+        tool_calls = [
+            {"id": f"call_{i}", "name": "search_lorebook", "args": {"query": str(i)}}
+            for i in range(3)
+        ]
+        running = 0
+        max_running = 0
+
+        async def fake_ainvoke(tool_call):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01 * (3 - int(tool_call["args"]["query"])))
+            running -= 1
+            return f"결과 {tool_call['args']['query']}"
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.ainvoke = fake_ainvoke
+            tool_messages = asyncio.run(agent._arun_tool_calls(tool_calls))
+
+        assert [m.content for m in tool_messages] == ["결과 0", "결과 1", "결과 2"]
+        assert max_running == 3
+
+    def test_default_acall_runs_sync_call(self, agent):
+        """기본 acall이 동기 __call__을 실행하는지 테스트"""
+        agent.llm_with_tools.invoke.return_value = AIMessage(content="Response")
+
+        result = asyncio.run(agent.acall(GraphState(user_input="t"), runtime=None))
+
+        assert result["is_complete"] is True
+
+
 class TestBaseAgentCallable:
     """BaseAgent __call__ 메서드 테스트"""
 
@@ -200,7 +759,7 @@ class TestBaseAgentCallable:
         return GraphState(user_input="테스트")
 
     def test_call_returns_updated_state(self, mock_llm, sample_state):
-        """__call__이 업데이트된 state를 반환하는지 테스트"""
+        """__call__이 상태 업데이트를 반환하는지 테스트"""
         agent = ConcreteAgent(llm=mock_llm, system_prompt="Test")
 
         mock_response = AIMessage(content="Response")
@@ -209,7 +768,7 @@ class TestBaseAgentCallable:
 
         result = agent(sample_state, runtime=None)
 
-        assert result.is_complete is True
+        assert result["is_complete"] is True
 
     def test_call_invokes_llm(self, mock_llm, sample_state):
         """__call__이 LLM을 호출하는지 테스트"""
@@ -0,0 +1,99 @@
+"""캐시 유틸리티 테스트"""
+
+import threading
+
+import pytest
+
+from src.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """LRUCache 테스트"""
+
+    def test_get_missing_returns_default(self):
+        """없는 키 조회 시 default 반환 테스트"""
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get("a") is None
+        assert cache.get("a", 1) == 1
+
+    def test_set_and_get(self):
+        """저장 후 조회 테스트"""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """용량 초과 시 LRU 항목 제거 테스트"""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_get_or_create_calls_factory_once(self):
+        """get_or_create가 factory를 한 번만 호출하는지 테스트"""
+        cache = LRUCache(maxsize=2)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = cache.get_or_create("a", factory)
+        second = cache.get_or_create("a", factory)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_get_or_create_concurrent_returns_same_value(self):
+        """동시 생성 시 모든 스레드가 같은 값을 공유하는지 테스트"""
+        cache = LRUCache(maxsize=2)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_create("key", object))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+
+    def test_stats(self):
+        """적중/미스 통계 테스트"""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_clear(self):
+        """clear 테스트"""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_maxsize_raises_error(self):
+        """잘못된 maxsize 에러 테스트"""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
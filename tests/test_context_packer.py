@@ -0,0 +1,130 @@
+"""ContextPacker 테스트"""
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.utils.context_packer import ContextPacker, estimate_tokens
+
+
+class TestEstimateTokens:
+    """토큰 수 추정 테스트"""
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_hangul_counts_per_character(self):
+        assert estimate_tokens("화이트런") == 4
+
+    def test_latin_counts_per_four_characters(self):
+        assert estimate_tokens("abcdefgh") == 2
+
+    def test_spaces_are_ignored(self):
+        assert estimate_tokens("가 나 다") == 3
+
+
+class TestContextPacker:
+    """ContextPacker 패킹 테스트"""
+
+    @pytest.fixture
+    def whiterun(self):
+        return Document(page_content="화이트런은 스카이림의 중심 도시입니다.")
+
+    @pytest.fixture
+    def dragonborn(self):
+        return Document(page_content="드래곤본은 용의 영혼을 흡수합니다.")
+
+    def test_pack_single_query_has_no_header(self, whiterun):
+        """검색어가 하나면 머리말 없이 자료만 넣는지 테스트"""
+        packed = ContextPacker().pack({"화이트런": [whiterun]})
+        assert packed == f"[설정 자료]: {whiterun.page_content}"
+
+    def test_pack_multiple_queries_have_headers(self, whiterun, dragonborn):
+        """여러 검색어는 검색어별 섹션으로 묶는지 테스트"""
+        packed = ContextPacker().pack({"화이트런": [whiterun], "드래곤본": [dragonborn]})
+        assert "## 화이트런" in packed
+        assert "## 드래곤본" in packed
+
+    def test_pack_empty_result(self):
+        """결과가 없는 검색어 표시 테스트"""
+        assert ContextPacker().pack({"없는곳": []}) == "관련된 설정을 찾을 수 없습니다."
+
+    def test_pack_tracks_used_tokens(self, whiterun):
+        packer = ContextPacker(budget_tokens=100)
+        packer.pack({"화이트런": [whiterun]})
+        assert packer.used_tokens == estimate_tokens(whiterun.page_content)
+        assert packer.remaining_tokens == 100 - packer.used_tokens
+
+    def test_duplicate_across_calls_is_not_repeated(self, whiterun):
+        """이전 호출에서 넣은 문서는 다시 넣지 않는지 테스트"""
+        packer = ContextPacker()
+        packer.pack({"화이트런": [whiterun]})
+        used = packer.used_tokens
+
+        packed = packer.pack({"스카이림 도시": [whiterun]})
+
+        assert whiterun.page_content not in packed
+        assert "'화이트런' 검색 결과와 같은 자료" in packed
+        assert packer.used_tokens == used
+
+    def test_duplicate_within_batch_is_not_repeated(self, whiterun):
+        """한 배치의 여러 검색어가 같은 문서를 찾으면 한 번만 넣는지 테스트"""
+        packed = ContextPacker().pack({"화이트런": [whiterun], "중심 도시": [whiterun]})
+        assert packed.count(whiterun.page_content) == 1
+
+    def test_from_messages_skips_documents_in_prompt(self, whiterun, dragonborn):
+        """이미 메시지에 들어간 문서는 제외하는지 테스트"""
+        messages = [
+            SystemMessage(content="시스템"),
+            HumanMessage(content=f"참고 자료: {whiterun.page_content}"),
+        ]
+        packer = ContextPacker.from_messages(messages)
+
+        packed = packer.pack({"화이트런": [whiterun, dragonborn]})
+
+        assert whiterun.page_content not in packed
+        assert "이전 메시지" in packed
+        assert dragonborn.page_content in packed
+
+    def test_relevance_ordering(self):
+        """검색어와 더 관련된 문서를 먼저 넣는지 테스트"""
+        unrelated = Document(page_content="모로윈드의 화산 지대에 대한 설명")
+        related = Document(page_content="윈드헬름은 스톰클록의 수도입니다.")
+
+        packed = ContextPacker().pack({"윈드헬름": [unrelated, related]})
+
+        assert packed.index(related.page_content) < packed.index(unrelated.page_content)
+
+    def test_budget_trims_at_paragraph_boundary(self):
+        """예산이 부족하면 문단 경계에서 자르는지 테스트"""
+        doc = Document(page_content="가" * 80 + "\n\n" + "나" * 80)
+        packed = ContextPacker(budget_tokens=100).pack({"가": [doc]})
+
+        assert "가" * 80 in packed
+        assert "나" not in packed
+        assert packed.endswith("…")
+
+    def test_budget_exceeded_reports_omitted(self):
+        """예산을 다 쓰면 남은 문서를 생략하고 개수를 표시하는지 테스트"""
+        docs = [Document(page_content=f"{i}번 " + "가" * 90) for i in range(3)]
+        packer = ContextPacker(budget_tokens=100)
+
+        packed = packer.pack({"가": docs})
+
+        assert "(컨텍스트 예산 초과로 자료 2개 생략)" in packed
+        assert packer.used_tokens <= 100
+
+    def test_pack_text_trims_to_remaining_budget(self):
+        """문서 구조가 없는 결과도 남은 예산에 맞게 자르는지 테스트"""
+        packer = ContextPacker(budget_tokens=100)
+        assert packer.pack_text("짧은 결과") == "짧은 결과"
+
+        packed = packer.pack_text("가" * 300)
+        assert estimate_tokens(packed) <= 100
+        assert packer.pack_text("더 많은 결과") == "(컨텍스트 예산 초과로 생략)"
+
+    def test_custom_token_counter(self, whiterun):
+        """토큰 계산 함수를 주입할 수 있는지 테스트"""
+        packer = ContextPacker(budget_tokens=1000, token_counter=len)
+        packer.pack({"화이트런": [whiterun]})
+        assert packer.used_tokens == len(whiterun.page_content)
@@ -1,12 +1,19 @@
 """Director 테스트"""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, AIMessageChunk
 
-from src.agents.director import Director
+from src.agents.director import Director, ReviewTextEvent
 from src.schemas.state import EvalReport, GraphState, RefinedRequest, StoryOutput
+from src.utils.retry_policy import (
+    ConvergencePolicy,
+    RetryPolicy,
+    get_retry_stats,
+    reset_retry_stats,
+)
 
 
 class TestDirector:
@@ -62,6 +69,22 @@ class TestDirector:
         assert "판타지" in message
         assert "소설" in message
 
+    def test_build_user_message_includes_writer_lore(self, director, sample_state):
+        """StoryWriter가 참고한 자료만 검수 메시지에 포함되는지 테스트"""
+        memo = sample_state.retrieval_memo
+        memo.record("화이트런", ["화이트런은 스카이림의 중심입니다."], agent="StoryWriter")
+        memo.record("윈드헬름", ["윈드헬름은 스톰클록의 수도입니다."], agent="Director")
+
+        message = director._build_user_message(sample_state)
+
+        assert "Story Writer가 참고한 설정 자료" in message
+        assert "화이트런은 스카이림의 중심입니다." in message
+        assert "윈드헬름은 스톰클록의 수도입니다." not in message
+
+    def test_build_user_message_without_memo(self, director, sample_state):
+        message = director._build_user_message(sample_state)
+        assert "Story Writer가 참고한 설정 자료" not in message
+
     def test_parse_response_creates_eval_report(self, director):
         """응답 파싱이 EvalReport을 생성하는지 테스트"""
         response = """{
@@ -136,8 +159,8 @@ class TestDirector:
 
         result = director(sample_state, runtime=None)
 
-        assert result.is_complete is True
-        assert result.eval_report.is_approved is True
+        assert result["is_complete"] is True
+        assert result["eval_report"].is_approved is True
 
     def test_call_rejected_sets_incomplete(self, director, mock_llm, sample_state):
         """거부 시 is_complete가 False인지 테스트"""
@@ -153,8 +176,9 @@ class TestDirector:
 
         result = director(sample_state, runtime=None)
 
-        assert result.is_complete is False
-        assert result.eval_report.is_approved is False
+        assert "is_complete" not in result
+        assert result["eval_report"].is_approved is False
+        assert result["retry_count"] == 1
 
     def test_call_max_retries_forces_complete(self, director, mock_llm, sample_state):
         """최대 재시도 도달 시 강제 완료 테스트"""
@@ -174,7 +198,21 @@ class TestDirector:
         result = director(sample_state, runtime=None)
 
         # 거부되었어도 max_retries 도달로 완료
-        assert result.is_complete is True
+        assert result["is_complete"] is True
+
+    def test_acall_approved_sets_complete(self, director, sample_state):
+        """비동기 검수: 승인 시 is_complete가 True가 되는지 테스트"""
+        director.llm_with_tools.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content='{"is_approved": true, "score": 9.0, "feedback": "좋습니다"}'
+            )
+        )
+
+        result = asyncio.run(director.acall(sample_state, runtime=None))
+
+        assert result["is_complete"] is True
+        assert result["eval_report"].score == 9.0
+        director.llm_with_tools.invoke.assert_not_called()
 
 
 class TestDirectorEdgeCases:
@@ -224,5 +262,265 @@ class TestDirectorEdgeCases:
 
         result = director(state, runtime=None)
 
-        assert len(result.feedback_history) > 0
-        assert "더 나은 설명이 필요합니다" in result.feedback_history[0]
+        # 새 피드백만 반환하고 입력 state는 수정하지 않음
+        assert result["feedback_history"] == ["더 나은 설명이 필요합니다"]
+        assert state.feedback_history == []
+
+
+class TestDirectorIncrementalReview:
+    """Director 문단 단위 재검수 테스트"""
+
+    STORY = "화이트런의 아침.\n\n드래곤이 나타났다.\n\n용사가 승리했다."
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def director(self, mock_llm):
+        return Director(llm=mock_llm, system_prompt="Test")
+
+    def _state(self, story: str, **kwargs) -> GraphState:
+        return GraphState(
+            request=RefinedRequest(summarized_prompt="용사 이야기"),
+            story_output=StoryOutput(title="t", story=story),
+            **kwargs,
+        )
+
+    def _review(self, director, state, content: str) -> dict:
+        director.llm_with_tools.invoke.return_value = AIMessage(content=content)
+        return director(state, runtime=None)
+
+    def test_invalid_review_mode_raises(self, mock_llm):
+        with pytest.raises(ValueError):
+            Director(llm=mock_llm, review_mode="partial")
+
+    def test_first_review_numbers_all_paragraphs(self, director):
+        """첫 검수는 모든 문단을 번호와 함께 전체 본문으로 보내는지 테스트"""
+        message = director._build_user_message(self._state(self.STORY))
+
+        assert "[P2] 드래곤이 나타났다." in message
+        assert "변경 없음" not in message
+
+    def test_review_caches_paragraph_verdicts(self, director):
+        """문단별 검수 결과가 해시 기준으로 기록되는지 테스트"""
+        result = self._review(
+            director,
+            self._state(self.STORY),
+            '{"is_approved": false, "score": 5.0, "feedback": "드래곤 묘사 부족",'
+            ' "issues": ["묘사 부족"], "paragraph_issues": {"2": ["묘사 부족"]}}',
+        )
+
+        reviews = result["paragraph_reviews"]
+        assert len(reviews) == 3
+        assert sorted(map(len, reviews.values())) == [0, 0, 1]
+        assert result["eval_report"].paragraph_issues == {2: ["묘사 부족"]}
+
+    def test_retry_sends_only_changed_paragraphs(self, director):
+        """재검수 때 바뀐 문단만 전체 본문으로 보내는지 테스트"""
+        first = self._review(
+            director,
+            self._state(self.STORY),
+            '{"is_approved": false, "feedback": "f", "paragraph_issues": {"2": ["묘사 부족"]}}',
+        )
+        revised = self.STORY.replace("드래곤이 나타났다.", "붉은 드래곤이 포효했다.")
+        state = self._state(revised, paragraph_reviews=first["paragraph_reviews"])
+
+        message = director._build_user_message(state)
+
+        assert "[P2] 붉은 드래곤이 포효했다." in message
+        assert "[P1] (변경 없음, 이전 검수 통과) 화이트런의 아침." in message
+        assert "1개 문단이 바뀌었습니다" in message
+
+    def test_unchanged_issues_carry_into_final_report(self, director):
+        """바뀌지 않은 문단의 이전 지적이 최종 보고서에 남는지 테스트"""
+        first = self._review(
+            director,
+            self._state(self.STORY),
+            '{"is_approved": false, "feedback": "f",'
+            ' "paragraph_issues": {"2": ["묘사 부족"], "3": ["결말 급함"]}}',
+        )
+        revised = self.STORY.replace("드래곤이 나타났다.", "붉은 드래곤이 포효했다.")
+        state = self._state(revised, paragraph_reviews=first["paragraph_reviews"])
+
+        result = self._review(
+            director, state, '{"is_approved": false, "feedback": "결말 보완 필요"}'
+        )
+
+        report = result["eval_report"]
+        assert report.paragraph_issues == {3: ["결말 급함"]}
+        assert "결말 급함" in report.issues
+        # 캐시는 현재 버전 문단만 보관
+        assert len(result["paragraph_reviews"]) == 3
+
+    def test_parse_failure_does_not_cache_changed(self, director):
+        """응답 파싱 실패 시 이번 문단 결과를 통과로 기록하지 않는지 테스트"""
+        result = self._review(director, self._state(self.STORY), "JSON 아님")
+
+        assert result["paragraph_reviews"] == {}
+
+    def test_full_mode_always_sends_whole_story(self, mock_llm):
+        director = Director(llm=mock_llm, review_mode="full")
+        first = self._review(director, self._state(self.STORY), '{"is_approved": false}')
+        state = self._state(self.STORY, paragraph_reviews=first["paragraph_reviews"])
+
+        message = director._build_user_message(state)
+
+        assert "변경 없음" not in message
+        assert "[P3] 용사가 승리했다." in message
+
+    def test_parse_paragraph_issues_ignores_invalid(self, director):
+        report = director._parse_response(
+            '{"is_approved": true, "paragraph_issues": {"x": ["a"], "2": "b", "3": []}}'
+        )
+        assert report.paragraph_issues == {2: ["b"]}
+
+
+class TestDirectorStreaming:
+    """Director 검수 피드백 스트리밍 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def runtime(self):
+        runtime = MagicMock()
+        runtime.events = []
+        runtime.stream_writer = runtime.events.append
+        return runtime
+
+    def test_stream_output_emits_feedback_events(self, mock_llm, runtime):
+        """스트리밍 모드에서 feedback 조각을 ReviewTextEvent로 내보내는지 테스트"""
+        director = Director(llm=mock_llm, stream_output=True)
+        director.llm_with_tools.stream.return_value = iter(
+            [
+                AIMessageChunk(content='{"is_approved": false, "score": 5, '),
+                AIMessageChunk(content='"feedback": "결말이 '),
+                AIMessageChunk(content='약합니다.", "issues": []}'),
+            ]
+        )
+        state = GraphState(story_output=StoryOutput(story="s"), retry_count=1)
+
+        result = director(state, runtime)
+
+        assert runtime.events == [
+            ReviewTextEvent("feedback", "결말이 ", attempt=2),
+            ReviewTextEvent("feedback", "약합니다.", attempt=2),
+        ]
+        assert result["eval_report"].feedback == "결말이 약합니다."
+        director.llm_with_tools.invoke.assert_not_called()
+
+    def test_without_stream_output_uses_invoke(self, mock_llm, runtime):
+        director = Director(llm=mock_llm)
+        director.llm_with_tools.invoke.return_value = AIMessage(
+            content='{"is_approved": true, "score": 9, "feedback": "좋음"}'
+        )
+
+        director(GraphState(story_output=StoryOutput(story="s")), runtime)
+
+        director.llm_with_tools.stream.assert_not_called()
+        assert runtime.events == []
+
+
+class TestDirectorRetryPolicy:
+    """Director 재작성 정책 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        reset_retry_stats()
+        yield
+        reset_retry_stats()
+
+    @pytest.fixture
+    def director(self):
+        llm = MagicMock()
+        llm.bind_tools.return_value = llm
+        director = Director(llm=llm)
+        director.retry_policy = ConvergencePolicy(good_enough=8.0, min_improvement=0.5)
+        return director
+
+    @staticmethod
+    def _review(director, state, score: float, approved: bool = False) -> dict:
+        director.llm_with_tools.invoke.return_value = AIMessage(
+            content=(
+                f'{{"is_approved": {str(approved).lower()}, '
+                f'"score": {score}, "feedback": "수정 필요"}}'
+            )
+        )
+        return director(state, runtime=None)
+
+    def _state(self, **kwargs) -> GraphState:
+        return GraphState(
+            story_output=StoryOutput(story="용사가 드래곤을 물리쳤습니다."),
+            max_retries=5,
+            **kwargs,
+        )
+
+    def test_score_history_is_appended(self, director):
+        result = self._review(director, self._state(), 5.0)
+
+        assert result["score_history"] == [5.0]
+        assert "is_complete" not in result
+
+    def test_plateau_stops_early(self, director):
+        """점수가 오르지 않으면 max_retries 전에 종료하고 절약 횟수를 기록하는지 테스트"""
+        state = self._state(score_history=[6.0], retry_count=1)
+
+        result = self._review(director, state, 6.2)
+
+        assert result["is_complete"] is True
+        stats = get_retry_stats()
+        assert stats.early_stops == 1
+        assert stats.loops_saved == 3
+
+    def test_good_enough_stops_without_approval(self, director):
+        result = self._review(director, self._state(), 8.5)
+
+        assert result["is_complete"] is True
+        assert result["eval_report"].is_approved is False
+
+    def test_parse_failure_does_not_stop(self, director):
+        """파싱에 실패한 검수는 점수 히스토리와 정책 판단에서 제외되는지 테스트"""
+        director.llm_with_tools.invoke.return_value = AIMessage(content="not json")
+
+        result = director(self._state(score_history=[6.0], retry_count=1), runtime=None)
+
+        assert "score_history" not in result
+        assert "is_complete" not in result
+
+    def test_default_policy_keeps_retrying(self):
+        llm = MagicMock()
+        llm.bind_tools.return_value = llm
+        director = Director(llm=llm)
+
+        result = self._review(director, self._state(score_history=[6.0]), 6.0)
+
+        assert "is_complete" not in result
+
+    def test_final_write_skips_review(self, director):
+        """마지막 작성이면 검수를 생략하고, 이전 작성본의 검수 결과를 지우는지 테스트"""
+        state = self._state(
+            retry_count=4,
+            score_history=[4.0, 5.0, 6.0, 7.0],
+            eval_report=EvalReport(is_approved=False, score=7.0),
+        )
+
+        assert director.should_skip_review(state) is True
+        update = director.skip_review(state)
+
+        assert update == {"eval_report": None, "review_skipped": True, "is_complete": True}
+        assert get_retry_stats().reviews_skipped == 1
+
+    def test_non_final_or_first_write_is_reviewed(self, director):
+        assert director.should_skip_review(self._state(retry_count=3)) is False
+        assert director.should_skip_review(GraphState(max_retries=1)) is False
+
+    def test_final_review_kept_when_policy_disables_skip(self, director):
+        director.retry_policy = RetryPolicy()
+
+        assert director.should_skip_review(self._state(retry_count=4)) is False
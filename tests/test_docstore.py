@@ -0,0 +1,101 @@
+"""SQLiteDocStore 테스트"""
+
+import pickle
+
+import pytest
+from langchain_core.documents import Document
+
+from src.utils.docstore import SQLiteDocStore, migrate_local_file_store
+
+
+class TestSQLiteDocStore:
+    """SQLiteDocStore 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return SQLiteDocStore(tmp_path / "docs.sqlite3")
+
+    def test_mset_and_mget(self, store):
+        """저장 후 조회 테스트"""
+        store.mset(
+            [
+                ("a", Document(page_content="화이트런", metadata={"section": "영지"})),
+                ("b", Document(page_content="윈드헬름")),
+            ]
+        )
+
+        docs = store.mget(["b", "missing", "a"])
+
+        assert docs[0].page_content == "윈드헬름"
+        assert docs[1] is None
+        assert docs[2].page_content == "화이트런"
+        assert docs[2].metadata == {"section": "영지"}
+
+    def test_mget_many_keys(self, store):
+        """SQLite 변수 제한보다 많은 키 조회 테스트"""
+        store.mset([(str(i), Document(page_content=str(i))) for i in range(1200)])
+
+        docs = store.mget([str(i) for i in range(1200)])
+
+        assert [d.page_content for d in docs] == [str(i) for i in range(1200)]
+
+    def test_mset_overwrites(self, store):
+        store.mset([("a", Document(page_content="old"))])
+        store.mset([("a", Document(page_content="new"))])
+
+        assert store.mget(["a"])[0].page_content == "new"
+        assert len(store) == 1
+
+    def test_mdelete(self, store):
+        store.mset([("a", Document(page_content="x")), ("b", Document(page_content="y"))])
+        store.mdelete(["a"])
+
+        assert store.mget(["a", "b"])[0] is None
+        assert len(store) == 1
+
+    def test_yield_keys_with_prefix(self, store):
+        store.mset(
+            [
+                ("skyrim-1", Document(page_content="1")),
+                ("skyrim-2", Document(page_content="2")),
+                ("morrowind-1", Document(page_content="3")),
+            ]
+        )
+
+        assert list(store.yield_keys(prefix="skyrim")) == ["skyrim-1", "skyrim-2"]
+        assert len(list(store.yield_keys())) == 3
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "docs.sqlite3"
+        SQLiteDocStore(path).mset([("a", Document(page_content="x"))])
+
+        reopened = SQLiteDocStore(path, read_only=True)
+
+        assert reopened.mget(["a"])[0].page_content == "x"
+
+    def test_values_are_not_pickled(self, store, tmp_path):
+        """저장 형식이 pickle이 아닌 JSON인지 테스트"""
+        store.mset([("a", Document(page_content="화이트런"))])
+
+        (raw,) = store._conn.execute("SELECT value FROM documents").fetchone()
+
+        assert raw.startswith("{")
+        assert "화이트런" in raw
+
+
+class TestMigrateLocalFileStore:
+    """pickle 저장소 마이그레이션 테스트"""
+
+    def test_migrates_all_documents(self, tmp_path):
+        legacy_dir = tmp_path / "parent_docs_store"
+        legacy_dir.mkdir()
+        for key in ("id-1", "id-2"):
+            (legacy_dir / key).write_bytes(
+                pickle.dumps(Document(page_content=f"content {key}"))
+            )
+        store = SQLiteDocStore(tmp_path / "docs.sqlite3")
+
+        count = migrate_local_file_store(legacy_dir, store)
+
+        assert count == 2
+        assert store.mget(["id-2"])[0].page_content == "content id-2"
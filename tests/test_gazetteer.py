@@ -0,0 +1,122 @@
+"""lorebook 개체명 사전 테스트"""
+
+import pytest
+from langchain_core.documents import Document
+
+from src.utils.docstore import SQLiteDocStore
+from src.utils.gazetteer import (
+    Gazetteer,
+    build_gazetteer,
+    extract_name_pairs,
+    name_variants,
+)
+
+LOREBOOK = """## 제2부: 스카이림의 지리적 환경과 9개 영지
+### 1. 화이트런 영지 (Whiterun Hold) - 스카이림의 심장
+- **수도:** 화이트런 (Whiterun)
+- **지배자:** 야를 발그루프 (Jarl Balgruuf the Greater)
+일반 문단의 팔크리스 (Falkreath)는 추출하지 않는다.
+#### 1.2 대전쟁(The Great War)과 백금 조약(White-Gold Concordat)
+- 스카이림의 공식적인 수도이자 제국군의 본부가 위치한 카슬 도어(Castle Dour)가 있다.
+"""
+
+
+class TestExtractNamePairs:
+    """이름 쌍 추출 테스트"""
+
+    def test_headings_and_list_items(self):
+        pairs = extract_name_pairs(LOREBOOK)
+
+        assert ("화이트런 영지", "Whiterun Hold") in pairs
+        assert ("화이트런", "Whiterun") in pairs
+        assert ("야를 발그루프", "Jarl Balgruuf the Greater") in pairs
+
+    def test_strips_numbering_and_particles(self):
+        pairs = extract_name_pairs(LOREBOOK)
+
+        assert ("대전쟁", "The Great War") in pairs
+        assert ("백금 조약", "White-Gold Concordat") in pairs
+
+    def test_skips_prose_and_long_phrases(self):
+        """일반 문단과 문장 속 긴 구절은 개체로 보지 않는지 테스트"""
+        names = {english for _, english in extract_name_pairs(LOREBOOK)}
+
+        assert "Falkreath" not in names
+        assert "Castle Dour" not in names
+
+
+class TestNameVariants:
+    def test_article_and_spacing_variants(self):
+        variants = name_variants("화이트런 영지", "The Whiterun Hold")
+
+        assert {"화이트런 영지", "화이트런영지", "the whiterun hold", "whiterun hold"} <= variants
+
+    def test_title_variants(self):
+        assert "발그루프" in name_variants("야를 발그루프", "Jarl Balgruuf")
+        assert "balgruuf" in name_variants("야를 발그루프", "Jarl Balgruuf")
+
+
+class TestGazetteer:
+    """Gazetteer 테스트"""
+
+    @pytest.fixture
+    def gazetteer(self):
+        return Gazetteer.build(
+            [
+                ("whiterun", LOREBOOK),
+                ("falmer-1", "### 3. 팔머 (Falmer)와 차루스 (Chaurus)"),
+                ("falmer-2", "- **팔머 (Snow Elves):** 퇴화한 종족"),
+            ]
+        )
+
+    def test_lookup_in_either_language(self, gazetteer):
+        assert gazetteer.lookup("화이트런 영지") == ["whiterun"]
+        assert gazetteer.lookup("  WHITERUN   hold ") == ["whiterun"]
+        assert gazetteer.lookup("화이트런 영지 (Whiterun Hold)") == ["whiterun"]
+
+    def test_shared_name_maps_to_all_sections(self, gazetteer):
+        assert gazetteer.lookup("팔머") == ["falmer-1", "falmer-2"]
+        assert {e.english for e in gazetteer.entities("팔머")} == {"Falmer", "Snow Elves"}
+
+    def test_aliases(self, gazetteer):
+        assert "팔머" in gazetteer.aliases("Snow Elves")
+        assert "chaurus" in gazetteer.aliases("차루스")
+
+    def test_unknown_name(self, gazetteer):
+        assert gazetteer.lookup("솔스타임") == []
+        assert "솔스타임" not in gazetteer
+        assert "Whiterun" in gazetteer
+
+    def test_mentions_with_particles_in_order(self):
+        """조사가 붙은 이름도 등장 순서대로 찾고 한 글자 별칭은 제외하는지 테스트"""
+        gazetteer = Gazetteer()
+        gazetteer.add("화이트런", "Whiterun", "w")
+        gazetteer.add("윈드헬름", "Windhelm", "h")
+        gazetteer.add("곰", "Bear", "b")
+
+        entities = gazetteer.mentions("윈드헬름에서 출발해 Whiterun의 곰을 만나다")
+
+        assert [e.korean for e in entities] == ["윈드헬름", "화이트런"]
+
+    def test_save_and_load(self, gazetteer, tmp_path):
+        path = tmp_path / "entities.json"
+        gazetteer.save(path)
+
+        loaded = Gazetteer.load(path)
+
+        assert len(loaded) == len(gazetteer)
+        assert loaded.lookup("팔머") == gazetteer.lookup("팔머")
+        assert loaded.lookup("Reach") == gazetteer.lookup("Reach")
+
+    def test_load_rejects_unknown_version(self, tmp_path):
+        path = tmp_path / "entities.json"
+        path.write_text('{"version": 999}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            Gazetteer.load(path)
+
+    def test_build_from_docstore(self, tmp_path):
+        store = SQLiteDocStore(tmp_path / "docs.sqlite3")
+        store.mset([("whiterun", Document(page_content=LOREBOOK))])
+
+        assert build_gazetteer(store).lookup("Whiterun") == ["whiterun"]
@@ -1,11 +1,28 @@
 """graph 모듈 테스트"""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.graph import create_graph
+from src.graph import (
+    arun_story_generation,
+    clear_graph_registry,
+    configure_story_cache,
+    create_graph,
+    get_compiled_graph,
+    run_story_generation,
+    stream_story_generation,
+)
+from langchain_core.messages import AIMessage
+
 from src.schemas.state import GraphState
+from src.utils.retry_policy import (
+    ConvergencePolicy,
+    configure_retry_policy,
+    get_retry_stats,
+    reset_retry_stats,
+)
 
 
 class TestCreateGraph:
@@ -40,6 +57,7 @@ class TestCreateGraph:
         # 노드 이름 확인
         node_names = list(graph.nodes.keys())
         assert "init" in node_names
+        assert "prefetch" in node_names
         assert "write" in node_names
         assert "review" in node_names
 
@@ -51,6 +69,342 @@ class TestCreateGraph:
         app = graph.compile()
         assert app is not None
 
+    def test_graph_ainvoke_uses_async_agents(self):
+        """비동기 실행 시 모든 노드가 ainvoke 경로를 사용하는지 테스트"""
+        llm = MagicMock()
+        llm.bind_tools.return_value = llm
+        llm.ainvoke = AsyncMock(
+            side_effect=[
+                AIMessage(content='{"title": "t", "story": "s"}'),
+                AIMessage(content='{"is_approved": true, "score": 9.0}'),
+            ]
+        )
+
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.ainvoke = AsyncMock(
+                return_value=AIMessage(content='{"summarized_prompt": "p"}')
+            )
+            mock_template.from_messages.return_value.__or__ = MagicMock(
+                return_value=mock_chain
+            )
+
+            with patch(
+                "src.agents.lore_prefetcher.retrieve_documents_batch",
+                return_value=[[]],
+            ):
+                app = create_graph(llm=llm).compile()
+                result = asyncio.run(app.ainvoke(GraphState(user_input="테스트")))
+
+        assert result["story_output"].story == "s"
+        assert result["is_complete"] is True
+        llm.invoke.assert_not_called()
+        mock_chain.invoke.assert_not_called()
+
+
+class TestGraphHistory:
+    """재시도 루프의 히스토리 누적 회귀 테스트"""
+
+    def _run(
+        self, rejections: int, max_retries: int = 5, history_limit: int | None = None
+    ) -> dict:
+        """rejections번 거부 후 승인되는 그래프 실행"""
+        llm = MagicMock()
+        llm.bind_tools.return_value = llm
+        responses = []
+        for attempt in range(rejections + 1):
+            approved = "true" if attempt == rejections else "false"
+            responses.append(
+                AIMessage(content=f'{{"title": "t", "story": "s{attempt}"}}')
+            )
+            responses.append(
+                AIMessage(
+                    content=f'{{"is_approved": {approved}, "feedback": "f{attempt}"}}'
+                )
+            )
+        llm.invoke.side_effect = responses
+
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+            mock_template.from_messages.return_value.__or__ = MagicMock(
+                return_value=mock_chain
+            )
+            with patch(
+                "src.agents.lore_prefetcher.retrieve_documents_batch",
+                return_value=[[]],
+            ):
+                app = create_graph(llm=llm, history_limit=history_limit).compile()
+                return app.invoke(GraphState(user_input="테스트", max_retries=max_retries))
+
+    @pytest.mark.parametrize("rejections", [0, 1, 3])
+    def test_history_grows_linearly(self, rejections):
+        """N번 재시도 후 히스토리 길이가 시도 횟수와 같은지 테스트"""
+        result = self._run(rejections)
+
+        assert result["story_history"] == [f"s{i}" for i in range(rejections + 1)]
+        assert result["feedback_history"] == [f"f{i}" for i in range(rejections)]
+        assert result["retry_count"] == rejections
+
+    def test_bounded_history_keeps_latest(self):
+        """압축 모드에서 최근 항목만 남는지 테스트"""
+        result = self._run(3, history_limit=2)
+
+        assert result["story_history"] == ["s2", "s3"]
+        assert result["feedback_history"] == ["f1", "f2"]
+
+    def test_history_limit_is_per_graph(self):
+        """한 그래프의 압축 모드가 다른 그래프의 히스토리를 자르지 않는지 테스트"""
+        self._run(3, history_limit=2)
+
+        result = self._run(3)
+
+        assert result["story_history"] == ["s0", "s1", "s2", "s3"]
+
+
+class TestGraphRetryPolicy:
+    """재작성 정책에 따른 루프 종료 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_policy(self):
+        reset_retry_stats()
+        yield
+        configure_retry_policy(None)
+        reset_retry_stats()
+
+    def _run(self, scores: list[float], max_retries: int) -> tuple[dict, MagicMock]:
+        """scores 순서대로 점수를 받고 계속 거부되는 그래프 실행"""
+        llm = MagicMock()
+        llm.bind_tools.return_value = llm
+        responses = []
+        for attempt, score in enumerate(scores):
+            responses.append(AIMessage(content=f'{{"title": "t", "story": "s{attempt}"}}'))
+            responses.append(
+                AIMessage(
+                    content=f'{{"is_approved": false, "score": {score}, "feedback": "f"}}'
+                )
+            )
+        # 검수를 생략하는 마지막 작성용 응답
+        responses.append(AIMessage(content='{"title": "t", "story": "last"}'))
+        llm.invoke.side_effect = responses
+
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+            mock_template.from_messages.return_value.__or__ = MagicMock(
+                return_value=mock_chain
+            )
+            with patch(
+                "src.agents.lore_prefetcher.retrieve_documents_batch",
+                return_value=[[]],
+            ):
+                app = create_graph(llm=llm).compile()
+                result = app.invoke(
+                    GraphState(user_input="테스트", max_retries=max_retries)
+                )
+        return result, llm
+
+    def test_plateau_stops_before_max_retries(self):
+        configure_retry_policy(ConvergencePolicy(good_enough=None, skip_final_review=False))
+
+        result, llm = self._run([5.0, 5.2], max_retries=5)
+
+        assert result["story_history"] == ["s0", "s1"]
+        assert result["score_history"] == [5.0, 5.2]
+        assert result["is_complete"] is True
+        assert get_retry_stats().loops_saved == 3
+
+    def test_last_write_skips_review(self):
+        """마지막 작성본은 Director를 호출하지 않고 종료하는지 테스트"""
+        configure_retry_policy(ConvergencePolicy(good_enough=None, min_improvement=0.0))
+
+        result, llm = self._run([4.0, 6.0], max_retries=3)
+
+        assert result["story_history"] == ["s0", "s1", "last"]
+        assert result["score_history"] == [4.0, 6.0]
+        assert result["is_complete"] is True
+        # 검수하지 않은 마지막 작성본에 이전 작성본의 점수가 남지 않음
+        assert result["review_skipped"] is True
+        assert result["eval_report"] is None
+        assert llm.invoke.call_count == 5  # 작성 3회 + 검수 2회
+        assert get_retry_stats().reviews_skipped == 1
+
+    def test_default_policy_reviews_every_write(self):
+        result, llm = self._run([4.0, 4.0, 4.0], max_retries=3)
+
+        assert result["review_skipped"] is False
+
+        assert result["score_history"] == [4.0, 4.0, 4.0]
+        assert llm.invoke.call_count == 6
+
+
+class TestStoryResultCache:
+    """스토리 생성 결과 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def story_cache(self, tmp_path):
+        clear_graph_registry()
+        cache = configure_story_cache(str(tmp_path / "stories.sqlite3"))
+        yield cache
+        configure_story_cache(None)
+        clear_graph_registry()
+
+    @pytest.fixture
+    def mock_llm(self):
+        llm = MagicMock()
+        llm.model = "test-model"
+        llm.bind_tools.return_value = llm
+        llm.invoke.side_effect = lambda messages: AIMessage(
+            content='{"is_approved": true, "score": 9.0}'
+            if "Review Info" in messages[-1].content
+            else '{"title": "t", "story": "s"}'
+        )
+        return llm
+
+    @pytest.fixture(autouse=True)
+    def patch_parser(self):
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+            mock_template.from_messages.return_value.__or__ = MagicMock(
+                return_value=mock_chain
+            )
+            with patch(
+                "src.agents.lore_prefetcher.retrieve_documents_batch",
+                return_value=[[]],
+            ):
+                yield
+
+    def test_hit_returns_final_state_without_running(self, mock_llm):
+        """같은 요청은 그래프를 실행하지 않고 저장된 최종 상태를 반환하는지 테스트"""
+        first = run_story_generation("용사 이야기", llm=mock_llm)
+        calls = mock_llm.invoke.call_count
+
+        second = run_story_generation("용사 이야기", llm=mock_llm)
+
+        assert second == first
+        assert second.story_output.story == "s"
+        assert mock_llm.invoke.call_count == calls
+
+    def test_hit_replays_updates(self, mock_llm):
+        """스트리밍 소비자에게 저장된 노드 업데이트를 같은 순서로 재생하는지 테스트"""
+        live = list(stream_story_generation("용사 이야기", llm=mock_llm))
+        replayed = list(stream_story_generation("용사 이야기", llm=mock_llm))
+
+        assert [list(chunk) for _, chunk in replayed] == [
+            ["init"],
+            ["prefetch"],
+            ["write"],
+            ["review"],
+        ]
+        assert replayed == live
+
+    def test_use_cache_false_runs_graph(self, mock_llm, story_cache):
+        """use_cache=False이면 캐시를 조회/저장하지 않는지 테스트"""
+        run_story_generation("용사 이야기", llm=mock_llm, use_cache=False)
+        assert len(story_cache) == 0
+
+        run_story_generation("용사 이야기", llm=mock_llm)
+        calls = mock_llm.invoke.call_count
+        run_story_generation("용사 이야기", llm=mock_llm, use_cache=False)
+
+        assert mock_llm.invoke.call_count > calls
+
+    def test_llm_without_model_name_is_not_cached(self, mock_llm, story_cache):
+        """모델 이름을 알 수 없는 LLM은 캐시하지 않는지 테스트"""
+        del mock_llm.model
+
+        run_story_generation("용사 이야기", llm=mock_llm)
+
+        assert len(story_cache) == 0
+
+    def test_injected_llm_options_are_part_of_key(self, story_cache):
+        """모델 이름이 같아도 temperature가 다른 주입 LLM은 결과를 공유하지 않는지 테스트"""
+        from langchain_ollama import ChatOllama
+
+        def respond(messages, *args, **kwargs):
+            return AIMessage(
+                content='{"is_approved": true, "score": 9.0}'
+                if "Review Info" in messages[-1].content
+                else '{"title": "t", "story": "s"}'
+            )
+
+        with patch.object(ChatOllama, "invoke", side_effect=respond) as invoke:
+            run_story_generation(
+                "용사 이야기", llm=ChatOllama(model="test-model", temperature=0)
+            )
+            calls = invoke.call_count
+            run_story_generation(
+                "용사 이야기", llm=ChatOllama(model="test-model", temperature=0.8)
+            )
+            assert invoke.call_count > calls
+            assert len(story_cache) == 2
+
+            calls = invoke.call_count
+            run_story_generation(
+                "용사 이야기", llm=ChatOllama(model="test-model", temperature=0)
+            )
+            assert invoke.call_count == calls
+
+    def test_async_run_shares_cache(self, mock_llm):
+        """비동기 실행도 같은 캐시를 사용하는지 테스트"""
+        first = run_story_generation("용사 이야기", llm=mock_llm)
+        mock_llm.ainvoke = AsyncMock()
+
+        second = asyncio.run(arun_story_generation("용사 이야기", llm=mock_llm))
+
+        assert second == first
+        mock_llm.ainvoke.assert_not_called()
+
+
+class TestGraphRegistry:
+    """컴파일된 그래프 레지스트리 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        clear_graph_registry()
+        yield
+        clear_graph_registry()
+
+    @pytest.fixture
+    def mock_llm(self):
+        return MagicMock()
+
+    def test_same_key_returns_cached_graph(self, mock_llm):
+        """같은 설정이면 동일한 컴파일 그래프를 반환하는지 테스트"""
+        first = get_compiled_graph(llm=mock_llm, story_writer_system_prompt="W")
+        second = get_compiled_graph(llm=mock_llm, story_writer_system_prompt="W")
+
+        assert first is second
+
+    def test_different_prompt_returns_new_graph(self, mock_llm):
+        """프롬프트가 다르면 다른 그래프를 반환하는지 테스트"""
+        first = get_compiled_graph(llm=mock_llm, director_system_prompt="A")
+        second = get_compiled_graph(llm=mock_llm, director_system_prompt="B")
+
+        assert first is not second
+
+    def test_different_history_limit_returns_new_graph(self, mock_llm):
+        """히스토리 보관 개수가 다르면 다른 그래프를 반환하는지 테스트"""
+        first = get_compiled_graph(llm=mock_llm)
+        second = get_compiled_graph(llm=mock_llm, history_limit=2)
+
+        assert first is not second
+        assert get_compiled_graph(llm=mock_llm, history_limit=2) is second
+
+    def test_model_name_builds_llm_once(self):
+        """모델 이름으로 조회 시 LLM을 한 번만 생성하는지 테스트"""
+        with patch("langchain_ollama.ChatOllama") as mock_chat:
+            mock_chat.return_value = MagicMock()
+            first = get_compiled_graph("test-model", reasoning=True)
+            second = get_compiled_graph("test-model", reasoning=True)
+            third = get_compiled_graph("test-model")
+
+        assert first is second
+        assert first is not third
+        assert mock_chat.call_count == 2
+        mock_chat.assert_any_call(model="test-model", reasoning=True)
+
 
 class TestGraphFlow:
     """그래프 흐름 테스트"""
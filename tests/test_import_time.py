@@ -0,0 +1,68 @@
+"""import 시간 예산 테스트
+
+CLI(main.py)와 테스트가 torch/transformers/chromadb를 로드하지 않고 빠르게 시작하는지 확인합니다.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 시작 시 import 되면 안 되는 무거운 모듈 (첫 검색 시점에 로드)
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "chromadb",
+    "langchain_chroma",
+    "langchain_huggingface",
+    "langchain_ollama",
+)
+
+# src.graph import 예산 (초)
+IMPORT_TIME_BUDGET = 1.0
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def cumulative_import_seconds(stderr: str, module: str) -> float:
+    """-X importtime 출력에서 모듈의 누적 import 시간(초)을 추출"""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        # 형식: "import time: self [us] | cumulative | imported package"
+        _, cumulative_us, name = line.split(":", 1)[1].split("|")
+        if name.strip() == module:
+            return int(cumulative_us) / 1_000_000
+    raise AssertionError(f"{module} import 기록을 찾을 수 없습니다")
+
+
+@pytest.mark.parametrize("module", ["src.graph", "src.agents"])
+def test_heavy_modules_not_imported_at_startup(module):
+    """시작 시 무거운 의존성이 import 되지 않는지 테스트"""
+    result = run_python(
+        "-c",
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_graph_import_within_budget():
+    """src.graph import 시간이 예산 이내인지 테스트"""
+    result = run_python("-X", "importtime", "-c", "import src.graph")
+
+    seconds = cumulative_import_seconds(result.stderr, "src.graph")
+    assert seconds < IMPORT_TIME_BUDGET, f"src.graph import {seconds:.2f}초"
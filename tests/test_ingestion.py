@@ -0,0 +1,227 @@
+"""lorebook 증분 적재 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from typer.testing import CliRunner
+
+from src.utils.docstore import SQLiteDocStore
+from src.utils.lexical_index import BM25Index
+from src.utils.ingest_cli import app, resolve_lorebooks, split_lorebooks
+from src.utils.split_and_store_to_vector_db import (
+    ID_KEY,
+    ingest_lorebook,
+    parent_id,
+    split_into_parents,
+    split_lorebook,
+    write_children,
+)
+
+
+def _sections(*names: str) -> str:
+    """부모 청크 하나씩 차지하는 섹션들로 lorebook 원문 생성"""
+    return "\n\n".join(f"## {name}\n" + f"{name} 설명 문장. " * 40 for name in names)
+
+
+class TestIncrementalIngestion:
+    """ingest_lorebook 테스트"""
+
+    @pytest.fixture
+    def vectorstore(self):
+        return InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+
+    @pytest.fixture
+    def docstore(self, tmp_path):
+        return SQLiteDocStore(tmp_path / "docs.sqlite3")
+
+    @pytest.fixture
+    def lorebook(self, tmp_path):
+        path = tmp_path / "Skyrim.md"
+        path.write_text(_sections("화이트런", "윈드헬름", "솔리튜드"), encoding="utf-8")
+        return path
+
+    def test_parent_ids_are_stable(self):
+        """같은 원문은 항상 같은 ID를 받는지 테스트"""
+        text = _sections("화이트런", "윈드헬름")
+
+        first = [doc.id for doc in split_into_parents(text, "Skyrim.md")]
+        second = [doc.id for doc in split_into_parents(text, "Skyrim.md")]
+
+        assert first == second
+        assert len(set(first)) == len(first)
+        assert parent_id("A.md", "x") != parent_id("B.md", "x")
+
+    def test_first_ingestion_adds_all(self, lorebook, vectorstore, docstore):
+        report = ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+
+        assert report.added == len(docstore) > 0
+        assert report.unchanged == report.deleted == 0
+        assert report.child_chunks == len(vectorstore.store)
+
+    def test_rerun_skips_unchanged(self, lorebook, vectorstore, docstore):
+        """변경 없는 재실행은 임베딩을 하지 않는지 테스트"""
+        first = ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+        children_before = set(vectorstore.store)
+
+        second = ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+
+        assert second.added == second.deleted == second.child_chunks == 0
+        assert second.unchanged == first.added
+        assert set(vectorstore.store) == children_before
+
+    def test_changed_section_is_replaced(self, lorebook, vectorstore, docstore):
+        """바뀐 섹션만 교체되고 사라진 청크는 두 저장소에서 삭제되는지 테스트"""
+        ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+        lorebook.write_text(_sections("화이트런", "리치"), encoding="utf-8")
+
+        report = ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+
+        assert report.added > 0
+        assert report.deleted > 0
+        assert report.unchanged > 0
+
+        stored_ids = set(docstore.yield_keys())
+        expected_ids = {doc.id for doc in split_into_parents(
+            lorebook.read_text(encoding="utf-8"), "Skyrim.md", chunk_size=600
+        )}
+        assert stored_ids == expected_ids
+
+        child_parents = {v["metadata"][ID_KEY] for v in vectorstore.store.values()}
+        assert child_parents == expected_ids
+
+    def test_other_sources_are_untouched(self, tmp_path, lorebook, vectorstore, docstore):
+        """다른 lorebook의 청크는 삭제하지 않는지 테스트"""
+        other = tmp_path / "Morrowind.md"
+        other.write_text(_sections("발렌우드"), encoding="utf-8")
+        ingest_lorebook(other, vectorstore, docstore, parent_chunk_size=600)
+        other_ids = set(docstore.yield_keys())
+
+        ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+
+        assert other_ids <= set(docstore.yield_keys())
+
+    def test_legacy_parents_are_replaced(self, lorebook, vectorstore, docstore):
+        """source 메타데이터가 없는 이전 청크는 교체 대상인지 테스트"""
+        docstore.mset([("legacy-uuid", Document(page_content="예전 청크"))])
+        vectorstore.add_documents(
+            [Document(page_content="예전 자식", metadata={ID_KEY: "legacy-uuid"})],
+            ids=["legacy-child"],
+        )
+
+        report = ingest_lorebook(lorebook, vectorstore, docstore, parent_chunk_size=600)
+
+        assert report.deleted == 1
+        assert "legacy-uuid" not in set(docstore.yield_keys())
+
+
+class TestWriteChildren:
+    """write_children 배치 임베딩 테스트"""
+
+    def test_batches_and_reports_timing(self, tmp_path):
+        path = tmp_path / "Skyrim.md"
+        path.write_text(_sections("화이트런", "윈드헬름"), encoding="utf-8")
+        children = split_lorebook(path, parent_chunk_size=600).children
+        vectorstore = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+        batches = []
+
+        write_children(
+            vectorstore,
+            children,
+            batch_size=3,
+            on_batch=lambda size, seconds: batches.append((size, seconds)),
+        )
+
+        assert sum(n for n, _ in batches) == len(children)
+        assert all(n <= 3 for n, _ in batches)
+        assert all(s >= 0 for _, s in batches)
+        assert set(vectorstore.store) == {child.id for child in children}
+
+    def test_chroma_collection_upsert(self):
+        """Chroma는 임베딩을 직접 계산해 컬렉션에 upsert하는지 테스트"""
+        vectorstore = MagicMock()
+        vectorstore.embeddings.embed_documents.side_effect = lambda texts: [[0.0]] * len(texts)
+        children = [
+            Document(id=f"p-{i}", page_content=f"청크 {i}", metadata={ID_KEY: "p"})
+            for i in range(5)
+        ]
+
+        write_children(vectorstore, children, batch_size=2)
+
+        assert vectorstore.embeddings.embed_documents.call_count == 3
+        assert vectorstore._collection.upsert.call_count == 3
+        vectorstore.add_documents.assert_not_called()
+        first = vectorstore._collection.upsert.call_args_list[0].kwargs
+        assert first["ids"] == ["p-0", "p-1"]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            write_children(MagicMock(), [], batch_size=0)
+
+
+class TestIngestCli:
+    """일괄 적재 CLI 테스트"""
+
+    @pytest.fixture
+    def lorebook_dir(self, tmp_path):
+        directory = tmp_path / "lorebooks"
+        directory.mkdir()
+        (directory / "Skyrim.md").write_text(_sections("화이트런", "윈드헬름"), encoding="utf-8")
+        (directory / "Morrowind.md").write_text(_sections("발렌우드"), encoding="utf-8")
+        (directory / "notes.txt").write_text("무시", encoding="utf-8")
+        return directory
+
+    def test_resolve_directory_and_glob(self, lorebook_dir):
+        assert [p.name for p in resolve_lorebooks(str(lorebook_dir))] == [
+            "Morrowind.md",
+            "Skyrim.md",
+        ]
+        assert [p.name for p in resolve_lorebooks(str(lorebook_dir / "Sky*.md"))] == [
+            "Skyrim.md"
+        ]
+
+    def test_process_pool_matches_serial(self, lorebook_dir):
+        """프로세스 풀 분할 결과가 직렬 분할과 같은지 테스트"""
+        paths = resolve_lorebooks(str(lorebook_dir))
+
+        serial = split_lorebooks(paths, workers=1, parent_chunk_size=600)
+        parallel = split_lorebooks(paths, workers=2, parent_chunk_size=600)
+
+        assert [[c.id for c in s.children] for s in serial] == [
+            [c.id for c in s.children] for s in parallel
+        ]
+
+    def test_ingest_command(self, tmp_path, lorebook_dir):
+        vectorstore = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+        docstore_path = tmp_path / "docs.sqlite3"
+
+        with patch("src.utils.ingest_cli.create_vectorstore", return_value=vectorstore):
+            result = CliRunner().invoke(
+                app,
+                [
+                    str(lorebook_dir),
+                    "--workers", "1",
+                    "--batch-size", "4",
+                    "--parent-chunk-size", "600",
+                    "--docstore-path", str(docstore_path),
+                    "--lexical-index-path", str(tmp_path / "bm25.json"),
+                    "--gazetteer-path", str(tmp_path / "entities.json"),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "docs/s" in result.output
+        assert "chunks/s" in result.output
+        assert "임베딩" in result.output and "ms" in result.output
+        assert len(SQLiteDocStore(docstore_path)) > 0
+        assert len(vectorstore.store) > 0
+        assert len(BM25Index.load(tmp_path / "bm25.json")) == len(SQLiteDocStore(docstore_path))
+        assert (tmp_path / "entities.json").exists()
+
+    def test_no_lorebooks(self, tmp_path):
+        result = CliRunner().invoke(app, [str(tmp_path / "missing*.md")])
+
+        assert result.exit_code == 1
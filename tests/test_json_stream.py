@@ -0,0 +1,80 @@
+"""스트리밍 JSON 필드 파서 테스트"""
+
+import json
+
+import pytest
+
+from src.utils.json_stream import FieldDelta, StreamingJSONParser
+
+SAMPLE = {
+    "title": '용사 "영웅"',
+    "notes": {"tags": ["}", "{"], "count": 2},
+    "story": "첫 줄\n둘째 줄 \\ 끝 😀 é\t탭",
+    "word_count": 12,
+}
+
+
+def _feed_all(parser: StreamingJSONParser, text: str, size: int) -> list[FieldDelta]:
+    deltas = []
+    for start in range(0, len(text), size):
+        deltas.extend(parser.feed(text[start : start + size]))
+    return deltas
+
+
+class TestStreamingJSONParser:
+    """StreamingJSONParser 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_decodes_fields_for_any_chunking(self, size, ensure_ascii):
+        """청크 경계와 이스케이프 방식에 관계없이 필드 값을 정확히 복원하는지 테스트"""
+        text = json.dumps(SAMPLE, ensure_ascii=ensure_ascii)
+        parser = StreamingJSONParser()
+
+        deltas = _feed_all(parser, text, size)
+
+        assert parser.values == {"title": SAMPLE["title"], "story": SAMPLE["story"]}
+        assert "".join(d.text for d in deltas if d.field == "story") == SAMPLE["story"]
+        assert parser.done is True
+
+    def test_emits_as_tokens_arrive(self):
+        """값이 끝나기 전에도 도착한 글자를 바로 내보내는지 테스트"""
+        parser = StreamingJSONParser(fields=("story",))
+
+        assert parser.feed('{"story": "옛날') == [FieldDelta("story", "옛날")]
+        assert parser.feed(" 옛적에") == [FieldDelta("story", " 옛적에")]
+        assert parser.done is False
+
+    def test_merges_consecutive_characters(self):
+        parser = StreamingJSONParser()
+        deltas = parser.feed('{"title": "t", "story": "abc"}')
+        assert deltas == [FieldDelta("title", "t"), FieldDelta("story", "abc")]
+
+    def test_ignores_prefix_and_trailing_text(self):
+        """코드 블록 표시와 객체 뒤의 텍스트를 무시하는지 테스트"""
+        parser = StreamingJSONParser()
+
+        parser.feed('```json\n{"story": "본문"}\n```\n추가 설명')
+
+        assert parser.done is True
+        assert parser.text.endswith('"}')
+        assert json.loads(parser.text.split("```json")[1]) == {"story": "본문"}
+
+    def test_nested_keys_are_not_streamed(self):
+        """중첩 객체 안의 같은 이름 필드는 스트리밍하지 않는지 테스트"""
+        parser = StreamingJSONParser()
+
+        parser.feed('{"meta": {"story": "가짜"}, "story": "진짜"}')
+
+        assert parser.values == {"story": "진짜"}
+
+    def test_non_string_values_are_skipped(self):
+        parser = StreamingJSONParser()
+        parser.feed('{"title": null, "story": "본문"}')
+        assert parser.values == {"story": "본문"}
+
+    def test_feed_after_done_returns_nothing(self):
+        parser = StreamingJSONParser()
+        parser.feed('{"story": "a"}')
+        assert parser.feed('{"story": "b"}') == []
+        assert parser.text == '{"story": "a"}'
@@ -0,0 +1,105 @@
+"""BM25 어휘 검색 인덱스 테스트"""
+
+import pytest
+from langchain_core.documents import Document
+
+from src.utils.docstore import SQLiteDocStore
+from src.utils.lexical_index import (
+    BM25Index,
+    build_lexical_index,
+    char_ngrams,
+    reciprocal_rank_fusion,
+)
+
+DOCUMENTS = [
+    ("whiterun", "화이트런은 스카이림 중앙의 영지로, 드래곤즈리치 성이 있다."),
+    ("windhelm", "윈드헬름은 울프릭 스톰클로크가 다스리는 이스트마치의 수도다."),
+    ("dragons", "블러드 드래곤은 고대 드래곤의 한 종류로 화이트런 근처에도 나타난다."),
+]
+
+
+class TestCharNgrams:
+    """글자 n-gram 토큰화 테스트"""
+
+    def test_korean_bigrams(self):
+        assert char_ngrams("화이트런") == ["화이", "이트", "트런"]
+
+    def test_particles_still_share_bigrams(self):
+        """조사가 붙어도 같은 n-gram을 공유하는지 테스트"""
+        assert set(char_ngrams("화이트런")) <= set(char_ngrams("화이트런의"))
+
+    def test_normalizes_case_and_short_words(self):
+        assert char_ngrams("Jarl 용") == ["ja", "ar", "rl", "용"]
+
+    def test_ignores_punctuation(self):
+        assert char_ngrams("...!?") == []
+
+
+class TestBM25Index:
+    """BM25Index 테스트"""
+
+    @pytest.fixture
+    def index(self):
+        return BM25Index.build(DOCUMENTS)
+
+    def test_exact_entity_ranks_first(self, index):
+        hits = index.search("윈드헬름")
+
+        assert hits[0].doc_id == "windhelm"
+        assert hits[0].coverage == 1.0
+
+    def test_ranking_by_term_frequency(self, index):
+        hits = index.search("화이트런")
+
+        assert {hit.doc_id for hit in hits} == {"whiterun", "dragons"}
+        assert hits[0].score >= hits[1].score
+
+    def test_partial_match_has_low_coverage(self, index):
+        hits = index.search("윈드헬름의 역사와 솔리튜드")
+
+        assert hits[0].doc_id == "windhelm"
+        assert hits[0].coverage < 0.8
+
+    def test_no_match(self, index):
+        assert index.search("솔스타임") == []
+        assert BM25Index().search("화이트런") == []
+
+    def test_k_limits_results(self, index):
+        assert len(index.search("화이트런 드래곤", k=1)) == 1
+
+    def test_save_and_load(self, index, tmp_path):
+        path = tmp_path / "bm25.json"
+        index.save(path)
+
+        loaded = BM25Index.load(path)
+
+        assert len(loaded) == 3
+        assert loaded.search("블러드 드래곤") == index.search("블러드 드래곤")
+
+    def test_load_rejects_unknown_version(self, index, tmp_path):
+        path = tmp_path / "bm25.json"
+        path.write_text('{"version": 999}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            BM25Index.load(path)
+
+    def test_build_from_docstore(self, tmp_path):
+        store = SQLiteDocStore(tmp_path / "docs.sqlite3")
+        store.mset([(doc_id, Document(page_content=text)) for doc_id, text in DOCUMENTS])
+
+        index = build_lexical_index(store)
+
+        assert len(index) == 3
+        assert index.search("울프릭")[0].doc_id == "windhelm"
+
+
+class TestReciprocalRankFusion:
+    """RRF 결합 테스트"""
+
+    def test_shared_documents_rank_higher(self):
+        a, b, c = (Document(page_content=t) for t in ("a", "b", "c"))
+
+        fused = reciprocal_rank_fusion([[a, b], [c, b]], k=3)
+
+        assert fused[0].page_content == "b"
+        assert len(fused) == 3
@@ -0,0 +1,98 @@
+"""LLM 응답 캐시 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.utils.llm_cache import (
+    LLMResponseCache,
+    cache_allowed,
+    is_deterministic,
+    llm_identity,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_entries=10)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def llm():
+    return SimpleNamespace(model="test-model", temperature=0, seed=None)
+
+
+@pytest.fixture
+def messages():
+    return [SystemMessage(content="시스템"), HumanMessage(content="용사 이야기")]
+
+
+class TestCachePolicy:
+    """캐시 허용 정책 테스트"""
+
+    @pytest.mark.parametrize(
+        ("temperature", "seed", "expected"),
+        [
+            (0, None, True),
+            (0.0, None, True),
+            (None, 42, True),
+            (0.8, None, False),
+            (None, None, False),
+        ],
+    )
+    def test_is_deterministic(self, temperature, seed, expected):
+        llm = SimpleNamespace(temperature=temperature, seed=seed)
+        assert is_deterministic(llm) is expected
+
+    def test_policies(self):
+        sampling = SimpleNamespace(temperature=0.8, seed=None)
+        assert cache_allowed("always", sampling) is True
+        assert cache_allowed("deterministic", sampling) is False
+        assert cache_allowed("never", SimpleNamespace(temperature=0)) is False
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            cache_allowed("sometimes", SimpleNamespace())
+
+    def test_identity_requires_model_name(self):
+        assert llm_identity(SimpleNamespace()) is None
+        assert llm_identity(SimpleNamespace(model="m"))["model"] == "m"
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 저장/조회 테스트"""
+
+    def test_round_trip_with_tool_calls(self, cache, llm, messages):
+        """tool call을 포함한 응답이 그대로 복원되는지 테스트"""
+        key = cache.make_key(llm, messages)
+        message = AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "search_lorebook", "args": {"query": "화이트런"}, "id": "1"}
+            ],
+        )
+
+        cache.set(key, message)
+
+        assert cache.get(key) == message
+        assert cache.stats().hits == 1
+
+    def test_key_depends_on_messages_options_and_tools(self, llm, messages):
+        key = LLMResponseCache.make_key(llm, messages)
+
+        assert key == LLMResponseCache.make_key(llm, list(messages))
+        assert key != LLMResponseCache.make_key(llm, messages[:1])
+        assert key != LLMResponseCache.make_key(
+            SimpleNamespace(model="other-model", temperature=0, seed=None), messages
+        )
+        assert key != LLMResponseCache.make_key(llm, messages, tools=[{"name": "t"}])
+
+    def test_unknown_model_has_no_key(self, messages):
+        assert LLMResponseCache.make_key(SimpleNamespace(), messages) is None
+
+    def test_miss(self, cache):
+        assert cache.get("없는 키") is None
+        assert cache.stats().misses == 1
@@ -0,0 +1,138 @@
+"""LorePrefetcher 테스트"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.documents import Document
+
+from src.agents.lore_prefetcher import LorePrefetcher
+from src.schemas.state import GraphState, RefinedRequest
+from src.utils.gazetteer import Gazetteer
+
+
+class TestLorePrefetcher:
+    """LorePrefetcher 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def gazetteer(self):
+        """테스트용 개체명 사전"""
+        gazetteer = Gazetteer()
+        gazetteer.add("화이트런", "Whiterun", "whiterun")
+        gazetteer.add("블러드 드래곤", "Blood Dragon", "dragons")
+        with patch("src.agents.lore_prefetcher.get_gazetteer", return_value=gazetteer):
+            yield gazetteer
+
+    @pytest.fixture
+    def prefetcher(self):
+        return LorePrefetcher(max_queries=3, max_docs=3)
+
+    def _state(self, prompt: str) -> GraphState:
+        return GraphState(request=RefinedRequest(summarized_prompt=prompt))
+
+    def test_extract_queries_entities_then_prompt(self, prefetcher):
+        """요청에 등장하는 개체가 먼저, 요청 문장이 마지막 검색어인지 테스트"""
+        prompt = "블러드 드래곤이 화이트런을 습격하는 이야기"
+
+        queries = prefetcher.extract_queries(RefinedRequest(summarized_prompt=prompt))
+
+        assert queries == ["블러드 드래곤", "화이트런", prompt]
+
+    def test_extract_queries_respects_limit(self):
+        prefetcher = LorePrefetcher(max_queries=2)
+        prompt = "블러드 드래곤이 화이트런을 습격하는 이야기"
+
+        queries = prefetcher.extract_queries(RefinedRequest(summarized_prompt=prompt))
+
+        assert queries == ["블러드 드래곤", prompt]
+
+    def test_empty_request_skips_search(self, prefetcher):
+        with patch("src.agents.lore_prefetcher.retrieve_documents_batch") as batch:
+            update = prefetcher(self._state(""), None)
+
+        batch.assert_not_called()
+        assert update == {}
+
+    def test_call_batches_and_dedupes(self, prefetcher):
+        """한 번의 배치 검색 후 중복 문서를 제거하는지 테스트"""
+        shared = Document(page_content="화이트런 자료")
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            return_value=[[shared], [shared, Document(page_content="습격 자료")]],
+        ) as batch:
+            update = prefetcher(self._state("화이트런 습격"), None)
+
+        batch.assert_called_once_with(["화이트런", "화이트런 습격"])
+        assert [(s.query, s.content) for s in update["prefetched_lore"]] == [
+            ("화이트런", "화이트런 자료"),
+            ("화이트런 습격", "습격 자료"),
+        ]
+
+    def test_results_are_recorded_in_memo(self, prefetcher):
+        """사전 검색 결과가 실행 단위 검색 메모에 기록되는지 테스트"""
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            return_value=[[Document(page_content="화이트런 자료")], []],
+        ):
+            update = prefetcher(self._state("화이트런 습격"), None)
+
+        memo = update["retrieval_memo"]
+        assert memo.recall("화이트런") == ["화이트런 자료"]
+        assert memo.recall("화이트런 습격") == []
+        assert memo.records["화이트런"].used_by == ["LorePrefetcher"]
+
+    def test_input_memo_is_not_mutated(self, prefetcher):
+        """입력 상태의 메모는 바꾸지 않고 새 메모를 업데이트로 반환하는지 테스트"""
+        state = self._state("화이트런 습격")
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            return_value=[[Document(page_content="화이트런 자료")], []],
+        ):
+            update = prefetcher(state, None)
+
+        assert update["retrieval_memo"] is not state.retrieval_memo
+        assert state.retrieval_memo.records == {}
+        assert state.retrieval_memo.misses == 0
+
+    def test_max_docs(self, prefetcher):
+        docs = [Document(page_content=str(i)) for i in range(5)]
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch", return_value=[docs]
+        ):
+            update = prefetcher(self._state("모험 이야기"), None)
+
+        assert len(update["prefetched_lore"]) == 3
+
+    def test_search_failure_keeps_running(self, prefetcher):
+        """검색 실패 시 예외 없이 빈 자료로 진행하는지 테스트"""
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            side_effect=RuntimeError("retriever 로드 실패"),
+        ):
+            update = prefetcher(self._state("모험 이야기"), None)
+
+        assert "prefetched_lore" not in update
+
+    def test_gazetteer_failure_falls_back_to_prompt(self, prefetcher):
+        """개체명 사전 로드 실패 시 요청 문장만으로 사전 검색을 계속하는지 테스트"""
+        with patch(
+            "src.agents.lore_prefetcher.get_gazetteer",
+            side_effect=FileNotFoundError("split_parents_entities.json"),
+        ), patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            return_value=[[Document(page_content="자료")]],
+        ) as batch:
+            update = prefetcher(self._state("화이트런 이야기"), None)
+
+        batch.assert_called_once_with(["화이트런 이야기"])
+        assert update["prefetched_lore"][0].content == "자료"
+
+    def test_acall(self, prefetcher):
+        with patch(
+            "src.agents.lore_prefetcher.retrieve_documents_batch",
+            return_value=[[Document(page_content="자료")]],
+        ):
+            update = asyncio.run(prefetcher.acall(self._state("모험 이야기"), None))
+
+        assert update["prefetched_lore"][0].content == "자료"
+
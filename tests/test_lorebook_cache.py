@@ -0,0 +1,159 @@
+"""Lorebook 검색 캐시 테스트"""
+
+import time
+
+import pytest
+from langchain_core.documents import Document
+
+from src.utils.cache import SQLiteCache
+from src.utils.lorebook_cache import (
+    LorebookFingerprint,
+    LorebookQueryCache,
+    normalize_query,
+)
+
+
+@pytest.fixture
+def lorebook_env(tmp_path):
+    """임시 lorebook / chroma_db 디렉토리"""
+    lorebook_dir = tmp_path / "lorebooks"
+    lorebook_dir.mkdir()
+    (lorebook_dir / "world.md").write_text("# 화이트런\n스카이림의 중심", encoding="utf-8")
+    persist_dir = tmp_path / "chroma_db"
+    persist_dir.mkdir()
+    (persist_dir / "chroma.sqlite3").write_bytes(b"v1")
+    return lorebook_dir, persist_dir
+
+
+def make_fingerprint(lorebook_env) -> LorebookFingerprint:
+    lorebook_dir, persist_dir = lorebook_env
+    return LorebookFingerprint(
+        lorebook_dir=lorebook_dir,
+        persist_directory=persist_dir,
+        docstore_path=None,
+        check_interval=0.0,
+    )
+
+
+class TestNormalizeQuery:
+    """normalize_query 테스트"""
+
+    def test_collapses_whitespace_and_case(self):
+        assert normalize_query("  Whiterun   HOLD ") == "whiterun hold"
+
+    def test_unicode_nfc(self):
+        """NFD로 분해된 한글도 같은 키가 되는지 테스트"""
+        import unicodedata
+
+        decomposed = unicodedata.normalize("NFD", "화이트런")
+        assert normalize_query(decomposed) == normalize_query("화이트런")
+
+
+class TestLorebookQueryCache:
+    """LorebookQueryCache 테스트"""
+
+    def test_miss_then_memory_hit(self, lorebook_env):
+        cache = LorebookQueryCache({"model": "m"}, fingerprint=make_fingerprint(lorebook_env))
+        docs = [Document(page_content="화이트런", metadata={"doc_id": "1"})]
+
+        assert cache.get("화이트런") is None
+        cache.set("화이트런", docs)
+
+        assert cache.get("화이트런 ") == docs
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.memory_hits == 1
+
+    def test_retriever_config_is_part_of_key(self, lorebook_env):
+        fingerprint = make_fingerprint(lorebook_env)
+        cache_a = LorebookQueryCache({"model": "a"}, fingerprint=fingerprint)
+        cache_b = LorebookQueryCache({"model": "b"}, fingerprint=fingerprint)
+
+        assert cache_a._make_key("q") != cache_b._make_key("q")
+
+    def test_disk_tier_survives_new_instance(self, lorebook_env, tmp_path):
+        disk_path = tmp_path / "cache" / "queries.sqlite3"
+        docs = [Document(page_content="드래곤본", metadata={"doc_id": "2"})]
+
+        first = LorebookQueryCache(
+            {"model": "m"}, disk_path=disk_path, fingerprint=make_fingerprint(lorebook_env)
+        )
+        first.set("드래곤본", docs)
+
+        second = LorebookQueryCache(
+            {"model": "m"}, disk_path=disk_path, fingerprint=make_fingerprint(lorebook_env)
+        )
+        assert second.get("드래곤본") == docs
+        assert second.stats().disk_hits == 1
+
+    def test_lorebook_change_invalidates(self, lorebook_env):
+        lorebook_dir, _ = lorebook_env
+        cache = LorebookQueryCache({"model": "m"}, fingerprint=make_fingerprint(lorebook_env))
+        cache.set("화이트런", [Document(page_content="old")])
+
+        (lorebook_dir / "world.md").write_text("# 화이트런\n바뀐 내용", encoding="utf-8")
+
+        assert cache.get("화이트런") is None
+        assert cache.stats().invalidations == 1
+
+    def test_chroma_db_change_invalidates(self, lorebook_env, tmp_path):
+        _, persist_dir = lorebook_env
+        disk_path = tmp_path / "queries.sqlite3"
+        cache = LorebookQueryCache(
+            {"model": "m"}, disk_path=disk_path, fingerprint=make_fingerprint(lorebook_env)
+        )
+        cache.set("화이트런", [Document(page_content="old")])
+
+        (persist_dir / "chroma.sqlite3").write_bytes(b"version-2")
+
+        assert cache.get("화이트런") is None
+        assert len(cache._disk) == 0
+
+    def test_ttl_expires_entries(self, lorebook_env):
+        cache = LorebookQueryCache(
+            {"model": "m"}, ttl=0.01, fingerprint=make_fingerprint(lorebook_env)
+        )
+        cache.set("q", [Document(page_content="x")])
+        time.sleep(0.02)
+
+        assert cache.get("q") is None
+
+
+class TestSQLiteCache:
+    """SQLiteCache 테스트"""
+
+    def test_set_get(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite3")
+        cache.set("k", "v")
+
+        assert cache.get("k") == "v"
+        assert cache.get("missing") is None
+
+    def test_max_entries_evicts_least_recently_accessed(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite3", max_entries=2)
+        cache.set("a", "1")
+        time.sleep(0.01)
+        cache.set("b", "2")
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_tag_mismatch_is_miss(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite3")
+        cache.set("k", "v", tag="v1")
+
+        assert cache.get("k", tag="v2") is None
+        assert cache.get("k", tag="v1") is None  # 불일치 시 삭제됨
+
+    def test_purge_except(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "c.sqlite3")
+        cache.set("a", "1", tag="old")
+        cache.set("b", "2", tag="new")
+
+        assert cache.purge_except("new") == 1
+        assert cache.get("b") == "2"
@@ -1,13 +1,22 @@
 """UserRequestParser 테스트"""
 
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.messages import AIMessage
 
-from src.agents.request_parser import RequestParserError, UserRequestParser
+from src.agents.request_parser import (
+    RequestParserError,
+    UserRequestParser,
+    configure_request_cache,
+    get_fast_path_stats,
+    reset_fast_path_stats,
+)
 from src.schemas.state import GraphState, RefinedRequest
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.semantic_cache import SemanticCache
 
 
 class TestUserRequestParser:
@@ -203,9 +212,9 @@ class TestUserRequestParserIntegration:
 
             result = parser(state, runtime=None)
 
-            assert result.request is not None
-            assert result.request.summarized_prompt == "드래곤과 마법사의 대결 이야기"
-            assert result.request.genre == "판타지"
+            assert result["request"] is not None
+            assert result["request"].summarized_prompt == "드래곤과 마법사의 대결 이야기"
+            assert result["request"].genre == "판타지"
 
     def test_call_fallback_on_invalid_json(self, mock_llm):
         """잘못된 JSON 시 폴백 테스트"""
@@ -224,6 +233,298 @@ class TestUserRequestParserIntegration:
             result = parser(state, runtime=None)
 
             # 폴백으로 원본 입력 사용
-            assert result.request is not None
-            assert result.request.summarized_prompt == "테스트 입력"
-            assert result.request.genre == "판타지"  # 기본값
+            assert result["request"] is not None
+            assert result["request"].summarized_prompt == "테스트 입력"
+            assert result["request"].genre == "판타지"  # 기본값
+
+    def test_acall_success(self, mock_llm):
+        """비동기 호출 성공 테스트"""
+        parser = UserRequestParser(llm=mock_llm)
+        state = GraphState(user_input="드래곤과 마법사 이야기")
+
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.ainvoke = AsyncMock(
+                return_value=AIMessage(
+                    content=json.dumps({"summarized_prompt": "드래곤 이야기"})
+                )
+            )
+
+            mock_prompt = MagicMock()
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            mock_template.from_messages.return_value = mock_prompt
+
+            result = asyncio.run(parser.acall(state, runtime=None))
+
+            assert result["request"].summarized_prompt == "드래곤 이야기"
+            mock_chain.invoke.assert_not_called()
+
+    def test_acall_fallback_on_invalid_json(self, mock_llm):
+        """비동기 호출: 잘못된 JSON 시 폴백 테스트"""
+        parser = UserRequestParser(llm=mock_llm)
+        state = GraphState(user_input="테스트 입력")
+
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            mock_chain = MagicMock()
+            mock_chain.ainvoke = AsyncMock(return_value=AIMessage(content="잘못된 응답"))
+
+            mock_prompt = MagicMock()
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            mock_template.from_messages.return_value = mock_prompt
+
+            result = asyncio.run(parser.acall(state, runtime=None))
+
+            assert result["request"].summarized_prompt == "테스트 입력"
+            assert mock_chain.ainvoke.await_count == parser.MAX_RETRIES + 1
+
+
+class TestUserRequestParserLLMCache:
+    """UserRequestParser LLM 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def parser(self, tmp_path):
+        llm = MagicMock()
+        llm.model = "test-model"
+        llm.temperature = 0
+        parser = UserRequestParser(llm=llm)
+        parser.llm_cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+        yield parser
+        parser.llm_cache.close()
+
+    @pytest.fixture
+    def mock_chain(self):
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            chain = MagicMock()
+            mock_prompt = MagicMock()
+            mock_prompt.__or__ = MagicMock(return_value=chain)
+            mock_template.from_messages.return_value = mock_prompt
+            yield chain
+
+    def test_same_input_calls_model_once(self, parser, mock_chain):
+        """결정적인 모델은 같은 입력에 모델을 한 번만 호출하는지 테스트"""
+        mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+        state = GraphState(user_input="드래곤 이야기")
+
+        first = parser(state, runtime=None)
+        second = parser(state, runtime=None)
+
+        assert first == second
+        assert mock_chain.invoke.call_count == 1
+
+    def test_sampling_model_is_not_cached(self, parser, mock_chain):
+        """temperature가 0이 아니고 seed가 없으면 분석 결과를 캐시하지 않는지 테스트"""
+        parser.llm.temperature = 0.8
+        parser.llm.seed = None
+        mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+        state = GraphState(user_input="드래곤 이야기")
+
+        parser(state, runtime=None)
+        parser(state, runtime=None)
+
+        assert mock_chain.invoke.call_count == 2
+        assert len(parser.llm_cache) == 0
+
+    def test_failed_parse_is_not_cached(self, parser, mock_chain):
+        """파싱에 실패한 응답은 저장하지 않아 재시도가 모델을 다시 호출하는지 테스트"""
+        mock_chain.invoke.side_effect = [
+            AIMessage(content="잘못된 응답"),
+            AIMessage(content='{"summarized_prompt": "p"}'),
+        ]
+
+        result = parser(GraphState(user_input="드래곤 이야기"), runtime=None)
+
+        assert result["request"].summarized_prompt == "p"
+        assert mock_chain.invoke.call_count == 2
+        assert len(parser.llm_cache) == 1
+
+    def test_acall_shares_cache_with_call(self, parser, mock_chain):
+        """동기 실행이 저장한 응답을 비동기 실행이 재사용하는지 테스트"""
+        mock_chain.invoke.return_value = AIMessage(content='{"summarized_prompt": "p"}')
+        mock_chain.ainvoke = AsyncMock()
+        state = GraphState(user_input="드래곤 이야기")
+
+        first = parser(state, runtime=None)
+        second = asyncio.run(parser.acall(state, runtime=None))
+
+        assert first == second
+        mock_chain.ainvoke.assert_not_called()
+
+
+class TestUserRequestParserSemanticCache:
+    """UserRequestParser 의미 기반 요청 캐시 테스트"""
+
+    @pytest.fixture
+    def parser(self):
+        parser = UserRequestParser(llm=MagicMock())
+        parser.request_cache = SemanticCache(threshold=0.9)
+        return parser
+
+    @pytest.fixture
+    def mock_chain(self):
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            chain = MagicMock()
+            chain.invoke.return_value = AIMessage(
+                content='{"summarized_prompt": "드래곤과 싸우는 용사", "genre": "판타지"}'
+            )
+            mock_prompt = MagicMock()
+            mock_prompt.__or__ = MagicMock(return_value=chain)
+            mock_template.from_messages.return_value = mock_prompt
+            yield chain
+
+    @pytest.fixture
+    def embed(self):
+        vectors = {
+            "용사가 드래곤과 싸우는 이야기": [1.0, 0.0],
+            "용사가 용과 싸우는 이야기": [0.98, 0.1],
+            "화이트런을 지키는 경비병 이야기": [0.6, 0.8],
+            "솔리튜드를 지키는 경비병 이야기": [0.61, 0.79],
+        }
+        with patch(
+            "src.agents.request_parser.embed_text_if_ready",
+            side_effect=lambda text: vectors.get(text, [0.0, 1.0]),
+        ) as mock_embed:
+            yield mock_embed
+
+    def test_paraphrase_reuses_request(self, parser, mock_chain, embed):
+        """임베딩이 가까운 요청은 LLM을 호출하지 않고 이전 분석을 사용하는지 테스트"""
+        first = parser(GraphState(user_input="용사가 드래곤과 싸우는 이야기"), runtime=None)
+        second = parser(GraphState(user_input="용사가 용과 싸우는 이야기"), runtime=None)
+
+        assert second["request"].genre == first["request"].genre
+        assert second["request"].style == first["request"].style
+        assert second["request"].length == first["request"].length
+        assert second["request"].summarized_prompt == "용사가 용과 싸우는 이야기"
+        assert mock_chain.invoke.call_count == 1
+        assert parser.request_cache.stats().semantic_hits == 1
+
+    def test_semantic_hit_keeps_current_subject(self, parser, mock_chain, embed):
+        """임베딩이 비슷해도 다른 지명을 말한 요청에 이전 요청의 주제를 쓰지 않는지 테스트"""
+        mock_chain.invoke.return_value = AIMessage(
+            content='{"summarized_prompt": "화이트런 경비병의 하루", "genre": "판타지"}'
+        )
+        parser(GraphState(user_input="화이트런을 지키는 경비병 이야기"), runtime=None)
+
+        result = parser(
+            GraphState(user_input="솔리튜드를 지키는 경비병 이야기"), runtime=None
+        )
+
+        assert result["request"].summarized_prompt == "솔리튜드를 지키는 경비병 이야기"
+        assert "화이트런" not in result["request"].summarized_prompt
+        assert result["request"].genre == "판타지"
+        assert mock_chain.invoke.call_count == 1
+
+    def test_dissimilar_request_calls_llm(self, parser, mock_chain, embed):
+        parser(GraphState(user_input="용사가 드래곤과 싸우는 이야기"), runtime=None)
+        parser(GraphState(user_input="도둑 길드의 음모"), runtime=None)
+
+        assert mock_chain.invoke.call_count == 2
+
+    def test_exact_repeat_skips_embedding(self, parser, mock_chain, embed):
+        """같은 입력은 임베딩도 계산하지 않는지 테스트"""
+        parser(GraphState(user_input="용사가 드래곤과 싸우는 이야기"), runtime=None)
+        embed.reset_mock()
+
+        parser(GraphState(user_input="용사가 드래곤과 싸우는 이야기"), runtime=None)
+
+        embed.assert_not_called()
+        assert mock_chain.invoke.call_count == 1
+
+    def test_exact_match_works_before_embedding_model_loads(self, parser, mock_chain):
+        with patch("src.agents.request_parser.embed_text_if_ready", return_value=None):
+            parser(GraphState(user_input="용사 이야기"), runtime=None)
+            parser(GraphState(user_input="용사 이야기"), runtime=None)
+
+        assert mock_chain.invoke.call_count == 1
+
+    def test_cached_request_is_a_copy(self, parser, mock_chain, embed):
+        """반환한 요청을 수정해도 캐시된 값이 바뀌지 않는지 테스트"""
+        first = parser(GraphState(user_input="용사 이야기"), runtime=None)
+        first["request"].genre = "SF"
+
+        second = parser(GraphState(user_input="용사 이야기"), runtime=None)
+
+        assert second["request"].genre == "판타지"
+
+    def test_shared_cache_is_off_by_default(self, mock_chain):
+        configure_request_cache(enabled=False)
+        parser = UserRequestParser(llm=MagicMock())
+
+        parser(GraphState(user_input="용사 이야기"), runtime=None)
+        parser(GraphState(user_input="용사 이야기"), runtime=None)
+
+        assert mock_chain.invoke.call_count == 2
+
+
+class TestUserRequestParserFastPath:
+    """UserRequestParser 규칙 기반 분석(fast path) 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        reset_fast_path_stats()
+        yield
+        reset_fast_path_stats()
+
+    @pytest.fixture
+    def mock_chain(self):
+        with patch("src.agents.request_parser.ChatPromptTemplate") as mock_template:
+            chain = MagicMock()
+            chain.invoke.return_value = AIMessage(
+                content='{"summarized_prompt": "도둑 길드의 음모", "genre": "미스터리"}'
+            )
+            chain.ainvoke = AsyncMock(return_value=chain.invoke.return_value)
+            mock_prompt = MagicMock()
+            mock_prompt.__or__ = MagicMock(return_value=chain)
+            mock_template.from_messages.return_value = mock_prompt
+            yield chain
+
+    @pytest.fixture
+    def parser(self):
+        return UserRequestParser(llm=MagicMock())
+
+    def test_explicit_keywords_skip_llm(self, parser, mock_chain):
+        """장르/스타일/분량이 명시된 요청은 LLM을 호출하지 않는지 테스트"""
+        result = parser(GraphState(user_input="SF 대본을 짧게 써줘"), runtime=None)
+
+        mock_chain.invoke.assert_not_called()
+        assert result["request"].genre == "SF"
+        assert result["request"].style == "대본"
+        assert result["request"].length == "Short"
+
+    def test_low_confidence_falls_back_to_llm(self, parser, mock_chain):
+        result = parser(GraphState(user_input="도둑 길드의 음모"), runtime=None)
+
+        mock_chain.invoke.assert_called_once()
+        assert result["request"].genre == "미스터리"
+
+    def test_acall_uses_fast_path(self, parser, mock_chain):
+        result = asyncio.run(
+            parser.acall(GraphState(user_input="판타지 소설을 길게"), runtime=None)
+        )
+
+        mock_chain.ainvoke.assert_not_called()
+        assert result["request"].length == "Long"
+
+    def test_disabled_fast_path_always_calls_llm(self, parser, mock_chain):
+        parser.fast_path_min_confidence = None
+
+        parser(GraphState(user_input="SF 대본을 짧게 써줘"), runtime=None)
+
+        mock_chain.invoke.assert_called_once()
+
+    def test_stats_report_fast_path_rate(self, parser, mock_chain):
+        """fast path 비율과 LLM 호출 수가 집계되는지 테스트"""
+        parser(GraphState(user_input="SF 대본을 짧게 써줘"), runtime=None)
+        parser(GraphState(user_input="도둑 길드의 음모"), runtime=None)
+
+        stats = get_fast_path_stats()
+        assert stats.fast_path == 1
+        assert stats.llm == 1
+        assert stats.fast_path_rate == 0.5
+        assert stats.estimated_seconds_saved >= 0.0
+
+    def test_fast_path_result_is_stored_in_request_cache(self, parser, mock_chain):
+        parser.request_cache = SemanticCache()
+
+        parser(GraphState(user_input="SF 대본을 짧게 써줘"), runtime=None)
+
+        assert len(parser.request_cache) == 1
@@ -0,0 +1,129 @@
+"""규칙 기반 요청 분석 테스트"""
+
+import pytest
+
+from src.utils.request_rules import FastPathStats, extract_request
+
+
+class TestExtractRequest:
+    """extract_request 테스트"""
+
+    def test_explicit_keywords_give_full_confidence(self):
+        result = extract_request("판타지 소설을 짧게 써줘")
+
+        assert result.request.genre == "판타지"
+        assert result.request.style == "소설"
+        assert result.request.length == "Short"
+        assert result.confidence == 1.0
+
+    @pytest.mark.parametrize(
+        "user_input, style",
+        [
+            ("SF 시나리오", "대본"),
+            ("짧은 시를 써줘", "시"),
+            ("호러 동화", "동화"),
+        ],
+    )
+    def test_style_keywords(self, user_input, style):
+        assert extract_request(user_input).request.style == style
+
+    def test_si_inside_word_is_not_poem(self):
+        """'도시', '시간'처럼 단어 안의 '시'는 스타일로 보지 않는지 테스트"""
+        result = extract_request("도시의 시간")
+
+        assert result.matched["style"] == []
+        assert result.request.style == "소설"
+
+    def test_keyword_inside_compound_noun_is_ignored(self):
+        """'길고양이'의 '길고'를 분량 키워드로 보지 않는지 테스트"""
+        result = extract_request("길고양이가 등장하는 판타지 동화풍 이야기")
+
+        assert result.matched["length"] == []
+        assert result.request.length == "Medium"
+        assert result.request.style == "동화"
+        assert result.confidence < 1.0
+
+    @pytest.mark.parametrize(
+        "user_input, field",
+        [
+            ("긴장감 넘치는 이야기", "length"),
+            ("시인의 하루", "style"),
+            ("공포영화 같은 이야기", "genre"),
+            ("동시에 일어난 사건", "style"),
+        ],
+    )
+    def test_compound_noun_false_positives(self, user_input, field):
+        """키워드로 시작하지만 다른 단어인 어절은 키워드로 보지 않는지 테스트"""
+        assert extract_request(user_input).matched[field] == []
+
+    @pytest.mark.parametrize(
+        "user_input, genre, style, length",
+        [
+            ("SF소설 단편으로", "SF", "소설", "Short"),
+            ("추리소설을 길게", "미스터리", "소설", "Long"),
+            ("공상과학 동화풍으로 짤막하게", "SF", "동화", "Short"),
+            ("연애 이야기를 적당한 길이로", "로맨스", "소설", "Medium"),
+        ],
+    )
+    def test_keywords_with_particles_and_compounds(
+        self, user_input, genre, style, length
+    ):
+        """조사/어미나 다른 키워드가 붙은 어절의 키워드를 찾는지 테스트"""
+        request = extract_request(user_input).request
+
+        assert (request.genre, request.style, request.length) == (genre, style, length)
+
+    def test_world_term_must_start_a_word(self):
+        """'사용사례'처럼 어절 중간에 있는 세계관 용어로 판타지를 추정하지 않는지 테스트"""
+        assert extract_request("사용사례 정리").confidence < 0.5
+
+    def test_missing_fields_use_parser_defaults(self):
+        result = extract_request("로맨스 이야기")
+
+        assert result.request.style == "소설"
+        assert result.request.length == "Medium"
+        assert result.confidence == pytest.approx(0.8)
+
+    def test_world_terms_infer_fantasy_with_lower_confidence(self):
+        """장르 없이 세계관 용어만 있으면 판타지로 추정하되 신뢰도를 낮추는지 테스트"""
+        result = extract_request("용사 이야기")
+
+        assert result.request.genre == "판타지"
+        assert result.confidence == pytest.approx(0.7)
+
+    def test_no_genre_gives_low_confidence(self):
+        assert extract_request("도둑 길드의 음모").confidence < 0.5
+
+    def test_conflicting_genres_lower_confidence(self):
+        assert extract_request("로맨스 호러").confidence < 0.75
+
+    def test_negation_lowers_confidence(self):
+        """'짧지 않게'처럼 부정 표현이 있으면 신뢰도를 낮추는지 테스트"""
+        assert extract_request("짧지 않게 판타지 소설").confidence < 0.75
+
+    def test_long_input_needs_llm_summary(self):
+        assert extract_request("판타지 소설 " * 50).confidence == 0.0
+
+    def test_summary_collapses_whitespace(self):
+        result = extract_request("  판타지   소설\n짧게 ")
+
+        assert result.request.summarized_prompt == "판타지 소설 짧게"
+
+
+class TestFastPathStats:
+    """FastPathStats 테스트"""
+
+    def test_empty_stats(self):
+        stats = FastPathStats()
+
+        assert stats.fast_path_rate == 0.0
+        assert stats.estimated_seconds_saved == 0.0
+
+    def test_estimated_seconds_saved(self):
+        """평균 LLM 분석 시간에서 fast path 소요 시간을 뺀 값인지 테스트"""
+        stats = FastPathStats(
+            fast_path=3, llm=1, fast_path_seconds=0.01, llm_seconds=2.0
+        )
+
+        assert stats.fast_path_rate == 0.75
+        assert stats.estimated_seconds_saved == pytest.approx(5.99)
@@ -0,0 +1,99 @@
+"""재작성 정책 테스트"""
+
+import pytest
+
+from src.utils.retry_policy import (
+    ConvergencePolicy,
+    RetryPolicy,
+    configure_retry_policy,
+    get_retry_policy,
+    get_retry_stats,
+    record_run,
+    reset_retry_stats,
+)
+
+
+class TestRetryPolicy:
+    """RetryPolicy / ConvergencePolicy 테스트"""
+
+    def test_default_policy_never_stops_early(self):
+        policy = RetryPolicy()
+
+        assert policy.stop_reason([9.5, 9.5, 9.5]) is None
+        assert policy.skip_final_review is False
+
+    def test_good_enough_score_stops(self):
+        policy = ConvergencePolicy(good_enough=8.0)
+
+        assert "충분한 점수" in policy.stop_reason([8.5])
+
+    def test_plateau_stops(self):
+        """최근 patience회 동안 최고 점수가 min_improvement만큼 오르지 않으면 종료하는지 테스트"""
+        policy = ConvergencePolicy(good_enough=None, min_improvement=0.5)
+
+        assert "점수 정체" in policy.stop_reason([6.0, 6.2])
+        assert "점수 정체" in policy.stop_reason([6.0, 5.0])
+
+    def test_improving_scores_continue(self):
+        policy = ConvergencePolicy(good_enough=None, min_improvement=0.5)
+
+        assert policy.stop_reason([5.0]) is None
+        assert policy.stop_reason([5.0, 6.0]) is None
+
+    def test_patience_waits_for_more_reviews(self):
+        policy = ConvergencePolicy(good_enough=None, min_improvement=0.5, patience=2)
+
+        assert policy.stop_reason([6.0, 6.1]) is None
+        assert policy.stop_reason([6.0, 6.1, 6.2]) is not None
+        assert policy.stop_reason([6.0, 6.1, 7.0]) is None
+
+    def test_invalid_patience_raises(self):
+        with pytest.raises(ValueError):
+            ConvergencePolicy(patience=0)
+
+    def test_configure_none_restores_default(self):
+        configure_retry_policy(ConvergencePolicy())
+        try:
+            assert isinstance(get_retry_policy(), ConvergencePolicy)
+        finally:
+            configure_retry_policy(None)
+        assert get_retry_policy() == RetryPolicy()
+
+
+class TestRetryStats:
+    """record_run / RetryStats 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        reset_retry_stats()
+        yield
+        reset_retry_stats()
+
+    def test_early_stop_counts_saved_loops(self):
+        stats = record_run([6.0, 6.2], writes=2, max_writes=5, early_stop=True)
+
+        assert stats.loops_saved == 3
+        assert stats.early_stops == 1
+        assert stats.mean_last_gain == pytest.approx(0.2)
+        assert stats.mean_score_gain == pytest.approx(0.2)
+
+    def test_completed_run_saves_nothing(self):
+        """정책과 무관하게 끝난 실행은 절약 횟수에 포함하지 않는지 테스트"""
+        stats = record_run([4.0, 6.0, 7.0], writes=3, max_writes=3)
+
+        assert stats.loops_saved == 0
+        assert stats.writes == 3
+        assert stats.mean_score_gain == pytest.approx(3.0)
+
+    def test_skipped_review_is_counted(self):
+        record_run([5.0, 6.0], writes=3, max_writes=3, review_skipped=True)
+
+        stats = get_retry_stats()
+        assert stats.reviews_skipped == 1
+        assert "검수 생략 1회" in stats.summary()
+
+    def test_single_score_has_no_gain(self):
+        stats = record_run([7.0], writes=1, max_writes=3)
+
+        assert stats.scored_runs == 0
+        assert stats.mean_score_gain == 0.0
@@ -0,0 +1,446 @@
+"""search_lorebook 도구 테스트"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+
+import src.agents.tools.search_lorebook as search_lorebook_module
+from src.utils.docstore import SQLiteDocStore
+from src.utils.gazetteer import Gazetteer
+from src.utils.lexical_index import build_lexical_index
+from src.agents.tools.search_lorebook import (
+    RetrieverStatus,
+    configure_hybrid_search,
+    configure_query_cache,
+    find_entity_documents,
+    get_query_cache,
+    get_retriever,
+    get_retriever_status,
+    retrieve_documents,
+    retrieve_documents_batch,
+    search_lorebook,
+    search_lorebook_batch,
+    set_eager_warmup,
+    start_retriever_warmup,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_query_cache(monkeypatch):
+    """테스트마다 검색 캐시 초기화 (하이브리드 검색 테스트 외에는 벡터 검색만 사용)"""
+    for name in (
+        "_hybrid_mode",
+        "_min_lexical_coverage",
+        "_lexical_index_path",
+        "_lexical_index",
+        "_gazetteer_path",
+        "_docstore",
+    ):
+        monkeypatch.setattr(search_lorebook_module, name, getattr(search_lorebook_module, name))
+    # 실제 lorebook의 개체명 사전이 Mock retriever보다 먼저 응답하지 않도록 비워 둠
+    monkeypatch.setattr(search_lorebook_module, "_gazetteer", Gazetteer())
+    configure_query_cache()
+    configure_hybrid_search(mode="vector")
+    yield
+
+
+class TestSearchLorebook:
+    """search_lorebook 테스트"""
+
+    @pytest.fixture
+    def mock_retriever(self):
+        """Mock retriever fixture"""
+        retriever = MagicMock()
+        retriever.invoke.return_value = [
+            Document(page_content="화이트런은 스카이림의 중심입니다.")
+        ]
+        with patch(
+            "src.agents.tools.search_lorebook.get_retriever",
+            return_value=retriever,
+        ):
+            yield retriever
+
+    def test_invoke_returns_joined_documents(self, mock_retriever):
+        """동기 검색 결과 포맷 테스트"""
+        result = search_lorebook.invoke({"query": "화이트런"})
+
+        assert "[설정 자료]: 화이트런은 스카이림의 중심입니다." in result
+        mock_retriever.invoke.assert_called_once_with("화이트런")
+
+    def test_invoke_no_results(self, mock_retriever):
+        """검색 결과가 없을 때 테스트"""
+        mock_retriever.invoke.return_value = []
+
+        result = search_lorebook.invoke({"query": "없는 지역"})
+
+        assert result == "관련된 설정을 찾을 수 없습니다."
+
+    def test_ainvoke_runs_retrieval_off_event_loop(self, mock_retriever):
+        """비동기 검색이 이벤트 루프 밖의 스레드에서 실행되는지 테스트"""
+        threads = []
+
+        def record(query):
+            threads.append(threading.current_thread())
+            return [Document(page_content=query)]
+
+        mock_retriever.invoke.side_effect = record
+
+        result = asyncio.run(search_lorebook.ainvoke({"query": "드래곤본"}))
+
+        assert "드래곤본" in result
+        assert threads[0] is not threading.main_thread()
+
+    def test_repeated_query_uses_cache(self, mock_retriever):
+        """같은 검색어(정규화 기준) 반복 시 retriever를 한 번만 호출하는지 테스트"""
+        first = retrieve_documents("화이트런")
+        second = retrieve_documents("  화이트런 ")
+
+        assert first == second
+        mock_retriever.invoke.assert_called_once()
+        stats = get_query_cache().stats()
+        assert stats.memory_hits == 1
+        assert stats.misses == 1
+
+
+class TestSearchLorebookBatch:
+    """배치 검색 테스트"""
+
+    @pytest.fixture
+    def batch_retriever(self):
+        """배치 검색용 Mock retriever (자식 청크 → 부모 문서 구조)"""
+        parents = {
+            "p1": Document(page_content="화이트런 부모 문서"),
+            "p2": Document(page_content="드래곤 부모 문서"),
+        }
+        child_parents = {"화이트런": ["p1"], "드래곤본": ["p2", "p1"], "드래곤": ["p2"]}
+
+        retriever = MagicMock()
+        retriever.id_key = "doc_id"
+        retriever.search_kwargs = {}
+        embeddings = MagicMock(spec=["embed_documents", "embed_query"])
+        embeddings.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        retriever.vectorstore.embeddings = embeddings
+
+        def query(query_embeddings, n_results, include):
+            # 임베딩 값으로 검색어를 역추적할 수 없으므로 호출 순서대로 응답
+            queries = query.pending
+            return {
+                "documents": [[f"child {q}"] * len(child_parents[q]) for q in queries],
+                "metadatas": [[{"doc_id": p} for p in child_parents[q]] for q in queries],
+            }
+
+        retriever.vectorstore._collection.query.side_effect = query
+        retriever.docstore.mget.side_effect = lambda ids: [parents[i] for i in ids]
+
+        with patch(
+            "src.agents.tools.search_lorebook.get_retriever",
+            return_value=retriever,
+        ):
+            yield retriever, query
+
+    def test_batch_embeds_once_and_fetches_shared_parents_once(self, batch_retriever):
+        """배치 임베딩 1회, 벡터 검색 1회, 공유 부모 문서 1회 조회 테스트"""
+        retriever, query = batch_retriever
+        query.pending = ["화이트런", "드래곤본"]
+
+        results = retrieve_documents_batch(["화이트런", "드래곤본"])
+
+        retriever.vectorstore.embeddings.embed_documents.assert_called_once_with(
+            ["화이트런", "드래곤본"]
+        )
+        retriever.vectorstore._collection.query.assert_called_once()
+        retriever.docstore.mget.assert_called_once_with(["p1", "p2"])
+        assert [d.page_content for d in results[0]] == ["화이트런 부모 문서"]
+        assert [d.page_content for d in results[1]] == [
+            "드래곤 부모 문서",
+            "화이트런 부모 문서",
+        ]
+
+    def test_batch_skips_cached_and_duplicate_queries(self, batch_retriever):
+        """캐시된 검색어와 중복 검색어는 다시 임베딩하지 않는지 테스트"""
+        retriever, query = batch_retriever
+        query.pending = ["화이트런"]
+        retrieve_documents_batch(["화이트런"])
+
+        query.pending = ["드래곤"]
+        results = retrieve_documents_batch(["화이트런", "드래곤", "드래곤"])
+
+        last_call = retriever.vectorstore.embeddings.embed_documents.call_args
+        assert last_call.args[0] == ["드래곤"]
+        assert len(results) == 3
+        assert results[1] == results[2]
+
+    def test_batch_tool_marks_shared_documents(self, batch_retriever):
+        """배치 tool 응답에서 공유 문서를 한 번만 포함하는지 테스트"""
+        _, query = batch_retriever
+        query.pending = ["화이트런", "드래곤본"]
+
+        result = search_lorebook_batch.invoke({"queries": ["화이트런", "드래곤본"]})
+
+        assert result.count("화이트런 부모 문서") == 1
+        assert "## 드래곤본" in result
+        assert "'화이트런' 검색 결과와 같은 자료 포함" in result
+
+    def test_query_encode_kwargs_use_public_embed_query(self, batch_retriever):
+        """검색어 전용 인코딩 옵션이 있으면 공개 API embed_query로 임베딩하는지 테스트"""
+        retriever, query = batch_retriever
+        embeddings = MagicMock(
+            spec=["embed_documents", "embed_query", "query_encode_kwargs", "encode_kwargs"]
+        )
+        embeddings.query_encode_kwargs = {"prompt": "query: "}
+        embeddings.encode_kwargs = {}
+        embeddings.embed_query.side_effect = lambda text: [float(len(text))]
+        retriever.vectorstore.embeddings = embeddings
+        query.pending = ["화이트런", "드래곤본"]
+
+        retrieve_documents_batch(["화이트런", "드래곤본"])
+
+        assert embeddings.embed_query.call_count == 2
+        embeddings.embed_documents.assert_not_called()
+
+
+class TestHybridSearch:
+    """BM25 + 벡터 하이브리드 검색 테스트"""
+
+    @pytest.fixture
+    def lexical_setup(self, tmp_path, monkeypatch):
+        """임시 docstore와 BM25 인덱스, 벡터 검색용 Mock retriever"""
+        docstore = SQLiteDocStore(tmp_path / "docs.sqlite3")
+        docstore.mset(
+            [
+                ("whiterun", Document(page_content="화이트런은 스카이림 중앙의 영지다.")),
+                ("windhelm", Document(page_content="윈드헬름은 울프릭이 다스리는 도시다.")),
+            ]
+        )
+        index_path = tmp_path / "bm25.json"
+        build_lexical_index(docstore).save(index_path)
+        monkeypatch.setattr(search_lorebook_module, "_docstore", docstore)
+
+        retriever = MagicMock()
+        retriever.invoke.return_value = [Document(page_content="벡터 검색 결과")]
+        with patch(
+            "src.agents.tools.search_lorebook.get_retriever",
+            return_value=retriever,
+        ):
+            yield str(index_path), retriever
+
+    def test_auto_mode_answers_entity_lookup_without_vectors(self, lexical_setup):
+        """고유명사 검색은 임베딩 없이 BM25로 반환하는지 테스트"""
+        index_path, retriever = lexical_setup
+        configure_hybrid_search(mode="auto", index_path=index_path)
+
+        docs = retrieve_documents("윈드헬름")
+
+        assert [d.page_content for d in docs] == ["윈드헬름은 울프릭이 다스리는 도시다."]
+        retriever.invoke.assert_not_called()
+
+    def test_auto_mode_falls_back_on_low_confidence(self, lexical_setup):
+        """어휘 일치도가 낮으면 벡터 검색을 사용하는지 테스트"""
+        index_path, retriever = lexical_setup
+        configure_hybrid_search(mode="auto", index_path=index_path)
+
+        docs = retrieve_documents("북쪽 항구 도시의 정치 상황")
+
+        assert [d.page_content for d in docs] == ["벡터 검색 결과"]
+        retriever.invoke.assert_called_once()
+
+    def test_fusion_mode_combines_results(self, lexical_setup):
+        index_path, retriever = lexical_setup
+        configure_hybrid_search(mode="fusion", index_path=index_path)
+
+        docs = retrieve_documents("화이트런")
+
+        contents = [d.page_content for d in docs]
+        assert "벡터 검색 결과" in contents
+        assert "화이트런은 스카이림 중앙의 영지다." in contents
+        retriever.invoke.assert_called_once()
+
+    def test_lexical_mode_never_uses_vectors(self, lexical_setup):
+        index_path, retriever = lexical_setup
+        configure_hybrid_search(mode="lexical", index_path=index_path)
+
+        assert retrieve_documents("솔스타임") == []
+        retriever.invoke.assert_not_called()
+
+    def test_batch_sends_only_low_confidence_queries_to_vectors(self, lexical_setup):
+        """배치 검색에서 BM25로 충분한 검색어는 벡터 배치에서 빠지는지 테스트"""
+        index_path, retriever = lexical_setup
+        configure_hybrid_search(mode="auto", index_path=index_path)
+
+        with patch(
+            "src.agents.tools.search_lorebook._retrieve_uncached_batch",
+            return_value=[[Document(page_content="벡터 검색 결과")]],
+        ) as vector_batch:
+            results = retrieve_documents_batch(["화이트런", "북쪽 항구 도시"])
+
+        vector_batch.assert_called_once_with(retriever, ["북쪽 항구 도시"])
+        assert results[0][0].page_content.startswith("화이트런")
+        assert results[1][0].page_content == "벡터 검색 결과"
+
+    def test_missing_index_file_builds_from_docstore(self, lexical_setup, tmp_path):
+        _, retriever = lexical_setup
+        configure_hybrid_search(mode="auto", index_path=str(tmp_path / "missing.json"))
+
+        docs = retrieve_documents("화이트런")
+
+        assert docs[0].page_content.startswith("화이트런")
+        retriever.invoke.assert_not_called()
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            configure_hybrid_search(mode="semantic")
+
+
+class TestEntityLookup:
+    """개체명 사전 조회 테스트"""
+
+    @pytest.fixture
+    def entity_setup(self, tmp_path, monkeypatch):
+        docstore = SQLiteDocStore(tmp_path / "docs.sqlite3")
+        docstore.mset(
+            [
+                (
+                    "hold",
+                    Document(
+                        page_content="### 1. 화이트런 영지 (Whiterun Hold)\n"
+                        "- **수도:** 화이트런 (Whiterun)"
+                    ),
+                ),
+                ("reach", Document(page_content="### 4. 리치 (The Reach) - 고대의 유산")),
+            ]
+        )
+        monkeypatch.setattr(search_lorebook_module, "_docstore", docstore)
+        monkeypatch.setattr(search_lorebook_module, "_gazetteer", None)
+        configure_hybrid_search(mode="vector", gazetteer_path=str(tmp_path / "missing.json"))
+
+        retriever = MagicMock()
+        retriever.invoke.return_value = [Document(page_content="벡터 검색 결과")]
+        with patch(
+            "src.agents.tools.search_lorebook.get_retriever",
+            return_value=retriever,
+        ):
+            yield retriever
+
+    def test_both_languages_resolve_to_same_section(self, entity_setup):
+        korean = find_entity_documents("화이트런 영지")
+        english = find_entity_documents("whiterun hold")
+
+        assert korean == english
+        assert korean[0].page_content.startswith("### 1. 화이트런 영지")
+
+    def test_alias_without_article(self, entity_setup):
+        assert find_entity_documents("Reach")[0].page_content.startswith("### 4. 리치")
+
+    def test_search_skips_retriever_on_exact_match(self, entity_setup, tmp_path):
+        """정확히 일치하는 이름은 retriever를 거치지 않는지 테스트"""
+        configure_hybrid_search(mode="fusion", gazetteer_path=str(tmp_path / "missing.json"))
+
+        result = search_lorebook.invoke({"query": "Whiterun"})
+
+        assert "화이트런 영지" in result
+        entity_setup.invoke.assert_not_called()
+
+    def test_vector_mode_ignores_gazetteer(self, entity_setup):
+        """vector 모드는 정확히 일치하는 이름도 벡터 검색을 사용하는지 테스트"""
+        result = search_lorebook.invoke({"query": "Whiterun"})
+
+        assert "벡터 검색 결과" in result
+        entity_setup.invoke.assert_called_once()
+
+    def test_unknown_name_uses_retriever(self, entity_setup):
+        assert find_entity_documents("솔스타임") == []
+
+        result = search_lorebook.invoke({"query": "솔스타임"})
+
+        assert "벡터 검색 결과" in result
+        entity_setup.invoke.assert_called_once()
+
+
+class TestRetrieverWarmup:
+    """retriever 백그라운드 워밍업 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_retriever(self, monkeypatch):
+        """retriever 전역 상태 초기화"""
+        module = "src.agents.tools.search_lorebook"
+        monkeypatch.setattr(f"{module}._cached_retriever", None)
+        monkeypatch.setattr(f"{module}._warmup_future", None)
+        monkeypatch.setattr(f"{module}._retriever_status", RetrieverStatus())
+        monkeypatch.setattr(f"{module}._eager_warmup", False)
+
+    @pytest.fixture
+    def slow_build(self):
+        """로딩에 시간이 걸리는 Mock _build_retriever"""
+        retriever = MagicMock()
+
+        def build(*args):
+            time.sleep(0.05)
+            return retriever
+
+        with patch(
+            "src.agents.tools.search_lorebook._build_retriever", side_effect=build
+        ) as mock_build:
+            yield mock_build, retriever
+
+    def test_status_idle_before_load(self):
+        assert get_retriever_status().state == "idle"
+        assert get_retriever_status().is_ready is False
+
+    def test_warmup_loads_once_and_reports_time(self, slow_build):
+        """워밍업 중 get_retriever가 두 번째 복사본을 만들지 않는지 테스트"""
+        mock_build, retriever = slow_build
+
+        future = start_retriever_warmup()
+        assert start_retriever_warmup() is future
+        assert get_retriever() is retriever
+        assert future.result(timeout=1) is retriever
+
+        mock_build.assert_called_once()
+        retriever.vectorstore.embeddings.embed_query.assert_called_once()
+        status = get_retriever_status()
+        assert status.is_ready
+        assert status.load_seconds >= 0.05
+
+    def test_failed_warmup_falls_back_to_direct_load(self):
+        """워밍업 실패 시 get_retriever가 직접 다시 로드하는지 테스트"""
+        retriever = MagicMock()
+        with patch(
+            "src.agents.tools.search_lorebook._build_retriever",
+            side_effect=[RuntimeError("load failed"), retriever],
+        ):
+            future = start_retriever_warmup()
+            with pytest.raises(RuntimeError):
+                future.result(timeout=1)
+            assert get_retriever_status().state == "failed"
+
+            assert get_retriever() is retriever
+        assert get_retriever_status().is_ready
+
+    def test_embed_text_if_ready_does_not_load(self):
+        """retriever가 로드되기 전에는 임베딩하지 않고 로딩도 시작하지 않는지 테스트"""
+        with patch("src.agents.tools.search_lorebook._build_retriever") as mock_build:
+            assert search_lorebook_module.embed_text_if_ready("용사") is None
+        mock_build.assert_not_called()
+
+    def test_embed_text_if_ready_uses_loaded_model(self, monkeypatch):
+        retriever = MagicMock()
+        retriever.vectorstore.embeddings.embed_query.return_value = [0.1, 0.2]
+        monkeypatch.setattr(search_lorebook_module, "_cached_retriever", retriever)
+
+        assert search_lorebook_module.embed_text_if_ready("용사") == [0.1, 0.2]
+
+    def test_create_graph_starts_warmup_in_eager_mode(self, slow_build):
+        """eager 모드에서 그래프 생성 시 워밍업이 시작되는지 테스트"""
+        from src.graph import create_graph
+
+        create_graph(llm=MagicMock())
+        assert search_lorebook_module._warmup_future is None
+
+        set_eager_warmup(True)
+        create_graph(llm=MagicMock())
+        assert search_lorebook_module._warmup_future is not None
+        search_lorebook_module._warmup_future.result(timeout=1)
@@ -0,0 +1,68 @@
+"""의미 기반 캐시 테스트"""
+
+import pytest
+
+from src.utils.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """SemanticCache 테스트"""
+
+    @pytest.fixture
+    def cache(self):
+        return SemanticCache(threshold=0.9, maxsize=3)
+
+    def test_exact_match_without_embedding(self, cache):
+        """정규화한 텍스트가 같으면 임베딩 없이 적중하는지 테스트"""
+        cache.add("용사 이야기", "결과")
+
+        assert cache.get_exact("  용사   이야기 ") == "결과"
+        assert cache.get("용사 이야기") == ("결과", 1.0)
+        assert cache.stats().exact_hits == 2
+
+    def test_nearest_above_threshold(self, cache):
+        """threshold 이상인 항목 중 가장 가까운 항목을 반환하는지 테스트"""
+        cache.add("용사 이야기", "용사", embedding=[1.0, 0.0])
+        cache.add("도둑 이야기", "도둑", embedding=[0.0, 1.0])
+
+        value, score = cache.get("용사의 모험 이야기", embedding=[0.95, 0.1])
+
+        assert value == "용사"
+        assert score == pytest.approx(0.9945, abs=1e-3)
+        assert cache.stats().semantic_hits == 1
+
+    def test_below_threshold_misses(self, cache):
+        cache.add("용사 이야기", "용사", embedding=[1.0, 0.0])
+
+        assert cache.get("다른 이야기", embedding=[0.7, 0.7]) is None
+        assert cache.stats().misses == 1
+
+    def test_entries_without_embedding_match_exactly_only(self, cache):
+        cache.add("용사 이야기", "용사")
+
+        assert cache.get("용사의 이야기", embedding=[1.0, 0.0]) is None
+
+    def test_lru_eviction(self, cache):
+        """maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거하는지 테스트"""
+        for i in range(3):
+            cache.add(f"요청 {i}", i, embedding=[1.0, float(i)])
+        cache.get_exact("요청 0")
+
+        cache.add("요청 3", 3)
+
+        assert len(cache) == 3
+        assert cache.get_exact("요청 1") is None
+        assert cache.get_exact("요청 0") == 0
+        assert cache.stats().evictions == 1
+
+    def test_zero_vector_is_ignored(self, cache):
+        cache.add("용사 이야기", "용사", embedding=[0.0, 0.0])
+
+        assert cache.get("용사의 이야기", embedding=[0.0, 0.0]) is None
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"threshold": 0.0}, {"threshold": 1.5}, {"maxsize": 0}]
+    )
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            SemanticCache(**kwargs)
@@ -0,0 +1,91 @@
+"""상태 스키마 테스트"""
+
+import pytest
+
+from src.schemas.state import (
+    GraphState,
+    RetrievalMemo,
+    append_history,
+    bounded_history,
+    graph_state_schema,
+)
+
+
+class TestHistoryReducer:
+    """히스토리 reducer 테스트"""
+
+    def test_appends_delta(self):
+        assert append_history(["a"], ["b"]) == ["a", "b"]
+
+    def test_unbounded_by_default(self):
+        assert len(append_history(["x"] * 10, ["y"])) == 11
+
+    def test_bounded_keeps_latest(self):
+        assert bounded_history(2)(["a", "b"], ["c"]) == ["b", "c"]
+
+    def test_invalid_limit_raises(self):
+        with pytest.raises(ValueError):
+            bounded_history(0)
+
+
+class TestGraphStateSchema:
+    """히스토리 보관 개수별 상태 스키마 테스트"""
+
+    def test_unbounded_is_graph_state(self):
+        assert graph_state_schema(None) is GraphState
+
+    def test_bounded_schema_is_cached_subclass(self):
+        schema = graph_state_schema(2)
+
+        assert issubclass(schema, GraphState)
+        assert graph_state_schema(2) is schema
+        assert graph_state_schema(3) is not schema
+
+    def test_invalid_limit_raises(self):
+        with pytest.raises(ValueError):
+            graph_state_schema(0)
+
+
+class TestRetrievalMemo:
+    """RetrievalMemo 테스트"""
+
+    def test_recall_missing_returns_none(self):
+        memo = RetrievalMemo()
+        assert memo.recall("화이트런") is None
+        assert memo.hits == 0
+
+    def test_record_then_recall(self):
+        """기록한 결과를 재사용하고 적중 수를 세는지 테스트"""
+        memo = RetrievalMemo()
+        memo.record("화이트런", ["화이트런 자료"], agent="StoryWriter")
+
+        assert memo.recall("화이트런", agent="Director") == ["화이트런 자료"]
+        assert (memo.hits, memo.misses) == (1, 1)
+
+    def test_recall_normalizes_query(self):
+        memo = RetrievalMemo()
+        memo.record("Whiterun  Hold", ["자료"])
+        assert memo.recall(" whiterun hold ") == ["자료"]
+
+    def test_used_by_tracks_agents(self):
+        """결과를 받은 에이전트별로 조회되는지 테스트"""
+        memo = RetrievalMemo()
+        memo.record("화이트런", ["a"], agent="LorePrefetcher")
+        memo.record("윈드헬름", ["b"], agent="Director")
+        memo.recall("윈드헬름", agent="StoryWriter")
+        memo.record("솔스타임", ["c"], agent="Director")
+
+        queries = [r.query for r in memo.used_by({"LorePrefetcher", "StoryWriter"})]
+
+        assert queries == ["화이트런", "윈드헬름"]
+
+    def test_summary(self):
+        memo = RetrievalMemo()
+        memo.record("화이트런", ["a"])
+        memo.recall("화이트런")
+        assert memo.summary() == "고유 검색어 1개, 실제 검색 1회, 메모 재사용 1회"
+
+    def test_graph_state_has_empty_memo(self):
+        state = GraphState()
+        assert state.retrieval_memo.records == {}
+        assert GraphState().retrieval_memo is not state.retrieval_memo
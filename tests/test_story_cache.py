@@ -0,0 +1,113 @@
+"""스토리 생성 결과 캐시 테스트"""
+
+import pytest
+
+from src.schemas.state import EvalReport, GraphState, RefinedRequest, StoryOutput
+from src.utils.lorebook_cache import LorebookFingerprint
+from src.utils.story_cache import StoryCache
+
+
+@pytest.fixture
+def lorebook_dir(tmp_path):
+    """임시 lorebook 디렉토리"""
+    path = tmp_path / "lorebooks"
+    path.mkdir()
+    (path / "world.md").write_text("# 화이트런\n스카이림의 중심", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path, lorebook_dir):
+    fingerprint = LorebookFingerprint(
+        lorebook_dir=lorebook_dir,
+        persist_directory=tmp_path / "chroma_db",
+        docstore_path=None,
+        check_interval=0.0,
+    )
+    cache = StoryCache(tmp_path / "stories.sqlite3", max_entries=2, fingerprint=fingerprint)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def final_state():
+    return GraphState(
+        user_input="용사 이야기",
+        request=RefinedRequest(summarized_prompt="p", genre="판타지"),
+        story_output=StoryOutput(title="용사", story="옛날 옛적에"),
+        story_history=["옛날 옛적에"],
+        eval_report=EvalReport(is_approved=True, score=9.0, paragraph_issues={1: ["a"]}),
+        is_complete=True,
+    )
+
+
+@pytest.fixture
+def updates(final_state):
+    return [
+        {"init": {"request": final_state.request}},
+        {"prefetch": None},
+        {"write": {"story_output": final_state.story_output, "story_history": ["옛날 옛적에"]}},
+        {"review": {"eval_report": final_state.eval_report, "is_complete": True}},
+    ]
+
+
+class TestStoryCacheKey:
+    """캐시 키 테스트"""
+
+    def test_same_request_same_key(self):
+        assert StoryCache.make_key("용사 이야기", "m") == StoryCache.make_key(
+            " 용사 이야기 ", "m"
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"model_name": "other"},
+            {"llm_options": {"temperature": 0.5}},
+            {"story_writer_system_prompt": "다른 프롬프트"},
+            {"director_system_prompt": "다른 프롬프트"},
+            {"max_retries": 5},
+            {"retry_policy": "ConvergencePolicy()"},
+        ],
+    )
+    def test_config_changes_key(self, changed):
+        """모델/옵션/프롬프트/재시도 횟수/재작성 정책이 다르면 다른 키인지 테스트"""
+        base = {"user_input": "용사 이야기", "model_name": "m"}
+        assert StoryCache.make_key(**base) != StoryCache.make_key(**{**base, **changed})
+
+
+class TestStoryCache:
+    """StoryCache 저장/조회 테스트"""
+
+    def test_round_trip(self, cache, final_state, updates):
+        """최종 상태와 노드 업데이트가 원래 타입으로 복원되는지 테스트"""
+        cache.set("k", final_state, updates)
+
+        cached = cache.get("k")
+
+        assert cached.final_state == final_state
+        assert cached.updates == updates
+        assert cached.updates[3]["review"]["eval_report"].paragraph_issues == {1: ["a"]}
+
+    def test_miss(self, cache):
+        assert cache.get("없는 키") is None
+
+    def test_lorebook_change_invalidates(self, cache, final_state, lorebook_dir):
+        """lorebook이 바뀌면 이전 결과를 사용하지 않는지 테스트"""
+        cache.set("k", final_state, [])
+
+        (lorebook_dir / "world.md").write_text("# 화이트런\n바뀐 설정", encoding="utf-8")
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_size_bounded_eviction(self, cache, final_state):
+        """max_entries를 넘으면 가장 오래 조회되지 않은 결과부터 제거하는지 테스트"""
+        cache.set("a", final_state, [])
+        cache.set("b", final_state, [])
+        cache.get("a")
+        cache.set("c", final_state, [])
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
@@ -0,0 +1,104 @@
+"""스토리 부분 수정 모듈 테스트"""
+
+import pytest
+
+from src.utils.story_diff import (
+    EditApplyError,
+    ParagraphEdit,
+    apply_edits,
+    join_paragraphs,
+    number_paragraphs,
+    parse_edits,
+    split_paragraphs,
+)
+
+
+class TestParagraphs:
+    """문단 분리/번호 테스트"""
+
+    def test_split_paragraphs(self):
+        story = "첫 문단\n\n\n두 번째 문단\n이어지는 줄\r\n\r\n세 번째"
+        assert split_paragraphs(story) == ["첫 문단", "두 번째 문단\n이어지는 줄", "세 번째"]
+
+    def test_join_roundtrip(self):
+        paragraphs = ["a", "b", "c"]
+        assert split_paragraphs(join_paragraphs(paragraphs)) == paragraphs
+
+    def test_number_paragraphs(self):
+        assert number_paragraphs(["a", "b"]) == "[P1] a\n\n[P2] b"
+
+
+class TestParseEdits:
+    """수정안 파싱 테스트"""
+
+    def test_parse_valid(self):
+        edits = parse_edits(
+            [
+                {"op": "replace", "paragraph": "2", "text": " 새 문단 "},
+                {"op": "delete", "paragraph": 3},
+            ]
+        )
+        assert edits == [ParagraphEdit("replace", 2, "새 문단"), ParagraphEdit("delete", 3)]
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            None,
+            [{"op": "rewrite", "paragraph": 1, "text": "x"}],
+            [{"op": "replace", "paragraph": "둘", "text": "x"}],
+            [{"op": "insert_after", "paragraph": 1}],
+            ["replace 1"],
+        ],
+    )
+    def test_parse_invalid_raises(self, raw):
+        with pytest.raises(EditApplyError):
+            parse_edits(raw)
+
+
+class TestApplyEdits:
+    """수정안 적용 테스트"""
+
+    @pytest.fixture
+    def paragraphs(self):
+        return ["p1", "p2", "p3"]
+
+    def test_replace(self, paragraphs):
+        assert apply_edits(paragraphs, [ParagraphEdit("replace", 2, "P2")]) == [
+            "p1",
+            "P2",
+            "p3",
+        ]
+
+    def test_insert_and_delete_use_original_numbers(self, paragraphs):
+        """연산 순서와 무관하게 이전 버전 번호를 기준으로 적용되는지 테스트"""
+        edits = [
+            ParagraphEdit("delete", 1),
+            ParagraphEdit("insert_after", 0, "서문"),
+            ParagraphEdit("insert_after", 2, "새 문단"),
+            ParagraphEdit("replace", 3, "P3"),
+        ]
+        assert apply_edits(paragraphs, edits) == ["서문", "p2", "새 문단", "P3"]
+
+    def test_no_edits_keeps_story(self, paragraphs):
+        assert apply_edits(paragraphs, []) == paragraphs
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            ParagraphEdit("replace", 4, "x"),
+            ParagraphEdit("delete", 0),
+            ParagraphEdit("insert_after", -1, "x"),
+        ],
+    )
+    def test_out_of_range_raises(self, paragraphs, edit):
+        with pytest.raises(EditApplyError):
+            apply_edits(paragraphs, [edit])
+
+    def test_conflicting_edits_raise(self, paragraphs):
+        edits = [ParagraphEdit("replace", 1, "x"), ParagraphEdit("delete", 1)]
+        with pytest.raises(EditApplyError):
+            apply_edits(paragraphs, edits)
+
+    def test_empty_result_raises(self):
+        with pytest.raises(EditApplyError):
+            apply_edits(["p1"], [ParagraphEdit("delete", 1)])
@@ -1,12 +1,14 @@
 """StoryWriter 테스트"""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langchain_core.messages import AIMessage
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
 
-from src.agents.story_writer import StoryWriter
-from src.schemas.state import GraphState, RefinedRequest, StoryOutput
+from src.agents.story_writer import StoryTextEvent, StoryWriter
+from src.schemas.state import GraphState, LoreSnippet, RefinedRequest, StoryOutput
 
 
 class TestStoryWriter:
@@ -68,6 +70,16 @@ class TestStoryWriter:
 
         assert "이전 스토리 내용" in message
 
+    def test_build_user_message_includes_prefetched_lore(self, writer, sample_state):
+        """사전 검색한 Lorebook 자료가 첫 프롬프트에 포함되는지 테스트"""
+        sample_state.prefetched_lore = [
+            LoreSnippet(query="화이트런", content="화이트런은 스카이림의 중심입니다.")
+        ]
+        message = writer._build_user_message(sample_state)
+
+        assert "[설정 자료]: 화이트런은 스카이림의 중심입니다." in message
+        assert message.index("참고 설정 자료") < message.index("Story Request")
+
     def test_parse_response_creates_story_output(self, writer):
         """응답 파싱이 StoryOutput을 생성하는지 테스트"""
         response = """{
@@ -127,9 +139,22 @@ class TestStoryWriter:
 
         result = writer(sample_state, runtime=None)
 
-        assert result.story_output is not None
-        assert result.story_output.title == "테스트"
-        assert len(result.story_history) > 0
+        assert result["story_output"] is not None
+        assert result["story_output"].title == "테스트"
+        assert result["story_history"] == [result["story_output"].story]
+
+    def test_acall_updates_state(self, writer, sample_state):
+        """acall이 비동기 LLM 호출로 state를 업데이트하는지 테스트"""
+        writer.llm_with_tools.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content='{"title":"비동기","story":"비동기 스토리","word_count":1}'
+            )
+        )
+
+        result = asyncio.run(writer.acall(sample_state, runtime=None))
+
+        assert result["story_output"].title == "비동기"
+        writer.llm_with_tools.invoke.assert_not_called()
 
 
 class TestStoryWriterEdgeCases:
@@ -174,5 +199,203 @@ class TestStoryWriterEdgeCases:
         result = writer(state, runtime=None)
 
         # story_history에 새 스토리 추가됨
-        assert len(result.story_history) == 1
-        assert result.story_history[0] == "s"
+        assert result["story_history"] == ["s"]
+
+
+    def test_input_memo_is_not_mutated(self, writer):
+        """검색 결과는 업데이트의 메모에만 기록되고 입력 상태의 메모는 그대로인지 테스트"""
+        state = GraphState(request=RefinedRequest(summarized_prompt="테스트"))
+        state.retrieval_memo.record("화이트런", ["화이트런 메모"])
+        writer.llm_with_tools.invoke.side_effect = [
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"id": "c1", "name": "search_lorebook", "args": {"query": "화이트런"}},
+                    {"id": "c2", "name": "search_lorebook", "args": {"query": "윈드헬름"}},
+                ],
+            ),
+            AIMessage(content='{"title": "t", "story": "s"}'),
+        ]
+
+        with patch("src.agents.base.search_lorebook") as mock_search:
+            mock_search.invoke.return_value = ToolMessage(
+                content="윈드헬름 자료",
+                artifact={"윈드헬름": [Document(page_content="윈드헬름 자료")]},
+                tool_call_id="c2",
+            )
+            result = writer(state, runtime=None)
+
+        assert set(result["retrieval_memo"].records) == {"화이트런", "윈드헬름"}
+        assert result["retrieval_memo"].hits == 1
+        assert result["retrieval_memo"] is not state.retrieval_memo
+        assert set(state.retrieval_memo.records) == {"화이트런"}
+        assert state.retrieval_memo.hits == 0
+        assert state.retrieval_memo.records["화이트런"].used_by == []
+
+
+class TestStoryWriterRevision:
+    """StoryWriter 부분 수정 모드 테스트"""
+
+    PREVIOUS = "첫 문단입니다.\n\n드래곤이 나타났다.\n\n용사가 승리했다."
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def writer(self, mock_llm):
+        return StoryWriter(llm=mock_llm, system_prompt="Test", revision_mode="diff")
+
+    @pytest.fixture
+    def retry_state(self):
+        return GraphState(
+            request=RefinedRequest(summarized_prompt="용사 이야기", length="Long"),
+            story_output=StoryOutput(title="용사", story=self.PREVIOUS),
+            story_history=[self.PREVIOUS],
+            feedback_history=["드래곤 묘사가 부족합니다."],
+        )
+
+    def test_invalid_revision_mode_raises(self, mock_llm):
+        with pytest.raises(ValueError):
+            StoryWriter(llm=mock_llm, revision_mode="patch")
+
+    def test_auto_mode_uses_story_length(self, mock_llm, retry_state):
+        """auto 모드는 긴 스토리만 부분 수정하는지 테스트"""
+        writer = StoryWriter(llm=mock_llm)
+        assert writer._use_revision(retry_state) is False
+
+        long_story = "\n\n".join(["가" * 600] * 3)
+        retry_state.story_output = StoryOutput(story=long_story)
+        assert writer._use_revision(retry_state) is True
+
+    def test_first_attempt_is_full_write(self, writer, retry_state):
+        retry_state.feedback_history = []
+        assert writer._use_revision(retry_state) is False
+
+    def test_revision_message_numbers_paragraphs(self, writer, retry_state):
+        """수정 모드 메시지에 번호 붙인 문단과 피드백이 포함되는지 테스트"""
+        message = writer._build_revision_message(retry_state)
+
+        assert "[P2] 드래곤이 나타났다." in message
+        assert "드래곤 묘사가 부족합니다." in message
+        assert "Title: 용사" in message
+
+    def test_call_applies_edits(self, writer, retry_state):
+        """수정안을 이전 버전에 적용한 전체 스토리를 반환하는지 테스트"""
+        writer.llm_with_tools.invoke.return_value = AIMessage(
+            content='{"edits": [{"op": "replace", "paragraph": 2, '
+            '"text": "붉은 비늘의 드래곤이 포효했다."}], "notes": "묘사 보강"}'
+        )
+
+        result = writer(retry_state, runtime=None)
+
+        story = "첫 문단입니다.\n\n붉은 비늘의 드래곤이 포효했다.\n\n용사가 승리했다."
+        assert result["story_output"].story == story
+        assert result["story_output"].title == "용사"
+        assert result["story_output"].word_count == len(story)
+        assert result["story_history"] == [story]
+        writer.llm_with_tools.invoke.assert_called_once()
+
+    def test_invalid_edits_fall_back_to_full_rewrite(self, writer, retry_state):
+        """적용할 수 없는 수정안이면 전체 재작성으로 대체하는지 테스트"""
+        writer.llm_with_tools.invoke.side_effect = [
+            AIMessage(content='{"edits": [{"op": "replace", "paragraph": 9, "text": "x"}]}'),
+            AIMessage(content='{"title": "새 용사", "story": "전체 재작성"}'),
+        ]
+
+        result = writer(retry_state, runtime=None)
+
+        assert result["story_output"].story == "전체 재작성"
+        full_prompt = writer.llm_with_tools.invoke.call_args_list[1].args[0][1].content
+        assert "## 이전 스토리 버전" in full_prompt
+        assert "[P1]" not in full_prompt
+
+    def test_full_story_response_is_accepted(self, writer, retry_state):
+        """수정안 대신 전체 스토리를 출력하면 그대로 사용하는지 테스트"""
+        writer.llm_with_tools.invoke.return_value = AIMessage(
+            content='{"title": "t", "story": "새 스토리"}'
+        )
+
+        result = writer(retry_state, runtime=None)
+
+        assert result["story_output"].story == "새 스토리"
+        writer.llm_with_tools.invoke.assert_called_once()
+
+    def test_acall_applies_edits(self, writer, retry_state):
+        writer.llm_with_tools.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content='{"edits": [{"op": "delete", "paragraph": 1}]}'
+            )
+        )
+
+        result = asyncio.run(writer.acall(retry_state, runtime=None))
+
+        assert result["story_output"].story == "드래곤이 나타났다.\n\n용사가 승리했다."
+
+
+class TestStoryWriterStreaming:
+    """StoryWriter 스토리 텍스트 스트리밍 테스트"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock = MagicMock()
+        mock.bind_tools.return_value = mock
+        return mock
+
+    @pytest.fixture
+    def runtime(self):
+        runtime = MagicMock()
+        runtime.events = []
+        runtime.stream_writer = runtime.events.append
+        return runtime
+
+    def test_stream_output_emits_story_text_events(self, mock_llm, runtime):
+        """스트리밍 모드에서 title/story 조각을 StoryTextEvent로 내보내는지 테스트"""
+        writer = StoryWriter(llm=mock_llm, stream_output=True)
+        writer.llm_with_tools.stream.return_value = iter(
+            [
+                AIMessageChunk(content='{"title": "용사", '),
+                AIMessageChunk(content='"story": "옛날 '),
+                AIMessageChunk(content='옛적에", "word_count": 6}'),
+            ]
+        )
+
+        result = writer(GraphState(request=RefinedRequest(summarized_prompt="p")), runtime)
+
+        assert runtime.events == [
+            StoryTextEvent("title", "용사", attempt=1),
+            StoryTextEvent("story", "옛날 ", attempt=1),
+            StoryTextEvent("story", "옛적에", attempt=1),
+        ]
+        assert result["story_output"].story == "옛날 옛적에"
+        writer.llm_with_tools.invoke.assert_not_called()
+
+    def test_revision_emits_merged_story_once(self, mock_llm, runtime):
+        """부분 수정 결과를 replace 이벤트로 한 번에 내보내는지 테스트"""
+        writer = StoryWriter(llm=mock_llm, revision_mode="diff", stream_output=True)
+        writer.llm_with_tools.stream.return_value = iter(
+            [AIMessageChunk(content='{"edits": [{"op": "delete", "paragraph": 1}]}')]
+        )
+        state = GraphState(
+            story_output=StoryOutput(title="t", story="a\n\nb"),
+            feedback_history=["f"],
+            retry_count=1,
+        )
+
+        writer(state, runtime)
+
+        assert runtime.events == [
+            StoryTextEvent("title", "t", attempt=2, replace=True),
+            StoryTextEvent("story", "b", attempt=2, replace=True),
+        ]
+
+    def test_without_stream_output_uses_invoke(self, mock_llm, runtime):
+        writer = StoryWriter(llm=mock_llm)
+        writer.llm_with_tools.invoke.return_value = AIMessage(content='{"story": "s"}')
+
+        writer(GraphState(), runtime)
+
+        writer.llm_with_tools.stream.assert_not_called()
+        assert runtime.events == []
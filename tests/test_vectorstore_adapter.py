@@ -0,0 +1,88 @@
+"""벡터 DB 배치 접근 어댑터 테스트"""
+
+from unittest.mock import MagicMock
+
+from langchain_core.documents import Document
+
+from src.utils.vectorstore_adapter import (
+    native_collection,
+    similarity_search_by_vectors,
+    upsert_embeddings,
+)
+
+
+class TestNativeCollection:
+    """native_collection 테스트"""
+
+    def test_returns_collection_with_batch_methods(self):
+        vectorstore = MagicMock()
+
+        assert native_collection(vectorstore) is vectorstore._collection
+
+    def test_non_chroma_store_returns_none(self):
+        vectorstore = MagicMock(spec=["similarity_search_by_vector", "add_documents"])
+
+        assert native_collection(vectorstore) is None
+
+    def test_collection_without_required_methods_returns_none(self):
+        """래퍼 내부 구조가 바뀌어 필요한 메서드가 없으면 None인지 테스트"""
+        vectorstore = MagicMock()
+        vectorstore._collection = MagicMock(spec=["count"])
+
+        assert native_collection(vectorstore) is None
+
+
+class TestSimilaritySearchByVectors:
+    """similarity_search_by_vectors 테스트"""
+
+    def test_chroma_uses_single_query(self):
+        vectorstore = MagicMock()
+        vectorstore._collection.query.return_value = {
+            "documents": [["a"], ["b"]],
+            "metadatas": [[{"doc_id": "1"}], [None]],
+        }
+
+        results = similarity_search_by_vectors(vectorstore, [[0.1], [0.2]], k=1)
+
+        vectorstore._collection.query.assert_called_once()
+        assert [[d.page_content for d in docs] for docs in results] == [["a"], ["b"]]
+        assert results[1][0].metadata == {}
+
+    def test_falls_back_to_public_api(self):
+        vectorstore = MagicMock(spec=["similarity_search_by_vector"])
+        vectorstore.similarity_search_by_vector.side_effect = lambda e, k: [
+            Document(page_content=str(e[0]))
+        ]
+
+        results = similarity_search_by_vectors(vectorstore, [[1.0], [2.0]], k=3)
+
+        assert vectorstore.similarity_search_by_vector.call_count == 2
+        assert [docs[0].page_content for docs in results] == ["1.0", "2.0"]
+
+    def test_native_query_error_falls_back(self):
+        """네이티브 쿼리 형식이 바뀌어 실패하면 공개 API로 검색하는지 테스트"""
+        vectorstore = MagicMock()
+        vectorstore._collection.query.side_effect = TypeError("unexpected keyword")
+        vectorstore.similarity_search_by_vector.return_value = []
+
+        results = similarity_search_by_vectors(vectorstore, [[1.0]], k=1)
+
+        assert results == [[]]
+        vectorstore.similarity_search_by_vector.assert_called_once()
+
+
+class TestUpsertEmbeddings:
+    """upsert_embeddings 테스트"""
+
+    def test_upserts_precomputed_embeddings(self):
+        vectorstore = MagicMock()
+
+        assert upsert_embeddings(vectorstore, ["1"], ["a"], [{}], [[0.0]]) is True
+        vectorstore._collection.upsert.assert_called_once_with(
+            ids=["1"], embeddings=[[0.0]], documents=["a"], metadatas=[{}]
+        )
+
+    def test_returns_false_without_collection(self):
+        vectorstore = MagicMock(spec=["add_documents"])
+
+        assert upsert_embeddings(vectorstore, ["1"], ["a"], [{}], [[0.0]]) is False